@@ -25,20 +25,22 @@ import sys
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import hashlib
 import json
 import logging
 import re
-import time
 import traceback
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 
 import plexapi.exceptions
 import requests
 from plexapi.myplex import MyPlexAccount
 
 from utils import (
+    BATCH_SCORING_MIN_CANDIDATES,
     CACHE_VERSION,
     CALIBRATION_CERTIFICATE_WEIGHT,
     CALIBRATION_GENRE_WEIGHT,
@@ -70,43 +72,58 @@ from utils import (
     TIER_DIVERSE_PERCENT,
     TIER_SAFE_PERCENT,
     TIER_WILDCARD_PERCENT,
-    TMDB_RATE_LIMIT_DELAY,
     WEIGHT_SUM_TOLERANCE,
     YELLOW,
+    BatchCorpus,
     CalibrationDimension,
+    CompiledProfile,
+    LibraryIndex,
+    LibraryItem,
+    MediaCacheStore,
+    ScoringOptions,
+    TermIndex,
+    WatchLedger,
     add_labels_to_items,
     apply_franchise_ordering,
     apply_ignored_penalties,
     apply_user_label_restrictions,
     assess_pool_health,
+    batch_scoring_available,
+    batch_similarity_scores,
     build_all_private_labels,
     build_certificate_distribution,
-    build_corpus_idf,
-    build_franchise_index,
     build_label_name,
+    build_profile_from_counters,
     build_target_distribution,
     calculate_recency_multiplier,
     calculate_rewatch_multiplier,
     calibrate_multi,
     calibration_report,
     categorize_labeled_items,
+    changed_terms,
     check_cache_version,
     cleanup_legacy_unnamed_collection,
     cleanup_old_collections,
     coerce_year,
-    collect_library_tmdb_ids,
+    compile_profile,
+    content_terms,
     create_empty_counters,
     decisions_of_kind,
     describe_least_informative,
     enhance_profile_with_trakt,
     extract_ids_from_guids,
+    fetch_concurrently,
+    fetch_plex_items,
+    fetch_title_record,
     fetch_tmdb_with_retry,
     fetch_user_played_ids,
     find_ignored_recommendations,
     find_library_gaps,
     find_next_unwatched,
     find_supply_gaps,
+    find_supply_gaps_in,
     format_health_report,
+    get_cache_backend,
     get_configured_users,
     get_excluded_genres_for_user,
     get_franchise_order_for_user,
@@ -123,30 +140,72 @@ from utils import (
     init_plex,
     is_rating_allowed,
     is_sufficiently_sampled,
+    iter_ranked_recommendations,
+    library_content_version,
     load_collection_details,
     load_config,
+    load_full_plex_items,
+    load_library_index,
     load_media_cache,
+    load_score_store_record,
+    load_watch_ledger,
     log_error,
     log_warning,
     migrate_legacy_cache_dir,
     normalize_collection_id,
+    plex_max_workers,
+    plex_metadata_digest,
     print_similarity_breakdown,
     process_counters_from_cache,
+    profile_signature,
+    profile_snapshot,
+    read_library_snapshot,
+    recommendation_rank_key,
     remove_labels_from_items,
     remove_owned_collection,
     render_collection_name,
     resolve_media_type_overrides,
+    save_library_index,
     save_media_cache,
+    save_score_store,
+    save_watch_ledger,
     save_watched_cache,
     select_tiered_recommendations,
     show_progress,
     summarize_decisions,
     update_plex_collection,
+    updated_at_epoch,
     user_select_recommendations,
 )
 
 logger = logging.getLogger("curatarr")
 
+# Per-item score fields older versions wrote into the shared library cache.
+LEGACY_SCORE_FIELDS = ("cached_score", "profile_hash", "score_breakdown")
+
+# Per-item field holding the Plex updatedAt (epoch seconds) an item's
+# cache entry was built from - see BaseCache.update_cache.
+PLEX_UPDATED_AT_FIELD = "plex_updated_at"
+
+# Per-item field holding the digest of the Plex metadata an item's cache
+# entry was built from (utils/plex.py's plex_metadata_digest).
+PLEX_DIGEST_FIELD = "plex_digest"
+
+
+def cache_entry_version(item_info: Mapping) -> Any:
+    """
+    What changes whenever BaseCache.update_cache rewrites an item's cache
+    entry: its metadata digest, or for an entry built without one, its
+    updatedAt stamp (only re-stamped alongside a digest match). A stored
+    score is only reused for the version it was computed from.
+    """
+    return item_info.get(PLEX_DIGEST_FIELD) or item_info.get(PLEX_UPDATED_AT_FIELD)
+
+
+def library_keys_digest(rating_keys: Iterable[Any]) -> str:
+    """Order-independent digest of a library listing's rating keys."""
+    return hashlib.sha1("\n".join(sorted(str(key) for key in rating_keys)).encode()).hexdigest()
+
 
 class BaseCache(ABC):
     """
@@ -180,16 +239,61 @@ class BaseCache(ABC):
         self.recommender = recommender
         prefix = recommender._cache_library_prefix() if recommender else ""
         self.cache_path = os.path.join(cache_dir, f"{prefix}{self.cache_filename}")
+        self.index_path = os.path.join(cache_dir, f"{prefix}{self.media_key}_library_index.json")
+        # general.cache_backend: sqlite keeps the same cache in a database
+        # next to the JSON file, saved row by row (utils/media_store.py).
+        self._store: Optional[MediaCacheStore] = None
+        config = getattr(recommender, "config", None)
+        if isinstance(config, dict) and get_cache_backend(config) == "sqlite":
+            self._store = MediaCacheStore(os.path.splitext(self.cache_path)[0] + ".db", self.media_key)
         self.cache = self._load_cache()
+        self._index: Optional[LibraryIndex] = None
 
     def _load_cache(self) -> Dict:
         """Load cache from file."""
-        return load_media_cache(self.cache_path, self.media_key)
+        if self._store is not None:
+            cache = self._store.load(self.cache_path)
+        else:
+            cache = load_media_cache(self.cache_path, self.media_key)
+        # Per-item scores moved to the per-user score store (see
+        # BaseRecommender._score_store_path). Dropped here so they never
+        # read as current, and leave the file at its next save.
+        for item_info in cache.get(self.media_key, {}).values():
+            for field in LEGACY_SCORE_FIELDS:
+                item_info.pop(field, None)
+        return cache
 
     def _save_cache(self):
         """Save cache to file."""
         self.cache["cache_version"] = CACHE_VERSION
-        save_media_cache(self.cache_path, self.cache, self.media_key)
+        if self._store is not None:
+            self._store.save(self.cache)
+        else:
+            save_media_cache(self.cache_path, self.cache, self.media_key)
+
+    def library_index(self) -> LibraryIndex:
+        """
+        The library-wide derived indexes for this cache (see
+        utils/library_index.py) - loaded from next to the cache file when
+        they were saved for its current contents, rebuilt and saved
+        otherwise.
+        """
+        if self._index is None:
+            version = library_content_version(self.cache, self.media_key)
+            index = LibraryIndex.from_dict(load_library_index(self.index_path, version), version)
+            if index is None:
+                index = LibraryIndex.build(self.cache.get(self.media_key, {}), version)
+                save_library_index(self.index_path, version, index.to_dict())
+            self._index = index
+        return self._index
+
+    def _mark_contents_changed(self) -> None:
+        """
+        Bump the cache's content_version after items were added, removed
+        or rewritten, so a library index saved for the old contents reads
+        as stale.
+        """
+        self.cache["content_version"] = self.cache.get("content_version", 0) + 1
 
     def update_cache(
         self, plex, library_title: str, tmdb_api_key: Optional[str] = None, all_items: Optional[List] = None
@@ -197,11 +301,19 @@ class BaseCache(ABC):
         """
         Update cache with current library contents and TMDB metadata.
 
+        Only what changed in Plex is re-analyzed: items added or removed
+        since the last update (found through the listing's rating-key
+        digest) and items whose Plex updatedAt moved past the one their
+        entry was built from (see _changed_items) - of those, the ones
+        whose metadata is as it was (a label or collection edit - curatarr
+        makes its own every run) are only re-stamped (see _fetch_item_info).
+
         Args:
             plex: PlexServer instance
             library_title: Name of the library section
             tmdb_api_key: Optional TMDB API key for fetching additional metadata
-            all_items: Optional pre-fetched section.all() result. When
+            all_items: Optional pre-fetched library listing (a snapshot or
+                a section.all() result). When
                 provided, this skips the library fetch entirely instead of
                 re-querying Plex - callers that already hold a full-library
                 snapshot (see BaseRecommender._get_all_library_items(), #233
@@ -215,70 +327,195 @@ class BaseCache(ABC):
         """
         if all_items is None:
             section = plex.library.section(library_title)
-            all_items = section.all()
+            all_items = read_library_snapshot(plex, section)
         current_count = len(all_items)
+        cached = self.cache[self.media_key]
+
+        # Added or removed items: the listing's keys against those of the
+        # last update. A cache saved before the digest was kept falls back
+        # to comparing the keys themselves.
+        keys_digest = library_keys_digest(item.ratingKey for item in all_items)
+        stored_digest = self.cache.get("library_keys_digest")
+        if stored_digest is not None:
+            keys_changed = keys_digest != stored_digest
+        else:
+            keys_changed = {str(item.ratingKey) for item in all_items} != set(cached)
+        changed_items, stamped = self._changed_items(all_items)
 
-        if current_count == self.cache["library_count"]:
+        if not keys_changed and not changed_items:
             print(f"{GREEN}{self.media_key.title()} cache is up to date{RESET}")
+            contents_changed = False
             # Still check for missing collection data (backfill for existing caches)
             if self.media_type == "movie" and tmdb_api_key:
-                if self._backfill_collection_data(tmdb_api_key):
-                    self._save_cache()
+                contents_changed = self._backfill_collection_data(tmdb_api_key)
+            if contents_changed:
+                self._mark_contents_changed()
+            if contents_changed or stamped or stored_digest != keys_digest:
+                self.cache["library_keys_digest"] = keys_digest
+                self._save_cache()
             return False
 
         print(f"\n{YELLOW}Analyzing library {self.media_key}...{RESET}")
 
-        # Remove items no longer in library
-        current_ids = set(str(item.ratingKey) for item in all_items)
-        removed = set(self.cache[self.media_key].keys()) - current_ids
+        # Kept in step item by item below rather than rebuilt afterwards.
+        index = self.library_index()
+
+        removed: Set[str] = set()
+        new_items: List[Any] = []
+        if keys_changed:
+            # Remove items no longer in library
+            current_ids = set(str(item.ratingKey) for item in all_items)
+            removed = set(cached.keys()) - current_ids
 
-        if removed:
-            print(f"{YELLOW}Removing {len(removed)} {self.media_key} from cache that are no longer in library{RESET}")
-            for item_id in removed:
-                del self.cache[self.media_key][item_id]
+            if removed:
+                print(
+                    f"{YELLOW}Removing {len(removed)} {self.media_key} from cache that are no longer in library{RESET}"
+                )
+                for item_id in removed:
+                    index.remove_item(item_id, cached.pop(item_id))
 
-        # Find new items to process
-        existing_ids = set(self.cache[self.media_key].keys())
-        new_items = [item for item in all_items if str(item.ratingKey) not in existing_ids]
+            # Find new items to process
+            existing_ids = set(cached.keys())
+            new_items = [item for item in all_items if str(item.ratingKey) not in existing_ids]
 
         if new_items:
             print(f"Found {len(new_items)} new {self.media_key} to analyze")
+        if changed_items:
+            print(f"Found {len(changed_items)} {self.media_key} updated in Plex to check")
+
+        to_process = new_items + changed_items
+        contents_changed = bool(removed)
+        if to_process:
+            # Snapshot records (read_library_snapshot) carry too little to
+            # process - load those items in full, in batches, up front.
+            full_items = fetch_plex_items(
+                plex, (item.ratingKey for item in to_process if isinstance(item, LibraryItem))
+            )
 
-            for i, item in enumerate(new_items, 1):
-                pct_done = int((i / len(new_items)) * 100)
-                msg = f"\r{CYAN}Processing {self.media_type} {i}/{len(new_items)} ({pct_done}%){RESET}"
+            # Items are reloaded and looked up on TMDB concurrently (TMDB's
+            # pace is kept by the shared rate limiter), but added here in
+            # library order so the cache reads the same however they finish.
+            # A changed item's entry is handed back as is when its metadata
+            # didn't change, and then only re-stamped.
+            previous = {str(item.ratingKey): cached[str(item.ratingKey)] for item in changed_items}
+            results = fetch_concurrently(
+                lambda item: self._fetch_item_info(item, tmdb_api_key, full_items, previous.get(str(item.ratingKey))),
+                to_process,
+                ordered=True,
+            )
+            for i, (item, item_info) in enumerate(results, 1):
+                pct_done = int((i / len(to_process)) * 100)
+                msg = f"\r{CYAN}Processing {self.media_type} {i}/{len(to_process)} ({pct_done}%){RESET}"
                 sys.stdout.write(msg)
                 sys.stdout.flush()
 
-                item_id = str(item.ratingKey)
-                try:
-                    item.reload()
-
-                    # Rate limiting for TMDB
-                    if i > 1 and tmdb_api_key:
-                        time.sleep(TMDB_RATE_LIMIT_DELAY)
-
-                    # Process the item (media-specific logic)
-                    item_info = self._process_item(item, tmdb_api_key)
-
-                    if item_info:
-                        self.cache[self.media_key][item_id] = item_info
-
-                except (plexapi.exceptions.PlexApiException, requests.RequestException, AttributeError, KeyError) as e:
-                    log_warning(f"Error processing {self.media_type} {item.title}: {e}")
-                    continue
+                # A changed item that can't be processed keeps its old
+                # entry (and stamp), so it is retried next time.
+                if item_info:
+                    item_id = str(item.ratingKey)
+                    updated_at = updated_at_epoch(item)
+                    if updated_at:
+                        item_info[PLEX_UPDATED_AT_FIELD] = updated_at
+                    if item_info is previous.get(item_id):
+                        continue
+                    contents_changed = True
+                    # A rewrite keeps the entry's place in the cache (and
+                    # so in the index - media cache order breaks ties).
+                    if item_id in cached:
+                        index.replace_item(item_id, cached[item_id], item_info, cached)
+                        cached[item_id] = item_info
+                    else:
+                        cached[item_id] = item_info
+                        index.add_item(item_id, item_info)
 
         self.cache["library_count"] = current_count
+        self.cache["library_keys_digest"] = keys_digest
         self.cache["last_updated"] = datetime.now().isoformat()
 
         # Backfill collection data for movies missing it
         if self.media_type == "movie" and tmdb_api_key:
             self._backfill_collection_data(tmdb_api_key)
 
+        if contents_changed:
+            self._mark_contents_changed()
         self._save_cache()
+        if contents_changed and self._index is not None:
+            self._index.version = library_content_version(self.cache, self.media_key)
+            save_library_index(self.index_path, self._index.version, self._index.to_dict())
         print(f"\n{GREEN}{self.media_key.title()} cache updated{RESET}")
         return True
 
+    def _changed_items(self, all_items: List) -> Tuple[List, bool]:
+        """
+        The listed items already cached whose Plex updatedAt is newer
+        than the one their cache entry was built from - new labels,
+        collections, ratings or a re-match all bump it, so these are only
+        candidates: _fetch_item_info re-analyzes the ones whose metadata
+        actually changed.
+
+        An entry without a stamp (cached before stamps were kept) is
+        stamped with the item's current updatedAt instead of being
+        re-analyzed, so upgrading never re-reads the whole library.
+
+        Returns:
+            (changed items, whether any entry was newly stamped)
+        """
+        cached = self.cache[self.media_key]
+        changed = []
+        stamped = False
+        for item in all_items:
+            item_info = cached.get(str(item.ratingKey))
+            updated_at = updated_at_epoch(item)
+            if item_info is None or not updated_at:
+                continue
+            if PLEX_UPDATED_AT_FIELD not in item_info:
+                item_info[PLEX_UPDATED_AT_FIELD] = updated_at
+                stamped = True
+            elif updated_at > item_info[PLEX_UPDATED_AT_FIELD]:
+                changed.append(item)
+        return changed, stamped
+
+    def _fetch_item_info(
+        self,
+        item,
+        tmdb_api_key: Optional[str],
+        full_items: Optional[Mapping[int, Any]] = None,
+        previous: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        """
+        Reload one new or changed library item and build its cache entry.
+        Runs on a fetch_concurrently() worker, so it only reads shared state.
+
+        A snapshot record is processed as its already-loaded item from
+        `full_items` (see update_cache) instead. A changed item whose
+        metadata digest still matches its `previous` entry's gets that
+        entry back, without another TMDB lookup: what moved its updatedAt
+        is nothing the entry holds.
+
+        Returns:
+            The item's info dict, or None if it could not be processed
+        """
+        try:
+            if isinstance(item, LibraryItem):
+                full_item = (full_items or {}).get(item.ratingKey)
+                if full_item is None:
+                    log_warning(f"Error processing {self.media_type} {item.title}: could not load it from Plex")
+                    return None
+            else:
+                item.reload()
+                full_item = item
+            digest = plex_metadata_digest(full_item)
+            if digest is not None and previous is not None and previous.get(PLEX_DIGEST_FIELD) == digest:
+                return previous
+            # Process the item (media-specific logic)
+            item_info = self._process_item(full_item, tmdb_api_key)
+            if item_info and digest is not None:
+                item_info[PLEX_DIGEST_FIELD] = digest
+            return item_info
+        except (plexapi.exceptions.PlexApiException, requests.RequestException, AttributeError, KeyError) as e:
+            log_warning(f"Error processing {self.media_type} {item.title}: {e}")
+            return None
+
     def _backfill_collection_data(self, tmdb_api_key: str) -> bool:
         """
         Backfill collection data for cached movies that don't have it.
@@ -301,37 +538,37 @@ class BaseCache(ABC):
         total = len(movies_needing_collection)
         print(f"\n{CYAN}Backfilling collection data for {total} movies (one-time migration)...{RESET}")
 
+        def fetch_collection(info: Dict) -> Optional[Dict]:
+            try:
+                return fetch_title_record(tmdb_api_key, info["tmdb_id"], "movie")
+            except (requests.RequestException, KeyError) as e:
+                logger.debug(f"Error fetching collection for TMDB {info.get('tmdb_id')}: {e}")
+                return None
+
+        # Each movie's lookup is independent, so results are applied in
+        # whatever order they arrive.
         updated = 0
-        for i, (_item_id, info) in enumerate(movies_needing_collection, 1):
+        results = fetch_concurrently(fetch_collection, [info for _item_id, info in movies_needing_collection])
+        for i, (info, record) in enumerate(results, 1):
             pct = int((i / total) * 100)
             sys.stdout.write(f"\r{CYAN}Processing {i}/{total} ({pct}%) - Found {updated} collections{RESET}")
             sys.stdout.flush()
 
-            try:
-                time.sleep(TMDB_RATE_LIMIT_DELAY)
-                detail_data = fetch_tmdb_with_retry(
-                    f"https://api.themoviedb.org/3/movie/{info['tmdb_id']}", {"api_key": tmdb_api_key}
-                )
-                if detail_data:
-                    collection = detail_data.get("belongs_to_collection")
-                    if collection:
-                        info["collection_id"] = collection.get("id")
-                        info["collection_name"] = collection.get("name")
-                        updated += 1
-                    else:
-                        info["collection_id"] = None
-                        info["collection_name"] = None
-                else:
-                    # API failed (404, etc) - mark as processed to avoid infinite retries
-                    info["collection_id"] = None
-                    info["collection_name"] = None
-            except (requests.RequestException, KeyError) as e:
-                # Mark as processed even on exception
-                logger.debug(f"Error fetching collection for TMDB {info.get('tmdb_id')}: {e}")
+            if record and record["collection_id"]:
+                info["collection_id"] = record["collection_id"]
+                info["collection_name"] = record["collection_name"]
+                updated += 1
+            else:
+                # No collection, or the API failed (404, etc) - marked as
+                # processed either way to avoid infinite retries
                 info["collection_id"] = None
                 info["collection_name"] = None
 
         print(f"\n{GREEN}Added collection data for {updated} movies{RESET}")
+        # New collection members can't be slotted into the index's
+        # membership order item by item; the next library_index() call
+        # rebuilds it.
+        self._index = None
         return True
 
     @abstractmethod
@@ -415,36 +652,23 @@ class BaseCache(ABC):
         if not result["tmdb_id"] and tmdb_api_key:
             result["tmdb_id"] = get_tmdb_id_for_item(item, tmdb_api_key, self.media_type)
 
-        # Fetch TMDB metadata
+        # Fetch TMDB metadata - keywords, rating and the collection (movies)
+        # or production companies (TV) all come from one title record.
         if result["tmdb_id"] and tmdb_api_key:
-            # Get keywords
-            result["keywords"] = get_tmdb_keywords(tmdb_api_key, result["tmdb_id"], self.media_type)
-
-            # Get rating/vote_count for both media types (used by
-            # quality_filters); collection info is movie-only (sequel
-            # bonus), production companies are TV-only (franchise bonus).
-            if self.media_type == "movie":
-                detail_data = fetch_tmdb_with_retry(
-                    f"https://api.themoviedb.org/3/movie/{result['tmdb_id']}", {"api_key": tmdb_api_key}
-                )
-                if detail_data:
-                    result["rating"] = detail_data.get("vote_average")
-                    result["vote_count"] = detail_data.get("vote_count")
-                    # Extract collection info (for sequel bonus)
-                    collection = detail_data.get("belongs_to_collection")
-                    if collection:
-                        result["collection_id"] = collection.get("id")
-                        result["collection_name"] = collection.get("name")
-
-            elif self.media_type == "tv":
-                detail_data = fetch_tmdb_with_retry(
-                    f"https://api.themoviedb.org/3/tv/{result['tmdb_id']}", {"api_key": tmdb_api_key}
-                )
-                if detail_data:
-                    result["rating"] = detail_data.get("vote_average")
-                    result["vote_count"] = detail_data.get("vote_count")
-                    production_companies = detail_data.get("production_companies", [])
-                    result["production_company_ids"] = [pc["id"] for pc in production_companies]
+            record = fetch_title_record(tmdb_api_key, result["tmdb_id"], self.media_type)
+            if record:
+                result["keywords"] = [k.lower() for k in record["keywords"]]
+                # rating/vote_count for both media types (used by
+                # quality_filters); collection info is movie-only (sequel
+                # bonus), production companies are TV-only (franchise bonus).
+                result["rating"] = record["rating"]
+                result["vote_count"] = record["vote_count"]
+                if self.media_type == "movie":
+                    result["collection_id"] = record["collection_id"]
+                    result["collection_name"] = record["collection_name"]
+                else:
+                    result["production_company_ids"] = record["production_company_ids"]
+                result["imdb_id"] = result["imdb_id"] or record["imdb_id"]
 
         # Update recommender caches if available
         if self.recommender and result["tmdb_id"]:
@@ -554,6 +778,8 @@ class BaseRecommender(ABC):
         self.plex_tmdb_cache: Dict[str, Any] = {}
         self.tmdb_keywords_cache: Dict[str, Any] = {}
         self.label_dates: Dict[str, Any] = {}
+        # (counters dict, its CompiledProfile) - see _compiled_scoring_profile().
+        self._compiled_profile_cache: Optional[Tuple[Optional[Dict], CompiledProfile]] = None
         # Rating keys THIS user has played, read through their own Plex
         # connection (utils/plex.fetch_user_played_ids). Populated lazily
         # by _load_user_played_ids() because it needs the library section
@@ -810,6 +1036,128 @@ class BaseRecommender(ABC):
         sanitized = re.sub(r"\W+", "", user_ctx)
         return f"{self._cache_library_prefix()}{sanitized}"
 
+    def _watch_ledger_path(self) -> str:
+        """Per-user, per-library watch ledger (utils/watch_ledger.py)."""
+        return os.path.join(self.cache_dir, f"watch_ledger_{self.media_key}_{self._get_user_context()}.json")
+
+    def _load_watch_ledger(self) -> WatchLedger:
+        """The stored watch ledger, or an empty one that triggers a full history read."""
+        ledger = WatchLedger.from_dict(load_watch_ledger(self._watch_ledger_path()), self.media_type)
+        return ledger if ledger is not None else WatchLedger(self.media_type)
+
+    def _apply_watch_ledger(self, ledger: WatchLedger, contributions: Dict[int, Tuple[float, float]]) -> Dict:
+        """
+        Bring the ledger's counters in line with `contributions` (rating
+        key -> (weight, cap_penalty) for every watched item in the media
+        cache) and save it. Returns the counters - a copy, so Trakt
+        history and ignored-recommendation penalties folded into them
+        later never reach the ledger.
+        """
+        media_cache = self._get_media_cache()
+        items = media_cache.cache[self.media_key]
+        library_version = library_content_version(media_cache.cache, self.media_key)
+        counters, updates = ledger.plan(contributions, library_version)
+        for rating_key, weight, cap_penalty in updates:
+            info = items.get(rating_key)
+            if info:
+                process_counters_from_cache(
+                    info, counters, media_type=self.media_type, weight=weight, cap_penalty=cap_penalty
+                )
+                if tmdb_id := info.get("tmdb_id"):
+                    counters["tmdb_ids"].add(tmdb_id)
+        logger.debug(f"Watch ledger: applied {len(updates)} of {len(contributions)} {self.media_key} weight updates")
+        ledger.commit(counters, contributions, library_version)
+        save_watch_ledger(self._watch_ledger_path(), ledger.to_dict())
+        return counters
+
+    def _score_store_path(self) -> str:
+        """
+        Per-user, per-library score store (utils/cache.py's load_score_store_record).
+
+        Scores used to be written into the shared library cache's own
+        item dicts, keyed by profile_hash alone. With several users each
+        run overwrote the last user's hashes - so the score cache almost
+        never hit in a multi-user run - and rewrote the whole multi-MB
+        library cache once per user. A sidecar per user context keeps
+        every user's scores valid across the others' runs and leaves the
+        library cache untouched by scoring.
+        """
+        return os.path.join(self.cache_dir, f"scores_{self.media_key}_{self._get_user_context()}.json")
+
+    # watched_data counters (beyond the scoring profile) that
+    # _apply_similarity_bonus() reads - e.g. ("collections",) - and that
+    # delta rescoring therefore has to diff too. See _similarity_bonus_terms().
+    similarity_bonus_counters: Tuple[str, ...] = ()
+
+    def _score_profile_state(self) -> Tuple[Dict[str, Dict[str, float]], str]:
+        """
+        This run's (profile snapshot, profile signature) for the score
+        store - see utils/delta_scoring.py.
+        """
+        watched_data = getattr(self, "watched_data", self.watched_data_counters) or {}
+        compiled = self._compiled_scoring_profile(watched_data)
+        snapshot = profile_snapshot(
+            build_profile_from_counters(watched_data),
+            {counter: watched_data.get(counter, {}) for counter in self.similarity_bonus_counters},
+        )
+        signature = profile_signature(compiled, self.weights, self.media_type, self._scoring_options())
+        return snapshot, signature
+
+    def _reusable_scores(
+        self, score_store: Dict, items: List[Dict], snapshot: Dict[str, Dict[str, float]], signature: str
+    ) -> Dict[str, float]:
+        """
+        The stored scores (ratingKey -> score) that still hold this run.
+
+        All of them when the store was saved for this exact profile. When
+        the profile has changed since, only the candidates carrying none of
+        the changed terms keep theirs (utils/delta_scoring.py) - a new
+        watch or two typically touches a small slice of the library. When
+        a global normalizer (max count, TF-IDF threshold, effective
+        weight, scoring option) moved, or when the store predates delta
+        rescoring: then everything is rescored, as before.
+
+        Either way, a score computed from a cache entry update_cache has
+        rewritten since (see cache_entry_version) no longer holds.
+        """
+        scores = score_store.get("scores", {})
+        if not scores or score_store.get("signature") != signature:
+            return {}
+        versions = score_store.get("entry_versions") or {}
+        current = {}
+        for item_info in items:
+            rating_key = str(item_info["plex_rating_key"])
+            if rating_key in scores and versions.get(rating_key) == cache_entry_version(item_info):
+                current[rating_key] = scores[rating_key]
+        scores = current
+        if score_store.get("profile_hash") == self.profile_hash:
+            return scores
+        previous = score_store.get("profile")
+        if not isinstance(previous, dict):
+            return {}
+
+        index = TermIndex()
+        for item_info in items:
+            content = self._scoring_content_info(item_info)
+            if content is None:
+                return {}
+            terms = content_terms(content, self.media_type)
+            terms.update(self._similarity_bonus_terms(item_info))
+            index.add(str(item_info["plex_rating_key"]), terms)
+        changed = changed_terms(previous, snapshot)
+        affected = index.affected_items(changed, fuzzy_keywords=self.use_tmdb_keywords)
+
+        reusable = {}
+        for item_info in items:
+            rating_key = str(item_info["plex_rating_key"])
+            if rating_key in scores and rating_key not in affected:
+                reusable[rating_key] = scores[rating_key]
+        logger.debug(
+            f"Profile changed in {sum(len(terms) for terms in changed.values())} terms: "
+            f"rescoring {len(items) - len(reusable)} of {len(items)} {self.media_key}"
+        )
+        return reusable
+
     def _refresh_watched_data(self):
         """Force refresh of watched data from Plex."""
         # {} (not None) - every consumer below only ever checks this
@@ -1048,6 +1396,9 @@ class BaseRecommender(ABC):
 
         # Filter out watched items and excluded genres
         unwatched_items = []
+        # Everything filtered out, for the library health report's
+        # supply measurement (see _report_library_health).
+        withheld_items = []
         excluded_count = 0
         quality_filtered_count = 0
 
@@ -1063,10 +1414,12 @@ class BaseRecommender(ABC):
 
         for item_id, item_info in all_items.items():
             if int(str(item_id)) in self.watched_ids:
+                withheld_items.append(item_info)
                 continue
 
             if any(g.lower() in excluded_genres for g in item_info.get("genres", [])):
                 excluded_count += 1
+                withheld_items.append(item_info)
                 continue
 
             rating = item_info.get("rating") or 0.0
@@ -1074,6 +1427,7 @@ class BaseRecommender(ABC):
 
             if rating < min_rating or vote_count < min_vote_count:
                 quality_filtered_count += 1
+                withheld_items.append(item_info)
                 continue
 
             # Store ratingKey in item for later matching
@@ -1091,15 +1445,16 @@ class BaseRecommender(ABC):
         # Corpus IDF over the whole library, built once per run (see
         # utils/corpus_idf.py). Scoring falls back to its previous
         # behavior wherever these come back empty.
-        self.genre_idf = build_corpus_idf(all_items.values(), "genres")
-        self.keyword_idf = build_corpus_idf(all_items.values(), "tmdb_keywords")
+        library_index = self._library_index()
+        self.genre_idf = library_index.corpus_idf("genres")
+        self.keyword_idf = library_index.corpus_idf("tmdb_keywords")
         if self.keyword_idf and logger.isEnabledFor(logging.DEBUG):
             discounted = describe_least_informative(self.keyword_idf)
             summary = ", ".join(f"{t} ({w:.2f})" for t, w in discounted)
             logger.debug(f"Least informative keywords (discounted by corpus IDF): {summary}")
 
         self._load_user_played_ids()
-        self._report_library_health(unwatched_items)
+        self._report_library_health(unwatched_items, withheld_items)
 
         if not unwatched_items:
             log_warning(f"No unwatched {self.media_key} found matching your criteria.")
@@ -1107,24 +1462,54 @@ class BaseRecommender(ABC):
         else:
             print(f"Calculating similarity scores for {len(unwatched_items)} {self.media_key}...")
 
+            # Recompiled at the start of every scoring pass: the counters
+            # may have been adjusted in place since any earlier compile
+            # (ignored-recommendation penalties, Trakt merge).
+            self._compiled_profile_cache = None
+
+            # Scores live in a per-user sidecar store keyed by
+            # (ratingKey, profile_hash, SCORER_VERSION), not in the shared
+            # library cache - see _score_store_path(). A store saved for
+            # an earlier profile keeps every score the change can't have
+            # touched (see _reusable_scores).
+            score_store_path = self._score_store_path()
+            score_store = load_score_store_record(score_store_path)
+            snapshot, signature = self._score_profile_state()
+            stored_scores = self._reusable_scores(score_store, unwatched_items, snapshot, signature)
+            store_is_current = (
+                score_store.get("profile_hash") == self.profile_hash and score_store.get("signature") == signature
+            )
+
+            # Misses are scored in one vectorized pass when there are
+            # enough of them (see _batch_similarity_scores); anything it
+            # doesn't cover falls through to per-item scoring below.
+            batch_scores = self._batch_similarity_scores(
+                [item_info for item_info in unwatched_items if str(item_info["plex_rating_key"]) not in stored_scores]
+            )
+
             scored_items = []
             cache_hits = 0
             scores_updated = False
             for i, item_info in enumerate(unwatched_items, 1):
                 show_progress("Processing", i, len(unwatched_items))
                 try:
-                    cached_hash = item_info.get("profile_hash")
-                    cached_score = item_info.get("cached_score")
+                    rating_key = str(item_info["plex_rating_key"])
+                    stored_score = stored_scores.get(rating_key)
 
-                    if cached_hash == self.profile_hash and cached_score is not None:
-                        similarity_score = cached_score
-                        breakdown = item_info.get("score_breakdown", {})
+                    if stored_score is not None:
+                        similarity_score = stored_score
                         cache_hits += 1
+                    elif id(item_info) in batch_scores:
+                        # No breakdown from the batch path;
+                        # _fill_missing_breakdowns() computes one for the
+                        # few items that end up displayed.
+                        similarity_score = batch_scores[id(item_info)]
+                        stored_scores[rating_key] = similarity_score
+                        scores_updated = True
                     else:
                         similarity_score, breakdown = self._calculate_similarity_from_cache(item_info)
-                        item_info["cached_score"] = similarity_score
-                        item_info["profile_hash"] = self.profile_hash
                         item_info["score_breakdown"] = breakdown
+                        stored_scores[rating_key] = similarity_score
                         scores_updated = True
 
                     item_info["similarity_score"] = similarity_score
@@ -1133,29 +1518,22 @@ class BaseRecommender(ABC):
                     log_warning(f"Error processing {item_info['title']}: {e}")
                     continue
 
-            if scores_updated:
-                media_cache._save_cache()
-                logger.debug(f"Saved {len(unwatched_items) - cache_hits} new scores to cache")
+            if scores_updated or not store_is_current:
+                entry_versions = {
+                    str(item_info["plex_rating_key"]): cache_entry_version(item_info) for item_info in unwatched_items
+                }
+                save_score_store(
+                    score_store_path,
+                    self.profile_hash,
+                    stored_scores,
+                    profile=snapshot,
+                    signature=signature,
+                    entry_versions={key: entry_versions.get(key) for key in stored_scores},
+                )
+                logger.debug(f"Saved {len(unwatched_items) - cache_hits} new scores to {score_store_path}")
             if cache_hits > 0:
                 logger.debug(f"Used {cache_hits} cached scores")
 
-            # #291 tiebreaker: with no watch history (or any tie in
-            # general), every candidate can score identically (observed:
-            # every component of calculate_similarity_score returns 0.0
-            # against an empty profile) - Python's sort is stable, so an
-            # unbroken tie previously fell through to media-cache
-            # insertion order, which is alphabetical by title. Breaking
-            # ties by (rating, vote_count) instead means a cold-start (or
-            # any tied) collection surfaces well-regarded, well-known
-            # unwatched titles first rather than an arbitrary alphabetical
-            # slice - the standard cold-start fallback (recommend
-            # popular/well-rated items), not produce noise. Applies to
-            # every tie, not just all-zero-score cold start.
-            scored_items.sort(
-                key=lambda x: (x["similarity_score"], x.get("rating") or 0.0, x.get("vote_count") or 0),
-                reverse=True,
-            )
-
             # Quality gate. Applied here as well as in _update_labels_by_rank
             # so the printed recommendation list never advertises items the
             # collection would refuse - previously this list ran all the way
@@ -1170,6 +1548,20 @@ class BaseRecommender(ABC):
                     )
                 scored_items = above_floor
 
+            # #291 tiebreaker: with no watch history (or any tie in
+            # general), every candidate can score identically (observed:
+            # every component of calculate_similarity_score returns 0.0
+            # against an empty profile) - Python's sort is stable, so an
+            # unbroken tie previously fell through to media-cache
+            # insertion order, which is alphabetical by title. Breaking
+            # ties by (rating, vote_count) instead means a cold-start (or
+            # any tied) collection surfaces well-regarded, well-known
+            # unwatched titles first rather than an arbitrary alphabetical
+            # slice - the standard cold-start fallback (recommend
+            # popular/well-rated items), not produce noise. Applies to
+            # every tie, not just all-zero-score cold start. See
+            # recommendation_rank_key().
+            #
             # Franchise ordering, deliberately AFTER the score floor and
             # the quality filters above: a promoted first entry inherits
             # the slot (and the score) its own sequel earned, so those
@@ -1178,9 +1570,11 @@ class BaseRecommender(ABC):
             # slot per franchise means duplicates collapse, and doing it
             # here lets the freed slots refill from the tail instead of
             # shrinking the collection.
-            scored_items = self._apply_franchise_ordering(scored_items, excluded_genres)
-
             if self.randomize_recommendations:
+                # Tiered selection samples from percentile pools of the
+                # whole ranked list, so only it needs every item ranked.
+                scored_items.sort(key=recommendation_rank_key, reverse=True)
+                scored_items = self._apply_franchise_ordering(scored_items, excluded_genres)
                 plex_recs = select_tiered_recommendations(
                     scored_items,
                     self.limit_plex_results,
@@ -1189,13 +1583,14 @@ class BaseRecommender(ABC):
                     TIER_WILDCARD_PERCENT,
                 )
             else:
-                plex_recs = scored_items[: self.limit_plex_results]
+                plex_recs = self._top_recommendations(scored_items, excluded_genres)
 
             # Reported on the truncated buffer, not the whole pool: this
             # is about the titles actually being recommended.
             self._report_franchise_gaps(plex_recs, all_items)
 
             if logger.isEnabledFor(logging.DEBUG):
+                self._fill_missing_breakdowns(plex_recs, all_items)
                 logger.debug("=== Similarity Score Breakdowns for Recommendations ===")
                 for item in plex_recs:
                     self._print_similarity_breakdown(item, item["similarity_score"], item["score_breakdown"])
@@ -1254,6 +1649,32 @@ class BaseRecommender(ABC):
             "media_type": self.media_type,
         }
 
+    def _top_recommendations(self, scored_items: List[Dict], excluded_genres: Iterable[str]) -> List[Dict]:
+        """
+        The first limit_plex_results ranked, franchise-ordered candidates,
+        without ranking the rest.
+
+        Franchise ordering reads its input in rank order and never drops
+        an item outside a collection, so ordering a ranked prefix yields
+        the same leading recommendations as ordering the whole list -
+        provided the prefix holds limit_plex_results such items, or is the
+        whole list. The prefix is grown until it does.
+        """
+        limit = max(0, self.limit_plex_results)
+        ranked = iter_ranked_recommendations(scored_items)
+        prefix: List[Dict] = []
+        kept = 0
+        may_drop = self._franchise_ordering_enabled()
+        while kept < limit:
+            more = list(islice(ranked, limit - kept))
+            if not more:
+                break
+            prefix.extend(more)
+            kept += sum(
+                1 for item in more if not may_drop or normalize_collection_id(item.get("collection_id")) is None
+            )
+        return self._apply_franchise_ordering(prefix, excluded_genres)[:limit]
+
     def _apply_franchise_ordering(self, scored_items: List[Dict], excluded_genres: Iterable[str]) -> List[Dict]:
         """
         Point franchise recommendations at the entry to watch next.
@@ -1267,7 +1688,7 @@ class BaseRecommender(ABC):
 
         try:
             all_items = self._get_media_cache().cache.get(self.media_key, {})
-            franchise_index = build_franchise_index(all_items)
+            franchise_index = self._library_index().franchise_index(all_items)
             if not franchise_index:
                 return scored_items
 
@@ -1329,7 +1750,7 @@ class BaseRecommender(ABC):
             if not collection_details:
                 return
 
-            library_tmdb_ids = collect_library_tmdb_ids(all_items)
+            library_tmdb_ids = self._library_index(all_items).library_tmdb_ids()
             gapped: Dict[Any, Tuple[Dict, Dict, List[Dict]]] = {}
 
             for rec in recommendations:
@@ -1402,7 +1823,7 @@ class BaseRecommender(ABC):
 
         try:
             media_items = self._get_media_cache().cache.get(self.media_key, {})
-            franchise_index = build_franchise_index(media_items)
+            franchise_index = self._library_index().franchise_index(media_items)
             if not franchise_index:
                 return all_candidates
 
@@ -1489,32 +1910,43 @@ class BaseRecommender(ABC):
                 print(f"  ... and {len(dropped) - FRANCHISE_GAP_REPORT_LIMIT} more")
 
     def _find_plex_items_for_recs(self, section, selected_items: List[Dict]) -> Tuple[List, List[str]]:
-        """Find Plex items matching recommendations."""
+        """
+        Find Plex items matching recommendations.
+
+        Recommendations carrying a plex_rating_key are loaded in batches
+        (fetch_plex_items); title/year search is only the fallback for the
+        ones without one or whose key has gone stale.
+        """
         items_found = []
         skipped = []
         total = len(selected_items)
         print(f"Finding {total} recommendations in Plex library...")
 
+        by_rating_key = fetch_plex_items(
+            self.plex, (rec["plex_rating_key"] for rec in selected_items if rec.get("plex_rating_key"))
+        )
+
         for i, rec in enumerate(selected_items, 1):
             if i % 20 == 0 or i == total:
                 print(f"\r  Locating items: {i}/{total}...", end="", flush=True)
 
             plex_item = None
 
-            # Try direct fetch by ratingKey first (reliable)
+            # Direct fetch by ratingKey first (reliable), already loaded in full
             rating_key = rec.get("plex_rating_key")
             if rating_key:
                 try:
-                    plex_item = self.plex.fetchItem(int(rating_key))
-                except Exception:
+                    plex_item = by_rating_key.get(int(rating_key))
+                except (TypeError, ValueError):
                     pass  # Fall back to search
 
-            # Fallback to fuzzy search
+            # Fallback to fuzzy search - a partial search result
             if not plex_item:
                 plex_item = self._find_plex_item(section, rec)
+                if plex_item:
+                    plex_item.reload()
 
             if plex_item:
-                plex_item.reload()
                 items_found.append(plex_item)
             else:
                 skipped.append(f"{rec['title']} ({rec.get('year', 'N/A')})")
@@ -1526,6 +1958,9 @@ class BaseRecommender(ABC):
         """Remove labels from watched/stale/excluded items, return fresh items."""
         currently_labeled = section.search(label=label_name)
         print(f"Found {len(currently_labeled)} currently labeled {self.media_key}")
+        # Search results are partial; load them all in full in a few batched
+        # requests rather than one reload() each inside categorize_labeled_items().
+        currently_labeled = load_full_plex_items(self.plex, currently_labeled)
 
         excluded_genres = get_excluded_genres_for_user(self.exclude_genres, self.user_preferences, self.single_user)
         # Union so categorize_labeled_items() no longer has to read
@@ -1534,15 +1969,23 @@ class BaseRecommender(ABC):
         # users' still-unwatched recommendations as "watched".
         watched_for_categorize = self.watched_ids | self.user_played_ids
         categories = categorize_labeled_items(
-            currently_labeled, watched_for_categorize, excluded_genres, label_name, self.label_dates, stale_days
+            currently_labeled,
+            watched_for_categorize,
+            excluded_genres,
+            label_name,
+            self.label_dates,
+            stale_days,
+            reload_items=False,
         )
 
         print(f"{GREEN}Keeping {len(categories['fresh'])} unwatched recommendations{RESET}")
         print(f"{YELLOW}Removing {len(categories['watched'])} watched {self.media_key} from recommendations{RESET}")
         print(f"{YELLOW}Removing {len(categories['excluded'])} {self.media_key} with excluded genres{RESET}")
 
-        remove_labels_from_items(categories["watched"], label_name, self.label_dates, "watched")
-        remove_labels_from_items(categories["excluded"], label_name, self.label_dates, "excluded genre")
+        remove_labels_from_items(categories["watched"], label_name, self.label_dates, "watched", section=section)
+        remove_labels_from_items(
+            categories["excluded"], label_name, self.label_dates, "excluded genre", section=section
+        )
 
         return categories["fresh"]
 
@@ -1744,10 +2187,14 @@ class BaseRecommender(ABC):
         except (AttributeError, KeyError, TypeError, ValueError) as e:
             logger.debug(f"Ignored-recommendation feedback skipped: {e}")
 
-    def _report_library_health(self, unwatched_items: List[Dict]) -> None:
+    def _report_library_health(self, unwatched_items: List[Dict], withheld_items: Optional[List[Dict]] = None) -> None:
         """
         Measure and report candidate supply (utils/library_health.py).
 
+        The unwatched pool's genre supply is measured from whichever side
+        is smaller: the pool itself, or the library index's genre mass
+        minus `withheld_items` (the rest of the media cache).
+
         Also stashes the resulting supply gaps on the instance so the
         external/Radarr discovery path can aim acquisition at the genres
         this profile wants and the library cannot serve, instead of at
@@ -1769,10 +2216,19 @@ class BaseRecommender(ABC):
                 return
 
             health = assess_pool_health(len(unwatched_items), self.limit_results)
-            self.supply_gaps = find_supply_gaps(
-                target_distribution,
-                [[g.lower() for g in (i.get("genres") or [])] for i in unwatched_items],
-            )
+            library_index = self._library_index() if withheld_items is not None else None
+            if (
+                library_index is not None
+                and withheld_items is not None
+                and len(withheld_items) < len(unwatched_items)
+                and library_index.total == len(withheld_items) + len(unwatched_items)
+            ):
+                self.supply_gaps = find_supply_gaps_in(target_distribution, library_index.genre_supply(withheld_items))
+            else:
+                self.supply_gaps = find_supply_gaps(
+                    target_distribution,
+                    [[g.lower() for g in (i.get("genres") or [])] for i in unwatched_items],
+                )
 
             for line in format_health_report(health, self.supply_gaps, self.media_key):
                 if health.depleted:
@@ -1905,9 +2361,14 @@ class BaseRecommender(ABC):
         return selected
 
     def _update_labels_by_rank(
-        self, all_candidates: Dict, unwatched_labeled: List, label_name: str, target_count: int
+        self, all_candidates: Dict, unwatched_labeled: List, label_name: str, target_count: int, section=None
     ) -> List:
-        """Update labels to keep only top-scoring items, return final collection."""
+        """
+        Update labels to keep only top-scoring items, return final collection.
+
+        Given the library section, the label changes go out as multi-id
+        edits (see utils/labels.py's bulk_edit_labels).
+        """
         # #291 tiebreaker - same rationale as get_recommendations()'s own
         # scored_items.sort(): all_candidates values are (plex_item, score)
         # tuples, and plex_item itself carries no TMDB rating/vote_count,
@@ -1956,12 +2417,14 @@ class BaseRecommender(ABC):
         if ids_to_remove:
             items_to_remove = [m for m in unwatched_labeled if int(m.ratingKey) in ids_to_remove]
             print(f"{YELLOW}Removing {len(items_to_remove)} lower-scoring items to make room for better ones{RESET}")
-            remove_labels_from_items(items_to_remove, label_name, self.label_dates, "replaced by higher score")
+            remove_labels_from_items(
+                items_to_remove, label_name, self.label_dates, "replaced by higher score", section=section
+            )
 
         items_to_add = [all_candidates[item_id][0] for item_id in ids_to_add if item_id in all_candidates]
         if items_to_add:
             print(f"{GREEN}Adding {len(items_to_add)} new high-scoring recommendations{RESET}")
-            add_labels_to_items(items_to_add, label_name, self.label_dates)
+            add_labels_to_items(items_to_add, label_name, self.label_dates, section=section)
 
         print(f"{GREEN}Collection now has top {len(top_candidates)} recommendations by score{RESET}")
 
@@ -2184,7 +2647,9 @@ class BaseRecommender(ABC):
             all_candidates = self._suppress_superseded_franchise_candidates(all_candidates)
 
             # Update labels to keep top items
-            final_items = self._update_labels_by_rank(all_candidates, unwatched_labeled, label_name, target_count)
+            final_items = self._update_labels_by_rank(
+                all_candidates, unwatched_labeled, label_name, target_count, section=section
+            )
 
             self._save_watched_cache()
 
@@ -2384,6 +2849,22 @@ class BaseRecommender(ABC):
         """Return the media cache instance (movie_cache or show_cache)."""
         pass
 
+    def _library_index(self, items: Optional[Mapping[str, Mapping]] = None) -> LibraryIndex:
+        """
+        The media cache's library-wide derived indexes (corpus IDF,
+        franchise membership, genre mass, owned TMDB IDs).
+
+        `items` other than the media cache's own, or a cache that doesn't
+        keep a persistent index, get a transient one built on the spot.
+        """
+        media_cache = self._get_media_cache()
+        cached_items = media_cache.cache.get(self.media_key, {})
+        if items is not None and items is not cached_items:
+            return LibraryIndex.build(items)
+        if isinstance(media_cache, BaseCache):
+            return media_cache.library_index()
+        return LibraryIndex.build(cached_items)
+
     # ------------------------------------------------------------------------
     # TMDB HELPER METHODS (shared by movie and TV recommenders)
     # ------------------------------------------------------------------------
@@ -2428,17 +2909,8 @@ class BaseRecommender(ABC):
         # Fallback to TMDB to get IMDb ID
         tmdb_id = self._get_plex_item_tmdb_id(plex_item)
         if tmdb_id:
-            if self.media_type == "movie":
-                data = fetch_tmdb_with_retry(
-                    f"https://api.themoviedb.org/3/movie/{tmdb_id}", {"api_key": self.tmdb_api_key}
-                )
-                return data.get("imdb_id") if data else None
-            else:
-                # TV shows need the external_ids endpoint
-                data = fetch_tmdb_with_retry(
-                    f"https://api.themoviedb.org/3/tv/{tmdb_id}/external_ids", {"api_key": self.tmdb_api_key}
-                )
-                return data.get("imdb_id") if data else None
+            record = fetch_title_record(self.tmdb_api_key, tmdb_id, self.media_type)
+            return record["imdb_id"] if record else None
         return None
 
     def _get_tmdb_id_via_imdb(self, plex_item) -> Optional[int]:
@@ -2497,10 +2969,14 @@ class BaseRecommender(ABC):
         already has its own try/except and log message) without poisoning
         the cache, so the next consumer simply retries instead of being
         stuck with a cached failure.
+
+        The items are a projected snapshot (utils/plex.py's
+        read_library_snapshot) - compact records of the attributes library
+        scans read, not full plexapi objects.
         """
         if self.library_title not in self._library_items_cache:
             section = self.plex.library.section(self.library_title)
-            self._library_items_cache[self.library_title] = section.all()
+            self._library_items_cache[self.library_title] = read_library_snapshot(self.plex, section)
         return self._library_items_cache[self.library_title]
 
     def _get_all_library_items_for_user(self, username: str) -> List:
@@ -2547,7 +3023,7 @@ class BaseRecommender(ABC):
             account = MyPlexAccount(token=self.config["plex"]["token"])
             user = account.user(username)
             user_plex = self.plex.switchUser(user)
-            items = user_plex.library.section(self.library_title).all()
+            items = read_library_snapshot(user_plex, user_plex.library.section(self.library_title))
         except (plexapi.exceptions.PlexApiException, KeyError, AttributeError) as e:
             log_warning(f"Could not fetch {username}'s own library snapshot, falling back to shared admin view: {e}")
             return self._get_all_library_items()
@@ -2555,6 +3031,33 @@ class BaseRecommender(ABC):
         self._library_items_cache[cache_key] = items
         return items
 
+    def _library_items_for_users(self, usernames: List[str]) -> Iterator[Tuple[str, List]]:
+        """(username, _get_all_library_items_for_user(username)) for every
+        user, in order - the snapshots fetched concurrently, up to
+        plex_max_workers() at once, since each is a MyPlexAccount +
+        switchUser + section.all() round trip sequence independent of the
+        others. A user whose snapshot (and its admin fallback) failed is
+        logged and left out."""
+
+        def fetch(username: str) -> Any:
+            try:
+                return self._get_all_library_items_for_user(username)
+            except Exception as e:
+                return e
+
+        results = fetch_concurrently(
+            fetch,
+            usernames,
+            max_workers=plex_max_workers(self.config),
+            ordered=True,
+            thread_name_prefix="plex-snapshot",
+        )
+        for username, items in results:
+            if isinstance(items, Exception):
+                logger.debug(f"Error fetching {username}'s own library snapshot: {items}")
+                continue
+            yield username, items
+
     def _get_library_imdb_ids(self) -> Set[str]:
         """Get set of all IMDb IDs in the library."""
         return get_library_imdb_ids_from_items(self._get_all_library_items())
@@ -2564,11 +3067,116 @@ class BaseRecommender(ABC):
         """Find a Plex item matching the recommendation."""
         pass
 
+    def _compiled_scoring_profile(self, watched_data_counters: Optional[Dict]) -> CompiledProfile:
+        """
+        The CompiledProfile for `watched_data_counters`, built once and
+        reused for every item scored against the same counters object.
+
+        Keyed on the counters dict's identity rather than its contents -
+        hashing the whole profile per item would cost most of what
+        compiling once saves. get_recommendations() clears the memo
+        before each scoring pass, so in-place edits made before scoring
+        are always picked up.
+        """
+        cached = getattr(self, "_compiled_profile_cache", None)
+        if cached is not None and cached[0] is watched_data_counters:
+            return cached[1]
+        # #317: single shared storage->profile translation (including the
+        # tmdb_keywords -> keywords rename) - see build_profile_from_counters.
+        compiled = compile_profile(build_profile_from_counters(watched_data_counters))
+        self._compiled_profile_cache = (watched_data_counters, compiled)
+        return compiled
+
     @abstractmethod
     def _calculate_similarity_from_cache(self, item_info: Dict) -> Tuple[float, Dict]:
         """Calculate similarity score for an item."""
         pass
 
+    def _scoring_content_info(self, item_info: Dict) -> Optional[Dict]:
+        """
+        The content_info dict calculate_similarity_score() scores `item_info` by.
+
+        None (the default) opts a recommender out of batch scoring;
+        movie.py and tv.py override it together with
+        _apply_similarity_bonus().
+        """
+        return None
+
+    def _apply_similarity_bonus(self, item_info: Dict, score: float, breakdown: Optional[Dict] = None) -> float:
+        """Media-specific bonus on top of calculate_similarity_score() - none by default."""
+        return score
+
+    def _similarity_bonus_terms(self, item_info: Dict) -> Dict[str, List[Any]]:
+        """
+        The item's keys into each similarity_bonus_counters counter, e.g.
+        {"collections": [collection_id]} - none by default.
+        """
+        return {}
+
+    def _scoring_options(self) -> ScoringOptions:
+        """The options _calculate_similarity_from_cache() scores with, as one ScoringOptions."""
+        return ScoringOptions(
+            normalize_counters=self.normalize_counters,
+            use_fuzzy_keywords=self.use_tmdb_keywords,
+            genre_idf=getattr(self, "genre_idf", None),
+            keyword_idf=getattr(self, "keyword_idf", None),
+        )
+
+    def _batch_similarity_scores(self, items: List[Dict]) -> Dict[int, float]:
+        """
+        Scores for `items` from utils/batch_scoring.py, keyed by id(item).
+
+        The scores _calculate_similarity_from_cache() would return, bonus
+        included, without the breakdowns. Empty - score them one at a
+        time - below BATCH_SCORING_MIN_CANDIDATES, without NumPy, for a
+        recommender that doesn't supply _scoring_content_info(), or if the
+        batch path fails for any reason.
+        """
+        if len(items) < BATCH_SCORING_MIN_CANDIDATES or not batch_scoring_available():
+            return {}
+        contents = []
+        for item in items:
+            content = self._scoring_content_info(item)
+            if content is None:
+                return {}
+            contents.append(content)
+        try:
+            corpus = BatchCorpus.from_content_infos(contents, self.media_type)
+            profile = self._compiled_scoring_profile(getattr(self, "watched_data", self.watched_data_counters))
+            scores = batch_similarity_scores(corpus, profile, self.weights, self._scoring_options())
+        except Exception as e:
+            logger.debug(f"Batch scoring failed, scoring item by item: {e}")
+            return {}
+        return {
+            id(item): self._apply_similarity_bonus(item, float(score))
+            for item, score in zip(items, scores, strict=True)
+        }
+
+    def _fill_missing_breakdowns(self, recs: List[Dict], all_items: Dict) -> None:
+        """
+        Compute score breakdowns for displayed recs that were batch scored.
+
+        A franchise-promoted rec shows its original's breakdown (see
+        utils/franchise.py's _promote), so that is the item rescored, with
+        the promotion's own annotation kept.
+        """
+        for rec in recs:
+            if "genre_score" in (rec.get("score_breakdown") or {}):
+                continue
+            source = rec
+            promoted_from = rec.get("franchise_promoted_from")
+            if promoted_from:
+                source = all_items.get(str(promoted_from.get("plex_rating_key"))) or rec
+            try:
+                _score, breakdown = self._calculate_similarity_from_cache(source)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Could not compute breakdown for {rec.get('title')}: {e}")
+                continue
+            annotation = ((rec.get("score_breakdown") or {}).get("details") or {}).get("franchise")
+            if promoted_from and annotation:
+                breakdown["details"]["franchise"] = annotation
+            rec["score_breakdown"] = breakdown
+
     def _print_similarity_breakdown(self, item_info: Dict, score: float, breakdown: Dict):
         """Print detailed breakdown of similarity score calculation.
 
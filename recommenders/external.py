@@ -84,7 +84,9 @@ from utils import (
     build_profile_from_counters,
     calculate_similarity_score,
     clickable_link,
+    compile_profile,
     enhance_profile_with_trakt,
+    fetch_concurrently,
     fetch_tmdb_details_for_profile,
     fetch_watch_history_with_tmdb,
     get_authenticated_trakt_client,
@@ -95,6 +97,7 @@ from utils import (
     get_tmdb_config,
     get_tmdb_id_from_imdb,
     get_trakt_discovery_candidates,
+    http_client,
     load_config,
     load_json_cache,
     log_error,
@@ -102,6 +105,7 @@ from utils import (
     log_warning,
     normalize_genre,
     normalize_user_profile,
+    owned_library_index,
     record_recommender_run,
     record_run_status,
     record_unhandled_error,
@@ -350,7 +354,7 @@ def discover_candidates_by_profile(
             }
             if language_filter:
                 params["with_original_language"] = language_filter
-            response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
+            response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
 
             if response.status_code == 200:
                 results = response.json().get("results", [])
@@ -391,7 +395,7 @@ def discover_candidates_by_profile(
             else:
                 # Search for keyword ID
                 url = "https://api.themoviedb.org/3/search/keyword"
-                response = requests.get(
+                response = http_client.get(
                     url, params={"api_key": tmdb_api_key, "query": keyword}, timeout=TMDB_REQUEST_TIMEOUT
                 )
 
@@ -416,7 +420,7 @@ def discover_candidates_by_profile(
                 }
                 if language_filter:
                     params["with_original_language"] = language_filter
-                response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
+                response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
 
                 if response.status_code == 200:
                     results = response.json().get("results", [])
@@ -527,7 +531,7 @@ def discover_popular_by_genre(
             }
             if language_filter:
                 params["with_original_language"] = language_filter
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -674,37 +678,15 @@ def _build_profile_via_recommender(username: str, media_type: str) -> Dict:
 
 
 def get_library_items(plex: Any, library_name: str, media_type: str = "movie") -> Dict[str, Set]:
-    """Get all items currently in Plex library - returns dict with tmdb_ids, tvdb_ids, and titles"""
+    """Get all items currently in Plex library - returns dict with tmdb_ids, tvdb_ids, and titles
+
+    Read from the section's owned-title index (utils/owned_index.py), which
+    asks Plex only for what changed since it was last refreshed."""
     try:
         library = plex.library.section(library_name)
-        items = library.all()
-
-        # Extract multiple identifiers for comparison
-        tmdb_ids = set()
-        tvdb_ids = set()
-        titles = set()  # (title_lower, year) tuples for fallback matching
-
-        for item in items:
-            # Add title for fallback matching
-            title_lower = item.title.lower().strip()
-            year = getattr(item, "year", None)
-            titles.add((title_lower, year))
-
-            for guid in item.guids:
-                if "tmdb://" in guid.id:
-                    try:
-                        tmdb_id = guid.id.split("tmdb://")[1]
-                        tmdb_ids.add(int(tmdb_id))
-                    except (ValueError, IndexError) as e:
-                        logger.debug(f"Error parsing TMDB ID from guid {guid.id}: {e}")
-                elif "tvdb://" in guid.id:
-                    try:
-                        tvdb_id = guid.id.split("tvdb://")[1]
-                        tvdb_ids.add(int(tvdb_id))
-                    except (ValueError, IndexError) as e:
-                        logger.debug(f"Error parsing TVDB ID from guid {guid.id}: {e}")
-
-        return {"tmdb_ids": tmdb_ids, "tvdb_ids": tvdb_ids, "titles": titles}
+        owned = owned_library_index(plex, library, os.path.join(get_project_root(), "cache"))
+        # titles are (title_lower, year) tuples for fallback matching
+        return {"tmdb_ids": owned.tmdb_ids(), "tvdb_ids": owned.tvdb_ids(), "titles": owned.titles()}
     except Exception as e:
         log_warning(f"Warning: Could not fetch {library_name} library: {e}")
         return {"tmdb_ids": set(), "tvdb_ids": set(), "titles": set()}
@@ -724,7 +706,7 @@ def get_movie_genre_ids(tmdb_api_key: str, tmdb_id: int) -> List[int]:
     try:
         url = f"https://api.themoviedb.org/3/movie/{tmdb_id}"
         params = {"api_key": tmdb_api_key}
-        response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
+        response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
         if response.status_code == 200:
             data = response.json()
             return [g["id"] for g in data.get("genres", [])]
@@ -766,7 +748,7 @@ def fetch_similar_from_tmdb(
     try:
         url = f"https://api.themoviedb.org/3/{media}/{tmdb_id}/similar"
         params: Dict[str, Any] = {"api_key": tmdb_api_key, "page": 1}
-        response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
+        response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             results = response.json().get("results", [])
@@ -877,6 +859,41 @@ def is_in_library(tmdb_id: Optional[int], title: Optional[str], year: Optional[s
     return False
 
 
+def _fetch_candidate_details(
+    tmdb_api_key: str,
+    candidate_id: int,
+    media_type: str,
+    exclude_genres: Optional[List[str]],
+    exclude_imdb_ids: Set[str],
+) -> Optional[Dict]:
+    """
+    Fetch one discovery candidate's TMDB details for scoring - run on a
+    fetch_concurrently() worker by find_similar_content_with_profile().
+
+    Returns:
+        The candidate's details, or None if unavailable, in an excluded
+        genre, or on the excluded (Trakt watchlist) IMDB ids
+    """
+    # Fetch full details from TMDB
+    details = fetch_tmdb_details_for_profile(tmdb_api_key, candidate_id, media_type)
+    if not details:
+        return None
+
+    # Check excluded genres
+    if exclude_genres:
+        content_genres = [g.lower() for g in details.get("genres", [])]
+        if any(eg.lower() in content_genres for eg in exclude_genres):
+            return None
+
+    # Check if on Trakt watchlist (exclude if IMDB ID matches)
+    if exclude_imdb_ids:
+        imdb_id = get_imdb_id(tmdb_api_key, candidate_id, media_type)
+        if imdb_id and imdb_id in exclude_imdb_ids:
+            return None
+
+    return details
+
+
 def find_similar_content_with_profile(
     tmdb_api_key: str,
     user_profile: Dict,
@@ -944,6 +961,10 @@ def find_similar_content_with_profile(
                 "language": config_weights.get("language", 0.05),
             }
 
+    # Compiled once for every candidate scored below, across all
+    # iterations - see utils.scoring.CompiledProfile.
+    compiled_profile = compile_profile(user_profile)
+
     # Check for thin profile - reduce iterations instead of skipping personalization entirely
     if is_thin_profile(user_profile):
         profile_size = sum(user_profile.get("genres", Counter()).values())
@@ -1023,29 +1044,22 @@ def find_similar_content_with_profile(
             total_to_score = len(candidate_list)
             print(f"  Scoring {total_to_score} new candidates...")
 
-            for i, candidate_id in enumerate(candidate_list, 1):
+            seen_ids.update(candidate_list)
+
+            # Candidates are fetched from TMDB concurrently, then scored
+            # here in candidate order.
+            results = fetch_concurrently(
+                lambda cid: _fetch_candidate_details(tmdb_api_key, cid, media_type, exclude_genres, exclude_imdb_ids),
+                candidate_list,
+                ordered=True,
+            )
+            for i, (candidate_id, details) in enumerate(results, 1):
                 if i % PROGRESS_UPDATE_FREQUENCY == 0 or i == total_to_score:
                     print(f"\r    Scored {i}/{total_to_score}...", end="", flush=True)
 
-                seen_ids.add(candidate_id)
-
-                # Fetch full details from TMDB
-                details = fetch_tmdb_details_for_profile(tmdb_api_key, candidate_id, media_type)
                 if not details:
                     continue
 
-                # Check excluded genres
-                if exclude_genres:
-                    content_genres = [g.lower() for g in details.get("genres", [])]
-                    if any(eg.lower() in content_genres for eg in exclude_genres):
-                        continue
-
-                # Check if on Trakt watchlist (exclude if IMDB ID matches)
-                if exclude_imdb_ids:
-                    imdb_id = get_imdb_id(tmdb_api_key, candidate_id, media_type)
-                    if imdb_id and imdb_id in exclude_imdb_ids:
-                        continue
-
                 # Calculate similarity score
                 content_info = {
                     "genres": details.get("genres", []),
@@ -1055,7 +1069,7 @@ def find_similar_content_with_profile(
                     "language": details.get("language", ""),
                     "keywords": details.get("keywords", []),
                 }
-                score, _ = calculate_similarity_score(content_info, user_profile, media_type, weights)
+                score, _ = calculate_similarity_score(content_info, compiled_profile, media_type, weights)
 
                 scored_item = {
                     "tmdb_id": candidate_id,
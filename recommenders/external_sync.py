@@ -25,8 +25,6 @@ import os
 import sys
 from typing import Any, Callable, Dict, List, Optional, Set
 
-import requests
-
 from utils import (
     CYAN,
     GREEN,
@@ -48,6 +46,7 @@ from utils import (
     create_sonarr_client,
     create_sonarr_client_from,
     derive_trakt_list_slug,
+    fetch_title_record,
     get_authenticated_trakt_client,
     get_effective_arr_config,
     get_libraries_for_media_type,
@@ -122,17 +121,9 @@ def collect_tmdb_ids(categorized: Dict) -> List[int]:
 
 
 def get_imdb_id(tmdb_api_key: str, tmdb_id: int, media_type: str = "movie") -> Optional[str]:
-    """Fetch IMDB ID from TMDB external IDs endpoint."""
-    try:
-        media = "movie" if media_type == "movie" else "tv"
-        url = f"https://api.themoviedb.org/3/{media}/{tmdb_id}/external_ids"
-        response = requests.get(url, params={"api_key": tmdb_api_key}, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("imdb_id")
-    except (requests.RequestException, KeyError) as e:
-        logger.debug(f"Error fetching IMDB ID for TMDB {tmdb_id}: {e}")
-    return None
+    """Fetch IMDB ID from the title's TMDB record (its external_ids)."""
+    record = fetch_title_record(tmdb_api_key, tmdb_id, media_type)
+    return record["imdb_id"] if record else None
 
 
 def _sync_items_in_batches(items: List[str], trakt_client: Any, media_type: str, result_key: str) -> int:
@@ -41,7 +41,7 @@ import logging
 import os
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Set, Tuple
 
 import requests
 
@@ -52,8 +52,10 @@ from utils import (
     RESET,
     TMDB_REQUEST_TIMEOUT,
     get_project_root,
+    http_client,
     load_json_cache,
     log_warning,
+    owned_library_index,
     save_json_cache,
 )
 
@@ -77,7 +79,7 @@ def get_movie_status(tmdb_api_key: str, tmdb_id: int) -> Tuple[str, str]:
     try:
         url = f"https://api.themoviedb.org/3/movie/{tmdb_id}"
         params = {"api_key": tmdb_api_key}
-        response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
+        response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
         if response.status_code == 200:
             data = response.json()
             return data.get("status", "Unknown"), data.get("release_date", "")
@@ -129,22 +131,15 @@ def find_horizon_movies(tmdb_api_key: str, plex: Any, library_name: str, stale_d
 
     try:
         library = plex.library.section(library_name)
-        items = library.all()
+        owned = owned_library_index(plex, library, os.path.join(project_root, "cache"))
     except Exception as e:
         log_warning(f"Could not access library {library_name}: {e}")
         return []
 
-    # Build current library state
-    library_tmdb_ids = set()
-    for item in items:
-        for guid in item.guids:
-            if "tmdb://" in guid.id:
-                try:
-                    tmdb_id: Optional[int] = int(guid.id.split("tmdb://")[1])
-                    library_tmdb_ids.add(tmdb_id)
-                    break
-                except (ValueError, IndexError):
-                    continue
+    # Build current library state: each movie's TMDB ID, from the owned-title
+    # index (utils/owned_index.py) rather than a listing of the section
+    owned_tmdb_ids = owned.item_tmdb_ids()
+    library_tmdb_ids = set(owned_tmdb_ids)
 
     # Load horizon cache
     cache = load_horizon_cache(cache_path, stale_days)
@@ -163,30 +158,18 @@ def find_horizon_movies(tmdb_api_key: str, plex: Any, library_name: str, stale_d
     # exactly like find_missing_sequels does: trust the cache for ids it
     # already knows about, but fetch collection data for any movie that
     # isn't in it yet (e.g. added to Plex after Sequel Huntarr's last run).
-    # This intentionally always scans `items` rather than trusting
+    # This intentionally always scans the owned index rather than trusting
     # movie_collections wholesale, so newly-owned movies aren't silently
     # skipped.
-    total_items = len(items)
+    total_items = len(owned_tmdb_ids)
     print(f"{CYAN}  Scanning {total_items} movies for collections...{RESET}")
 
     collection_owned: Dict[int, Set[int]] = {}
 
-    for i, item in enumerate(items):
+    for i, tmdb_id in enumerate(owned_tmdb_ids):
         if i % 50 == 0:
             show_progress("  Scanning library", i + 1, total_items)
 
-        tmdb_id = None
-        for guid in item.guids:
-            if "tmdb://" in guid.id:
-                try:
-                    tmdb_id = int(guid.id.split("tmdb://")[1])
-                    break
-                except (ValueError, IndexError):
-                    continue
-
-        if not tmdb_id:
-            continue
-
         tmdb_id_str = str(tmdb_id)
         if tmdb_id_str in movie_collections:
             coll_id = movie_collections[tmdb_id_str]
@@ -199,7 +182,7 @@ def find_horizon_movies(tmdb_api_key: str, plex: Any, library_name: str, stale_d
             try:
                 url = f"https://api.themoviedb.org/3/movie/{tmdb_id}"
                 params = {"api_key": tmdb_api_key}
-                response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
+                response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
 
                 if response.status_code == 200:
                     data = response.json()
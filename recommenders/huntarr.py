@@ -57,9 +57,12 @@ from utils import (
     TMDB_ANIMATION_GENRE_ID,
     TMDB_REQUEST_TIMEOUT,
     TMDB_TV_MOVIE_GENRE_ID,
+    fetch_watch_providers,
     get_project_root,
+    http_client,
     load_json_cache,
     log_warning,
+    owned_library_index,
     save_json_cache,
 )
 
@@ -122,39 +125,29 @@ def get_watch_providers(tmdb_api_key: str, tmdb_id: int, media_type: str = "movi
         if time.time() - cached_time < WATCH_PROVIDER_CACHE_TTL:
             return cached_result
 
-    try:
-        url = f"https://api.themoviedb.org/3/{'movie' if media_type == 'movie' else 'tv'}/{tmdb_id}/watch/providers"
-        params = {"api_key": tmdb_api_key}
-        response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
-
-        if response.status_code != 200:
-            return empty_result
-
-        data = response.json()
-        us_providers = data.get("results", {}).get("US", {})
-
-        def extract_providers(provider_list, provider_map):
-            """Extract provider names from TMDB provider list."""
-            services = []
-            for provider in provider_list:
-                provider_id = provider.get("provider_id")
-                if provider_id in provider_map:
-                    service_name = provider_map[provider_id]
-                    if service_name not in services:
-                        services.append(service_name)
-            return services
-
-        result = {
-            "streaming": extract_providers(us_providers.get("flatrate", []), TMDB_STREAMING_PROVIDERS),
-            "rent": extract_providers(us_providers.get("rent", []), TMDB_RENTAL_PROVIDERS),
-            "buy": extract_providers(us_providers.get("buy", []), TMDB_RENTAL_PROVIDERS),
-        }
-        # Cache successful result
-        _watch_provider_cache[cache_key] = (time.time(), result)
-        return result
-    except Exception as e:
-        logger.debug(f"Error fetching watch providers for TMDB {tmdb_id}: {e}")
+    providers = fetch_watch_providers(tmdb_api_key, tmdb_id, media_type)
+    if providers is None:
         return empty_result
+    us_providers = providers.get("US", {})
+
+    def extract_providers(provider_ids, provider_map):
+        """Map TMDB provider ids to service names, first occurrence wins."""
+        services = []
+        for provider_id in provider_ids:
+            if provider_id in provider_map:
+                service_name = provider_map[provider_id]
+                if service_name not in services:
+                    services.append(service_name)
+        return services
+
+    result = {
+        "streaming": extract_providers(us_providers.get("flatrate", []), TMDB_STREAMING_PROVIDERS),
+        "rent": extract_providers(us_providers.get("rent", []), TMDB_RENTAL_PROVIDERS),
+        "buy": extract_providers(us_providers.get("buy", []), TMDB_RENTAL_PROVIDERS),
+    }
+    # Cache successful result
+    _watch_provider_cache[cache_key] = (time.time(), result)
+    return result
 
 
 def get_collection_details(tmdb_api_key: str, collection_id: int) -> Optional[Dict]:
@@ -171,7 +164,7 @@ def get_collection_details(tmdb_api_key: str, collection_id: int) -> Optional[Di
     try:
         url = f"https://api.themoviedb.org/3/collection/{collection_id}"
         params = {"api_key": tmdb_api_key}
-        response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
+        response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
 
         if response.status_code != 200:
             return None
@@ -261,22 +254,15 @@ def find_missing_sequels(
 
     try:
         library = plex.library.section(library_name)
-        items = library.all()
+        owned = owned_library_index(plex, library, os.path.join(project_root, "cache"))
     except Exception as e:
         log_warning(f"Could not access library {library_name}: {e}")
         return []
 
-    # Build current library state
-    library_tmdb_ids = set()
-    for item in items:
-        for guid in item.guids:
-            if "tmdb://" in guid.id:
-                try:
-                    tmdb_id: Optional[int] = int(guid.id.split("tmdb://")[1])
-                    library_tmdb_ids.add(tmdb_id)
-                    break
-                except (ValueError, IndexError):
-                    continue
+    # Build current library state: each movie's TMDB ID, from the owned-title
+    # index (utils/owned_index.py) rather than a listing of the section
+    owned_tmdb_ids = owned.item_tmdb_ids()
+    library_tmdb_ids = set(owned_tmdb_ids)
 
     # Load cache and check if library changed
     cache = load_huntarr_cache(cache_path, stale_days)
@@ -290,7 +276,7 @@ def find_missing_sequels(
             item["on_user_services"] = [s for s in item.get("streaming_services", []) if s in user_services]
         return missing
 
-    total_items = len(items)
+    total_items = len(owned_tmdb_ids)
     print(f"{CYAN}  Scanning {total_items} movies for collections...{RESET}")
 
     # Step 1: Find all movies with collection IDs and track which are owned
@@ -300,22 +286,10 @@ def find_missing_sequels(
     movie_collections = cache.get("movie_collections", {})
     movies_to_fetch = []
 
-    for i, item in enumerate(items):
+    for i, tmdb_id in enumerate(owned_tmdb_ids):
         if i % 50 == 0:
             show_progress("  Scanning library", i + 1, total_items)
 
-        tmdb_id = None
-        for guid in item.guids:
-            if "tmdb://" in guid.id:
-                try:
-                    tmdb_id = int(guid.id.split("tmdb://")[1])
-                    break
-                except (ValueError, IndexError):
-                    continue
-
-        if not tmdb_id:
-            continue
-
         # Check cache first
         tmdb_id_str = str(tmdb_id)
         if tmdb_id_str in movie_collections:
@@ -339,7 +313,7 @@ def find_missing_sequels(
             try:
                 url = f"https://api.themoviedb.org/3/movie/{tmdb_id}"
                 params = {"api_key": tmdb_api_key}
-                response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
+                response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT)
 
                 if response.status_code == 200:
                     data = response.json()
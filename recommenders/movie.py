@@ -37,7 +37,6 @@ from utils import (
     RED,
     RESET,
     TOP_CAST_COUNT,
-    build_profile_from_counters,
     calculate_recency_multiplier,
     calculate_rewatch_multiplier,
     calculate_similarity_score,
@@ -57,7 +56,6 @@ from utils import (
     log_info,
     log_warning,
     merge_movie_history,
-    process_counters_from_cache,
     record_run_status,
     run_recommender_main,
     setup_log_file,
@@ -141,6 +139,7 @@ class PlexMovieRecommender(BaseRecommender):
     media_key = "movies"
     library_config_key = "movie_library"
     default_library_name = "Movies"
+    similarity_bonus_counters = ("collections",)
 
     def _load_weights(self, weights_config: Dict) -> Dict:
         """Load movie-specific scoring weights from config."""
@@ -303,8 +302,14 @@ class PlexMovieRecommender(BaseRecommender):
             log_error("No valid users found!")
             return counters
 
-        # Fetch watch history using the history API (properly per-user)
-        history_items, _ = fetch_plex_watch_history_movies(self.config, account_ids, movies_section)
+        # Fetch watch history using the history API (properly per-user) -
+        # only the plays newer than the ones the watch ledger already
+        # holds, unless it needs a full read (utils/watch_ledger.py).
+        ledger = self._load_watch_ledger()
+        viewed_after = ledger.history_since(account_ids)
+        history_items, _ = fetch_plex_watch_history_movies(
+            self.config, account_ids, movies_section, viewed_after=viewed_after
+        )
 
         # Optionally merge in Tautulli watch history, weighted the same way as
         # Plex history. Covers users whose Plex-native history is thin (e.g.
@@ -347,6 +352,17 @@ class PlexMovieRecommender(BaseRecommender):
                 if movie_id not in user_ratings or user_rating > user_ratings[movie_id]:
                     user_ratings[movie_id] = user_rating
 
+        # Fold the fetched plays into the ledger; from here on the whole
+        # recorded history is what gets weighted, not just this fetch.
+        fetched_count = len(watched_ids)
+        ledger.record_history(
+            {movie_id: int(watched_movie_dates.get(movie_id, 0)) for movie_id in watched_ids},
+            account_ids,
+            full=viewed_after is None,
+        )
+        watched_ids = ledger.watched_ids()
+        watched_movie_dates = {movie_id: str(ts) for movie_id, ts in ledger.viewed_timestamps().items()}
+
         # Get view counts, and (accurate mode only) ratings, from the
         # library - the history API above doesn't provide view counts at
         # all, and (per the verified finding above) never reliably
@@ -375,9 +391,9 @@ class PlexMovieRecommender(BaseRecommender):
         # above already covers - and, per the verified finding, never
         # actually populates - user_ratings for the disabled path).
         if self.config.get("profile_accuracy", {}).get("enabled", True):
-            for username in users_to_match:
+            for username, user_items in self._library_items_for_users(users_to_match):
                 try:
-                    for movie in self._get_all_library_items_for_user(username):
+                    for movie in user_items:
                         movie_id = int(movie.ratingKey)
                         if movie_id not in watched_ids:
                             continue
@@ -402,7 +418,10 @@ class PlexMovieRecommender(BaseRecommender):
             except Exception as e:
                 logger.debug(f"Error getting view counts for rewatch weighting: {e}")
 
-        print(f"Found {len(watched_ids)} unique watched movies from history API")
+        if viewed_after is None:
+            print(f"Found {len(watched_ids)} unique watched movies from history API")
+        else:
+            print(f"Found {fetched_count} movies watched since the last run ({len(watched_ids)} watched in total)")
 
         # Store watched movie IDs
         self.watched_ids.update(watched_ids)
@@ -411,6 +430,9 @@ class PlexMovieRecommender(BaseRecommender):
         print("")
         print(f"Processing {len(watched_ids)} unique watched movies with recency decay and rating weighting:")
         negative_signal_count = 0
+        ns_config = self.config.get("negative_signals", {})
+        cap_penalty = ns_config.get("bad_ratings", {}).get("cap_penalty", 0.5)
+        contributions: Dict[int, Tuple[float, float]] = {}
 
         for i, movie_id in enumerate(watched_ids, 1):
             show_progress("Processing", i, len(watched_ids))
@@ -447,18 +469,14 @@ class PlexMovieRecommender(BaseRecommender):
                         f"(rating: {user_ratings.get(movie_id)}, weight: {multiplier:.2f})"
                     )
 
-                # Process with weighted counters
-                ns_config = self.config.get("negative_signals", {})
-                cap_penalty = ns_config.get("bad_ratings", {}).get("cap_penalty", 0.5)
-                process_counters_from_cache(
-                    movie_info, counters, media_type="movie", weight=multiplier, cap_penalty=cap_penalty
-                )
-
-                if tmdb_id := movie_info.get("tmdb_id"):
-                    counters["tmdb_ids"].add(tmdb_id)
+                contributions[movie_id] = (multiplier, cap_penalty)
             else:
                 not_found_count += 1
 
+        # Only the movies whose weight moved since the last run are
+        # re-applied to the stored counters (utils/watch_ledger.py).
+        counters = self._apply_watch_ledger(ledger, contributions)
+
         logger.debug(f"Watched movies not in cache: {not_found_count}, TMDB IDs collected: {len(counters['tmdb_ids'])}")
         if negative_signal_count > 0:
             logger.info(f"Processed {negative_signal_count} movies as negative signals (low ratings)")
@@ -564,14 +582,9 @@ class PlexMovieRecommender(BaseRecommender):
     # ------------------------------------------------------------------------
     # CALCULATE SCORES
     # ------------------------------------------------------------------------
-    def _calculate_similarity_from_cache(self, movie_info: Dict) -> Tuple[float, Dict]:
-        """Calculate similarity score using cached movie data and return score with breakdown"""
-        # #317: single shared storage->profile translation (including the
-        # tmdb_keywords -> keywords rename) - see build_profile_from_counters.
-        user_profile = build_profile_from_counters(self.watched_data)
-
-        # Build content info dict
-        content_info = {
+    def _scoring_content_info(self, movie_info: Dict) -> Dict:
+        """The content_info dict calculate_similarity_score() scores a cached movie by"""
+        return {
             "genres": movie_info.get("genres", []),
             "directors": movie_info.get("directors", []),
             "cast": movie_info.get("cast", []),
@@ -581,19 +594,13 @@ class PlexMovieRecommender(BaseRecommender):
             "collection_id": movie_info.get("collection_id"),
         }
 
-        # Use shared scoring function
-        score, breakdown = calculate_similarity_score(
-            content_info=content_info,
-            user_profile=user_profile,
-            media_type="movie",
-            weights=self.weights,
-            normalize_counters=self.normalize_counters,
-            use_fuzzy_keywords=self.use_tmdb_keywords,
-            genre_idf=getattr(self, "genre_idf", None),
-            keyword_idf=getattr(self, "keyword_idf", None),
-        )
+    def _similarity_bonus_terms(self, movie_info: Dict) -> Dict[str, List]:
+        """The movie's collection, the one bonus counter _apply_similarity_bonus() reads"""
+        collection_id = movie_info.get("collection_id")
+        return {"collections": [collection_id] if collection_id else []}
 
-        # Apply collection bonus for sequels/prequels
+    def _apply_similarity_bonus(self, movie_info: Dict, score: float, breakdown: Optional[Dict] = None) -> float:
+        """Apply the collection bonus for sequels/prequels, noting it in `breakdown` if given"""
         collection_id = movie_info.get("collection_id")
         user_collections = self.watched_data.get("collections", {})
         if collection_id and collection_id in user_collections:
@@ -603,12 +610,32 @@ class PlexMovieRecommender(BaseRecommender):
             bonus = COLLECTION_BONUS_BASE * (1 + math.log2(max(1, collection_count)) * COLLECTION_BONUS_LOG_FACTOR)
             bonus = min(bonus, COLLECTION_BONUS_CAP)
             score = min(1.0, score * (1 + bonus))
-            breakdown["collection_bonus"] = round(bonus, 3)
-            breakdown["details"]["collection"] = (
-                f"{movie_info.get('collection_name', 'Unknown')} "
-                f"(watched: {collection_count:.1f}, bonus: {round(bonus * 100, 1)}%)"
-            )
+            if breakdown is not None:
+                breakdown["collection_bonus"] = round(bonus, 3)
+                breakdown["details"]["collection"] = (
+                    f"{movie_info.get('collection_name', 'Unknown')} "
+                    f"(watched: {collection_count:.1f}, bonus: {round(bonus * 100, 1)}%)"
+                )
+        return score
+
+    def _calculate_similarity_from_cache(self, movie_info: Dict) -> Tuple[float, Dict]:
+        """Calculate similarity score using cached movie data and return score with breakdown"""
+        # Compiled once per run, not per item - see CompiledProfile.
+        user_profile = self._compiled_scoring_profile(self.watched_data)
+
+        # Use shared scoring function
+        score, breakdown = calculate_similarity_score(
+            content_info=self._scoring_content_info(movie_info),
+            user_profile=user_profile,
+            media_type="movie",
+            weights=self.weights,
+            normalize_counters=self.normalize_counters,
+            use_fuzzy_keywords=self.use_tmdb_keywords,
+            genre_idf=getattr(self, "genre_idf", None),
+            keyword_idf=getattr(self, "keyword_idf", None),
+        )
 
+        score = self._apply_similarity_bonus(movie_info, score, breakdown)
         return score, breakdown
 
     # _print_similarity_breakdown(), get_recommendations() and
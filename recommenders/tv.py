@@ -39,7 +39,6 @@ from utils import (
     RESET,
     TOP_CAST_COUNT,
     YELLOW,
-    build_profile_from_counters,
     calculate_recency_multiplier,
     calculate_rewatch_multiplier,
     calculate_similarity_score,
@@ -48,6 +47,7 @@ from utils import (
     extract_genres,
     extract_ids_from_guids,
     extract_rating,
+    fetch_plex_history,
     fetch_plex_watch_history_shows,
     fetch_show_completion_data,
     fetch_tautulli_show_watched_data,
@@ -60,12 +60,12 @@ from utils import (
     log_info,
     log_warning,
     merge_show_watched_data,
-    process_counters_from_cache,
     record_run_status,
     run_recommender_main,
     setup_log_file,
     show_progress,
     teardown_log_file,
+    watched_episodes_by_show,
 )
 
 # Module-level logger - configured by setup_logging() in main()
@@ -133,6 +133,7 @@ class PlexTVRecommender(BaseRecommender):
     media_key = "shows"
     library_config_key = "tv_library"
     default_library_name = "TV Shows"
+    similarity_bonus_counters = ("production_companies",)
 
     def _load_weights(self, weights_config: Dict) -> Dict:
         """Load TV-specific scoring weights from config."""
@@ -335,7 +336,24 @@ class PlexTVRecommender(BaseRecommender):
         # its own docstring) - the isinstance check below is a real type
         # narrowing (return_timestamps=True is always passed here, so this
         # never actually hits the `else`), not a defensive runtime guard.
-        history_result = fetch_plex_watch_history_shows(self.config, account_ids, shows_section, return_timestamps=True)
+        # Only the plays newer than the ones the watch ledger already
+        # holds are fetched, unless it needs a full read
+        # (utils/watch_ledger.py). The one fetch also feeds dropped-show
+        # detection, through the episodes the ledger keeps per show.
+        ledger = self._load_watch_ledger()
+        viewed_after = ledger.history_since(account_ids)
+        ns_config = self.config.get("negative_signals", {})
+        dropped_config = ns_config.get("dropped_shows", {})
+        detect_dropped = ns_config.get("enabled", True) and dropped_config.get("enabled", True)
+        history = fetch_plex_history(self.config, account_ids, shows_section, viewed_after)
+        history_result = fetch_plex_watch_history_shows(
+            self.config,
+            account_ids,
+            shows_section,
+            return_timestamps=True,
+            viewed_after=viewed_after,
+            history=history,
+        )
         if isinstance(history_result, tuple):
             watched_ids, show_timestamps = history_result
         else:
@@ -357,17 +375,34 @@ class PlexTVRecommender(BaseRecommender):
                     f"({len(watched_ids)} unique watched shows, was {plex_count} from Plex alone)"
                 )
 
+        # Fold the fetched plays into the ledger; from here on the whole
+        # recorded history is what gets weighted, not just this fetch.
+        ledger.record_history(
+            {show_id: int(show_timestamps.get(show_id) or 0) for show_id in watched_ids},
+            account_ids,
+            full=viewed_after is None,
+        )
+        # Recorded whether or not detection is on, so turning it on never
+        # finds the ledger's episodes missing the plays before.
+        ledger.record_episodes(*watched_episodes_by_show(history, account_ids), full=viewed_after is None)
+        watched_ids = ledger.watched_ids()
+        show_timestamps = ledger.viewed_timestamps()
+
         # Store watched show IDs
         self.watched_ids.update(watched_ids)
 
         # Detect dropped shows (started but abandoned)
         dropped_show_ids = set()
         show_completion_data = {}  # Initialize before conditional block
-        ns_config = self.config.get("negative_signals", {})
-        dropped_config = ns_config.get("dropped_shows", {})
-        if ns_config.get("enabled", True) and dropped_config.get("enabled", True):
+        if detect_dropped:
             print(f"{YELLOW}Analyzing show completion for dropped show detection...{RESET}")
-            show_completion_data = fetch_show_completion_data(self.config, account_ids, shows_section)
+            show_completion_data = fetch_show_completion_data(
+                self.config,
+                account_ids,
+                shows_section,
+                shows=self._get_all_library_items(),
+                watched_episodes=ledger.watched_episodes(),
+            )
             dropped_show_ids = identify_dropped_shows(show_completion_data, self.config)
             if dropped_show_ids:
                 logger.info(f"Identified {len(dropped_show_ids)} dropped shows as negative signals")
@@ -425,8 +460,8 @@ class PlexTVRecommender(BaseRecommender):
         try:
             if self.config.get("profile_accuracy", {}).get("enabled", True):
                 users_to_match = [self.single_user] if self.single_user else self.users["plex_users"]
-                for username in users_to_match:
-                    for show in self._get_all_library_items_for_user(username):
+                for _username, user_items in self._library_items_for_users(users_to_match):
+                    for show in user_items:
                         _record_show_rewatch_and_rating(show)
             else:
                 for show in self._get_all_library_items():
@@ -445,6 +480,7 @@ class PlexTVRecommender(BaseRecommender):
 
         # Track production companies for franchise/spinoff bonus
         production_companies: Dict[int, float] = {}  # production_company_id -> weighted count
+        contributions: Dict[int, Tuple[float, float]] = {}
 
         for i, show_id in enumerate(normal_watched, 1):
             show_progress("Processing", i, len(normal_watched))
@@ -465,10 +501,7 @@ class PlexTVRecommender(BaseRecommender):
 
                 # Combined weight: recency * rewatch * rating
                 weight = recency_multiplier * rewatch_multiplier * rating_multiplier
-                process_counters_from_cache(show_info, counters, media_type="tv", weight=weight)
-
-                if tmdb_id := show_info.get("tmdb_id"):
-                    counters["tmdb_ids"].add(tmdb_id)
+                contributions[show_id] = (weight, 0.5)
 
                 # Track production companies with weight for franchise bonus
                 for pc_id in show_info.get("production_company_ids", []):
@@ -485,15 +518,14 @@ class PlexTVRecommender(BaseRecommender):
             for show_id in dropped_show_ids:
                 show_info = self.show_cache.cache["shows"].get(str(show_id))
                 if show_info:
-                    # Process with negative weight
+                    # Negative weight; the TMDB ID is still tracked so we
+                    # don't recommend the same show
                     cap_penalty = dropped_config.get("cap_penalty", 0.5)
-                    process_counters_from_cache(
-                        show_info, counters, media_type="tv", weight=penalty_mult, cap_penalty=cap_penalty
-                    )
+                    contributions[show_id] = (penalty_mult, cap_penalty)
 
-                    # Still track TMDB ID so we don't recommend the same show
-                    if tmdb_id := show_info.get("tmdb_id"):
-                        counters["tmdb_ids"].add(tmdb_id)
+        # Only the shows whose weight moved since the last run are
+        # re-applied to the stored counters (utils/watch_ledger.py).
+        counters = self._apply_watch_ledger(ledger, contributions)
 
         logger.debug(f"Watched shows not in cache: {not_found_count}, TMDB IDs collected: {len(counters['tmdb_ids'])}")
 
@@ -606,14 +638,9 @@ class PlexTVRecommender(BaseRecommender):
     # ------------------------------------------------------------------------
     # CALCULATE SCORES
     # ------------------------------------------------------------------------
-    def _calculate_similarity_from_cache(self, show_info: Dict) -> Tuple[float, Dict]:
-        """Calculate similarity score using cached show data and return score with breakdown"""
-        # #317: single shared storage->profile translation (including the
-        # tmdb_keywords -> keywords rename) - see build_profile_from_counters.
-        user_profile = build_profile_from_counters(self.watched_data)
-
-        # Build content info dict
-        content_info = {
+    def _scoring_content_info(self, show_info: Dict) -> Dict:
+        """The content_info dict calculate_similarity_score() scores a cached show by"""
+        return {
             "genres": show_info.get("genres", []),
             "studio": show_info.get("studio", "N/A"),
             "cast": show_info.get("cast", []),
@@ -622,19 +649,13 @@ class PlexTVRecommender(BaseRecommender):
             "vote_count": show_info.get("vote_count", 0),
         }
 
-        # Use shared scoring function
-        score, breakdown = calculate_similarity_score(
-            content_info=content_info,
-            user_profile=user_profile,
-            media_type="tv",
-            weights=self.weights,
-            normalize_counters=self.normalize_counters,
-            use_fuzzy_keywords=self.use_tmdb_keywords,
-            genre_idf=getattr(self, "genre_idf", None),
-            keyword_idf=getattr(self, "keyword_idf", None),
-        )
+    def _similarity_bonus_terms(self, show_info: Dict) -> Dict[str, List]:
+        """The show's production companies, the one bonus counter _apply_similarity_bonus() reads"""
+        return {"production_companies": list(show_info.get("production_company_ids", []) or [])}
 
-        # Apply franchise/spinoff bonus based on shared production companies
+    def _apply_similarity_bonus(self, show_info: Dict, score: float, breakdown: Optional[Dict] = None) -> float:
+        """Apply the franchise/spinoff bonus, noting it in `breakdown` if given"""
+        # Bonus based on shared production companies
         show_pc_ids = show_info.get("production_company_ids", [])
         user_production_companies = self.watched_data.get("production_companies", {})
         if show_pc_ids and user_production_companies:
@@ -652,11 +673,31 @@ class PlexTVRecommender(BaseRecommender):
                 bonus = COLLECTION_BONUS_BASE * (1 + math.log2(max(1, max_pc_weight)) * COLLECTION_BONUS_LOG_FACTOR)
                 bonus = min(bonus, COLLECTION_BONUS_CAP)
                 score = min(1.0, score * (1 + bonus))
-                breakdown["franchise_bonus"] = round(bonus, 3)
-                breakdown["details"]["franchise"] = (
-                    f"Shared production company (weight: {max_pc_weight:.1f}, bonus: {round(bonus * 100, 1)}%)"
-                )
+                if breakdown is not None:
+                    breakdown["franchise_bonus"] = round(bonus, 3)
+                    breakdown["details"]["franchise"] = (
+                        f"Shared production company (weight: {max_pc_weight:.1f}, bonus: {round(bonus * 100, 1)}%)"
+                    )
+        return score
+
+    def _calculate_similarity_from_cache(self, show_info: Dict) -> Tuple[float, Dict]:
+        """Calculate similarity score using cached show data and return score with breakdown"""
+        # Compiled once per run, not per item - see CompiledProfile.
+        user_profile = self._compiled_scoring_profile(self.watched_data)
+
+        # Use shared scoring function
+        score, breakdown = calculate_similarity_score(
+            content_info=self._scoring_content_info(show_info),
+            user_profile=user_profile,
+            media_type="tv",
+            weights=self.weights,
+            normalize_counters=self.normalize_counters,
+            use_fuzzy_keywords=self.use_tmdb_keywords,
+            genre_idf=getattr(self, "genre_idf", None),
+            keyword_idf=getattr(self, "keyword_idf", None),
+        )
 
+        score = self._apply_similarity_bonus(show_info, score, breakdown)
         return score, breakdown
 
     # _print_similarity_breakdown(), get_recommendations() and
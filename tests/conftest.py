@@ -203,6 +203,51 @@ def _isolated_metrics_dir(tmp_path_factory, monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_rate_limiters():
+    """utils/rate_limit.py's per-service limiters are process-wide, so a
+    test that feeds one a 429 (pausing that service for its Retry-After)
+    or a run of healthy responses (raising its rate) would otherwise
+    pace every later test talking to the same service. Each test starts
+    from the starting rate, unpaused."""
+    from utils.rate_limit import _reset_rate_limiters_for_tests
+
+    _reset_rate_limiters_for_tests()
+    yield
+    _reset_rate_limiters_for_tests()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_single_flight_counts():
+    """utils/single_flight.py's per-service flights are process-wide and
+    publish their leader/shared counts in batches - the remainder at
+    interpreter exit, long after _isolated_metrics_dir has been undone,
+    which would write a REAL cache/metrics_state.json into the repo root.
+    Each test's unpublished counts are dropped when it ends."""
+    from utils.single_flight import _reset_single_flights_for_tests
+
+    yield
+    _reset_single_flights_for_tests()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_tmdb_response_cache(tmp_path_factory, monkeypatch):
+    """Same reasoning as _isolated_metrics_dir above, for utils/
+    tmdb_cache.py's cache/tmdb_responses.db: every TMDB GET through
+    http_client consults it, so without this a test would both write a
+    REAL database into the repo root and be answered from a response an
+    earlier test stored. Each test gets its own empty database."""
+    from utils.tmdb_cache import tmdb_response_cache
+
+    tmdb_response_cache.close()
+    monkeypatch.setattr(
+        "utils.tmdb_cache.get_project_root",
+        lambda: str(tmp_path_factory.mktemp("tmdb_response_cache")),
+    )
+    yield
+    tmdb_response_cache.close()
+
+
 @pytest.fixture(autouse=True)
 def _isolated_recommender_cache_dir(tmp_path_factory, monkeypatch):
     """Same reasoning as _isolated_metrics_dir above, for
@@ -460,3 +505,19 @@ def _fail_if_real_logs_or_cache_written():
             "module's real get_project_root() resolve during a test run. "
             "Changed paths:\n  " + "\n  ".join(changed)
         )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_score_store(tmp_path_factory, monkeypatch):
+    """Same reasoning as _no_real_update_check_network above, for the
+    per-user score store (BaseRecommender._score_store_path): the
+    recommenders' cache_dir resolves to the real repo/data cache/ dir, so
+    every test that runs get_recommendations() would otherwise write a
+    real scores_*.json there. Tests that need to inspect the store
+    override this with their own path.
+    """
+    store_dir = tmp_path_factory.mktemp("score_store")
+    monkeypatch.setattr(
+        "recommenders.base.BaseRecommender._score_store_path",
+        lambda self: os.path.join(str(store_dir), f"scores_{self.media_key}_{self._get_user_context()}.json"),
+    )
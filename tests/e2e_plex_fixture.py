@@ -50,6 +50,7 @@ full rationale):
 
 from typing import Dict, List, Optional
 from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
 
 from plexapi.exceptions import NotFound
 
@@ -63,6 +64,12 @@ from utils.config import CACHE_VERSION
 # ---------------------------------------------------------------------------
 ACCOUNT_IDS = {"alice": "101", "bob": "102"}
 
+# Base URL and tokens of the fake servers' raw library listings: the admin
+# connection's own, or a switched user's (USER_TOKEN_PREFIX + username).
+FAKE_PLEX_URL = "http://fake-plex"
+ADMIN_TOKEN = "admin-token"
+USER_TOKEN_PREFIX = "user-token-"
+
 
 # ---------------------------------------------------------------------------
 # Movie catalog
@@ -574,8 +581,9 @@ class FakeMediaItem:
 
 
 class FakeSection:
-    def __init__(self, key: str, items: List[FakeMediaItem]):
+    def __init__(self, key: str, items: List[FakeMediaItem], section_type: str = "movie"):
         self.key = key
+        self.type = section_type
         self._items = items
 
     def all(self) -> List[FakeMediaItem]:
@@ -619,12 +627,22 @@ class FakePlexServer:
         # (build_fake_plex_server()); set to a username by
         # build_fake_plex_server_for_user() / switchUser() below.
         self.current_user: Optional[str] = None
+        # What utils/plex.py's iter_library_snapshot() builds its raw
+        # section-listing request from - the token says whose view
+        # make_fake_capped_get() serves (see _section_listing_xml).
+        self._baseurl = FAKE_PLEX_URL
+        self._token = ADMIN_TOKEN
 
     def fetchItem(self, rating_key):
         raise AssertionError(
             "FakePlexServer.fetchItem() was called - the label/collection-writing stage must stay mocked in this test."
         )
 
+    def fetchItems(self, ekey, *args, **kwargs):
+        raise AssertionError(
+            "FakePlexServer.fetchItems() was called - the label/collection-writing stage must stay mocked in this test."
+        )
+
     def switchUser(self, user):
         """Duck-typed stand-in for plexapi.server.PlexServer.switchUser()
         (#273): real plexapi resolves `user.get_token(machineIdentifier)`
@@ -643,8 +661,8 @@ def build_fake_plex_server() -> FakePlexServer:
     movies = [FakeMediaItem(m["rating_key"], m["title"], m["year"]) for m in MOVIE_CATALOG]
     shows = [FakeMediaItem(s["rating_key"], s["title"], s["year"]) for s in SHOW_CATALOG]
     sections = {
-        "Movies": FakeSection("1", movies),
-        "TV Shows": FakeSection("2", shows),
+        "Movies": FakeSection("1", movies, "movie"),
+        "TV Shows": FakeSection("2", shows, "show"),
     }
     return FakePlexServer(sections)
 
@@ -681,11 +699,12 @@ def build_fake_plex_server_for_user(username: str) -> FakePlexServer:
         for s in SHOW_CATALOG
     ]
     sections = {
-        "Movies": FakeSection("1", movies),
-        "TV Shows": FakeSection("2", shows),
+        "Movies": FakeSection("1", movies, "movie"),
+        "TV Shows": FakeSection("2", shows, "show"),
     }
     server = FakePlexServer(sections)
     server.current_user = username
+    server._token = f"{USER_TOKEN_PREFIX}{username}"
     return server
 
 
@@ -725,18 +744,23 @@ class FakeMyPlexAccount:
 
 
 # ---------------------------------------------------------------------------
-# Fake HTTP layer for utils.plex._capped_get - the raw XML watch-history/
-# account-id endpoints bypass plexapi objects entirely in production (see
-# utils/plex.py's get_plex_account_ids/get_watched_movie_count/
-# fetch_plex_watch_history_movies), so this is the single, narrow seam
-# patched to keep that real business logic (XML parsing, per-account
-# matching, timestamp tracking) running for real without a socket.
+# Fake HTTP layer for utils.plex._capped_get/_streamed_get - the raw XML
+# watch-history/account-id endpoints bypass plexapi objects entirely in
+# production (see utils/plex.py's get_plex_account_ids/
+# get_watched_movie_count/iter_plex_history), so this is the single,
+# narrow seam patched to keep that real business logic (XML parsing,
+# per-account matching, timestamp tracking) running for real without a
+# socket.
 # ---------------------------------------------------------------------------
 class FakeXMLResponse:
     def __init__(self, xml_bytes: bytes):
         self.content = xml_bytes
         self.headers: Dict = {}
 
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
     def raise_for_status(self):
         return None
 
@@ -762,9 +786,32 @@ def _history_xml_for_account(account_id: str) -> bytes:
     return f"<MediaContainer>{''.join(videos)}</MediaContainer>".encode("utf-8")
 
 
+def _section_listing_xml(section_key: str, token: Optional[str]) -> bytes:
+    """A /library/sections/{key}/all listing of the fake server the token
+    belongs to - the projected fields iter_library_snapshot() reads, and
+    the totalSize library_section_size() does. Filters and paging are
+    ignored: every request gets the whole section."""
+    if token and token.startswith(USER_TOKEN_PREFIX):
+        server = build_fake_plex_server_for_user(token[len(USER_TOKEN_PREFIX) :])
+    else:
+        server = build_fake_plex_server()
+    section = next(sec for sec in server.library._sections.values() if sec.key == section_key)
+    tag = "Video" if section.type == "movie" else "Directory"
+    elements = []
+    for item in section.all():
+        rating = f' userRating="{item.userRating}"' if item.userRating is not None else ""
+        guids = "".join(f'<Guid id="{guid.id}"/>' for guid in item.guids)
+        elements.append(
+            f'<{tag} ratingKey="{item.ratingKey}" type="{section.type}" title="{escape(item.title)}" '
+            f'year="{item.year or ""}" viewCount="{item.viewCount}"{rating}>{guids}</{tag}>'
+        )
+    return f'<MediaContainer totalSize="{len(elements)}">{"".join(elements)}</MediaContainer>'.encode("utf-8")
+
+
 def make_fake_capped_get():
-    """Returns a drop-in replacement for utils.plex._capped_get that serves
-    synthetic-but-real-shaped Plex XML instead of making a network call."""
+    """Returns a drop-in replacement for utils.plex._capped_get (and
+    _streamed_get) that serves synthetic-but-real-shaped Plex XML instead
+    of making a network call."""
 
     def _fake_capped_get(url, **kwargs):
         parsed = urlparse(url)
@@ -776,6 +823,10 @@ def make_fake_capped_get():
             return FakeXMLResponse(_accounts_xml())
         if parsed.path.endswith("/status/sessions/history/all"):
             return FakeXMLResponse(_history_xml_for_account(str(account_id)))
+        if parsed.path.startswith("/library/sections/") and parsed.path.endswith("/all"):
+            section_key = parsed.path.split("/")[3]
+            token = (kwargs.get("headers") or {}).get("X-Plex-Token")
+            return FakeXMLResponse(_section_listing_xml(section_key, token))
 
         raise AssertionError(f"Unexpected fake Plex HTTP call: {url} params={params or dict(query)}")
 
@@ -173,7 +173,7 @@ def _strict_get_dispatcher(url_map):
     on anything not in url_map instead of silently fabricating data -
     mirrors tests/test_external.py's identical helper."""
 
-    def _fake_get(url, params=None, timeout=None):
+    def _fake_get(url, params=None, timeout=None, **_kwargs):
         if url not in url_map:
             raise AssertionError(f"Unexpected TMDB URL requested by golden harness: {url}")
         return url_map[url]
@@ -271,7 +271,7 @@ def run() -> dict:
             patch("recommenders.external.get_project_root", return_value=tmp_root),
             patch("recommenders.huntarr.get_project_root", return_value=tmp_root),
             patch("recommenders.horizon.get_project_root", return_value=tmp_root),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             missing_sequels = find_missing_sequels(TMDB_API_KEY, plex, "Movies", "", ["netflix"])
             horizon_movies = find_horizon_movies(TMDB_API_KEY, plex, "Movies")
@@ -91,7 +91,11 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.scoring import calculate_similarity_score, select_tiered_recommendations  # noqa: E402
+from utils.scoring import (  # noqa: E402
+    calculate_similarity_score,
+    compile_profile,
+    select_tiered_recommendations,
+)
 
 FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "scoring_harness")
 PROFILE_BUILDER_FIXTURES_DIR = os.path.join(
@@ -114,17 +118,24 @@ def load_fixtures():
     return movies_cache, user_profile
 
 
-def run(seed: int = DEFAULT_SEED, limit: int = DEFAULT_LIMIT) -> dict:
+def run(seed: int = DEFAULT_SEED, limit: int = DEFAULT_LIMIT, compiled: bool = False) -> dict:
     """Recompute scores for every fixture movie against the fixture user
     profile (always a from-scratch recompute) and run the tiered/random
     selection with an explicitly seeded RNG.
 
+    compiled=True scores through one utils.scoring.CompiledProfile built
+    up front - the way the recommenders score - instead of handing the
+    plain profile dict to every call. The output must be byte-identical
+    either way; see tests/test_harness.py's TestCompiledProfileParity.
+
     Returns a JSON-serializable dict - see module docstring for why
     `score_hex` (float.hex(), the exact bit pattern) is reported alongside
     the plain float.
     """
     movies_cache, user_profile = load_fixtures()
     movies = movies_cache["movies"]
+    if compiled:
+        user_profile = compile_profile(user_profile)
 
     scored = []
     for rating_key, item in sorted(movies.items()):
@@ -259,7 +270,7 @@ def run_profile_builders() -> dict:
     files out of the real repo's cache/ dir into this function's
     throwaway temp dir, which is then deleted on the way out - i.e.
     permanently destroying real user data. Never touches the real repo's
-    cache/ dir, never opens a real socket (utils.plex._capped_get and
+    cache/ dir, never opens a real socket (utils.plex._capped_get/_streamed_get and
     every MyPlexAccount binding this call graph touches are patched to
     the synthetic tests/e2e_plex_fixture.py fakes for the duration).
     """
@@ -293,6 +304,7 @@ def run_profile_builders() -> dict:
             patch("recommenders.external.MyPlexAccount", FakeMyPlexAccount),
             patch("recommenders.base.migrate_legacy_cache_dir", lambda legacy_dir, new_dir: None),
             patch("utils.plex._capped_get", make_fake_capped_get()),
+            patch("utils.plex._streamed_get", make_fake_capped_get()),
         ):
             # --- (1) & (2): movie.py's / tv.py's own per-user builders ---
             os.environ["CURATARR_CONFIG_DIR"] = plex_users_root
@@ -389,6 +401,11 @@ def main():
         action="store_true",
         help="(--profile-builders only) (re)write the committed golden snapshot fixture instead of printing it.",
     )
+    parser.add_argument(
+        "--compiled",
+        action="store_true",
+        help="Score through a single up-front CompiledProfile instead of the plain profile dict.",
+    )
     args = parser.parse_args()
 
     if args.profile_builders:
@@ -400,7 +417,7 @@ def main():
             print(json.dumps(snapshot, indent=2, sort_keys=True))
         return
 
-    result = run()
+    result = run(compiled=args.compiled)
     print(json.dumps(result, indent=2, sort_keys=True))
 
 
@@ -63,7 +63,7 @@ class TestRedirectSafety:
 
     def test_allow_redirects_is_disabled_on_the_initial_request(self, client):
         with patch(
-            "utils.api_client.requests.request", return_value=_make_response(200, "http://radarr.local/api")
+            "utils.api_client.http_client.request", return_value=_make_response(200, "http://radarr.local/api")
         ) as mock_req:
             client._make_request_to_url("GET", "http://radarr.local/api")
         assert mock_req.call_args.kwargs.get("allow_redirects") is False
@@ -72,7 +72,7 @@ class TestRedirectSafety:
         responses = [
             _make_response(302, "http://radarr.local/api", headers={"Location": "http://evil.example.com/steal"}),
         ]
-        with patch("utils.api_client.requests.request", side_effect=responses) as mock_req:
+        with patch("utils.api_client.http_client.request", side_effect=responses) as mock_req:
             with pytest.raises(_FakeAPIError, match="unfollowed redirect"):
                 client._make_request_to_url("GET", "http://radarr.local/api")
         # Only the ONE call to the original (trusted) host ever happened -
@@ -85,7 +85,7 @@ class TestRedirectSafety:
             _make_response(302, "http://radarr.local/api", headers={"Location": "http://radarr.local/api/"}),
             _make_response(200, "http://radarr.local/api/", json_data={"ok": True}),
         ]
-        with patch("utils.api_client.requests.request", side_effect=responses) as mock_req:
+        with patch("utils.api_client.http_client.request", side_effect=responses) as mock_req:
             result = client._make_request_to_url("GET", "http://radarr.local/api")
         assert result == {"ok": True}
         assert mock_req.call_count == 2
@@ -98,7 +98,7 @@ class TestRedirectSafety:
             while True:
                 yield _make_response(302, "http://radarr.local/api", headers={"Location": "http://radarr.local/api"})
 
-        with patch("utils.api_client.requests.request", side_effect=infinite()) as mock_req:
+        with patch("utils.api_client.http_client.request", side_effect=infinite()) as mock_req:
             with pytest.raises(_FakeAPIError, match="unfollowed redirect"):
                 client._make_request_to_url("GET", "http://radarr.local/api")
         # 1 initial request + _MAX_REDIRECT_HOPS follow-up attempts, never more.
@@ -112,7 +112,7 @@ class TestResponseSizeCap:
 
     def test_oversized_content_length_is_rejected(self, client):
         resp = _make_response(200, "http://radarr.local/api", headers={"Content-Length": str(50 * 1024 * 1024)})
-        with patch("utils.api_client.requests.request", return_value=resp):
+        with patch("utils.api_client.http_client.request", return_value=resp):
             with pytest.raises(_FakeAPIError, match="response rejected"):
                 client._make_request_to_url("GET", "http://radarr.local/api")
 
@@ -122,13 +122,13 @@ class TestResponseSizeCap:
         resp.url = "http://radarr.local/api"
         resp.headers = {}
         resp.iter_content = Mock(return_value=(b"x" * 65536 for _ in range(200)))  # ~13MB > 10MB cap
-        with patch("utils.api_client.requests.request", return_value=resp):
+        with patch("utils.api_client.http_client.request", return_value=resp):
             with pytest.raises(_FakeAPIError, match="response rejected"):
                 client._make_request_to_url("GET", "http://radarr.local/api")
 
     def test_normal_sized_response_is_unaffected(self, client):
         resp = _make_response(200, "http://radarr.local/api", json_data={"ok": True})
-        with patch("utils.api_client.requests.request", return_value=resp):
+        with patch("utils.api_client.http_client.request", return_value=resp):
             result = client._make_request_to_url("GET", "http://radarr.local/api")
         assert result == {"ok": True}
 
@@ -145,7 +145,7 @@ class TestExternalApiFailureLogging:
 
         resp = _make_response(401, "http://radarr.local/api")
         with (
-            patch("utils.api_client.requests.request", return_value=resp),
+            patch("utils.api_client.http_client.request", return_value=resp),
             caplog.at_level(logging.ERROR, logger="curatarr"),
         ):
             with pytest.raises(_FakeAPIError):
@@ -159,7 +159,7 @@ class TestExternalApiFailureLogging:
 
         resp = _make_response(401, "http://radarr.local/api")
         with (
-            patch("utils.api_client.requests.request", return_value=resp),
+            patch("utils.api_client.http_client.request", return_value=resp),
             caplog.at_level(logging.ERROR, logger="curatarr"),
         ):
             with pytest.raises(_FakeAPIError):
@@ -173,7 +173,7 @@ class TestExternalApiFailureLogging:
         resp = _make_response(500, "http://radarr.local/api")
         resp.text = "Internal Server Error"
         with (
-            patch("utils.api_client.requests.request", return_value=resp),
+            patch("utils.api_client.http_client.request", return_value=resp),
             caplog.at_level(logging.ERROR, logger="curatarr"),
         ):
             with pytest.raises(_FakeAPIError):
@@ -187,7 +187,7 @@ class TestExternalApiFailureLogging:
         import requests
 
         with (
-            patch("utils.api_client.requests.request", side_effect=requests.exceptions.ConnectionError("refused")),
+            patch("utils.api_client.http_client.request", side_effect=requests.exceptions.ConnectionError("refused")),
             caplog.at_level(logging.ERROR, logger="curatarr"),
         ):
             with pytest.raises(_FakeAPIError):
@@ -202,7 +202,7 @@ class TestExternalApiFailureLogging:
         import requests
 
         with (
-            patch("utils.api_client.requests.request", side_effect=requests.exceptions.Timeout("timed out")),
+            patch("utils.api_client.http_client.request", side_effect=requests.exceptions.Timeout("timed out")),
             caplog.at_level(logging.ERROR, logger="curatarr"),
         ):
             with pytest.raises(_FakeAPIError):
@@ -218,10 +218,47 @@ class TestExternalApiFailureLogging:
 
         resp = _make_response(404, "http://radarr.local/api")
         with (
-            patch("utils.api_client.requests.request", return_value=resp),
+            patch("utils.api_client.http_client.request", return_value=resp),
             caplog.at_level(logging.ERROR, logger="curatarr"),
         ):
             result = client._make_request_to_url("GET", "http://radarr.local/api")
 
         assert result is None
         assert caplog.text == ""
+
+
+class _CoalescingClient(_Client):
+    api_name = "FakeCoalescingAPI"
+    coalesce_requests = True
+
+
+class TestRequestCoalescing:
+    def test_off_unless_the_client_opts_in(self, client):
+        assert client.single_flight is None
+        assert _CoalescingClient().single_flight is not None
+
+    def test_gets_are_keyed_by_url_params_and_headers(self):
+        coalescing = _CoalescingClient()
+        resp = _make_response(200, "http://api.local/x")
+        with (
+            patch.object(coalescing.single_flight, "do", wraps=coalescing.single_flight.do) as do,
+            patch("utils.api_client.http_client.request", return_value=resp),
+        ):
+            coalescing._send_with_retries("GET", "http://api.local/x", params={"page": 1}, headers={"A": "t1"})
+            coalescing._send_with_retries("GET", "http://api.local/x", params={"page": 1}, headers={"A": "t2"})
+
+        first, second = (c.args[0] for c in do.call_args_list)
+        assert first[:2] == second[:2] == ("http://api.local/x", (("page", "1"),))
+        # Another user's token is another key - never a shared response
+        assert first != second
+
+    def test_writes_are_sent_directly(self):
+        coalescing = _CoalescingClient()
+        resp = _make_response(201, "http://api.local/x")
+        with (
+            patch.object(coalescing.single_flight, "do") as do,
+            patch("utils.api_client.http_client.request", return_value=resp) as mock_req,
+        ):
+            assert coalescing._send_with_retries("POST", "http://api.local/x", data={"a": 1}) is resp
+        do.assert_not_called()
+        mock_req.assert_called_once()
@@ -21,15 +21,37 @@ Tests for recommenders/base.py - Base cache and recommender classes.
 import copy
 import json
 import os
+import random
+import threading
 from collections import Counter
 from unittest.mock import Mock, patch
 
 import plexapi.exceptions
+import pytest
 import requests
 
 import recommenders.base as base_module
 from recommenders.base import RECOMMEND_FOR_NO_HISTORY_DEFAULT, BaseCache, BaseRecommender
+from utils.batch_scoring import batch_scoring_available
+from utils.cache import load_score_store_record, save_score_store
+from utils.config import BATCH_SCORE_TOLERANCE
 from utils.helpers import get_project_root
+from utils.scoring import calculate_similarity_score, recommendation_rank_key
+from utils.tmdb import title_record
+
+
+def _stored_scores(recommender, profile_hash="hash1"):
+    """The recommender's saved score store's scores, checking it was saved for `profile_hash`."""
+    record = load_score_store_record(recommender._score_store_path())
+    assert record["profile_hash"] == profile_hash
+    return record["scores"]
+
+
+def _title_record(media_type="movie", **fields):
+    """A canonical TMDB title record (utils.tmdb.title_record) with `fields` set."""
+    record = title_record({}, media_type)
+    record.update(fields)
+    return record
 
 
 class ConcreteCache(BaseCache):
@@ -80,6 +102,23 @@ class TestBaseCacheInit:
         assert cache.recommender is mock_recommender
 
 
+class TestBaseCacheLegacyScoreFields:
+    """Per-item scores moved to the per-user score store."""
+
+    @patch("recommenders.base.load_media_cache")
+    def test_legacy_score_fields_dropped_on_load(self, mock_load):
+        mock_load.return_value = {
+            "movies": {
+                "123": {"title": "Test", "cached_score": 0.5, "profile_hash": "abc", "score_breakdown": {}},
+            },
+            "library_count": 1,
+        }
+
+        cache = ConcreteCache("/tmp/cache")
+
+        assert cache.cache["movies"]["123"] == {"title": "Test"}
+
+
 class TestBaseCachePerLibraryFilePath:
     """Tests for #157 cross-library cache eviction fix.
 
@@ -161,6 +200,38 @@ class TestBaseCachePerLibraryFilePath:
         assert "a-item" not in cache_b_reloaded.cache["movies"]
 
 
+class TestBaseCacheSqliteBackend:
+    """general.cache_backend: sqlite (utils/media_store.py)."""
+
+    @staticmethod
+    def _recommender(backend):
+        recommender = Mock()
+        recommender._cache_library_prefix.return_value = ""
+        recommender.config = {"general": {"cache_backend": backend}}
+        return recommender
+
+    def test_round_trips_through_the_database(self, tmp_path):
+        cache = ConcreteCache(str(tmp_path), recommender=self._recommender("sqlite"))
+        cache.cache["movies"]["1"] = {"title": "Heat"}
+        cache.cache["library_count"] = 1
+        cache._save_cache()
+
+        reloaded = ConcreteCache(str(tmp_path), recommender=self._recommender("sqlite"))
+
+        assert reloaded.cache["movies"] == {"1": {"title": "Heat"}}
+        assert os.path.exists(os.path.join(str(tmp_path), "test_cache.db"))
+        assert not os.path.exists(cache.cache_path)
+
+    def test_imports_the_json_cache_on_first_use(self, tmp_path):
+        json_cache = ConcreteCache(str(tmp_path), recommender=self._recommender("json"))
+        json_cache.cache["movies"]["1"] = {"title": "Heat"}
+        json_cache._save_cache()
+
+        cache = ConcreteCache(str(tmp_path), recommender=self._recommender("sqlite"))
+
+        assert cache.cache["movies"] == {"1": {"title": "Heat"}}
+
+
 class TestBaseCacheSave:
     """Tests for BaseCache save functionality."""
 
@@ -184,11 +255,11 @@ class TestBaseCacheUpdate:
     @patch("recommenders.base.load_media_cache")
     def test_update_returns_false_when_up_to_date(self, mock_load, mock_save):
         """Test that update returns False when cache is current."""
-        mock_load.return_value = {"movies": {}, "library_count": 5}
+        mock_load.return_value = {"movies": {str(key): {"title": "Cached"} for key in range(5)}, "library_count": 5}
 
         mock_plex = Mock()
         mock_section = Mock()
-        mock_section.all.return_value = [Mock() for _ in range(5)]
+        mock_section.all.return_value = [Mock(ratingKey=key) for key in range(5)]
         mock_plex.library.section.return_value = mock_section
 
         cache = ConcreteCache("/tmp/cache")
@@ -264,6 +335,274 @@ class TestBaseCacheUpdate:
         assert result is True  # Still returns True (cache was updated)
         mock_warn.assert_called()
 
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_snapshot_items_are_batch_loaded_not_reloaded(self, mock_load, mock_save):
+        """New snapshot records are processed as their batch-loaded full items."""
+        from utils.plex import LibraryItem
+
+        mock_load.return_value = {"movies": {}, "library_count": 0}
+        records = [
+            LibraryItem(key, "movie", f"Movie {key}", 2020, (), (), 0, None, None, None, None, None) for key in (1, 2)
+        ]
+        full_items = [Mock(ratingKey=1, title="Full 1", year=2020), Mock(ratingKey=2, title="Full 2", year=2021)]
+        mock_plex = Mock()
+        mock_plex.fetchItems.return_value = full_items
+
+        cache = ConcreteCache("/tmp/cache")
+        assert cache.update_cache(mock_plex, "Movies", all_items=records) is True
+
+        mock_plex.fetchItems.assert_called_once_with([1, 2])
+        assert cache.cache["movies"]["1"]["title"] == "Full 1"
+        assert cache.cache["movies"]["2"]["year"] == 2021
+        for full in full_items:
+            full.reload.assert_not_called()
+
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_update_keeps_the_library_index_in_step(self, mock_load, mock_save, tmp_path):
+        """Added and removed items adjust the persisted library index
+        rather than leaving it stale."""
+        mock_load.return_value = {
+            "movies": {"old_id": {"title": "Old Movie", "genres": ["drama"], "tmdb_id": 5}},
+            "library_count": 0,
+        }
+        mock_item = Mock()
+        mock_item.ratingKey = "new_id"
+        mock_item.title = "New Movie"
+        mock_plex = Mock()
+        mock_plex.library.section.return_value.all.return_value = [mock_item]
+
+        cache = ConcreteCache(str(tmp_path))
+        assert cache.library_index().library_tmdb_ids() == {5}
+        cache.update_cache(mock_plex, "Movies")
+
+        index = cache.library_index()
+        assert index.total == 1
+        assert index.library_tmdb_ids() == set()
+        assert set(index.genre_mass) == {"action", "comedy"}
+        assert index.version == base_module.library_content_version(cache.cache, "movies")
+        assert base_module.load_library_index(cache.index_path, index.version)
+
+
+def _listed(key, updated_at=None):
+    """A snapshot record of rating key `key`, last updated at `updated_at`."""
+    from datetime import datetime
+
+    from utils.plex import LibraryItem
+
+    return LibraryItem(
+        ratingKey=key,
+        type="movie",
+        title=f"Movie {key}",
+        year=2020,
+        guids=(),
+        labels=(),
+        viewCount=0,
+        userRating=None,
+        leafCount=None,
+        lastViewedAt=None,
+        addedAt=None,
+        updatedAt=datetime.fromtimestamp(updated_at) if updated_at else None,
+    )
+
+
+class TestBaseCacheDeltaSync:
+    """update_cache() re-analyzes only what changed in Plex."""
+
+    @staticmethod
+    def _plex(title):
+        """A server whose fetchItems() loads every item as `title`."""
+        plex = Mock()
+        plex.fetchItems.side_effect = lambda keys: [Mock(ratingKey=key, title=title, year=2020) for key in keys]
+        return plex
+
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_swap_with_equal_count_is_noticed(self, mock_load, mock_save):
+        mock_load.return_value = {
+            "movies": {"1": {"title": "Gone"}},
+            "library_count": 1,
+            "library_keys_digest": base_module.library_keys_digest(["1"]),
+        }
+
+        cache = ConcreteCache("/tmp/cache")
+        assert cache.update_cache(self._plex("Arrived"), "Movies", all_items=[_listed(2, 1_700_000_000)]) is True
+
+        assert cache.cache["movies"] == {
+            "2": {"title": "Arrived", "year": 2020, "genres": ["action", "comedy"], "plex_updated_at": 1_700_000_000}
+        }
+        assert cache.cache["library_keys_digest"] == base_module.library_keys_digest([2])
+
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_only_items_updated_in_plex_are_re_analyzed(self, mock_load, mock_save):
+        mock_load.return_value = {
+            "movies": {
+                "1": {"title": "Old 1", "plex_updated_at": 1_700_000_000},
+                "2": {"title": "Old 2", "plex_updated_at": 1_700_000_000},
+            },
+            "library_count": 2,
+            "library_keys_digest": base_module.library_keys_digest(["1", "2"]),
+        }
+        plex = self._plex("Relabeled")
+
+        cache = ConcreteCache("/tmp/cache")
+        listing = [_listed(1, 1_700_000_000), _listed(2, 1_700_009_999)]
+        assert cache.update_cache(plex, "Movies", all_items=listing) is True
+
+        plex.fetchItems.assert_called_once_with([2])
+        assert cache.cache["movies"]["1"]["title"] == "Old 1"
+        assert cache.cache["movies"]["2"]["title"] == "Relabeled"
+        assert cache.cache["movies"]["2"]["plex_updated_at"] == 1_700_009_999
+        assert cache.library_index().total == 2
+
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_unchanged_library_makes_no_request(self, mock_load, mock_save):
+        mock_load.return_value = {
+            "movies": {"1": {"title": "Old 1", "plex_updated_at": 1_700_000_000}},
+            "library_count": 1,
+            "library_keys_digest": base_module.library_keys_digest(["1"]),
+        }
+        plex = self._plex("unused")
+
+        cache = ConcreteCache("/tmp/cache")
+        assert cache.update_cache(plex, "Movies", all_items=[_listed(1, 1_700_000_000)]) is False
+
+        plex.fetchItems.assert_not_called()
+        mock_save.assert_not_called()
+
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_unstamped_entries_are_stamped_not_re_analyzed(self, mock_load, mock_save):
+        mock_load.return_value = {"movies": {"1": {"title": "Old 1"}}, "library_count": 1}
+        plex = self._plex("unused")
+
+        cache = ConcreteCache("/tmp/cache")
+        assert cache.update_cache(plex, "Movies", all_items=[_listed(1, 1_700_000_000)]) is False
+
+        plex.fetchItems.assert_not_called()
+        assert cache.cache["movies"]["1"] == {"title": "Old 1", "plex_updated_at": 1_700_000_000}
+        assert cache.cache["library_keys_digest"] == base_module.library_keys_digest([1])
+        mock_save.assert_called_once()
+
+    @patch("recommenders.base.log_warning")
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_changed_item_that_fails_keeps_its_entry(self, mock_load, mock_save, mock_warn):
+        mock_load.return_value = {
+            "movies": {"1": {"title": "Old 1", "plex_updated_at": 1_700_000_000}},
+            "library_count": 1,
+            "library_keys_digest": base_module.library_keys_digest(["1"]),
+        }
+        plex = Mock()
+        plex.fetchItems.return_value = []
+
+        cache = ConcreteCache("/tmp/cache")
+        cache.update_cache(plex, "Movies", all_items=[_listed(1, 1_700_009_999)])
+
+        assert cache.cache["movies"]["1"] == {"title": "Old 1", "plex_updated_at": 1_700_000_000}
+        mock_warn.assert_called()
+
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_rewritten_entry_keeps_its_place_in_cache_and_index(self, mock_load, mock_save, tmp_path):
+        from utils.library_index import LibraryIndex
+
+        def entry(key):
+            return {"title": f"Old {key}", "genres": ["drama"], "collection_id": 10, "tmdb_id": key}
+
+        mock_load.return_value = {
+            "movies": {str(key): {**entry(key), "plex_updated_at": 1_700_000_000} for key in (1, 2, 3)},
+            "library_count": 3,
+            "library_keys_digest": base_module.library_keys_digest(["1", "2", "3"]),
+        }
+        cache = ConcreteCache(str(tmp_path))
+        cache.library_index()
+        listing = [_listed(1, 1_700_009_999), _listed(2, 1_700_000_000), _listed(3, 1_700_000_000)]
+
+        with patch.object(cache, "_process_item", return_value={**entry(1), "title": "Re-matched 1"}):
+            cache.update_cache(self._plex("unused"), "Movies", all_items=listing)
+
+        assert list(cache.cache["movies"]) == ["1", "2", "3"]
+        index = cache.library_index()
+        rebuilt = LibraryIndex.build(cache.cache["movies"], index.version)
+        assert list(index.collection_members) == list(rebuilt.collection_members) == ["1", "2", "3"]
+        assert (index.total, index.document_frequency, index.genre_mass, index.tmdb_ids) == (
+            rebuilt.total,
+            rebuilt.document_frequency,
+            rebuilt.genre_mass,
+            rebuilt.tmdb_ids,
+        )
+
+    @staticmethod
+    def _loaded(key, title, labels=()):
+        """A fully loaded item carrying its XML, as plexapi builds them."""
+        import xml.etree.ElementTree as ET
+
+        data = ET.Element("Video", ratingKey=str(key), title=title)
+        for label in labels:
+            ET.SubElement(data, "Label", tag=label)
+        return Mock(ratingKey=key, title=title, year=2020, _data=data)
+
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_label_only_change_is_re_stamped_not_re_analyzed(self, mock_load, mock_save):
+        from utils.plex import plex_metadata_digest
+
+        entry = {
+            "title": "Old 1",
+            "plex_updated_at": 1_700_000_000,
+            "plex_digest": plex_metadata_digest(self._loaded(1, "Movie 1")),
+        }
+        mock_load.return_value = {
+            "movies": {"1": entry},
+            "library_count": 1,
+            "library_keys_digest": base_module.library_keys_digest(["1"]),
+            "content_version": 3,
+        }
+        plex = Mock()
+        plex.fetchItems.return_value = [self._loaded(1, "Movie 1", labels=("Curatarr_alice",))]
+
+        cache = ConcreteCache("/tmp/cache")
+        with patch.object(cache, "_process_item") as process:
+            cache.update_cache(plex, "Movies", all_items=[_listed(1, 1_700_009_999)])
+
+        process.assert_not_called()
+        assert cache.cache["movies"]["1"] == {**entry, "plex_updated_at": 1_700_009_999}
+        assert cache.cache["content_version"] == 3
+
+    @patch("recommenders.base.save_media_cache")
+    @patch("recommenders.base.load_media_cache")
+    def test_metadata_change_is_re_analyzed(self, mock_load, mock_save):
+        from utils.plex import plex_metadata_digest
+
+        mock_load.return_value = {
+            "movies": {
+                "1": {
+                    "title": "Old 1",
+                    "plex_updated_at": 1_700_000_000,
+                    "plex_digest": plex_metadata_digest(self._loaded(1, "Movie 1")),
+                }
+            },
+            "library_count": 1,
+            "library_keys_digest": base_module.library_keys_digest(["1"]),
+            "content_version": 3,
+        }
+        rematched = self._loaded(1, "Movie One")
+        plex = Mock()
+        plex.fetchItems.return_value = [rematched]
+
+        cache = ConcreteCache("/tmp/cache")
+        cache.update_cache(plex, "Movies", all_items=[_listed(1, 1_700_009_999)])
+
+        entry = cache.cache["movies"]["1"]
+        assert entry["title"] == "Movie One"
+        assert entry["plex_digest"] == plex_metadata_digest(rematched)
+        assert entry["plex_updated_at"] == 1_700_009_999
+        assert cache.cache["content_version"] == 4
+
 
 class TestBaseCacheGetLanguage:
     """Tests for BaseCache._get_language method."""
@@ -361,14 +700,14 @@ class TestBaseCacheGetTmdbData:
         assert result["imdb_id"] == "tt123"
         assert result["tmdb_id"] == 456
 
-    @patch("recommenders.base.get_tmdb_keywords")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
     @patch("recommenders.base.load_media_cache")
-    def test_get_tmdb_data_fetches_keywords(self, mock_load, mock_extract, mock_keywords):
-        """Test that keywords are fetched from TMDB."""
+    def test_get_tmdb_data_fetches_keywords(self, mock_load, mock_extract, mock_record):
+        """Test that keywords are fetched from TMDB (lowercased)."""
         mock_load.return_value = {"movies": {}, "library_count": 0}
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": 123}
-        mock_keywords.return_value = ["action", "hero"]
+        mock_record.return_value = _title_record(keywords=["Action", "hero"])
 
         cache = ConcreteCache("/tmp/cache")
         mock_item = Mock()
@@ -377,16 +716,37 @@ class TestBaseCacheGetTmdbData:
 
         assert result["keywords"] == ["action", "hero"]
 
-    @patch("recommenders.base.fetch_tmdb_with_retry")
-    @patch("recommenders.base.get_tmdb_keywords")
+    @patch("recommenders.base.fetch_title_record")
+    @patch("recommenders.base.extract_ids_from_guids")
+    @patch("recommenders.base.load_media_cache")
+    def test_get_tmdb_data_is_one_title_fetch(self, mock_load, mock_extract, mock_record):
+        """Keywords, rating, collection and IMDB id all come from a single
+        title record fetch."""
+        mock_load.return_value = {"movies": {}, "library_count": 0}
+        mock_extract.return_value = {"imdb_id": None, "tmdb_id": 123}
+        mock_record.return_value = _title_record(
+            keywords=["heist"], rating=7.0, vote_count=10, collection_id=5, collection_name="C", imdb_id="tt9"
+        )
+
+        cache = ConcreteCache("/tmp/cache")
+        result = cache._get_tmdb_data(Mock(), "api_key")
+
+        mock_record.assert_called_once_with("api_key", 123, "movie")
+        assert (result["keywords"], result["rating"], result["collection_id"], result["imdb_id"]) == (
+            ["heist"],
+            7.0,
+            5,
+            "tt9",
+        )
+
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
     @patch("recommenders.base.load_media_cache")
-    def test_get_tmdb_data_fetches_movie_rating(self, mock_load, mock_extract, mock_keywords, mock_fetch):
+    def test_get_tmdb_data_fetches_movie_rating(self, mock_load, mock_extract, mock_record):
         """Test that movie rating is fetched from TMDB."""
         mock_load.return_value = {"movies": {}, "library_count": 0}
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": 123}
-        mock_keywords.return_value = []
-        mock_fetch.return_value = {"vote_average": 7.5, "vote_count": 1000}
+        mock_record.return_value = _title_record(rating=7.5, vote_count=1000)
 
         cache = ConcreteCache("/tmp/cache")
         mock_item = Mock()
@@ -432,11 +792,10 @@ class TestBaseCacheGetTmdbData:
 
         assert mock_recommender.plex_tmdb_cache["456"] == 123
 
-    @patch("recommenders.base.fetch_tmdb_with_retry")
-    @patch("recommenders.base.get_tmdb_keywords")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
     @patch("recommenders.base.load_media_cache")
-    def test_get_tmdb_data_fetches_tv_rating(self, mock_load, mock_extract, mock_keywords, mock_fetch):
+    def test_get_tmdb_data_fetches_tv_rating(self, mock_load, mock_extract, mock_record):
         """Test that TV show rating/vote_count is fetched from TMDB too,
         mirroring test_get_tmdb_data_fetches_movie_rating above. Regression
         test for the tv: quality_filters no-op bug - ShowCache never
@@ -446,12 +805,7 @@ class TestBaseCacheGetTmdbData:
         fetch (which must keep working unchanged)."""
         mock_load.return_value = {"shows": {}, "library_count": 0}
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": 123}
-        mock_keywords.return_value = []
-        mock_fetch.return_value = {
-            "vote_average": 8.4,
-            "vote_count": 2000,
-            "production_companies": [{"id": 42, "name": "Test Studio"}],
-        }
+        mock_record.return_value = _title_record("tv", rating=8.4, vote_count=2000, production_company_ids=[42])
 
         class TVCache(BaseCache):
             media_type = "tv"
@@ -470,24 +824,18 @@ class TestBaseCacheGetTmdbData:
         assert result["vote_count"] == 2000
         assert result["production_company_ids"] == [42]
 
-    @patch("recommenders.base.fetch_tmdb_with_retry")
-    @patch("recommenders.base.get_tmdb_keywords")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
     @patch("recommenders.base.load_media_cache")
-    def test_get_tmdb_data_movie_rating_unaffected_by_tv_change(
-        self, mock_load, mock_extract, mock_keywords, mock_fetch
-    ):
+    def test_get_tmdb_data_movie_rating_unaffected_by_tv_change(self, mock_load, mock_extract, mock_record):
         """Movie path regression check: a movie's _get_tmdb_data result
         must still carry rating/vote_count/collection info and never
         production_company_ids, unchanged by the TV branch fix above."""
         mock_load.return_value = {"movies": {}, "library_count": 0}
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": 123}
-        mock_keywords.return_value = []
-        mock_fetch.return_value = {
-            "vote_average": 7.1,
-            "vote_count": 300,
-            "belongs_to_collection": {"id": 9, "name": "Test Collection"},
-        }
+        mock_record.return_value = _title_record(
+            rating=7.1, vote_count=300, collection_id=9, collection_name="Test Collection", production_company_ids=[1]
+        )
 
         cache = ConcreteCache("/tmp/cache")
         mock_item = Mock()
@@ -1217,11 +1565,10 @@ class TestBaseCacheBackfillCollectionData:
 
         assert result is False
 
-    @patch("recommenders.base.time.sleep")
-    @patch("recommenders.base.fetch_tmdb_with_retry")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.save_media_cache")
     @patch("recommenders.base.load_media_cache")
-    def test_backfill_updates_movies_missing_collection_id(self, mock_load, mock_save, mock_fetch, mock_sleep):
+    def test_backfill_updates_movies_missing_collection_id(self, mock_load, mock_save, mock_fetch):
         """Test backfill adds collection data to movies missing it."""
         mock_load.return_value = {
             "movies": {
@@ -1229,7 +1576,7 @@ class TestBaseCacheBackfillCollectionData:
             },
             "library_count": 1,
         }
-        mock_fetch.return_value = {"belongs_to_collection": {"id": 789, "name": "Test Collection"}}
+        mock_fetch.return_value = _title_record(collection_id=789, collection_name="Test Collection")
 
         cache = ConcreteCache("/tmp/cache")
         result = cache._backfill_collection_data("api_key")
@@ -1238,14 +1585,13 @@ class TestBaseCacheBackfillCollectionData:
         assert cache.cache["movies"]["123"]["collection_id"] == 789
         assert cache.cache["movies"]["123"]["collection_name"] == "Test Collection"
 
-    @patch("recommenders.base.time.sleep")
-    @patch("recommenders.base.fetch_tmdb_with_retry")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.save_media_cache")
     @patch("recommenders.base.load_media_cache")
-    def test_backfill_sets_none_when_no_collection(self, mock_load, mock_save, mock_fetch, mock_sleep):
+    def test_backfill_sets_none_when_no_collection(self, mock_load, mock_save, mock_fetch):
         """Test backfill sets None when movie has no collection."""
         mock_load.return_value = {"movies": {"123": {"tmdb_id": 456, "title": "Standalone Movie"}}, "library_count": 1}
-        mock_fetch.return_value = {"id": 456, "title": "Standalone Movie"}  # No belongs_to_collection key
+        mock_fetch.return_value = _title_record(tmdb_id=456, title="Standalone Movie")  # No collection
 
         cache = ConcreteCache("/tmp/cache")
         result = cache._backfill_collection_data("api_key")
@@ -1254,11 +1600,10 @@ class TestBaseCacheBackfillCollectionData:
         assert cache.cache["movies"]["123"]["collection_id"] is None
         assert cache.cache["movies"]["123"]["collection_name"] is None
 
-    @patch("recommenders.base.time.sleep")
-    @patch("recommenders.base.fetch_tmdb_with_retry")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.save_media_cache")
     @patch("recommenders.base.load_media_cache")
-    def test_backfill_handles_fetch_error(self, mock_load, mock_save, mock_fetch, mock_sleep):
+    def test_backfill_handles_fetch_error(self, mock_load, mock_save, mock_fetch):
         """Test backfill continues when fetch fails."""
         mock_load.return_value = {
             "movies": {"123": {"tmdb_id": 456, "title": "Movie 1"}, "124": {"tmdb_id": 457, "title": "Movie 2"}},
@@ -1266,7 +1611,7 @@ class TestBaseCacheBackfillCollectionData:
         }
         mock_fetch.side_effect = [
             requests.RequestException("Network error"),
-            {"belongs_to_collection": {"id": 1, "name": "Collection"}},
+            _title_record(collection_id=1, collection_name="Collection"),
         ]
 
         cache = ConcreteCache("/tmp/cache")
@@ -1295,11 +1640,10 @@ class TestBaseCacheBackfillCollectionData:
 class TestBaseCacheUpdateWithBackfill:
     """Tests for BaseCache.update_cache with backfill integration."""
 
-    @patch("recommenders.base.time.sleep")
-    @patch("recommenders.base.fetch_tmdb_with_retry")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.save_media_cache")
     @patch("recommenders.base.load_media_cache")
-    def test_update_triggers_backfill_when_cache_up_to_date(self, mock_load, mock_save, mock_fetch, mock_sleep):
+    def test_update_triggers_backfill_when_cache_up_to_date(self, mock_load, mock_save, mock_fetch):
         """Test that backfill runs even when cache is up to date."""
         mock_load.return_value = {
             "movies": {
@@ -1307,7 +1651,7 @@ class TestBaseCacheUpdateWithBackfill:
             },
             "library_count": 1,
         }
-        mock_fetch.return_value = {"belongs_to_collection": {"id": 789, "name": "Collection"}}
+        mock_fetch.return_value = _title_record(collection_id=789, collection_name="Collection")
 
         mock_plex = Mock()
         mock_item = Mock()
@@ -1327,20 +1671,16 @@ class TestBaseCacheUpdateWithBackfill:
 class TestBaseCacheGetTmdbDataWithCollection:
     """Tests for BaseCache._get_tmdb_data collection data extraction."""
 
-    @patch("recommenders.base.fetch_tmdb_with_retry")
-    @patch("recommenders.base.get_tmdb_keywords")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
     @patch("recommenders.base.load_media_cache")
-    def test_get_tmdb_data_extracts_collection_info(self, mock_load, mock_extract, mock_keywords, mock_fetch):
+    def test_get_tmdb_data_extracts_collection_info(self, mock_load, mock_extract, mock_record):
         """Test that collection info is extracted from TMDB response."""
         mock_load.return_value = {"movies": {}, "library_count": 0}
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": 123}
-        mock_keywords.return_value = []
-        mock_fetch.return_value = {
-            "vote_average": 7.5,
-            "vote_count": 1000,
-            "belongs_to_collection": {"id": 456, "name": "Marvel Collection"},
-        }
+        mock_record.return_value = _title_record(
+            rating=7.5, vote_count=1000, collection_id=456, collection_name="Marvel Collection"
+        )
 
         cache = ConcreteCache("/tmp/cache")
         mock_item = Mock()
@@ -1350,16 +1690,14 @@ class TestBaseCacheGetTmdbDataWithCollection:
         assert result["collection_id"] == 456
         assert result["collection_name"] == "Marvel Collection"
 
-    @patch("recommenders.base.fetch_tmdb_with_retry")
-    @patch("recommenders.base.get_tmdb_keywords")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
     @patch("recommenders.base.load_media_cache")
-    def test_get_tmdb_data_handles_no_collection(self, mock_load, mock_extract, mock_keywords, mock_fetch):
+    def test_get_tmdb_data_handles_no_collection(self, mock_load, mock_extract, mock_record):
         """Test that no collection is handled gracefully."""
         mock_load.return_value = {"movies": {}, "library_count": 0}
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": 123}
-        mock_keywords.return_value = []
-        mock_fetch.return_value = {"vote_average": 7.5, "vote_count": 1000}
+        mock_record.return_value = _title_record(rating=7.5, vote_count=1000)
 
         cache = ConcreteCache("/tmp/cache")
         mock_item = Mock()
@@ -1373,14 +1711,14 @@ class TestBaseCacheGetTmdbDataWithCollection:
 class TestBaseCacheGetTmdbDataKeywordsCache:
     """Tests for BaseCache._get_tmdb_data updating keyword caches."""
 
-    @patch("recommenders.base.get_tmdb_keywords")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
     @patch("recommenders.base.load_media_cache")
-    def test_get_tmdb_data_updates_keywords_cache(self, mock_load, mock_extract, mock_keywords):
+    def test_get_tmdb_data_updates_keywords_cache(self, mock_load, mock_extract, mock_record):
         """Test that TMDB keywords are cached on recommender."""
         mock_load.return_value = {"movies": {}, "library_count": 0}
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": 123}
-        mock_keywords.return_value = ["action", "hero", "superhero"]
+        mock_record.return_value = _title_record(keywords=["action", "hero", "superhero"])
 
         mock_recommender = Mock()
         mock_recommender.plex_tmdb_cache = {}
@@ -1403,7 +1741,7 @@ class TestBaseCacheTVShowBackfill:
     @patch("recommenders.base.load_media_cache")
     def test_backfill_skips_tv_shows(self, mock_load, mock_save):
         """Test that backfill does not run for TV show caches."""
-        mock_load.return_value = {"shows": {}, "library_count": 1}
+        mock_load.return_value = {"shows": {"123": {"title": "Cached Show"}}, "library_count": 1}
 
         class TVCache(BaseCache):
             media_type = "tv"  # Not 'movie'
@@ -2221,14 +2559,61 @@ class TestGetAllLibraryItemsForUser:
         mock_log_warning.assert_called()
 
 
+class TestLibraryItemsForUsers:
+    """Tests for BaseRecommender._library_items_for_users - the per-user
+    snapshots fetched concurrently."""
+
+    def test_snapshots_are_fetched_concurrently_and_yielded_in_order(self):
+        recommender = _make_recommender()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def snapshot(username):
+            # Only passes once all three users' fetches are in flight.
+            barrier.wait()
+            return [username]
+
+        recommender._get_all_library_items_for_user = snapshot
+
+        results = list(recommender._library_items_for_users(["alice", "bob", "carol"]))
+
+        assert results == [("alice", ["alice"]), ("bob", ["bob"]), ("carol", ["carol"])]
+
+    def test_concurrency_is_capped_by_config(self):
+        recommender = _make_recommender()
+        recommender.config["plex"]["max_concurrent_requests"] = 1
+        threads = set()
+
+        def snapshot(username):
+            threads.add(threading.get_ident())
+            return []
+
+        recommender._get_all_library_items_for_user = snapshot
+
+        list(recommender._library_items_for_users(["alice", "bob"]))
+
+        assert threads == {threading.get_ident()}
+
+    def test_failed_user_is_left_out(self):
+        recommender = _make_recommender()
+
+        def snapshot(username):
+            if username == "bob":
+                raise plexapi.exceptions.PlexApiException("admin snapshot failed too")
+            return [username]
+
+        recommender._get_all_library_items_for_user = snapshot
+
+        assert list(recommender._library_items_for_users(["alice", "bob"])) == [("alice", ["alice"])]
+
+
 class TestFindPlexItemsForRecs:
     """Tests for BaseRecommender._find_plex_items_for_recs."""
 
     def test_finds_by_rating_key(self):
         recommender = _make_recommender()
         recommender.plex = Mock()
-        found_item = Mock()
-        recommender.plex.fetchItem.return_value = found_item
+        found_item = Mock(ratingKey=123)
+        recommender.plex.fetchItems.return_value = [found_item]
         section = Mock()
         selected = [{"title": "A", "year": 2020, "plex_rating_key": 123}]
 
@@ -2236,12 +2621,31 @@ class TestFindPlexItemsForRecs:
 
         assert items_found == [found_item]
         assert skipped == []
-        found_item.reload.assert_called_once()
+        # Already loaded in full by the batch fetch
+        found_item.reload.assert_not_called()
+        recommender.plex.fetchItem.assert_not_called()
+
+    def test_rating_keys_fetched_in_one_batch_in_rec_order(self):
+        recommender = _make_recommender()
+        recommender.plex = Mock()
+        first, second = Mock(ratingKey=1), Mock(ratingKey=2)
+        recommender.plex.fetchItems.return_value = [second, first]
+        recommender._find_plex_item = Mock()
+        selected = [
+            {"title": "A", "year": 2020, "plex_rating_key": 1},
+            {"title": "B", "year": 2021, "plex_rating_key": "2"},
+        ]
+
+        items_found, skipped = recommender._find_plex_items_for_recs(Mock(), selected)
+
+        assert items_found == [first, second]
+        recommender.plex.fetchItems.assert_called_once_with([1, 2])
+        recommender._find_plex_item.assert_not_called()
 
     def test_falls_back_to_fuzzy_search_on_fetch_error(self):
         recommender = _make_recommender()
         recommender.plex = Mock()
-        recommender.plex.fetchItem.side_effect = Exception("not found")
+        recommender.plex.fetchItems.side_effect = plexapi.exceptions.NotFound("not found")
         found_item = Mock()
         recommender._find_plex_item = Mock(return_value=found_item)
         section = Mock()
@@ -2251,6 +2655,25 @@ class TestFindPlexItemsForRecs:
 
         assert items_found == [found_item]
         recommender._find_plex_item.assert_called_once_with(section, selected[0])
+        found_item.reload.assert_called_once()
+
+    def test_stale_rating_key_falls_back_to_fuzzy_search(self):
+        recommender = _make_recommender()
+        recommender.plex = Mock()
+        live_item = Mock(ratingKey=1)
+        recommender.plex.fetchItems.return_value = [live_item]
+        found_item = Mock()
+        recommender._find_plex_item = Mock(return_value=found_item)
+        section = Mock()
+        selected = [
+            {"title": "A", "year": 2020, "plex_rating_key": 1},
+            {"title": "B", "year": 2021, "plex_rating_key": 999},
+        ]
+
+        items_found, skipped = recommender._find_plex_items_for_recs(section, selected)
+
+        assert items_found == [live_item, found_item]
+        recommender._find_plex_item.assert_called_once_with(section, selected[1])
 
     def test_no_rating_key_uses_fuzzy_search(self):
         recommender = _make_recommender()
@@ -2290,6 +2713,27 @@ class TestRemoveOutdatedLabels:
         reasons = {call.args[3] for call in mock_remove.call_args_list}
         assert reasons == {"watched", "excluded genre"}
 
+    @patch("recommenders.base.remove_labels_from_items")
+    @patch("recommenders.base.categorize_labeled_items")
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_labeled_items_loaded_in_one_batch(self, mock_excl, mock_categorize, mock_remove):
+        recommender = _make_recommender()
+        recommender.plex = Mock()
+        section = Mock()
+        partial_a, partial_b = Mock(ratingKey=1), Mock(ratingKey=2)
+        full_a, full_b = Mock(ratingKey=1), Mock(ratingKey=2)
+        section.search.return_value = [partial_a, partial_b]
+        recommender.plex.fetchItems.return_value = [full_a, full_b]
+        mock_categorize.return_value = {"fresh": [full_a, full_b], "watched": [], "excluded": [], "stale": []}
+
+        recommender._remove_outdated_labels(section, "Recommended_alice", 7)
+
+        recommender.plex.fetchItems.assert_called_once_with([1, 2])
+        assert mock_categorize.call_args.args[0] == [full_a, full_b]
+        assert mock_categorize.call_args.kwargs["reload_items"] is False
+        partial_a.reload.assert_not_called()
+        partial_b.reload.assert_not_called()
+
 
 class TestBuildScoredCandidates:
     """Tests for BaseRecommender._build_scored_candidates."""
@@ -2414,6 +2858,21 @@ class TestUpdateLabelsByRank:
         mock_remove.assert_called_once()
         mock_add.assert_called_once()
 
+    @patch("recommenders.base.add_labels_to_items")
+    @patch("recommenders.base.remove_labels_from_items")
+    def test_section_passed_through_for_bulk_edits(self, mock_remove, mock_add):
+        recommender = _make_recommender()
+        item_high, item_low, item_new = Mock(ratingKey=1), Mock(ratingKey=2), Mock(ratingKey=3)
+        candidates = {1: (item_high, 0.9), 2: (item_low, 0.1), 3: (item_new, 0.8)}
+        section = Mock()
+
+        recommender._update_labels_by_rank(
+            candidates, [item_high, item_low], "Recommended_alice", target_count=2, section=section
+        )
+
+        assert mock_remove.call_args.kwargs["section"] is section
+        assert mock_add.call_args.kwargs["section"] is section
+
     @patch("recommenders.base.add_labels_to_items")
     @patch("recommenders.base.remove_labels_from_items")
     def test_no_changes_when_already_optimal(self, mock_remove, mock_add):
@@ -3159,33 +3618,33 @@ class TestGetPlexItemImdbId:
 
         assert result == "tt222"
 
-    @patch("recommenders.base.fetch_tmdb_with_retry")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
-    def test_falls_back_to_tmdb_movie_lookup(self, mock_extract, mock_fetch):
+    def test_falls_back_to_tmdb_movie_lookup(self, mock_extract, mock_record):
         recommender = _make_recommender()  # media_type == 'movie'
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": None}
         recommender._get_plex_item_tmdb_id = Mock(return_value=555)
-        mock_fetch.return_value = {"imdb_id": "tt333"}
+        mock_record.return_value = _title_record(imdb_id="tt333")
         plex_item = Mock(guid=None)
 
         result = recommender._get_plex_item_imdb_id(plex_item)
 
         assert result == "tt333"
-        assert "movie/555" in mock_fetch.call_args[0][0]
+        assert mock_record.call_args[0][1:] == (555, "movie")
 
-    @patch("recommenders.base.fetch_tmdb_with_retry")
+    @patch("recommenders.base.fetch_title_record")
     @patch("recommenders.base.extract_ids_from_guids")
-    def test_falls_back_to_tmdb_tv_external_ids(self, mock_extract, mock_fetch):
+    def test_falls_back_to_tmdb_tv_external_ids(self, mock_extract, mock_record):
         recommender = _make_recommender(recommender_cls=ConcreteTVRecommender)
         mock_extract.return_value = {"imdb_id": None, "tmdb_id": None}
         recommender._get_plex_item_tmdb_id = Mock(return_value=555)
-        mock_fetch.return_value = {"imdb_id": "tt444"}
+        mock_record.return_value = _title_record("tv", imdb_id="tt444")
         plex_item = Mock(guid=None)
 
         result = recommender._get_plex_item_imdb_id(plex_item)
 
         assert result == "tt444"
-        assert "tv/555/external_ids" in mock_fetch.call_args[0][0]
+        assert mock_record.call_args[0][1:] == (555, "tv")
 
     @patch("recommenders.base.extract_ids_from_guids")
     def test_returns_none_when_no_tmdb_id_available(self, mock_extract):
@@ -3369,19 +3828,11 @@ class TestGetRecommendationsBranches:
         assert result["plex_recommendations"] == []
 
     @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
-    def test_uses_cached_score_when_profile_hash_matches(self, mock_excl):
-        items = {
-            "1": {
-                "title": "Cached",
-                "rating": 8,
-                "vote_count": 500,
-                "genres": [],
-                "profile_hash": "hash1",
-                "cached_score": 0.77,
-                "score_breakdown": {},
-            }
-        }
+    def test_uses_stored_score_when_profile_hash_matches(self, mock_excl):
+        items = {"1": {"title": "Cached", "rating": 8, "vote_count": 500, "genres": []}}
         recommender, media_cache = self._recommender_with_cache(items)
+        snapshot, signature = recommender._score_profile_state()
+        save_score_store(recommender._score_store_path(), "hash1", {"1": 0.77}, profile=snapshot, signature=signature)
         recommender._calculate_similarity_from_cache = Mock(side_effect=AssertionError("should not recompute"))
 
         result = recommender.get_recommendations()
@@ -3389,6 +3840,60 @@ class TestGetRecommendationsBranches:
         assert result["plex_recommendations"][0]["similarity_score"] == 0.77
         media_cache._save_cache.assert_not_called()
 
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_stored_score_for_another_profile_is_recomputed(self, mock_excl):
+        items = {"1": {"title": "Stale", "rating": 8, "vote_count": 500, "genres": []}}
+        recommender, media_cache = self._recommender_with_cache(items)
+        save_score_store(recommender._score_store_path(), "old-hash", {"1": 0.77})
+        recommender._calculate_similarity_from_cache = Mock(return_value=(0.31, {}))
+
+        result = recommender.get_recommendations()
+
+        assert result["plex_recommendations"][0]["similarity_score"] == 0.31
+        assert _stored_scores(recommender) == {"1": 0.31}
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_re_analyzed_item_is_rescored_under_unchanged_profile(self, mock_excl):
+        items = {"1": {"title": "Heat", "rating": 8, "vote_count": 500, "genres": [], "plex_digest": "before"}}
+        recommender, media_cache = self._recommender_with_cache(items)
+        recommender._calculate_similarity_from_cache = Mock(return_value=(0.4, {}))
+        recommender.get_recommendations()
+
+        # update_cache rewrote the entry from changed Plex metadata
+        items["1"]["plex_digest"] = "after"
+        recommender._calculate_similarity_from_cache = Mock(return_value=(0.9, {}))
+        result = recommender.get_recommendations()
+
+        assert result["plex_recommendations"][0]["similarity_score"] == 0.9
+        assert _stored_scores(recommender) == {"1": 0.9}
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_score_of_unchanged_entry_is_reused(self, mock_excl):
+        items = {"1": {"title": "Heat", "rating": 8, "vote_count": 500, "genres": [], "plex_digest": "same"}}
+        recommender, media_cache = self._recommender_with_cache(items)
+        recommender._calculate_similarity_from_cache = Mock(return_value=(0.4, {}))
+        recommender.get_recommendations()
+
+        # Only re-stamped by update_cache: a label edit, say
+        items["1"]["plex_updated_at"] = 1_700_009_999
+        recommender._calculate_similarity_from_cache = Mock(side_effect=AssertionError("should not recompute"))
+        result = recommender.get_recommendations()
+
+        assert result["plex_recommendations"][0]["similarity_score"] == 0.4
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_scoring_leaves_library_cache_untouched(self, mock_excl):
+        items = {"1": {"title": "New", "rating": 8, "vote_count": 500, "genres": []}}
+        recommender, media_cache = self._recommender_with_cache(items)
+        recommender._calculate_similarity_from_cache = Mock(return_value=(0.5, {}))
+
+        recommender.get_recommendations()
+
+        media_cache._save_cache.assert_not_called()
+        assert "cached_score" not in items["1"]
+        assert "profile_hash" not in items["1"]
+        assert _stored_scores(recommender) == {"1": 0.5}
+
     @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
     def test_scoring_error_skips_item(self, mock_excl):
         items = {"1": {"title": "Bad Score", "rating": 8, "vote_count": 500, "genres": []}}
@@ -3962,6 +4467,42 @@ class TestApplyFranchiseOrderingIntegration:
         assert "held back 2 mid-series movies across 1 series you haven't started" in out
 
 
+class TestTopRecommendations:
+    """BaseRecommender._top_recommendations - ranking only as far as the limit needs."""
+
+    def _library(self, rng):
+        cache = {}
+        for key in range(1, 121):
+            info = {"title": f"Movie {key}", "year": 1980 + key % 30, "rating": rng.choice([6.0, 7.0, 8.0])}
+            if key % 3 == 0:
+                info["collection_id"] = 100 + key % 7
+                info["collection_name"] = f"Series {key % 7}"
+            cache[str(key)] = info
+        return cache
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_full_sort_then_franchise_ordering(self, seed):
+        rng = random.Random(seed)
+        recommender = _franchise_recommender(self._library(rng))
+        recommender.watched_ids = {3, 21}
+        recommender.limit_plex_results = 15
+        scored = [_scored_from(recommender, key, rng.choice([0.2, 0.4, 0.6, 0.8])) for key in range(1, 121)]
+
+        full = recommender._apply_franchise_ordering(
+            sorted(copy.deepcopy(scored), key=recommendation_rank_key, reverse=True), []
+        )[:15]
+        top = recommender._top_recommendations(copy.deepcopy(scored), [])
+
+        assert [i["plex_rating_key"] for i in top] == [i["plex_rating_key"] for i in full]
+
+    def test_short_candidate_list(self):
+        recommender = _franchise_recommender()
+        recommender.limit_plex_results = 10
+        scored = [_scored_from(recommender, 1, 0.5), _scored_from(recommender, 2, 0.9)]
+
+        assert [i["title"] for i in recommender._top_recommendations(scored, [])] == ["Rocky"]
+
+
 class TestSuppressSupersededFranchiseCandidates:
     """BaseRecommender._suppress_superseded_franchise_candidates - the
     manage_plex_labels() hook that stops a previously-labeled sequel
@@ -4214,3 +4755,219 @@ class TestDeclinedRatingKeys:
         recommender.label_dates = {"7_Recommended": "2020-01-01T00:00:00"}
         recommender._apply_ignored_recommendation_feedback()
         assert recommender.declined_rating_keys == set()
+
+
+class TestCompiledScoringProfile:
+    """BaseRecommender._compiled_scoring_profile - compile the user profile
+    once per scoring pass instead of once per candidate."""
+
+    def test_reused_for_the_same_counters_object(self):
+        recommender = _make_recommender()
+        counters = {"genres": Counter({"action": 3}), "tmdb_keywords": Counter({"robot": 2})}
+        first = recommender._compiled_scoring_profile(counters)
+        assert recommender._compiled_scoring_profile(counters) is first
+        assert first.prefs["keywords"] == Counter({"robot": 2})
+
+    def test_rebuilt_for_a_different_counters_object(self):
+        recommender = _make_recommender()
+        first = recommender._compiled_scoring_profile({"genres": Counter({"action": 3})})
+        second = recommender._compiled_scoring_profile({"genres": Counter({"drama": 3})})
+        assert second is not first
+        assert second.prefs["genres"] == Counter({"drama": 3})
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_get_recommendations_recompiles_after_in_place_edits(self, _mock_excl):
+        recommender = _make_recommender()
+        counters = {"genres": Counter({"action": 3})}
+        stale = recommender._compiled_scoring_profile(counters)
+        counters["genres"]["drama"] = 5
+
+        media_cache = Mock()
+        media_cache.cache = {"movies": {"1": {"title": "A", "genres": ["drama"]}}}
+        recommender._get_media_cache = Mock(return_value=media_cache)
+        recommender.watched_ids = {90001}
+        recommender.profile_hash = "hash1"
+        recommender._calculate_similarity_from_cache = Mock(
+            side_effect=lambda _info: (recommender._compiled_scoring_profile(counters).prefs["genres"]["drama"], {})
+        )
+
+        result = recommender.get_recommendations()
+
+        assert result["plex_recommendations"][0]["similarity_score"] == 5
+        assert recommender._compiled_scoring_profile(counters) is not stale
+
+
+class ScoringRecommender(ConcreteRecommender):
+    """ConcreteRecommender that scores for real, batch-capable."""
+
+    def _scoring_content_info(self, item_info):
+        return {"genres": item_info.get("genres", []), "cast": item_info.get("cast", [])}
+
+    def _apply_similarity_bonus(self, item_info, score, breakdown=None):
+        if item_info.get("bonus"):
+            score = min(1.0, score * 1.1)
+            if breakdown is not None:
+                breakdown["bonus"] = 0.1
+        return score
+
+    def _calculate_similarity_from_cache(self, item_info):
+        score, breakdown = calculate_similarity_score(
+            self._scoring_content_info(item_info),
+            self._compiled_scoring_profile(self.watched_data_counters),
+            self.media_type,
+            self.weights,
+            options=self._scoring_options(),
+        )
+        return self._apply_similarity_bonus(item_info, score, breakdown), breakdown
+
+
+@pytest.mark.skipif(not batch_scoring_available(), reason="NumPy not installed")
+class TestBatchScoringIntegration:
+    """get_recommendations() scoring cache misses through utils/batch_scoring.py."""
+
+    def _recommender(self):
+        recommender = _make_recommender(recommender_cls=ScoringRecommender)
+        recommender.watched_data_counters = {
+            "genres": Counter({"Drama": 5, "Action": 2}),
+            "actors": Counter({"Ann": 3, "Bob": 1}),
+        }
+        recommender.watched_ids = {90001}
+        recommender.profile_hash = "hash1"
+        return recommender
+
+    def _items(self):
+        return {
+            "1": {"title": "A", "genres": ["Drama"], "cast": ["Ann"], "bonus": True},
+            "2": {"title": "B", "genres": ["Action", "Drama"], "cast": ["Bob"]},
+            "3": {"title": "C", "genres": ["Horror"], "cast": []},
+        }
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_batch_scores_match_per_item_scores(self, _mock_excl, monkeypatch):
+        expected_recommender = self._recommender()
+        expected = {
+            key: expected_recommender._calculate_similarity_from_cache(item)[0] for key, item in self._items().items()
+        }
+
+        monkeypatch.setattr(base_module, "BATCH_SCORING_MIN_CANDIDATES", 1)
+        recommender = self._recommender()
+        media_cache = Mock()
+        media_cache.cache = {"movies": self._items()}
+        recommender._get_media_cache = Mock(return_value=media_cache)
+        with patch.object(ScoringRecommender, "_calculate_similarity_from_cache", autospec=True) as per_item:
+            recommender.get_recommendations()
+
+        per_item.assert_not_called()
+        stored = _stored_scores(recommender)
+        for key, item in media_cache.cache["movies"].items():
+            assert abs(stored[key] - expected[key]) <= BATCH_SCORE_TOLERANCE
+            assert abs(item["similarity_score"] - expected[key]) <= BATCH_SCORE_TOLERANCE
+            assert "score_breakdown" not in item
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_below_threshold_scores_item_by_item(self, _mock_excl):
+        recommender = self._recommender()
+        media_cache = Mock()
+        media_cache.cache = {"movies": self._items()}
+        recommender._get_media_cache = Mock(return_value=media_cache)
+
+        recommender.get_recommendations()
+
+        assert all("genre_score" in item["score_breakdown"] for item in media_cache.cache["movies"].values())
+
+    def test_no_batch_scores_without_numpy(self, monkeypatch):
+        monkeypatch.setattr(base_module, "BATCH_SCORING_MIN_CANDIDATES", 1)
+        monkeypatch.setattr(base_module, "batch_scoring_available", lambda: False)
+        recommender = self._recommender()
+        assert recommender._batch_similarity_scores(list(self._items().values())) == {}
+
+    def test_base_recommender_opts_out(self, monkeypatch):
+        monkeypatch.setattr(base_module, "BATCH_SCORING_MIN_CANDIDATES", 1)
+        recommender = _make_recommender()
+        assert recommender._batch_similarity_scores([{"title": "A", "genres": ["Drama"]}]) == {}
+
+    def test_fill_missing_breakdowns_rescores_promoted_original(self):
+        recommender = self._recommender()
+        items = self._items()
+        for key, item in items.items():
+            item["plex_rating_key"] = int(key)
+        promoted = {
+            "title": "Z",
+            "genres": ["Horror"],
+            "similarity_score": 0.9,
+            "score_breakdown": {"details": {"franchise": "earliest unwatched entry in Saga"}},
+            "franchise_promoted_from": {"title": "A", "plex_rating_key": 1},
+        }
+        plain = items["2"]
+
+        recommender._fill_missing_breakdowns([promoted, plain], items)
+
+        _score, expected = recommender._calculate_similarity_from_cache(items["1"])
+        assert promoted["score_breakdown"]["genre_score"] == expected["genre_score"]
+        assert promoted["score_breakdown"]["bonus"] == 0.1
+        assert promoted["score_breakdown"]["details"]["franchise"] == "earliest unwatched entry in Saga"
+        assert "genre_score" in plain["score_breakdown"]
+
+
+class TestDeltaRescoring:
+    """get_recommendations() rescoring only what a profile change touched."""
+
+    def _run(self, counters, profile_hash):
+        recommender = _make_recommender(recommender_cls=ScoringRecommender)
+        recommender.watched_data_counters = counters
+        recommender.watched_ids = {90001}
+        recommender.profile_hash = profile_hash
+        media_cache = Mock()
+        media_cache.cache = {
+            "movies": {
+                "1": {"title": "A", "genres": ["Drama"], "cast": ["Ann"]},
+                "2": {"title": "B", "genres": ["Action"], "cast": ["Bob"]},
+                "3": {"title": "C", "genres": ["Horror"], "cast": ["Cy"]},
+            }
+        }
+        recommender._get_media_cache = Mock(return_value=media_cache)
+        rescored = []
+        original = ScoringRecommender._calculate_similarity_from_cache
+
+        def record(self, item_info):
+            rescored.append(item_info["title"])
+            return original(self, item_info)
+
+        with patch.object(ScoringRecommender, "_calculate_similarity_from_cache", record):
+            recommender.get_recommendations()
+        scores = {key: item["similarity_score"] for key, item in media_cache.cache["movies"].items()}
+        return sorted(rescored), scores
+
+    def _counters(self, **actors):
+        return {
+            "genres": Counter({"Drama": 5, "Action": 2}),
+            "actors": Counter({"Ann": 3, "Bob": 1, **actors}),
+        }
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_only_items_with_changed_terms_are_rescored(self, _mock_excl):
+        self._run(self._counters(), "hash1")
+
+        rescored, scores = self._run(self._counters(Bob=2), "hash2")
+
+        assert rescored == ["B"]
+        os.remove(_make_recommender(recommender_cls=ScoringRecommender)._score_store_path())
+        full_rescored, full_scores = self._run(self._counters(Bob=2), "hash2")
+        assert full_rescored == ["A", "B", "C"]
+        assert scores == full_scores
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_moved_max_count_rescores_everything(self, _mock_excl):
+        self._run(self._counters(), "hash1")
+
+        rescored, _scores = self._run(self._counters(Bob=9), "hash2")
+
+        assert rescored == ["A", "B", "C"]
+
+    @patch("recommenders.base.get_excluded_genres_for_user", return_value=[])
+    def test_unchanged_profile_rescores_nothing(self, _mock_excl):
+        self._run(self._counters(), "hash1")
+
+        rescored, _scores = self._run(self._counters(), "hash1")
+
+        assert rescored == []
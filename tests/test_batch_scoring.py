@@ -0,0 +1,172 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/batch_scoring.py - vectorized scoring must agree with
+calculate_similarity_score() item for item.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from tests.harness import load_fixtures  # noqa: E402
+from utils import batch_scoring  # noqa: E402
+from utils.batch_scoring import BatchCorpus, batch_similarity_scores, intern_rows  # noqa: E402
+from utils.config import BATCH_SCORE_TOLERANCE  # noqa: E402
+from utils.scoring import ScoringOptions, calculate_similarity_score, compile_profile  # noqa: E402
+
+GENRES = ["Action", "Drama", "Sci-Fi", "Science Fiction", "Comedy", "Horror", "Thriller", "Animation"]
+PEOPLE = [f"Person {i}" for i in range(40)]
+KEYWORDS = [f"keyword {i}" for i in range(120)] + ["time travel", "timetravel", "alien invasion"]
+
+
+def _scalar_scores(contents, profile, media_type, weights=None, options=None):
+    return [calculate_similarity_score(c, profile, media_type, weights, options=options)[0] for c in contents]
+
+
+def _assert_parity(contents, profile, media_type, weights=None, options=None):
+    corpus = BatchCorpus.from_content_infos(contents, media_type)
+    batch = batch_similarity_scores(corpus, profile, weights, options)
+    scalar = _scalar_scores(contents, profile, media_type, weights, options)
+    assert len(batch) == len(scalar)
+    for i, (b, s) in enumerate(zip(batch, scalar, strict=True)):
+        assert abs(b - s) <= BATCH_SCORE_TOLERANCE, f"item {i}: batch {b!r} vs scalar {s!r}"
+
+
+def _random_profile(rng):
+    return {
+        "genres": Counter({g: rng.uniform(-3, 20) for g in rng.sample(GENRES, 6)}),
+        "directors": Counter({p: rng.uniform(-2, 5) for p in rng.sample(PEOPLE, 10)}),
+        "studios": Counter({p.lower(): rng.uniform(-2, 5) for p in rng.sample(PEOPLE, 10)}),
+        "actors": Counter({p: rng.uniform(-2, 9) for p in rng.sample(PEOPLE, 20)}),
+        "languages": Counter({"english": 30, "french": 3}),
+        "keywords": Counter({k: rng.uniform(-1, 12) for k in rng.sample(KEYWORDS, 60)}),
+    }
+
+
+def _keyword(rng):
+    """A profile-vocabulary keyword, occasionally in the wrong case."""
+    keyword = rng.choice(KEYWORDS)
+    return keyword.upper() if rng.random() < 0.1 else keyword
+
+
+def _random_contents(rng, count):
+    return [
+        {
+            "genres": rng.sample(GENRES, rng.randint(0, 4)),
+            "directors": rng.sample(PEOPLE, rng.randint(0, 2)),
+            "studio": rng.choice([rng.sample(PEOPLE, rng.randint(0, 3)), "N/A", "", rng.choice(PEOPLE)]),
+            "cast": [rng.choice(PEOPLE) for _ in range(rng.randint(0, 5))],
+            "language": rng.choice(["English", "French", "German", "N/A"]),
+            "keywords": [_keyword(rng) for _ in range(8)],
+            "vote_count": rng.choice([0, 100, 60000, 2_000_000, None]),
+        }
+        for _ in range(count)
+    ]
+
+
+class TestInternRows:
+    def test_terms_get_one_id_each_across_rows(self):
+        rows = intern_rows([["a", "b"], [], ["b", "b", "c"]])
+        assert rows.terms == ["a", "b", "c"]
+        assert rows.indptr.tolist() == [0, 2, 2, 5]
+        assert rows.indices.tolist() == [0, 1, 1, 1, 2]
+        assert rows.row_ids.tolist() == [0, 0, 2, 2, 2]
+
+
+class TestBatchCorpus:
+    def test_has_data_matches_calculate_similarity_score(self):
+        corpus = BatchCorpus.from_content_infos(
+            [{"genres": ["Drama"], "studio": "N/A", "language": "N/A"}, {"cast": ["X"], "language": "English"}],
+            media_type="tv",
+        )
+        assert corpus.has_data["genre"].tolist() == [True, False]
+        # A literal "N/A" studio is present data to the scalar path, even
+        # though no studio is actually checked against the profile.
+        assert corpus.has_data["studio"].tolist() == [True, False]
+        assert corpus.has_data["language"].tolist() == [False, True]
+        assert corpus.has_data["director"].tolist() == [False, False]
+
+    def test_directors_ignored_for_tv(self):
+        corpus = BatchCorpus.from_content_infos([{"directors": ["X"]}], media_type="tv")
+        assert corpus.directors.terms == []
+
+
+class TestBatchParity:
+    def test_harness_fixtures(self):
+        movies_cache, user_profile = load_fixtures()
+        contents = [
+            {
+                "genres": item.get("genres", []),
+                "directors": item.get("directors", []),
+                "cast": item.get("cast", []),
+                "language": item.get("language", "N/A"),
+                "keywords": item.get("tmdb_keywords", []),
+                "vote_count": item.get("vote_count", 0),
+            }
+            for _key, item in sorted(movies_cache["movies"].items())
+        ]
+        _assert_parity(contents, user_profile, "movie")
+        _assert_parity(contents, compile_profile(user_profile), "movie")
+
+    @pytest.mark.parametrize("media_type", ["movie", "tv"])
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_random_profiles(self, media_type, seed):
+        rng = random.Random(seed)
+        profile = compile_profile(_random_profile(rng))
+        _assert_parity(_random_contents(rng, 300), profile, media_type)
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            ScoringOptions(normalize_counters=False),
+            ScoringOptions(use_tfidf=False),
+            ScoringOptions(use_fuzzy_keywords=False),
+            ScoringOptions(use_popularity_dampening=False),
+            ScoringOptions(genre_idf={"action": 0.3, "drama": 0.7}, keyword_idf={"keyword 3": 0.2}),
+        ],
+    )
+    def test_scoring_options(self, options):
+        rng = random.Random(7)
+        profile = compile_profile(_random_profile(rng))
+        _assert_parity(_random_contents(rng, 200), profile, "movie", options=options)
+
+    def test_custom_weights(self):
+        rng = random.Random(11)
+        profile = compile_profile(_random_profile(rng))
+        weights = {"genre": 0.4, "director": 0.1, "actor": 0.2, "keyword": 0.25, "language": 0.05}
+        _assert_parity(_random_contents(rng, 200), profile, "movie", weights=weights)
+
+    def test_empty_profile_scores_zero(self):
+        corpus = BatchCorpus.from_content_infos([{"genres": ["Drama"]}], "movie")
+        assert batch_similarity_scores(corpus, {}).tolist() == [0.0]
+
+    def test_empty_corpus(self):
+        corpus = BatchCorpus.from_content_infos([], "movie")
+        assert batch_similarity_scores(corpus, {"genres": Counter({"Drama": 1})}).tolist() == []
+
+
+class TestAvailability:
+    def test_raises_without_numpy(self, monkeypatch):
+        corpus = BatchCorpus.from_content_infos([{"genres": ["Drama"]}], "movie")
+        monkeypatch.setattr(batch_scoring, "np", None)
+        assert not batch_scoring.batch_scoring_available()
+        with pytest.raises(RuntimeError):
+            batch_similarity_scores(corpus, {"genres": Counter({"Drama": 1})})
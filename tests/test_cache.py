@@ -23,8 +23,20 @@ import os
 import tempfile
 from unittest.mock import patch
 
-from utils.cache import load_json_cache, load_media_cache, save_json_cache, save_media_cache, save_watched_cache
-from utils.config import CACHE_VERSION
+from utils.cache import (
+    load_json_cache,
+    load_library_index,
+    load_media_cache,
+    load_score_store_record,
+    load_watch_ledger,
+    save_json_cache,
+    save_library_index,
+    save_media_cache,
+    save_score_store,
+    save_watch_ledger,
+    save_watched_cache,
+)
+from utils.config import CACHE_VERSION, SCORER_VERSION
 
 
 class TestSaveJsonCache:
@@ -470,3 +482,85 @@ class TestAtomicCacheWrite:
             assert content == '{"original": "data"}'
         finally:
             os.unlink(cache_path)
+
+
+class TestScoreStore:
+    """Tests for load_score_store_record()/save_score_store()."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "scores_movies_plex_alice.json")
+        assert save_score_store(path, "hash1", {"1": 0.5, "2": 0.25}) is True
+        assert load_score_store_record(path)["scores"] == {"1": 0.5, "2": 0.25}
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert load_score_store_record(str(tmp_path / "missing.json")) == {}
+
+    def test_record_keeps_another_profiles_scores(self, tmp_path):
+        path = str(tmp_path / "scores.json")
+        save_score_store(path, "hash1", {"1": 0.5}, profile={"actors": {"ann": 1}}, signature="sig")
+        record = load_score_store_record(path)
+        assert record["profile_hash"] == "hash1"
+        assert record["scores"] == {"1": 0.5}
+        assert record["profile"] == {"actors": {"ann": 1}}
+        assert record["signature"] == "sig"
+
+    def test_record_from_another_scorer_is_empty(self, tmp_path):
+        path = str(tmp_path / "scores.json")
+        save_score_store(path, "hash1", {"1": 0.5}, scorer_version=SCORER_VERSION + 1)
+        assert load_score_store_record(path) == {}
+
+    def test_written_compact(self, tmp_path):
+        path = str(tmp_path / "scores.json")
+        save_score_store(path, "hash1", {"1": 0.5})
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        assert "\n" not in content
+        assert json.loads(content)["scorer_version"] == SCORER_VERSION
+
+    def test_save_failure_returns_false(self, tmp_path):
+        with patch("utils.cache._atomic_write_json", side_effect=OSError("disk full")):
+            assert save_score_store(str(tmp_path / "scores.json"), "hash1", {}) is False
+
+
+class TestLibraryIndexStore:
+    """Tests for load_library_index()/save_library_index()."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "movies_library_index.json")
+        assert save_library_index(path, "v1", {"format": 1, "total": 2}) is True
+        assert load_library_index(path, "v1") == {"format": 1, "total": 2}
+
+    def test_stale_content_version_is_discarded(self, tmp_path):
+        path = str(tmp_path / "movies_library_index.json")
+        save_library_index(path, "v1", {"format": 1})
+        assert load_library_index(path, "v2") == {}
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert load_library_index(str(tmp_path / "missing.json"), "v1") == {}
+
+    def test_save_failure_returns_false(self, tmp_path):
+        with patch("utils.cache._atomic_write_json", side_effect=OSError("disk full")):
+            assert save_library_index(str(tmp_path / "index.json"), "v1", {}) is False
+
+
+class TestWatchLedgerStore:
+    """Tests for load_watch_ledger()/save_watch_ledger()."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "watch_ledger_movies_plex_alice.json")
+        assert save_watch_ledger(path, {"format": 1, "watermark": 1700000000}) is True
+        loaded = load_watch_ledger(path)
+        assert loaded["watermark"] == 1700000000
+        assert "last_updated" in loaded
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert load_watch_ledger(str(tmp_path / "missing.json")) == {}
+
+    def test_non_dict_payload_returns_empty(self, tmp_path):
+        path = tmp_path / "ledger.json"
+        path.write_text("[1, 2]")
+        assert load_watch_ledger(str(path)) == {}
+
+    def test_save_failure_returns_false(self, tmp_path):
+        with patch("utils.cache._atomic_write_json", side_effect=OSError("disk full")):
+            assert save_watch_ledger(str(tmp_path / "ledger.json"), {}) is False
@@ -20,6 +20,7 @@ Tests for utils/calibration.py - calibrated recommendation re-ranking
 """
 
 import math
+import random
 
 import pytest
 
@@ -36,7 +37,7 @@ from utils.calibration import (
     list_distribution,
     projected_distribution,
 )
-from utils.config import CALIBRATION_MIN_PROFILE_SAMPLE, CALIBRATION_SMOOTHING_ALPHA
+from utils.config import CALIBRATION_DIVERGENCE_SCALE, CALIBRATION_MIN_PROFILE_SAMPLE, CALIBRATION_SMOOTHING_ALPHA
 
 
 def _item(title, genres, score):
@@ -568,3 +569,74 @@ class TestGreedyDoesNotFavorBroadlyTaggedItems:
 
         genres = [i["genres"][0] for i in selected]
         assert genres.count("romance") >= 2, genres
+
+
+def _full_recompute_multi(candidates, limit, dims, strength):
+    """The greedy loop as the objective states it: every candidate's
+    projected list distribution rebuilt from scratch at every step."""
+    selected, remaining = [], list(candidates)
+    while len(selected) < limit and remaining:
+        best_index, best_value = 0, -math.inf
+        for i, candidate in enumerate(remaining):
+            divergence = 0.0
+            for dim in dims:
+                trial = [dim.get_values(s) for s in selected] + [dim.get_values(candidate)]
+                trial_distribution = projected_distribution(list_distribution(trial), dim.target, len(trial), limit)
+                divergence += dim.weight * kl_divergence(dim.target, trial_distribution)
+            value = (1 - strength) * candidate["score"] - strength * CALIBRATION_DIVERGENCE_SCALE * divergence
+            if value > best_value:
+                best_index, best_value = i, value
+        selected.append(remaining.pop(best_index))
+    return selected
+
+
+class TestIncrementalLazyGreedy:
+    """The incremental, lazily evaluated greedy loop picks exactly what a
+    full recompute of the objective would."""
+
+    GENRES = ["action", "drama", "comedy", "family", "horror", "sci-fi", "romance", "thriller"]
+    CERTS = ["G", "PG", "PG-13", "R"]
+
+    def _pool(self, seed, size):
+        rng = random.Random(seed)
+        return [
+            {
+                "title": f"t{i}",
+                "genres": rng.sample(self.GENRES, rng.randint(0, 5)),
+                "cert": rng.choice(self.CERTS),
+                # Coarse scores, so ties between candidates actually occur.
+                "score": round(rng.random(), 1),
+            }
+            for i in range(size)
+        ]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_single_dimension_matches_full_recompute(self, seed):
+        rng = random.Random(seed)
+        items = self._pool(seed, rng.randint(10, 60))
+        target = build_target_distribution({g: rng.random() for g in rng.sample(self.GENRES, 4)})
+        limit = rng.randint(1, 25)
+        strength = rng.choice([0.25, 0.5, 0.9])
+        dims = [CalibrationDimension("genre", target, lambda i: i["genres"])]
+        expected = _full_recompute_multi(items, limit, dims, strength) if len(items) > limit else items[:limit]
+        assert _calibrate(items, limit, target, strength) == expected
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_multi_dimension_matches_full_recompute(self, seed):
+        rng = random.Random(seed)
+        items = self._pool(seed, rng.randint(30, 60))
+        dims = [
+            CalibrationDimension(
+                "genre", build_target_distribution({g: 1 + rng.random() for g in self.GENRES}), lambda i: i["genres"]
+            ),
+            CalibrationDimension(
+                "certificate",
+                build_target_distribution({c: 1 + rng.random() for c in self.CERTS}),
+                lambda i: [i["cert"]],
+                0.7,
+            ),
+        ]
+        limit = rng.randint(1, 25)
+        assert calibrate_multi(items, limit, lambda i: i["score"], dims, 0.5) == _full_recompute_multi(
+            items, limit, dims, 0.5
+        )
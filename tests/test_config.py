@@ -23,6 +23,7 @@ import tempfile
 import yaml
 
 from utils.config import (
+    CACHE_BACKENDS,
     CACHE_VERSION,
     DEFAULT_NEGATIVE_MULTIPLIERS,
     DEFAULT_NEGATIVE_THRESHOLD,
@@ -36,6 +37,7 @@ from utils.config import (
     UPDATE_MODES,
     _deep_merge_dicts,
     check_cache_version,
+    get_cache_backend,
     get_config_section,
     get_effective_arr_config,
     get_env_override,
@@ -1959,3 +1961,19 @@ class TestKnownRootConfigKeysCoverThePublishedExamples:
         sanctioned = set(CORE_SECTIONS) | set(TUNING_SECTIONS) | set(FEATURE_MODULES)
         missing = sanctioned - KNOWN_ROOT_CONFIG_KEYS
         assert not missing, f"sections migrate_config.py preserves but KNOWN_ROOT_CONFIG_KEYS omits: {missing}"
+
+
+class TestGetCacheBackend:
+    """Tests for get_cache_backend - the general.cache_backend resolver."""
+
+    def test_defaults_to_json(self):
+        assert get_cache_backend({"general": {}}) == "json"
+        assert get_cache_backend({}) == "json"
+        assert get_cache_backend(None) == "json"
+
+    def test_all_valid_backends_are_covered(self):
+        for backend in CACHE_BACKENDS:
+            assert get_cache_backend({"general": {"cache_backend": backend}}) == backend
+
+    def test_unrecognized_value_falls_back_to_json(self):
+        assert get_cache_backend({"general": {"cache_backend": "postgres"}}) == "json"
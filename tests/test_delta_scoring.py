@@ -0,0 +1,172 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/delta_scoring.py - every item TermIndex leaves out of a
+profile change must score exactly as it did before the change.
+"""
+
+import copy
+import random
+from collections import Counter
+
+import pytest
+
+from utils.delta_scoring import (
+    TermIndex,
+    changed_terms,
+    content_terms,
+    profile_signature,
+    profile_snapshot,
+    term_key,
+)
+from utils.scoring import DEFAULT_SCORING_WEIGHTS, ScoringOptions, calculate_similarity_score, compile_profile
+
+GENRES = ["Action", "Drama", "Sci-Fi", "Science Fiction", "Comedy", "Horror"]
+PEOPLE = [f"Person {i}" for i in range(30)]
+KEYWORDS = ["time travel", "time", "travel", "alien invasion", "alien", "robot", "heist", "space war", "war"]
+
+
+def _random_profile(rng):
+    profile = {
+        "genres": Counter({g: rng.uniform(-3, 20) for g in rng.sample(GENRES, 4)}),
+        "directors": Counter({p: rng.uniform(-2, 5) for p in rng.sample(PEOPLE, 8)}),
+        "studios": Counter({p.lower(): rng.uniform(-2, 5) for p in rng.sample(PEOPLE, 8)}),
+        "actors": Counter({p: rng.uniform(-2, 9) for p in rng.sample(PEOPLE, 15)}),
+        "languages": Counter({"english": 30, "french": 3}),
+        "keywords": Counter({k: rng.uniform(-1, 12) for k in rng.sample(KEYWORDS, 5)}),
+    }
+    # Pin every max count so the edits below leave the signature alone.
+    for dimension, counter in profile.items():
+        counter[f"pinned {dimension}"] = 100
+    return profile
+
+
+def _random_contents(rng, count):
+    return [
+        {
+            "genres": rng.sample(GENRES, rng.randint(0, 3)),
+            "directors": rng.sample(PEOPLE, rng.randint(0, 2)),
+            "studio": rng.choice([rng.sample(PEOPLE, 2), "N/A", rng.choice(PEOPLE)]),
+            "cast": rng.sample(PEOPLE, rng.randint(0, 4)),
+            "language": rng.choice(["English", "French", "N/A"]),
+            "keywords": [
+                rng.choice(KEYWORDS).upper() if rng.random() < 0.2 else rng.choice(KEYWORDS) for _ in range(3)
+            ],
+        }
+        for _ in range(count)
+    ]
+
+
+def _edit(rng, profile):
+    edited = copy.deepcopy(profile)
+    pools = {"genres": GENRES, "keywords": KEYWORDS, "languages": ["english", "german"]}
+    for _ in range(rng.randint(1, 4)):
+        dimension = rng.choice(list(edited))
+        term = rng.choice(pools.get(dimension, PEOPLE))
+        if dimension == "studios":
+            term = term.lower()
+        if rng.random() < 0.3:
+            edited[dimension].pop(term, None)
+        else:
+            edited[dimension][term] = rng.uniform(-3, 20)
+    return edited
+
+
+class TestTermKey:
+    def test_genres_use_normalize_genre(self):
+        assert term_key("genres", "Sci-Fi") == term_key("genres", "science fiction")
+
+    def test_other_dimensions_lower_case(self):
+        assert term_key("actors", "Ann Lee") == "ann lee"
+
+    def test_non_strings_stringified(self):
+        assert term_key("collections", 10) == "10"
+
+
+class TestContentTerms:
+    def test_media_type_gating(self):
+        content = {"directors": ["D"], "studio": "S", "language": "N/A"}
+        assert "studios" not in content_terms(content, "movie")
+        assert "directors" not in content_terms(content, "tv")
+        assert content_terms(content, "tv")["studios"] == ["S"]
+        assert content_terms(content, "tv")["languages"] == []
+
+
+class TestChangedTerms:
+    def test_added_removed_and_changed(self):
+        old = profile_snapshot({"actors": {"Ann": 1, "Bob": 2, "Cy": 3}})
+        new = profile_snapshot({"actors": {"Ann": 1, "Bob": 5, "Di": 1}})
+        assert changed_terms(old, new) == {"actors": {"bob", "cy", "di"}}
+
+    def test_extra_counters(self):
+        old = profile_snapshot({}, {"collections": {10: 1}})
+        new = profile_snapshot({}, {"collections": {10: 2}})
+        assert changed_terms(old, new) == {"collections": {"10"}}
+
+
+class TestProfileSignature:
+    def test_moves_with_max_count(self):
+        before = compile_profile({"actors": {"Ann": 3, "Bob": 1}})
+        after = compile_profile({"actors": {"Ann": 3, "Bob": 4}})
+        options = ScoringOptions()
+        assert profile_signature(before, DEFAULT_SCORING_WEIGHTS, "movie", options) != profile_signature(
+            after, DEFAULT_SCORING_WEIGHTS, "movie", options
+        )
+
+    def test_stable_below_max_count(self):
+        before = compile_profile({"actors": {"Ann": 3, "Bob": 1}})
+        after = compile_profile({"actors": {"Ann": 3, "Bob": 2}})
+        options = ScoringOptions()
+        assert profile_signature(before, DEFAULT_SCORING_WEIGHTS, "movie", options) == profile_signature(
+            after, DEFAULT_SCORING_WEIGHTS, "movie", options
+        )
+
+
+class TestTermIndex:
+    def test_fuzzy_keyword_reach(self):
+        index = TermIndex()
+        index.add("1", {"keywords": ["Time Travel"]})
+        index.add("2", {"keywords": ["time"]})
+        index.add("3", {"keywords": ["heist"]})
+        assert index.affected_items({"keywords": {"time"}}) == {"1", "2"}
+        assert index.affected_items({"keywords": {"time"}}, fuzzy_keywords=False) == {"2"}
+
+    @pytest.mark.parametrize("media_type", ["movie", "tv"])
+    @pytest.mark.parametrize("seed", range(4))
+    def test_unaffected_items_keep_their_scores(self, media_type, seed):
+        rng = random.Random(seed)
+        options = ScoringOptions()
+        for _ in range(10):
+            before = _random_profile(rng)
+            after = _edit(rng, before)
+            compiled_before, compiled_after = compile_profile(before), compile_profile(after)
+            assert profile_signature(compiled_before, DEFAULT_SCORING_WEIGHTS, media_type, options) == (
+                profile_signature(compiled_after, DEFAULT_SCORING_WEIGHTS, media_type, options)
+            )
+
+            contents = _random_contents(rng, 60)
+            index = TermIndex()
+            for i, content in enumerate(contents):
+                index.add(str(i), content_terms(content, media_type))
+            affected = index.affected_items(changed_terms(profile_snapshot(before), profile_snapshot(after)))
+
+            for i, content in enumerate(contents):
+                if str(i) in affected:
+                    continue
+                score_before = calculate_similarity_score(content, compiled_before, media_type, options=options)[0]
+                score_after = calculate_similarity_score(content, compiled_after, media_type, options=options)[0]
+                assert score_before == score_after, content
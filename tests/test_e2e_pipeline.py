@@ -227,6 +227,7 @@ def e2e_project(tmp_path, monkeypatch):
         monkeypatch.setattr("recommenders.base.init_plex", lambda config: fake_plex)
         monkeypatch.setattr("utils.plex.MyPlexAccount", FakeMyPlexAccount)
         monkeypatch.setattr("utils.plex._capped_get", make_fake_capped_get())
+        monkeypatch.setattr("utils.plex._streamed_get", make_fake_capped_get())
         monkeypatch.setattr("utils.cli.migrate_renamed_plex_users", lambda *a, **kw: {})
         return config_path
 
@@ -83,32 +83,32 @@ from utils.trakt import enhance_profile_with_trakt
 class TestGetImdbId:
     """Tests for get_imdb_id function"""
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_imdb_id_for_movie(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"imdb_id": "tt1234567"}
+        mock_response.json.return_value = {"id": 12345, "external_ids": {"imdb_id": "tt1234567"}}
         mock_get.return_value = mock_response
 
         result = get_imdb_id("api_key", 12345, "movie")
 
         assert result == "tt1234567"
         mock_get.assert_called_once()
-        assert "movie/12345/external_ids" in mock_get.call_args[0][0]
+        assert mock_get.call_args[0][0].endswith("/movie/12345")
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_imdb_id_for_tv(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"imdb_id": "tt9876543"}
+        mock_response.json.return_value = {"id": 54321, "external_ids": {"imdb_id": "tt9876543"}}
         mock_get.return_value = mock_response
 
         result = get_imdb_id("api_key", 54321, "tv")
 
         assert result == "tt9876543"
-        assert "tv/54321/external_ids" in mock_get.call_args[0][0]
+        assert mock_get.call_args[0][0].endswith("/tv/54321")
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_none_on_api_error(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 404
@@ -118,19 +118,20 @@ class TestGetImdbId:
 
         assert result is None
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_none_on_missing_imdb_id(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"tvdb_id": 123}  # No imdb_id
+        mock_response.json.return_value = {"external_ids": {"tvdb_id": 123}}  # No imdb_id
         mock_get.return_value = mock_response
 
         result = get_imdb_id("api_key", 12345, "movie")
 
         assert result is None
 
-    @patch("recommenders.external.requests.get")
-    def test_returns_none_on_exception(self, mock_get):
+    @patch("utils.tmdb.time.sleep")
+    @patch("recommenders.external.http_client.get")
+    def test_returns_none_on_exception(self, mock_get, _mock_sleep):
         import requests
 
         mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
@@ -149,11 +150,12 @@ class TestGetWatchProviders:
 
         external._watch_provider_cache.clear()
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_providers_dict(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {
+            "id": 12345,
             "results": {
                 "US": {
                     "flatrate": [
@@ -163,7 +165,7 @@ class TestGetWatchProviders:
                     "rent": [{"provider_id": 2, "provider_name": "Apple TV"}],
                     "buy": [{"provider_id": 3, "provider_name": "Google Play"}],
                 }
-            }
+            },
         }
         mock_get.return_value = mock_response
 
@@ -174,7 +176,7 @@ class TestGetWatchProviders:
         assert "Apple TV" in result["rent"]
         assert "Google Play" in result["buy"]
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_empty_on_no_us_providers(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -185,7 +187,7 @@ class TestGetWatchProviders:
 
         assert result == {"streaming": [], "rent": [], "buy": []}
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_empty_on_error(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 500
@@ -533,7 +535,7 @@ class TestLoadIgnoreList:
 class TestGetTmdbIdFromImdb:
     """Tests for get_tmdb_id_from_imdb function"""
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_tmdb_id_for_movie(self, mock_get):
         """Test successful IMDB to TMDB conversion for movie."""
         mock_response = Mock()
@@ -547,7 +549,7 @@ class TestGetTmdbIdFromImdb:
         mock_get.assert_called_once()
         assert "find/tt1234567" in mock_get.call_args[0][0]
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_tmdb_id_for_tv(self, mock_get):
         """Test successful IMDB to TMDB conversion for TV."""
         mock_response = Mock()
@@ -559,7 +561,7 @@ class TestGetTmdbIdFromImdb:
 
         assert result == 67890
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_none_when_not_found(self, mock_get):
         """Test returns None when IMDB ID not found."""
         mock_response = Mock()
@@ -571,7 +573,7 @@ class TestGetTmdbIdFromImdb:
 
         assert result is None
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_none_on_api_error(self, mock_get):
         """Test returns None on API error."""
         mock_response = Mock()
@@ -582,7 +584,7 @@ class TestGetTmdbIdFromImdb:
 
         assert result is None
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_none_on_exception(self, mock_get):
         """Test returns None when exception occurs."""
         mock_get.side_effect = Exception("Network error")
@@ -1035,7 +1037,7 @@ class TestExportToTraktUserMode:
 class TestGetCollectionDetails:
     """Tests for get_collection_details function"""
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_collection_movies(self, mock_get):
         """Test successful collection fetch."""
         mock_response = Mock()
@@ -1057,7 +1059,7 @@ class TestGetCollectionDetails:
         assert len(result["movies"]) == 2
         assert result["movies"][0]["tmdb_id"] == 11
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_none_on_error(self, mock_get):
         """Test returns None on API error."""
         mock_response = Mock()
@@ -1068,7 +1070,7 @@ class TestGetCollectionDetails:
 
         assert result is None
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_none_on_exception(self, mock_get):
         """Test returns None on requests exception."""
         import requests
@@ -1248,7 +1250,7 @@ class TestHorizonHuntarrCache:
 class TestGetMovieStatus:
     """Tests for get_movie_status function"""
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_status_and_release_date(self, mock_get):
         """Test returns status and release date from TMDB."""
         mock_response = Mock()
@@ -1260,7 +1262,7 @@ class TestGetMovieStatus:
         assert status == "In Production"
         assert release_date == "2026-06-15"
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_returns_unknown_on_api_error(self, mock_get):
         """Test returns Unknown on API error."""
         import requests as req
@@ -1304,7 +1306,9 @@ def _tmdb_collection_detail_response(collection_id, name, parts):
     return resp
 
 
-def _tmdb_providers_detail_response(streaming_ids=None, rent_ids=None, buy_ids=None):
+def _tmdb_providers_response(streaming_ids=None, rent_ids=None, buy_ids=None):
+    """A title's /watch/providers response (see utils/tmdb.py's
+    fetch_watch_providers)."""
     resp = Mock()
     resp.status_code = 200
     resp.json.return_value = {
@@ -1331,7 +1335,7 @@ def _strict_get_dispatcher(url_map):
     MagicMock, so an unexpected (or missing) TMDB call fails the test
     instead of making up data."""
 
-    def _fake_get(url, params=None, timeout=None):
+    def _fake_get(url, params=None, timeout=None, **_kwargs):
         if url not in url_map:
             raise AssertionError(f"Unexpected TMDB URL requested by test: {url}")
         return url_map[url]
@@ -1400,7 +1404,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get") as mock_get,
+            patch("recommenders.external.http_client.get") as mock_get,
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1412,7 +1416,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get") as mock_get,
+            patch("recommenders.external.http_client.get") as mock_get,
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1447,7 +1451,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get") as mock_get,
+            patch("recommenders.external.http_client.get") as mock_get,
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", ["netflix"])
 
@@ -1463,7 +1467,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1486,14 +1490,14 @@ class TestFindMissingSequels:
                     },
                 ],
             ),
-            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_detail_response(
+            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_response(
                 streaming_ids=[8, 337]
             ),  # netflix, disney_plus
         }
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "", ["netflix"])
 
@@ -1525,7 +1529,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1547,7 +1551,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
         ):
             result = find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1563,7 +1567,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1612,12 +1616,12 @@ class TestFindMissingSequels:
         )
         plex = _plex_with_libraries([_library_item(1)])
         url_map = {
-            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_detail_response(),
+            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_response(),
         }
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
         ):
             result = find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1641,7 +1645,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_fake_get),
+            patch("recommenders.external.http_client.get", side_effect=_fake_get),
         ):
             result = find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1652,7 +1656,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get") as mock_get,
+            patch("recommenders.external.http_client.get") as mock_get,
         ):
             result = find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1671,12 +1675,12 @@ class TestFindMissingSequels:
                     {"id": 2, "title": "Two", "release_date": _PAST_DATE, "genre_ids": []},
                 ],
             ),
-            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_detail_response(),
+            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_response(),
         }
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1708,13 +1712,13 @@ class TestFindMissingSequels:
                     {"id": 4, "title": "A2", "release_date": _PAST_DATE, "genre_ids": []},
                 ],
             ),
-            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_detail_response(),
-            "https://api.themoviedb.org/3/movie/4/watch/providers": _tmdb_providers_detail_response(),
+            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_response(),
+            "https://api.themoviedb.org/3/movie/4/watch/providers": _tmdb_providers_response(),
         }
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1739,7 +1743,7 @@ class TestFindMissingSequels:
                     {"id": 2, "title": "Holiday Special", "release_date": _PAST_DATE, "genre_ids": [TV_MOVIE_GENRE_ID]},
                 ],
             ),
-            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_detail_response(),
+            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_response(),
         }
         return plex, url_map, tv_section
 
@@ -1751,7 +1755,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1766,7 +1770,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1796,7 +1800,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1824,7 +1828,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1839,7 +1843,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1855,7 +1859,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1868,7 +1872,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1897,12 +1901,12 @@ class TestFindMissingSequels:
                     {"id": 2, "title": "Holiday Special", "release_date": _PAST_DATE, "genre_ids": [TV_MOVIE_GENRE_ID]},
                 ],
             ),
-            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_detail_response(),
+            "https://api.themoviedb.org/3/movie/2/watch/providers": _tmdb_providers_response(),
         }
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "TV Shows", [])
 
@@ -1914,7 +1918,7 @@ class TestFindMissingSequels:
 
         with (
             patch("recommenders.huntarr.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_missing_sequels("key", plex, "Movies", "", [])
 
@@ -1935,7 +1939,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get") as mock_get,
+            patch("recommenders.external.http_client.get") as mock_get,
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -1947,7 +1951,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get") as mock_get,
+            patch("recommenders.external.http_client.get") as mock_get,
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -1973,7 +1977,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get") as mock_get,
+            patch("recommenders.external.http_client.get") as mock_get,
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -1999,7 +2003,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2017,7 +2021,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2028,7 +2032,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get") as mock_get,
+            patch("recommenders.external.http_client.get") as mock_get,
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2044,7 +2048,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2068,7 +2072,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2089,7 +2093,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_fake_get),
+            patch("recommenders.external.http_client.get", side_effect=_fake_get),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2133,7 +2137,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2162,7 +2166,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2184,7 +2188,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)) as mock_get,
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2210,7 +2214,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2233,7 +2237,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2256,7 +2260,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2293,7 +2297,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2320,7 +2324,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -2343,7 +2347,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             find_horizon_movies("key", plex, "Movies")
 
@@ -2399,7 +2403,7 @@ class TestFindHorizonMovies:
 
         with (
             patch("recommenders.horizon.get_project_root", return_value=str(tmp_path)),
-            patch("recommenders.external.requests.get", side_effect=_strict_get_dispatcher(url_map)),
+            patch("recommenders.external.http_client.get", side_effect=_strict_get_dispatcher(url_map)),
         ):
             result = find_horizon_movies("key", plex, "Movies")
 
@@ -4678,7 +4682,7 @@ class TestTVMovieGenreDetection:
         """Test TV_MOVIE_GENRE_ID is correct"""
         assert TV_MOVIE_GENRE_ID == 10770
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_get_movie_genre_ids_returns_genres(self, mock_get):
         """Test get_movie_genre_ids returns list of genre IDs"""
         mock_response = Mock()
@@ -4693,7 +4697,7 @@ class TestTVMovieGenreDetection:
         assert result == [28, 10770, 35]
         assert TV_MOVIE_GENRE_ID in result
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_get_movie_genre_ids_returns_empty_on_error(self, mock_get):
         """Test get_movie_genre_ids returns empty list on API error"""
         mock_response = Mock()
@@ -4704,7 +4708,7 @@ class TestTVMovieGenreDetection:
 
         assert result == []
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_get_movie_genre_ids_returns_empty_on_exception(self, mock_get):
         """Test get_movie_genre_ids handles exceptions gracefully"""
         import requests
@@ -4715,7 +4719,7 @@ class TestTVMovieGenreDetection:
 
         assert result == []
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_get_movie_genre_ids_no_genres_in_response(self, mock_get):
         """Test get_movie_genre_ids handles missing genres key"""
         mock_response = Mock()
@@ -4814,7 +4818,7 @@ class TestDiscoverCandidatesByProfileKeyCoercion:
     uses "keywords", never the raw watched_data_counters storage key
     "tmdb_keywords")."""
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_plain_dict_genres_and_keywords_do_not_raise(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 404
@@ -4835,7 +4839,7 @@ class TestDiscoverCandidatesByProfileKeyCoercion:
         )
         assert isinstance(candidates, dict)
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_counter_genres_and_keywords_key_still_work(self, mock_get):
         """Regression: the pre-existing shape (Counter-valued, 'keywords'
         key - load_user_profile_from_cache()'s own return shape) must
@@ -4856,7 +4860,7 @@ class TestDiscoverCandidatesByProfileKeyCoercion:
         )
         assert isinstance(candidates, dict)
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_missing_genres_and_keywords_keys_do_not_raise(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 404
@@ -4931,7 +4935,7 @@ class TestBuildProfileViaRecommender:
 class TestDiscoverPopularByGenre:
     """Tests for genre-popular fallback discovery"""
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     @patch("recommenders.external.time.sleep")
     def test_returns_recommendations_for_valid_genres(self, mock_sleep, mock_get):
         """Test that popular items are returned for valid genres"""
@@ -4971,7 +4975,7 @@ class TestDiscoverPopularByGenre:
         assert results[0]["tmdb_id"] == 123
         assert results[0]["rating"] == 8.5
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     @patch("recommenders.external.time.sleep")
     def test_filters_out_library_items(self, mock_sleep, mock_get):
         """Test that items already in library are excluded"""
@@ -5012,7 +5016,7 @@ class TestDiscoverPopularByGenre:
         assert len(results) == 1
         assert results[0]["tmdb_id"] == 456
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     @patch("recommenders.external.time.sleep")
     def test_handles_tv_shows(self, mock_sleep, mock_get):
         """Test TV show discovery uses correct field names"""
@@ -5042,7 +5046,7 @@ class TestDiscoverPopularByGenre:
         assert results[0]["title"] == "Popular TV Show"
         assert results[0]["year"] == 2024
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     @patch("recommenders.external.time.sleep")
     def test_respects_limit(self, mock_sleep, mock_get):
         """Test that limit parameter is respected"""
@@ -5071,7 +5075,7 @@ class TestDiscoverPopularByGenre:
 
         assert len(results) == 5
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     @patch("recommenders.external.time.sleep")
     def test_handles_invalid_genre(self, mock_sleep, mock_get):
         """Test graceful handling of invalid genre names"""
@@ -5083,7 +5087,7 @@ class TestDiscoverPopularByGenre:
         assert results == []
         mock_get.assert_not_called()
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     @patch("recommenders.external.time.sleep")
     def test_applies_rate_limit_delay_between_genre_calls(self, mock_sleep, mock_get):
         """Regression test for a ruff F821: TMDB_RATE_LIMIT_DELAY was an
@@ -5120,7 +5124,7 @@ class TestDiscoverPopularByGenre:
 class TestFindSimilarContentThinProfile:
     """Tests for thin profile handling in find_similar_content_with_profile"""
 
-    @patch("recommenders.external.requests.get")
+    @patch("recommenders.external.http_client.get")
     def test_thin_profile_uses_reduced_iterations(self, mock_get):
         """Test that thin profiles use reduced iterations instead of full discovery"""
         from recommenders.external import find_similar_content_with_profile, is_thin_profile
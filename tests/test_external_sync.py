@@ -131,33 +131,34 @@ class TestFlattenCategorized:
 class TestGetImdbId:
     """Tests for get_imdb_id function"""
 
-    @patch("recommenders.external_sync.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_imdb_id_for_movie(self, mock_get):
         """Test returns IMDB ID for movie."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"imdb_id": "tt1234567"}
+        mock_response.json.return_value = {"id": 12345, "external_ids": {"imdb_id": "tt1234567"}}
         mock_get.return_value = mock_response
 
         result = get_imdb_id("api_key", 12345, "movie")
 
         assert result == "tt1234567"
-        assert "movie/12345/external_ids" in mock_get.call_args[0][0]
+        assert mock_get.call_args[0][0].endswith("/movie/12345")
+        assert "external_ids" in mock_get.call_args[1]["params"]["append_to_response"]
 
-    @patch("recommenders.external_sync.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_imdb_id_for_tv(self, mock_get):
         """Test returns IMDB ID for TV show."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"imdb_id": "tt9876543"}
+        mock_response.json.return_value = {"id": 54321, "external_ids": {"imdb_id": "tt9876543"}}
         mock_get.return_value = mock_response
 
         result = get_imdb_id("api_key", 54321, "tv")
 
         assert result == "tt9876543"
-        assert "tv/54321/external_ids" in mock_get.call_args[0][0]
+        assert mock_get.call_args[0][0].endswith("/tv/54321")
 
-    @patch("recommenders.external_sync.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_on_api_error(self, mock_get):
         """Test returns None on API error."""
         mock_response = Mock()
@@ -168,7 +169,7 @@ class TestGetImdbId:
 
         assert result is None
 
-    @patch("recommenders.external_sync.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_on_request_exception(self, mock_get):
         """Test returns None on requests exception."""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -177,12 +178,12 @@ class TestGetImdbId:
 
         assert result is None
 
-    @patch("recommenders.external_sync.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_when_no_imdb_id(self, mock_get):
         """Test returns None when response has no imdb_id."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"tvdb_id": 123}  # No imdb_id
+        mock_response.json.return_value = {"external_ids": {"tvdb_id": 123}}  # No imdb_id
         mock_get.return_value = mock_response
 
         result = get_imdb_id("api_key", 12345, "movie")
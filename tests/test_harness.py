@@ -34,11 +34,11 @@ import sys
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
-def _run_harness(pythonhashseed: str) -> str:
+def _run_harness(pythonhashseed: str, *extra_args: str) -> str:
     env = dict(os.environ)
     env["PYTHONHASHSEED"] = pythonhashseed
     result = subprocess.run(
-        [sys.executable, "-m", "tests.harness"],
+        [sys.executable, "-m", "tests.harness", *extra_args],
         cwd=REPO_ROOT,
         env=env,
         capture_output=True,
@@ -97,3 +97,12 @@ class TestFloatNonAssociativityGap:
             "non-associativity). This would only ever "
             "surface on a genuine profile_hash cache-miss recompute."
         )
+
+
+class TestCompiledProfileParity:
+    """utils.scoring.CompiledProfile is a pure performance change: scoring
+    every fixture movie through one up-front compile must reproduce the
+    plain-dict path's exact bit patterns and selection order."""
+
+    def test_compiled_output_is_byte_identical(self):
+        assert _run_harness("0", "--compiled") == _run_harness("0")
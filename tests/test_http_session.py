@@ -0,0 +1,231 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/http_session.py - pooled keep-alive HTTP sessions.
+"""
+
+from unittest.mock import Mock, patch
+
+import requests
+
+from utils.http_session import PooledHTTPClient, SessionRegistry
+
+
+class TestSessionRegistry:
+    def test_one_session_per_host(self):
+        registry = SessionRegistry()
+        tmdb = registry.session_for("https://api.themoviedb.org/3/movie/1")
+        assert registry.session_for("https://api.themoviedb.org/3/find/tt1") is tmdb
+        assert registry.session_for("https://api.trakt.tv/users/me") is not tmdb
+
+    def test_scheme_and_port_are_part_of_the_key(self):
+        registry = SessionRegistry()
+        plain = registry.session_for("http://plex.local:32400/library")
+        assert registry.session_for("https://plex.local:32400/library") is not plain
+        assert registry.session_for("http://plex.local:32401/library") is not plain
+
+    def test_adapter_pool_is_sized(self):
+        session = SessionRegistry(pool_maxsize=7).session_for("https://api.themoviedb.org/3")
+        assert session.get_adapter("https://api.themoviedb.org/3")._pool_maxsize == 7
+
+    def test_cookies_are_not_carried_between_calls(self):
+        session = SessionRegistry().session_for("https://api.trakt.tv")
+        response = requests.Response()
+        response.url = "https://api.trakt.tv/users/me"
+        response.raw = Mock(_original_response=Mock(msg=Mock(get_all=Mock(return_value=["sid=abc; Path=/"]))))
+        requests.cookies.extract_cookies_to_jar(session.cookies, requests.Request("GET", response.url), response.raw)
+        session.cookies.set("sid", "abc", domain="api.trakt.tv")
+        assert len(session.cookies) == 0
+
+    def test_explicit_per_call_cookies_still_sent(self):
+        session = SessionRegistry().session_for("https://api.trakt.tv")
+        prepared = session.prepare_request(requests.Request("GET", "https://api.trakt.tv/x", cookies={"a": "1"}))
+        assert prepared.headers["Cookie"] == "a=1"
+
+    def test_fork_starts_an_empty_registry(self):
+        registry = SessionRegistry()
+        parent = registry.session_for("https://api.themoviedb.org/3")
+        with patch("utils.http_session.os.getpid", return_value=registry._pid + 1):
+            assert registry.session_for("https://api.themoviedb.org/3") is not parent
+
+    def test_close_drops_the_sessions(self):
+        registry = SessionRegistry()
+        first = registry.session_for("https://api.themoviedb.org/3")
+        registry.close()
+        assert registry.session_for("https://api.themoviedb.org/3") is not first
+
+
+class TestPooledHTTPClient:
+    def _client(self):
+        session = Mock()
+        registry = Mock()
+        registry.session_for.return_value = session
+        return PooledHTTPClient(registry), registry, session
+
+    def test_get_passes_per_call_arguments_through(self):
+        client, registry, session = self._client()
+        client.get("https://api.themoviedb.org/3/movie/1", params={"a": 1}, timeout=10, allow_redirects=False)
+
+        registry.session_for.assert_called_once_with("https://api.themoviedb.org/3/movie/1")
+        session.request.assert_called_once_with(
+            method="GET",
+            url="https://api.themoviedb.org/3/movie/1",
+            params={"a": 1},
+            timeout=10,
+            allow_redirects=False,
+        )
+
+    def test_verify_and_stream_reach_the_session(self):
+        client, _registry, session = self._client()
+        client.put("https://plex.local:32400/x", verify=False, stream=True)
+
+        _, kwargs = session.request.call_args
+        assert kwargs["verify"] is False
+        assert kwargs["stream"] is True
+        assert kwargs["method"] == "PUT"
+
+    def test_post_sends_json(self):
+        client, _registry, session = self._client()
+        client.post("https://api.trakt.tv/oauth/token", json={"code": "x"}, timeout=10)
+
+        _, kwargs = session.request.call_args
+        assert kwargs["json"] == {"code": "x"}
+
+    def test_returns_the_session_response(self):
+        client, _registry, session = self._client()
+        response = Mock(spec=requests.Response)
+        session.request.return_value = response
+
+        assert client.request("DELETE", "https://radarr.local/api/v3/movie/1") is response
+
+    def test_rate_limited_host_takes_a_token(self):
+        session = Mock()
+        registry = Mock()
+        registry.session_for.return_value = session
+        limiter = Mock()
+        client = PooledHTTPClient(registry, limiters={"api.themoviedb.org": limiter})
+
+        client.get("https://api.themoviedb.org/3/movie/1")
+        client.get("https://api.trakt.tv/users/me")
+
+        limiter.acquire.assert_called_once_with()
+        assert session.request.call_count == 2
+
+    def test_tmdb_is_rate_limited_by_default(self):
+        from utils.http_session import http_client
+        from utils.rate_limit import tmdb_rate_limiter
+
+        assert http_client.limiters["api.themoviedb.org"] is tmdb_rate_limiter
+
+    def test_cached_get_skips_the_limiter_and_the_network(self):
+        session = Mock()
+        registry = Mock()
+        registry.session_for.return_value = session
+        limiter, cache = Mock(), Mock()
+        hit = Mock(spec=requests.Response)
+        cache.lookup.return_value = hit
+        client = PooledHTTPClient(
+            registry, limiters={"api.themoviedb.org": limiter}, caches={"api.themoviedb.org": cache}
+        )
+
+        assert client.get("https://api.themoviedb.org/3/movie/1", params={"api_key": "k"}) is hit
+
+        cache.lookup.assert_called_once_with("https://api.themoviedb.org/3/movie/1", {"api_key": "k"})
+        limiter.acquire.assert_not_called()
+        session.request.assert_not_called()
+
+    def test_cache_miss_is_fetched_and_stored(self):
+        session = Mock()
+        registry = Mock()
+        registry.session_for.return_value = session
+        cache = Mock()
+        cache.lookup.return_value = None
+        client = PooledHTTPClient(registry, caches={"api.themoviedb.org": cache})
+
+        response = client.get("https://api.themoviedb.org/3/movie/1", params={"api_key": "k"})
+
+        assert response is session.request.return_value
+        cache.store.assert_called_once_with("https://api.themoviedb.org/3/movie/1", {"api_key": "k"}, response)
+
+    def test_only_plain_gets_use_the_cache(self):
+        session = Mock()
+        registry = Mock()
+        registry.session_for.return_value = session
+        cache = Mock()
+        client = PooledHTTPClient(registry, caches={"api.themoviedb.org": cache})
+
+        client.post("https://api.themoviedb.org/3/list", json={})
+        client.get("https://api.themoviedb.org/3/movie/1", stream=True)
+
+        cache.lookup.assert_not_called()
+        cache.store.assert_not_called()
+
+    def test_tmdb_is_cached_by_default(self):
+        from utils.http_session import http_client
+        from utils.tmdb_cache import tmdb_response_cache
+
+        assert http_client.caches["api.themoviedb.org"] is tmdb_response_cache
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        import threading
+
+        from utils.single_flight import SingleFlight
+
+        release = threading.Event()
+        session = Mock()
+        session.request.side_effect = lambda **_kwargs: release.wait(5) and Mock(spec=requests.Response)
+        registry = Mock()
+        registry.session_for.return_value = session
+        flight = SingleFlight("test")
+        client = PooledHTTPClient(registry, flights={"api.themoviedb.org": flight})
+        responses = []
+
+        def get(key):
+            responses.append(client.get("https://api.themoviedb.org/3/movie/1", params={"api_key": key}))
+
+        threads = [threading.Thread(target=get, args=(key,)) for key in ("a", "b", "c")]
+        threads[0].start()
+        while not session.request.called:
+            threading.Event().wait(0.001)
+        for thread in threads[1:]:
+            thread.start()
+        while flight._counts["shared"] < 2:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert session.request.call_count == 1
+        assert len(responses) == 3 and all(r is responses[0] for r in responses)
+
+    def test_writes_are_never_coalesced(self):
+        session = Mock()
+        registry = Mock()
+        registry.session_for.return_value = session
+        flight = Mock()
+        client = PooledHTTPClient(registry, flights={"api.themoviedb.org": flight})
+
+        client.post("https://api.themoviedb.org/3/list", json={})
+
+        flight.do.assert_not_called()
+        session.request.assert_called_once()
+
+    def test_tmdb_is_coalesced_by_default(self):
+        from utils.http_session import http_client
+        from utils.single_flight import tmdb_single_flight
+
+        assert http_client.flights["api.themoviedb.org"] is tmdb_single_flight
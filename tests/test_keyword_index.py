@@ -0,0 +1,109 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/keyword_index.py - the indexed partial-match lookup must
+return exactly what fuzzy_keyword_match()'s linear scan returns.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from utils.keyword_index import FuzzyKeywordIndex
+from utils.scoring import compile_profile, fuzzy_keyword_match
+
+WORDS = ["time", "travel", "timetravel", "alien", "invasion", "robot", "ai", "love", "war", "spy", "space", "of", "x"]
+
+
+def _phrase(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+
+
+class TestFuzzyKeywordIndex:
+    def test_user_keyword_inside_content_keyword(self):
+        user_keywords = {"superhero": 10}
+        index = FuzzyKeywordIndex(user_keywords)
+        assert fuzzy_keyword_match("superhero team", user_keywords, index=index) == fuzzy_keyword_match(
+            "superhero team", user_keywords
+        )
+        assert index.best_partial_match("superhero team")[1] == "superhero"
+
+    def test_content_keyword_inside_user_keyword(self):
+        user_keywords = {"alien invasion": 4}
+        index = FuzzyKeywordIndex(user_keywords)
+        assert index.best_partial_match("alien") == fuzzy_keyword_match("alien", user_keywords)
+        assert index.best_partial_match("alien")[1] == "alien invasion"
+
+    def test_short_keyword_uses_scan(self):
+        user_keywords = {"ai uprising": 2, "spy": 3}
+        index = FuzzyKeywordIndex(user_keywords)
+        assert index.best_partial_match("ai") == fuzzy_keyword_match("ai", user_keywords)
+
+    def test_no_overlap(self):
+        index = FuzzyKeywordIndex({"robot": 5})
+        assert index.best_partial_match("romance") == (0, None)
+
+    def test_ties_go_to_the_earlier_profile_keyword(self):
+        user_keywords = {"space war": 4, "war space": 4}
+        index = FuzzyKeywordIndex(user_keywords)
+        assert index.best_partial_match("war") == fuzzy_keyword_match("war", user_keywords)
+        assert index.best_partial_match("war")[1] == "space war"
+
+    def test_non_positive_counts_never_match(self):
+        index = FuzzyKeywordIndex({"robot": -3, "robot war": 0})
+        assert index.best_partial_match("robot") == (0, None)
+
+    def test_returns_original_key_not_lowered(self):
+        user_keywords = {"Time Travel": 3}
+        index = FuzzyKeywordIndex(user_keywords)
+        assert index.best_partial_match("time")[1] == "Time Travel"
+
+    def test_empty_user_keyword_matches_anything(self):
+        user_keywords = {"": 2}
+        index = FuzzyKeywordIndex(user_keywords)
+        assert index.best_partial_match("robot") == fuzzy_keyword_match("robot", user_keywords)
+
+    def test_partial_matches_lists_every_candidate_in_profile_order(self):
+        index = FuzzyKeywordIndex({"time travel": 1, "heist": 1, "time": 1, "me": 1})
+        assert index.partial_matches("time") == ["time travel", "time", "me"]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_linear_scan(self, seed):
+        rng = random.Random(seed)
+        for _ in range(40):
+            user_keywords = {_phrase(rng): rng.choice([rng.randint(-3, 10), rng.uniform(0, 5), 0]) for _ in range(40)}
+            index = FuzzyKeywordIndex(user_keywords)
+            for _ in range(25):
+                keyword = _phrase(rng)
+                assert fuzzy_keyword_match(keyword, user_keywords, index=index) == fuzzy_keyword_match(
+                    keyword, user_keywords
+                ), keyword
+
+
+class TestCompiledProfileIndex:
+    def test_compile_profile_attaches_index(self):
+        compiled = compile_profile({"keywords": Counter({"Robot Uprising": 3})})
+        index = compiled.prefs["_fuzzy_index"]
+        assert isinstance(index, FuzzyKeywordIndex)
+        assert index.best_partial_match("robot") == fuzzy_keyword_match("robot", compiled.prefs["keywords_lower"])
+
+    def test_index_result_is_cached(self):
+        compiled = compile_profile({"keywords": Counter({"robot uprising": 3})})
+        cache = compiled.prefs["_fuzzy_cache"]
+        fuzzy_keyword_match("robot", compiled.prefs["keywords_lower"], cache, compiled.prefs["_fuzzy_index"])
+        assert cache["robot"][1] == "robot uprising"
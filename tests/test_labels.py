@@ -19,13 +19,17 @@ Tests for utils/labels.py - Label management functions.
 """
 
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
+
+import plexapi.exceptions
 
 from utils.labels import (
     DEFAULT_MOVIE_NAME_TEMPLATE,
     DEFAULT_TV_NAME_TEMPLATE,
+    LabelEdit,
     add_labels_to_items,
     build_label_name,
+    bulk_edit_labels,
     categorize_labeled_items,
     remove_labels_from_items,
     render_collection_name,
@@ -254,6 +258,22 @@ class TestCategorizeLabeledItems:
         assert item in result["watched"]
         assert item not in result["fresh"]
 
+    def test_reloads_each_item_by_default(self):
+        item = self._create_mock_item(456)
+
+        categorize_labeled_items([item], set(), [], "Recommended", {})
+
+        item.reload.assert_called_once()
+
+    def test_reload_items_false_uses_items_as_loaded(self):
+        """Callers that batch-loaded the items already skip the per-item reload."""
+        item = self._create_mock_item(456)
+
+        result = categorize_labeled_items([item], set(), [], "Recommended", {}, reload_items=False)
+
+        item.reload.assert_not_called()
+        assert item in result["fresh"]
+
     def test_categorizes_fresh_items(self):
         """Test that fresh items are correctly categorized."""
         item = self._create_mock_item(456)
@@ -427,3 +447,91 @@ class TestAddLabelsToItems:
         item1.addLabel.assert_called_once()
         item2.addLabel.assert_not_called()
         item3.addLabel.assert_called_once()
+
+
+class TestBulkEditLabels:
+    """Tests for bulk_edit_labels() - multi-id section label edits."""
+
+    def _item(self, rating_key, labels=(), item_type="movie"):
+        return Mock(
+            ratingKey=rating_key, title=f"Movie {rating_key}", type=item_type, labels=[Mock(tag=t) for t in labels]
+        )
+
+    def test_one_request_per_action(self):
+        section = Mock()
+        adds = [self._item(1), self._item(2)]
+        removes = [self._item(3)]
+        label_dates = {"3_Recommended": "2026-01-01T00:00:00"}
+
+        plan = bulk_edit_labels(section, "Recommended", label_dates, add=adds, remove=removes, reason="watched")
+
+        assert plan == [
+            LabelEdit("remove", "Recommended", (3,), "watched"),
+            LabelEdit("add", "Recommended", (1, 2), "watched"),
+        ]
+        assert section.batchMultiEdits.call_args_list == [call(removes), call(adds)]
+        section.removeLabel.assert_called_once_with("Recommended", locked=False)
+        section.addLabel.assert_called_once_with("Recommended", locked=False)
+        assert section.saveMultiEdits.call_count == 2
+        for item in adds + removes:
+            item.addLabel.assert_not_called()
+            item.removeLabel.assert_not_called()
+        assert set(label_dates) == {"1_Recommended", "2_Recommended"}
+
+    def test_already_labeled_items_are_not_added(self):
+        section = Mock()
+        labeled = self._item(1, labels=["Recommended"])
+
+        plan = bulk_edit_labels(section, "Recommended", {}, add=[labeled])
+
+        assert plan == []
+        section.batchMultiEdits.assert_not_called()
+
+    def test_batches_and_separates_item_types(self):
+        section = Mock()
+        movies = [self._item(i) for i in range(3)]
+        show = self._item(9, item_type="show")
+
+        with patch("utils.labels.PLEX_LABEL_EDIT_BATCH_SIZE", 2):
+            plan = bulk_edit_labels(section, "Recommended", {}, add=movies + [show])
+
+        assert [edit.rating_keys for edit in plan] == [(0, 1), (2,), (9,)]
+        assert section.saveMultiEdits.call_count == 3
+
+    def test_failed_multi_edit_falls_back_to_per_item(self):
+        section = Mock()
+        section.saveMultiEdits.side_effect = plexapi.exceptions.BadRequest("not from this library")
+        item = self._item(1)
+        label_dates = {}
+
+        bulk_edit_labels(section, "Recommended", label_dates, add=[item])
+
+        item.addLabel.assert_called_once_with("Recommended", locked=False)
+        assert "1_Recommended" in label_dates
+
+    def test_dry_run_sends_and_records_nothing(self):
+        section = Mock()
+        removed = self._item(2)
+        label_dates = {"2_Recommended": "2026-01-01T00:00:00"}
+
+        plan = bulk_edit_labels(
+            section, "Recommended", label_dates, add=[self._item(1)], remove=[removed], dry_run=True
+        )
+
+        assert [edit.action for edit in plan] == ["remove", "add"]
+        section.batchMultiEdits.assert_not_called()
+        assert label_dates == {"2_Recommended": "2026-01-01T00:00:00"}
+
+    def test_section_routes_add_and_remove_helpers_through_bulk_edit(self):
+        section = Mock()
+        items = [self._item(1), self._item(2)]
+        label_dates = {}
+
+        assert add_labels_to_items(items, "Recommended", label_dates, section=section) == 2
+        remove_labels_from_items(items, "Recommended", label_dates, "replaced", section=section)
+
+        assert section.batchMultiEdits.call_count == 2
+        assert label_dates == {}
+        for item in items:
+            item.addLabel.assert_not_called()
+            item.removeLabel.assert_not_called()
@@ -0,0 +1,140 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/library_index.py - persistent library-wide derived indexes.
+"""
+
+import json
+
+import pytest
+
+from utils.calibration import list_distribution
+from utils.config import IDF_MIN_CORPUS_SIZE
+from utils.corpus_idf import build_corpus_idf
+from utils.franchise import build_franchise_index, collect_library_tmdb_ids
+from utils.library_index import LibraryIndex, library_content_version
+
+
+def _library(size=IDF_MIN_CORPUS_SIZE + 5):
+    items = {}
+    for i in range(size):
+        items[str(i)] = {
+            "title": f"Movie {i}",
+            "genres": ["Action", "Drama"] if i % 2 else ["Comedy"],
+            "tmdb_keywords": ["sequel"] + (["nasa"] if i == 0 else []),
+            "tmdb_id": 1000 + i,
+        }
+    items["1"].update(collection_id=10, collection_name="Saga", year=2001)
+    items["3"].update(collection_id=10, collection_name="Saga", year=1999)
+    return items
+
+
+def _rating_keys(franchise_index):
+    """FranchiseEntry compares by identity; compare what it positions."""
+    return {cid: [entry.rating_key for entry in entries] for cid, entries in franchise_index.items()}
+
+
+class TestBuild:
+    def test_matches_the_from_scratch_tables(self):
+        items = _library()
+        index = LibraryIndex.build(items)
+        assert index.corpus_idf("tmdb_keywords") == build_corpus_idf(items.values(), "tmdb_keywords")
+        assert index.corpus_idf("genres") == build_corpus_idf(items.values(), "genres")
+        assert _rating_keys(index.franchise_index(items)) == _rating_keys(build_franchise_index(items))
+        assert index.library_tmdb_ids() == collect_library_tmdb_ids(items)
+
+    def test_genre_supply_matches_list_distribution(self):
+        items = _library()
+        index = LibraryIndex.build(items)
+        withheld = [items["0"], items["1"]]
+        offered = [info for key, info in items.items() if key not in ("0", "1")]
+        expected = list_distribution([[g.lower() for g in info["genres"]] for info in offered])
+        assert index.genre_supply(withheld) == pytest.approx(expected)
+
+    def test_genre_supply_of_everything_withheld_is_empty(self):
+        items = _library(5)
+        assert LibraryIndex.build(items).genre_supply(items.values()) == {}
+
+
+class TestIncrementalUpdates:
+    def test_add_then_remove_matches_a_rebuild(self):
+        items = _library()
+        index = LibraryIndex.build(items)
+        index.add_item("99", {"genres": ["Horror"], "tmdb_keywords": ["nasa"], "tmdb_id": 1003})
+        index.remove_item("1", items.pop("1"))
+        index.remove_item("99", {"genres": ["Horror"], "tmdb_keywords": ["nasa"], "tmdb_id": 1003})
+
+        rebuilt = LibraryIndex.build(items)
+        assert index.total == rebuilt.total
+        assert index.document_frequency == rebuilt.document_frequency
+        assert index.collection_members == rebuilt.collection_members
+        assert index.genre_mass == pytest.approx(rebuilt.genre_mass)
+        assert "horror" not in index.genre_mass
+        assert index.tmdb_ids == rebuilt.tmdb_ids
+
+    @pytest.mark.parametrize("key", ["1", "2"])
+    def test_rewrite_in_place_matches_a_rebuild(self, key):
+        """A rewritten entry (a collection member, or an item newly
+        joining one) keeps its media-cache-order place among the members."""
+        items = _library()
+        index = LibraryIndex.build(items)
+        rewritten = dict(items[key], collection_id=10, genres=["Horror"], tmdb_keywords=["nasa"])
+        index.replace_item(key, items[key], rewritten, items)
+        items[key] = rewritten
+
+        rebuilt = LibraryIndex.build(items)
+        assert list(index.collection_members) == list(rebuilt.collection_members)
+        assert index.document_frequency == rebuilt.document_frequency
+        assert index.genre_mass == pytest.approx(rebuilt.genre_mass)
+        assert index.tmdb_ids == rebuilt.tmdb_ids
+        assert _rating_keys(index.franchise_index(items)) == _rating_keys(build_franchise_index(items))
+
+    def test_rewrite_leaving_a_collection_drops_the_member(self):
+        items = _library()
+        index = LibraryIndex.build(items)
+        index.replace_item("1", items["1"], {"genres": ["Comedy"], "tmdb_id": 1001}, items)
+        assert list(index.collection_members) == ["3"]
+
+    def test_shared_tmdb_id_survives_one_removal(self):
+        index = LibraryIndex.build({"1": {"tmdb_id": 7}, "2": {"tmdb_id": 7}})
+        index.remove_item("1", {"tmdb_id": 7})
+        assert index.library_tmdb_ids() == {7}
+
+
+class TestSerialization:
+    def test_round_trips_through_json(self):
+        index = LibraryIndex.build(_library())
+        restored = LibraryIndex.from_dict(json.loads(json.dumps(index.to_dict())), "v1")
+        assert restored.version == "v1"
+        assert restored.total == index.total
+        assert restored.document_frequency == index.document_frequency
+        assert restored.collection_members == index.collection_members
+        assert restored.genre_mass == index.genre_mass
+        assert restored.tmdb_ids == index.tmdb_ids
+
+    @pytest.mark.parametrize("data", [{}, {"format": -1}, {"format": 1, "total": 3}])
+    def test_other_formats_and_malformed_data_are_rejected(self, data):
+        assert LibraryIndex.from_dict(data) is None
+
+
+class TestLibraryContentVersion:
+    def test_changes_with_the_content_counter_and_item_count(self):
+        cache = {"movies": {"1": {}}, "content_version": 1, "last_updated": "t"}
+        before = library_content_version(cache, "movies")
+        assert library_content_version({**cache, "content_version": 2}, "movies") != before
+        assert library_content_version({**cache, "movies": {"1": {}, "2": {}}}, "movies") != before
+        assert library_content_version(dict(cache), "movies") == before
@@ -38,45 +38,34 @@ class TestMDBListClientInit:
         """Test initialization with API key."""
         client = MDBListClient(api_key="test_api_key")
         assert client.api_key == "test_api_key"
-        assert client._last_request_time == 0
+        assert client.rate_limiter.rate == pytest.approx(1 / MDBLIST_RATE_LIMIT_DELAY)
         assert client._lists_cache is None
 
-    def test_init_initializes_rate_limit_state(self):
-        """Test rate limit state is initialized."""
-        client = MDBListClient("key")
-        assert client._last_request_time == 0
+    def test_clients_share_one_rate_limiter(self):
+        """Every MDBList client paces against the same service limit."""
+        assert MDBListClient("key").rate_limiter is MDBListClient("other").rate_limiter
 
 
 class TestMDBListClientRateLimit:
     """Tests for rate limiting."""
 
     @patch("utils.api_client.time.sleep")
-    @patch("utils.api_client.time.time")
-    def test_rate_limit_sleeps_when_needed(self, mock_time, mock_sleep):
+    def test_rate_limit_sleeps_when_needed(self, mock_sleep):
         """Test rate limiting enforces delay between requests."""
         client = MDBListClient("key")
-        client._last_request_time = 100.0
-
-        # First call returns current time, second updates last_request_time
-        mock_time.side_effect = [100.05, 100.1]  # 0.05s since last request
 
+        client._rate_limit()
         client._rate_limit()
 
-        # Should sleep for remaining time (0.1 - 0.05 = 0.05)
+        # The second request waits out the starting pace
         mock_sleep.assert_called_once()
         sleep_time = mock_sleep.call_args[0][0]
-        assert sleep_time == pytest.approx(MDBLIST_RATE_LIMIT_DELAY - 0.05, abs=0.01)
+        assert sleep_time == pytest.approx(MDBLIST_RATE_LIMIT_DELAY, abs=0.01)
 
     @patch("utils.api_client.time.sleep")
-    @patch("utils.api_client.time.time")
-    def test_rate_limit_no_sleep_when_enough_time_passed(self, mock_time, mock_sleep):
-        """Test no sleep when enough time has passed."""
-        client = MDBListClient("key")
-        client._last_request_time = 100.0
-
-        mock_time.return_value = 100.2  # 0.2s since last request
-
-        client._rate_limit()
+    def test_rate_limit_no_sleep_for_first_request(self, mock_sleep):
+        """Test no sleep when the limiter has a token."""
+        MDBListClient("key")._rate_limit()
 
         mock_sleep.assert_not_called()
 
@@ -84,7 +73,7 @@ class TestMDBListClientRateLimit:
 class TestMDBListClientMakeRequest:
     """Tests for API request handling."""
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_successful_request(self, mock_request):
         """Test successful API request."""
         mock_response = Mock()
@@ -105,7 +94,7 @@ class TestMDBListClientMakeRequest:
         assert result == {"status": "ok"}
         mock_request.assert_called_once()
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_api_key_in_params(self, mock_request):
         """Test API key is added to query params."""
         mock_response = Mock()
@@ -126,7 +115,7 @@ class TestMDBListClientMakeRequest:
         call_kwargs = mock_request.call_args[1]
         assert call_kwargs["params"]["apikey"] == "my_api_key"
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_unauthorized_raises_error(self, mock_request):
         """Test 401 raises MDBListAPIError."""
         mock_response = Mock()
@@ -145,7 +134,7 @@ class TestMDBListClientMakeRequest:
         with pytest.raises(MDBListAPIError, match="Invalid API key"):
             client._make_request("GET", "lists/user")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_404_returns_none(self, mock_request):
         """Test 404 returns None."""
         mock_response = Mock()
@@ -164,7 +153,7 @@ class TestMDBListClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_204_returns_none(self, mock_request):
         """Test 204 No Content returns None."""
         mock_response = Mock()
@@ -183,7 +172,7 @@ class TestMDBListClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_error_response_raises_api_error(self, mock_request):
         """Test error responses raise MDBListAPIError."""
         mock_response = Mock()
@@ -204,7 +193,7 @@ class TestMDBListClientMakeRequest:
         with pytest.raises(MDBListAPIError, match="Invalid list"):
             client._make_request("POST", "lists/user/add")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_timeout_raises_api_error(self, mock_request):
         """Test timeout raises MDBListAPIError."""
         mock_request.side_effect = requests.exceptions.Timeout()
@@ -214,7 +203,7 @@ class TestMDBListClientMakeRequest:
         with pytest.raises(MDBListAPIError, match="timeout"):
             client._make_request("GET", "lists/user")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_connection_error_raises_api_error(self, mock_request):
         """Test connection error raises MDBListAPIError."""
         mock_request.side_effect = requests.exceptions.ConnectionError()
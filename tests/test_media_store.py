@@ -0,0 +1,215 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/media_store.py - the SQLite media cache backend.
+"""
+
+import copy
+import json
+import sqlite3
+from contextlib import closing
+from unittest.mock import patch
+
+from utils.cache import save_media_cache
+from utils.config import CACHE_VERSION
+from utils.media_store import MEDIA_STORE_FORMAT, MediaCacheStore, _encode, import_json_media_cache
+
+
+def _cache(items):
+    return {"movies": items, "last_updated": "2026-01-01", "library_count": len(items), "cache_version": CACHE_VERSION}
+
+
+def _raw_row(db_path, key):
+    with closing(sqlite3.connect(db_path)) as conn:
+        row = conn.execute("SELECT data FROM items WHERE rating_key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+class TestLoadSave:
+    def test_round_trip(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        data = _cache({"1": {"title": "Heat", "genres": ["crime"], "collection_id": None}, "2": {"title": "Ran"}})
+        assert MediaCacheStore(db_path).save(data) is True
+
+        assert MediaCacheStore(db_path).load() == data
+
+    def test_missing_database_returns_empty(self, tmp_path):
+        loaded = MediaCacheStore(str(tmp_path / "missing.db")).load()
+        assert loaded["movies"] == {}
+        assert loaded["library_count"] == 0
+        assert loaded["cache_version"] == CACHE_VERSION
+
+    def test_outdated_version_is_cleared(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        stale = _cache({"1": {"title": "Heat"}})
+        stale["cache_version"] = CACHE_VERSION - 1
+        MediaCacheStore(db_path).save(stale)
+
+        assert MediaCacheStore(db_path).load()["movies"] == {}
+        assert _raw_row(db_path, "1") is None
+
+    def test_other_layout_is_dropped(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({"1": {"title": "Heat"}}))
+        with closing(sqlite3.connect(db_path)) as conn:
+            conn.execute(f"PRAGMA user_version = {MEDIA_STORE_FORMAT + 1}")
+
+        assert MediaCacheStore(db_path).load()["movies"] == {}
+
+    def test_uses_wal(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({}))
+        with closing(sqlite3.connect(db_path)) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestRowLevelWrites:
+    def test_unchanged_rows_are_not_rewritten(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({"1": {"title": "Heat"}, "2": {"title": "Ran"}}))
+        store = MediaCacheStore(db_path)
+        cache = store.load()
+        # Another process rewrites row 2 after this one loaded it.
+        with closing(sqlite3.connect(db_path)) as conn, conn:
+            conn.execute("UPDATE items SET data = ? WHERE rating_key = '2'", (json.dumps({"title": "Ran (1985)"}),))
+
+        cache["movies"]["1"]["collection_id"] = None
+        assert store.save(cache) is True
+
+        assert json.loads(_raw_row(db_path, "1")) == {"title": "Heat", "collection_id": None}
+        assert json.loads(_raw_row(db_path, "2")) == {"title": "Ran (1985)"}
+
+    def test_concurrent_writers_keep_each_others_items(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({"1": {"title": "Heat"}}))
+        first, second = MediaCacheStore(db_path), MediaCacheStore(db_path)
+        first_cache, second_cache = first.load(), second.load()
+
+        first_cache["movies"]["2"] = {"title": "Ran"}
+        second_cache["movies"]["3"] = {"title": "Ikiru"}
+        first.save(first_cache)
+        second.save(second_cache)
+
+        assert set(MediaCacheStore(db_path).load()["movies"]) == {"1", "2", "3"}
+
+    def test_removed_items_are_deleted(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({"1": {"title": "Heat"}, "2": {"title": "Ran"}}))
+        store = MediaCacheStore(db_path)
+        cache = store.load()
+
+        del cache["movies"]["2"]
+        store.save(cache)
+
+        assert set(MediaCacheStore(db_path).load()["movies"]) == {"1"}
+
+    def test_only_changed_items_are_encoded(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({str(i): {"title": f"Movie {i}"} for i in range(50)}))
+        store = MediaCacheStore(db_path)
+        cache = store.load()
+        # Dropping a field an entry doesn't have is no change.
+        for info in cache["movies"].values():
+            info.pop("similarity_score", None)
+
+        cache["movies"]["7"]["collection_id"] = 10
+        cache["movies"]["8"] = {"title": "Rewritten"}
+        with patch("utils.media_store._encode", wraps=_encode) as encode:
+            store.save(cache)
+
+        encoded_items = [c.args[0] for c in encode.call_args_list if isinstance(c.args[0], dict)]
+        assert sorted(info["title"] for info in encoded_items) == ["Movie 7", "Rewritten"]
+        reloaded = MediaCacheStore(db_path).load()["movies"]
+        assert reloaded["7"] == {"title": "Movie 7", "collection_id": 10}
+        assert reloaded["8"] == {"title": "Rewritten"}
+
+    def test_nothing_changed_writes_no_items(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({"1": {"title": "Heat"}}))
+        store = MediaCacheStore(db_path)
+        cache = store.load()
+        with closing(sqlite3.connect(db_path)) as conn, conn:
+            conn.execute("UPDATE items SET data = ? WHERE rating_key = '1'", (json.dumps({"title": "Other"}),))
+
+        store.save(cache)
+
+        assert json.loads(_raw_row(db_path, "1")) == {"title": "Other"}
+
+    def test_entry_set_as_a_plain_dict_is_tracked_across_saves(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        store = MediaCacheStore(db_path)
+        cache = store.load()
+        info = {"title": "Heat"}
+        cache["movies"]["1"] = info
+        store.save(cache)
+
+        info["collection_id"] = 10
+        store.save(cache)
+
+        assert json.loads(_raw_row(db_path, "1")) == {"title": "Heat", "collection_id": 10}
+
+    def test_removed_header_keys_are_deleted(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save({**_cache({}), "library_keys_digest": "abc"})
+        store = MediaCacheStore(db_path)
+        cache = store.load()
+
+        del cache["library_keys_digest"]
+        store.save(cache)
+
+        assert "library_keys_digest" not in MediaCacheStore(db_path).load()
+
+    def test_copies_are_plain_dicts(self, tmp_path):
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({"1": {"title": "Heat"}}))
+        items = MediaCacheStore(db_path).load()["movies"]
+
+        copied = copy.deepcopy(items)
+
+        assert type(copied) is dict and type(copied["1"]) is dict
+        assert copied == items
+
+    def test_save_failure_returns_false(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        assert MediaCacheStore(str(blocker / "all_movies_cache.db")).save(_cache({})) is False
+
+
+class TestJsonImport:
+    def test_first_load_imports_the_json_cache(self, tmp_path):
+        json_path = str(tmp_path / "all_movies_cache.json")
+        data = _cache({"1": {"title": "Heat"}})
+        save_media_cache(json_path, data)
+
+        loaded = MediaCacheStore(str(tmp_path / "all_movies_cache.db")).load(json_path)
+
+        assert loaded["movies"] == data["movies"]
+        assert loaded["library_count"] == 1
+        # Left in place for switching back to the json backend.
+        assert (tmp_path / "all_movies_cache.json").exists()
+
+    def test_existing_database_is_not_reimported(self, tmp_path):
+        json_path = str(tmp_path / "all_movies_cache.json")
+        db_path = str(tmp_path / "all_movies_cache.db")
+        MediaCacheStore(db_path).save(_cache({"1": {"title": "Heat"}}))
+        save_media_cache(json_path, _cache({"9": {"title": "Stale"}}))
+
+        assert set(MediaCacheStore(db_path).load(json_path)["movies"]) == {"1"}
+
+    def test_nothing_to_import(self, tmp_path):
+        store = MediaCacheStore(str(tmp_path / "all_movies_cache.db"))
+        assert import_json_media_cache(str(tmp_path / "missing.json"), store) is False
@@ -110,6 +110,16 @@ class TestRecordCacheLookup:
         assert 'curatarr_cache_lookups_total{result="miss"} 1.0' in text
 
 
+class TestRecordRateLimit:
+    def test_latest_value_wins(self):
+        metrics.record_rate_limit("tmdb", 40.0)
+        metrics.record_rate_limit("tmdb", 20.0)
+        metrics.record_rate_limit("trakt", 5.0)
+        text = metrics.render_prometheus_text()
+        assert 'curatarr_api_rate_limit_per_second{service="tmdb"} 20.0' in text
+        assert 'curatarr_api_rate_limit_per_second{service="trakt"} 5.0' in text
+
+
 class TestRecordSelfUpdateAttempt:
     def test_success_and_failure_tracked_separately(self):
         metrics.record_self_update_attempt("success")
@@ -151,6 +161,9 @@ class TestRenderPrometheusText:
         for name in metrics._COUNTERS:
             assert f"# HELP {name}" in text
             assert f"# TYPE {name} counter" in text
+        for name in metrics._GAUGES:
+            assert f"# HELP {name}" in text
+            assert f"# TYPE {name} gauge" in text
         for name in metrics._HISTOGRAMS:
             assert f"# HELP {name}" in text
             assert f"# TYPE {name} histogram" in text
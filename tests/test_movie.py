@@ -1293,7 +1293,7 @@ class TestGetPlexWatchedDataMovie:
         assert result is cached
 
     @patch("os.path.exists", return_value=False)
-    @patch("recommenders.movie.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.movie.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.movie.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.movie.fetch_plex_watch_history_movies")
@@ -1322,7 +1322,7 @@ class TestGetPlexWatchedDataMovie:
         mock_log_error.assert_called()
 
     @patch("os.path.exists", return_value=False)
-    @patch("recommenders.movie.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.movie.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.movie.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.movie.merge_movie_history")
@@ -1372,7 +1372,7 @@ class TestGetPlexWatchedDataMovieAccurateMode:
 
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.base.BaseRecommender._get_all_library_items_for_user")
-    @patch("recommenders.movie.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.movie.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.movie.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.movie.fetch_plex_watch_history_movies")
@@ -1419,7 +1419,7 @@ class TestGetPlexWatchedDataMovieAccurateMode:
 
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.base.BaseRecommender._get_all_library_items_for_user")
-    @patch("recommenders.movie.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.movie.fetch_plex_watch_history_movies")
     @patch("recommenders.movie.get_plex_account_ids")
     @patch("recommenders.movie.get_watched_movie_count", return_value=1)
@@ -1462,7 +1462,7 @@ class TestGetPlexWatchedDataMovieAccurateMode:
 
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.base.BaseRecommender._get_all_library_items_for_user")
-    @patch("recommenders.movie.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.movie.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.movie.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.movie.fetch_plex_watch_history_movies")
@@ -1501,7 +1501,7 @@ class TestGetPlexWatchedDataMovieAccurateMode:
 
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.base.BaseRecommender._get_all_library_items_for_user")
-    @patch("recommenders.movie.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.movie.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.movie.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.movie.fetch_plex_watch_history_movies")
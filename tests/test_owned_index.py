@@ -0,0 +1,214 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/owned_index.py - the persisted owned-title index.
+"""
+
+import json
+import os
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from utils.config import OWNED_INDEX_OVERLAP_SECONDS, OWNED_INDEX_RESYNC_DAYS
+from utils.owned_index import DAY_SECONDS, OwnedIndex, owned_library_index
+from utils.plex import LibraryGuid, LibraryItem
+
+NOW = 1_800_000_000.0
+
+
+def _item(rating_key, title, year=2020, guids=(), updated_at=None):
+    return LibraryItem(
+        ratingKey=rating_key,
+        type="movie",
+        title=title,
+        year=year,
+        guids=tuple(LibraryGuid(guid) for guid in guids),
+        labels=(),
+        viewCount=0,
+        userRating=None,
+        leafCount=None,
+        lastViewedAt=None,
+        addedAt=None,
+        updatedAt=datetime.fromtimestamp(updated_at) if updated_at else None,
+    )
+
+
+HEAT = _item(1, " Heat ", 1995, ("imdb://tt0113277", "tmdb://949"), updated_at=1_700_000_000)
+ALIEN = _item(2, "Alien", 1979, ("tmdb://348", "tvdb://55"), updated_at=1_700_000_500)
+NO_IDS = _item(3, "Home Video", None, ("local://3",), updated_at=1_600_000_000)
+
+
+def _index(*items, synced_at=NOW):
+    index = OwnedIndex("uuid-1")
+    for item in items:
+        index.add_item(item)
+    index.synced_at = synced_at
+    return index
+
+
+class TestOwnedIndex:
+    def test_collects_ids_and_titles(self):
+        index = _index(HEAT, ALIEN, NO_IDS)
+
+        assert index.tmdb_ids() == {949, 348}
+        assert index.tvdb_ids() == {55}
+        assert index.imdb_ids() == {"tt0113277"}
+        assert index.titles() == {("heat", 1995), ("alien", 1979), ("home video", None)}
+        assert index.item_tmdb_ids() == [949, 348]
+        assert len(index) == 3
+
+    def test_watermark_is_newest_updated_at(self):
+        assert _index(HEAT, ALIEN, NO_IDS).watermark == 1_700_000_500
+
+    def test_re_added_item_is_replaced_in_place(self):
+        index = _index(HEAT, ALIEN)
+
+        index.add_item(_item(1, "Heat", 1995, ("tmdb://950",), updated_at=1_700_001_000))
+
+        assert index.item_tmdb_ids() == [950, 348]
+        assert index.watermark == 1_700_001_000
+
+    def test_unparseable_guid_is_skipped(self):
+        index = _index(_item(4, "Odd", guids=("tmdb://abc", "imdb://tt1")))
+
+        assert index.tmdb_ids() == set()
+        assert index.imdb_ids() == {"tt1"}
+
+    def test_updated_since_is_watermark_less_overlap(self):
+        assert _index(HEAT, ALIEN).updated_since(now=NOW) == 1_700_000_500 - OWNED_INDEX_OVERLAP_SECONDS
+
+    def test_full_listing_when_empty_or_resync_due(self):
+        assert OwnedIndex().updated_since(now=NOW) is None
+        stale = _index(HEAT, synced_at=NOW - OWNED_INDEX_RESYNC_DAYS * DAY_SECONDS - 1)
+        assert stale.updated_since(now=NOW) is None
+
+    def test_round_trips_through_json(self):
+        index = _index(HEAT, ALIEN, NO_IDS)
+
+        restored = OwnedIndex.from_dict(json.loads(json.dumps(index.to_dict())), "uuid-1")
+
+        assert restored.entries == index.entries
+        assert list(restored.entries) == ["1", "2", "3"]
+        assert (restored.watermark, restored.synced_at) == (index.watermark, index.synced_at)
+
+    @pytest.mark.parametrize(
+        "data, uuid",
+        [
+            ({"format": 999}, "uuid-1"),
+            (None, "uuid-other"),
+            ({"format": 1, "section_uuid": "uuid-1", "watermark": 0, "synced_at": 0, "entries": {"1": {}}}, "uuid-1"),
+        ],
+    )
+    def test_rejects_other_format_section_or_malformed(self, data, uuid):
+        data = data if data is not None else _index(HEAT).to_dict()
+
+        assert OwnedIndex.from_dict(data, uuid) is None
+
+
+class TestOwnedLibraryIndex:
+    """owned_library_index() - refreshing, saving and reusing the index."""
+
+    @pytest.fixture
+    def section(self):
+        return Mock(key=1, uuid="uuid-1")
+
+    @pytest.fixture(autouse=True)
+    def _no_reuse(self):
+        with patch("utils.owned_index.OWNED_INDEX_REUSE_SECONDS", 0):
+            yield
+
+    def test_first_run_lists_section_and_saves(self, section, tmp_path):
+        with patch("utils.owned_index.read_library_snapshot", return_value=[HEAT, ALIEN]) as mock_full:
+            index = owned_library_index(Mock(), section, str(tmp_path))
+
+        mock_full.assert_called_once()
+        assert index.tmdb_ids() == {949, 348}
+        with open(os.path.join(tmp_path, "owned_index_1.json")) as f:
+            assert set(json.load(f)["entries"]) == {"1", "2"}
+
+    def test_later_run_reads_only_changes(self, section, tmp_path):
+        server = Mock()
+        added = _item(5, "Aliens", 1986, ("tmdb://679",), updated_at=1_700_002_000)
+        with patch("utils.owned_index.read_library_snapshot", return_value=[HEAT, ALIEN]):
+            owned_library_index(server, section, str(tmp_path))
+
+        with (
+            patch("utils.owned_index.read_library_snapshot") as mock_full,
+            patch("utils.owned_index.iter_library_snapshot", return_value=iter([added])) as mock_changes,
+            patch("utils.owned_index.library_section_size", return_value=3),
+        ):
+            index = owned_library_index(server, section, str(tmp_path))
+
+        mock_full.assert_not_called()
+        assert mock_changes.call_args.kwargs["filters"] == {"updatedAt>>": 1_700_000_500 - OWNED_INDEX_OVERLAP_SECONDS}
+        assert index.item_tmdb_ids() == [949, 348, 679]
+        assert index.watermark == 1_700_002_000
+
+    def test_removed_items_trigger_full_listing(self, section, tmp_path):
+        with patch("utils.owned_index.read_library_snapshot", return_value=[HEAT, ALIEN]):
+            owned_library_index(Mock(), section, str(tmp_path))
+
+        with (
+            patch("utils.owned_index.read_library_snapshot", return_value=[ALIEN]) as mock_full,
+            patch("utils.owned_index.iter_library_snapshot", return_value=iter([])),
+            patch("utils.owned_index.library_section_size", return_value=1),
+        ):
+            index = owned_library_index(Mock(), section, str(tmp_path))
+
+        mock_full.assert_called_once()
+        assert index.tmdb_ids() == {348}
+
+    def test_unreadable_changes_trigger_full_listing(self, section, tmp_path):
+        with patch("utils.owned_index.read_library_snapshot", return_value=[HEAT]):
+            owned_library_index(Mock(), section, str(tmp_path))
+
+        with (
+            patch("utils.owned_index.read_library_snapshot", return_value=[HEAT, ALIEN]) as mock_full,
+            patch("utils.owned_index.iter_library_snapshot", side_effect=requests.ConnectionError("down")),
+        ):
+            index = owned_library_index(Mock(), section, str(tmp_path))
+
+        mock_full.assert_called_once()
+        assert len(index) == 2
+
+    def test_another_section_under_the_same_key_is_rebuilt(self, tmp_path):
+        with patch("utils.owned_index.read_library_snapshot", return_value=[HEAT]):
+            owned_library_index(Mock(), Mock(key=1, uuid="uuid-1"), str(tmp_path))
+
+        with (
+            patch("utils.owned_index.read_library_snapshot", return_value=[ALIEN]) as mock_full,
+            patch("utils.owned_index.iter_library_snapshot") as mock_changes,
+        ):
+            index = owned_library_index(Mock(), Mock(key=1, uuid="uuid-2"), str(tmp_path))
+
+        mock_full.assert_called_once()
+        mock_changes.assert_not_called()
+        assert index.tmdb_ids() == {348}
+
+    def test_refreshed_index_is_reused_within_the_window(self, section, tmp_path):
+        with (
+            patch("utils.owned_index.OWNED_INDEX_REUSE_SECONDS", 300),
+            patch("utils.owned_index.read_library_snapshot", return_value=[HEAT]) as mock_full,
+        ):
+            first = owned_library_index(Mock(), section, str(tmp_path))
+            second = owned_library_index(Mock(), section, str(tmp_path))
+
+        assert second is first
+        mock_full.assert_called_once()
@@ -24,8 +24,9 @@ test file, since this suite predates that split and stays organized by
 function now lives in.
 """
 
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import plexapi.exceptions
 import pytest
@@ -632,7 +633,10 @@ class TestCleanupLegacyUnnamedCollection:
         cleanup_legacy_unnamed_collection(mock_section, "🎬 Alice - Recommendation", "🎬")
 
         mock_legacy_collection.delete.assert_called_once()
-        legacy_item.removeLabel.assert_called_once_with("Recommended", locked=False)
+        # One multi-id edit on the section rather than a removeLabel() per item
+        mock_section.batchMultiEdits.assert_called_once_with([legacy_item])
+        mock_section.removeLabel.assert_called_once_with("Recommended", locked=False)
+        mock_section.saveMultiEdits.assert_called_once()
 
     def test_leaves_current_collection_alone(self):
         """A real user literally named 'Recommended' would legitimately
@@ -804,7 +808,7 @@ class TestInitPlex:
 class TestGetPlexAccountIds:
     """Tests for get_plex_account_ids() function."""
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_finds_exact_match(self, mock_get):
         """Test finding account ID with exact name match."""
         from utils.plex import get_plex_account_ids
@@ -833,7 +837,7 @@ class TestGetPlexAccountIds:
 
         assert result == ["123"]
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_finds_normalized_match(self, mock_get):
         """Test finding account ID with normalized name match."""
         from utils.plex import get_plex_account_ids
@@ -862,7 +866,7 @@ class TestGetPlexAccountIds:
 
         assert result == ["456"]
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex.log_error")
     def test_logs_error_for_missing_user(self, mock_log, mock_get):
         """Test logging error when user not found."""
@@ -893,7 +897,7 @@ class TestGetPlexAccountIds:
         assert result == []
         mock_log.assert_called_once()
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex.log_error")
     def test_handles_api_error(self, mock_log, mock_get):
         """Test handling API errors."""
@@ -1060,7 +1064,7 @@ class TestGetWatchedMovieCount:
 
         assert result == 0
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex.MyPlexAccount")
     def test_returns_watched_count(self, mock_account_class, mock_get):
         """Test returning watched movie count."""
@@ -1117,7 +1121,7 @@ class TestGetWatchedMovieCount:
         assert result == 0
         mock_log.assert_called_once()
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex.MyPlexAccount")
     def test_matches_admin_user(self, mock_account_class, mock_get):
         """Test matching admin user."""
@@ -1165,7 +1169,7 @@ class TestGetWatchedShowCount:
 
         assert result == 0
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex.MyPlexAccount")
     def test_returns_watched_show_count(self, mock_account_class, mock_get):
         """Test returning watched show count."""
@@ -1224,7 +1228,7 @@ class TestGetWatchedShowCount:
 class TestFetchPlexWatchHistoryShows:
     """Tests for fetch_plex_watch_history_shows() function."""
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_fetches_show_history(self, mock_get):
         """Test fetching show watch history."""
         from utils.plex import fetch_plex_watch_history_shows
@@ -1240,12 +1244,10 @@ class TestFetchPlexWatchHistoryShows:
         # supports .headers (a real Mapping) and .iter_content()
         # natively; a plain Mock() needs both spelled out explicitly so
         # that code path doesn't choke on auto-generated Mock attributes.
-        # Doesn't touch .content (a separate, independently-mocked
-        # attribute here, not derived from it the way a real
-        # Response's is).
+        # History is parsed as it streams in (utils.plex.iter_plex_history),
+        # straight from .iter_content() - .content is never read.
         mock_response.headers = {}
-        mock_response.iter_content = Mock(return_value=[])
-        mock_response.content = xml_content
+        mock_response.iter_content = Mock(return_value=[xml_content])
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -1258,7 +1260,7 @@ class TestFetchPlexWatchHistoryShows:
         assert 100 in result
         assert 101 in result
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex.log_error")
     def test_handles_request_error(self, mock_log, mock_get):
         """Test handling request errors."""
@@ -1367,7 +1369,7 @@ class TestFetchPlexWatchHistoryMovies:
     """Tests for fetch_plex_watch_history_movies() function."""
 
     @patch("utils.plex.MyPlexAccount")
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_fetches_movie_history(self, mock_get, mock_account_class):
         """Test fetching movie watch history."""
         from utils.plex import fetch_plex_watch_history_movies
@@ -1390,12 +1392,10 @@ class TestFetchPlexWatchHistoryMovies:
         # supports .headers (a real Mapping) and .iter_content()
         # natively; a plain Mock() needs both spelled out explicitly so
         # that code path doesn't choke on auto-generated Mock attributes.
-        # Doesn't touch .content (a separate, independently-mocked
-        # attribute here, not derived from it the way a real
-        # Response's is).
+        # History is parsed as it streams in (utils.plex.iter_plex_history),
+        # straight from .iter_content() - .content is never read.
         mock_response.headers = {}
-        mock_response.iter_content = Mock(return_value=[])
-        mock_response.content = xml_content
+        mock_response.iter_content = Mock(return_value=[xml_content])
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -1425,7 +1425,7 @@ class TestFetchPlexWatchHistoryMovies:
         mock_log.assert_called()
 
     @patch("utils.plex.MyPlexAccount")
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_skips_unknown_account(self, mock_get, mock_account_class):
         """Test skipping unknown account IDs."""
         from utils.plex import fetch_plex_watch_history_movies
@@ -1445,7 +1445,7 @@ class TestFetchPlexWatchHistoryMovies:
         assert history == []
 
     @patch("utils.plex.MyPlexAccount")
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex.log_error")
     def test_per_account_fetch_error_routed_through_log_error_not_bare_print(
         self, mock_log, mock_get, mock_account_class
@@ -1486,7 +1486,7 @@ class TestFetchPlexWatchHistoryMovies:
 class TestFetchWatchHistoryWithTmdb:
     """Tests for fetch_watch_history_with_tmdb() function."""
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_fetches_movie_with_tmdb(self, mock_get):
         """Test fetching movie watch history with TMDB IDs."""
         from utils.plex import fetch_watch_history_with_tmdb
@@ -1530,7 +1530,7 @@ class TestFetchWatchHistoryWithTmdb:
         assert len(result) == 1
         assert result[0]["tmdb_id"] == 12345
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_handles_non_200_response(self, mock_get):
         """Test handling non-200 response."""
         from utils.plex import fetch_watch_history_with_tmdb
@@ -1558,7 +1558,7 @@ class TestFetchWatchHistoryWithTmdb:
 
         assert result == []
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_fetches_show_with_tmdb(self, mock_get):
         """Test fetching show watch history with TMDB IDs."""
         from utils.plex import fetch_watch_history_with_tmdb
@@ -1602,7 +1602,7 @@ class TestFetchWatchHistoryWithTmdb:
         assert len(result) == 1
         assert result[0]["tmdb_id"] == 54321
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_handles_exception_in_loop(self, mock_get):
         """Test handling exception when processing items."""
         from utils.plex import fetch_watch_history_with_tmdb
@@ -2643,7 +2643,7 @@ class TestIdentifyDroppedShows:
 class TestFetchShowCompletionData:
     """Tests for fetch_show_completion_data() function."""
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_returns_empty_dict_on_error(self, mock_get):
         """Test that empty dict is returned on API error."""
         from utils.plex import fetch_show_completion_data
@@ -2659,7 +2659,7 @@ class TestFetchShowCompletionData:
 
         assert result == {}
 
-    @patch("utils.plex.requests.get")
+    @patch("utils.plex.http_client.get")
     def test_processes_episode_data(self, mock_get):
         """Test processing episode watch data."""
         from utils.plex import fetch_show_completion_data
@@ -2676,21 +2676,18 @@ class TestFetchShowCompletionData:
         # supports .headers (a real Mapping) and .iter_content()
         # natively; a plain Mock() needs both spelled out explicitly so
         # that code path doesn't choke on auto-generated Mock attributes.
-        # Doesn't touch .content (a separate, independently-mocked
-        # attribute here, not derived from it the way a real
-        # Response's is).
+        # History is parsed as it streams in (utils.plex.iter_plex_history),
+        # straight from .iter_content() - .content is never read.
         mock_response.headers = {}
-        mock_response.iter_content = Mock(return_value=[])
-        mock_response.content = xml_response
+        mock_response.iter_content = Mock(return_value=[xml_response])
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
-        # Mock show in library
+        # Mock show in library - its listing carries the episode count
         mock_show = Mock()
         mock_show.ratingKey = 100
         mock_show.title = "Test Show"
-        mock_episode = Mock()
-        mock_show.episodes.return_value = [mock_episode] * 10
+        mock_show.leafCount = 10
 
         mock_section = Mock()
         mock_section.key = "1"
@@ -2703,6 +2700,78 @@ class TestFetchShowCompletionData:
         assert 100 in result
         assert result[100]["watched_episodes"] == 1
         assert result[100]["total_episodes"] == 10
+        assert result[100]["completion_percent"] == 10
+        mock_show.episodes.assert_not_called()
+
+    def test_uses_given_show_listing_and_history(self):
+        from utils.plex import PlexPlay, fetch_show_completion_data
+
+        history = {
+            "1": [
+                PlexPlay("201", "episode", "/library/metadata/100", 10, None),
+                PlexPlay("202", "episode", "/library/metadata/100", 30, None),
+            ],
+            "2": [
+                PlexPlay("201", "episode", "/library/metadata/100", 20, None),
+                PlexPlay("300", "movie", None, 40, None),
+            ],
+        }
+        watched_show = Mock(ratingKey=100, title="Watched", leafCount=8)
+        unwatched_show = Mock(ratingKey=101, title="Unwatched", leafCount=5)
+        mock_section = Mock()
+
+        result = fetch_show_completion_data(
+            {}, ["1", "2"], mock_section, history=history, shows=[watched_show, unwatched_show]
+        )
+
+        assert result == {
+            100: {
+                "total_episodes": 8,
+                "watched_episodes": 2,
+                "completion_percent": 25.0,
+                "last_watched": 30,
+                "title": "Watched",
+            }
+        }
+        mock_section.all.assert_not_called()
+
+    def test_uses_given_watched_episodes_instead_of_history(self):
+        from utils.plex import fetch_show_completion_data
+
+        show = Mock(ratingKey=100, title="Watched", leafCount=4)
+        mock_section = Mock()
+
+        with patch("utils.plex.fetch_plex_history") as mock_fetch:
+            result = fetch_show_completion_data(
+                {}, ["1"], mock_section, shows=[show], watched_episodes=({100: {"201", "202"}}, {100: 30})
+            )
+
+        mock_fetch.assert_not_called()
+        assert result[100]["watched_episodes"] == 2
+        assert result[100]["completion_percent"] == 50.0
+        assert result[100]["last_watched"] == 30
+
+    def test_watched_episodes_by_show(self):
+        from utils.plex import PlexPlay, watched_episodes_by_show
+
+        history = {
+            "1": [
+                PlexPlay("201", "episode", "/library/metadata/100", 10, None),
+                PlexPlay("201", "episode", "/library/metadata/100", 30, None),
+            ],
+            "2": [PlexPlay("202", "episode", "/library/metadata/100", 20, None)],
+            "3": [PlexPlay("301", "episode", "/library/metadata/300", 40, None)],
+        }
+
+        assert watched_episodes_by_show(history, ["1", "2"]) == ({100: {"201", "202"}}, {100: 30})
+
+    def test_no_started_shows_lists_nothing(self):
+        from utils.plex import fetch_show_completion_data
+
+        mock_section = Mock()
+
+        assert fetch_show_completion_data({}, ["1"], mock_section, history={"1": []}) == {}
+        mock_section.all.assert_not_called()
 
 
 class TestUpdatePlexCollectionSort:
@@ -2767,6 +2836,132 @@ class TestUpdatePlexCollectionSort:
         mock_logger.warning.assert_called_once()
 
 
+class TestPlanCollectionMoves:
+    """Tests for plan_collection_moves() - minimal moveItem plans."""
+
+    @staticmethod
+    def _items(*keys):
+        return [Mock(ratingKey=k) for k in keys]
+
+    @staticmethod
+    def _apply(current, moves):
+        order = list(current)
+        for item, after in moves:
+            if item in order:
+                order.remove(item)
+            order.insert(order.index(after) + 1 if after is not None else 0, item)
+        return order
+
+    def test_same_order_needs_no_moves(self):
+        from utils.plex import plan_collection_moves
+
+        items = self._items(1, 2, 3)
+
+        assert plan_collection_moves(items, items) == []
+
+    def test_one_item_moved_to_front(self):
+        from utils.plex import plan_collection_moves
+
+        a, b, c, d = self._items(1, 2, 3, 4)
+
+        moves = plan_collection_moves([a, b, c, d], [d, a, b, c])
+
+        assert moves == [(d, None)]
+
+    def test_reversal_keeps_one_item(self):
+        from utils.plex import plan_collection_moves
+
+        items = self._items(1, 2, 3, 4, 5)
+        desired = list(reversed(items))
+
+        moves = plan_collection_moves(items, desired)
+
+        assert len(moves) == 4
+        assert self._apply(items, moves) == desired
+
+    def test_items_missing_from_current_are_placed(self):
+        from utils.plex import plan_collection_moves
+
+        a, b, c, new = self._items(1, 2, 3, 4)
+
+        moves = plan_collection_moves([a, b, c], [a, new, b, c])
+
+        assert moves == [(new, a)]
+
+    def test_random_orders_reach_desired_order(self):
+        import random
+
+        from utils.plex import plan_collection_moves
+
+        rng = random.Random(7)
+        for _ in range(50):
+            current = self._items(*range(20))
+            desired = rng.sample(current, 15) + self._items(100, 101)
+            rng.shuffle(desired)
+
+            moves = plan_collection_moves(current, desired)
+
+            kept = [item for item in current if item in desired]
+            assert self._apply(kept, moves) == desired
+            assert {item.ratingKey for item, _ in moves} >= {100, 101}
+
+
+class TestUpdatePlexCollectionDiff:
+    """update_plex_collection() only writes what changed."""
+
+    @staticmethod
+    def _collection(current, sort=2):
+        collection = Mock(title="Recs", collectionSort=sort, labels=[])
+        collection.items.return_value = current
+        return collection
+
+    def test_unchanged_collection_is_skipped(self):
+        from utils.plex import update_plex_collection
+
+        items = [Mock(ratingKey=k) for k in (1, 2, 3)]
+        collection = self._collection(list(items))
+        section = Mock()
+        section.collections.return_value = [collection]
+
+        assert update_plex_collection(section, "Recs", items) is True
+
+        collection.removeItems.assert_not_called()
+        collection.addItems.assert_not_called()
+        collection.sortUpdate.assert_not_called()
+        collection.moveItem.assert_not_called()
+        section.multiEdit.assert_not_called()
+
+    def test_only_changed_membership_and_misplaced_items_are_written(self):
+        from utils.plex import update_plex_collection
+
+        a, b, c, gone, new = (Mock(ratingKey=k) for k in (1, 2, 3, 4, 5))
+        collection = self._collection([a, gone, b, c])
+        section = Mock()
+        section.collections.return_value = [collection]
+
+        assert update_plex_collection(section, "Recs", [a, b, new, c]) is True
+
+        collection.removeItems.assert_called_once_with([gone])
+        collection.addItems.assert_called_once_with([new])
+        collection.sortUpdate.assert_not_called()
+        assert collection.moveItem.call_args_list == [call(new, after=b)]
+
+    def test_non_custom_sort_moves_every_item(self):
+        """The listed order isn't the custom order yet - nothing can be assumed in place."""
+        from utils.plex import update_plex_collection
+
+        items = [Mock(ratingKey=k) for k in (1, 2, 3)]
+        collection = self._collection(list(items), sort=0)
+        section = Mock()
+        section.collections.return_value = [collection]
+
+        update_plex_collection(section, "Recs", items)
+
+        collection.sortUpdate.assert_called_once_with(sort="custom")
+        assert collection.moveItem.call_count == 3
+        collection.addItems.assert_not_called()
+
+
 class TestClearCollectionLock:
     """Tests for _clear_collection_lock() - the collection-field-lock
     half of the fix (label-lock half is covered by TestRemoveLabelsFromItems/
@@ -2927,8 +3122,8 @@ class TestUpdatePlexCollectionClearsLocks:
 class TestApplyUserLabelRestrictions:
     """Tests for apply_user_label_restrictions() function."""
 
-    @patch("utils.plex_policy.requests.put")
-    @patch("utils.plex_policy.requests.get")
+    @patch("utils.plex.http_client.put")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex_policy.MyPlexAccount")
     def test_exclude_filter_uses_passed_labels_verbatim(self, mock_account_class, mock_get, mock_put):
         """#261: exclude labels are used exactly as passed in, never
@@ -2968,8 +3163,8 @@ class TestApplyUserLabelRestrictions:
         put_filter_values = {call.kwargs["params"]["filterMovies"] for call in mock_put.call_args_list}
         assert put_filter_values == {"label!=SomeOtherLabel_Sarah", "label!=SomeOtherLabel_Jason"}
 
-    @patch("utils.plex_policy.requests.put")
-    @patch("utils.plex_policy.requests.get")
+    @patch("utils.plex.http_client.put")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex_policy.MyPlexAccount")
     def test_applies_exclude_restrictions_to_users(self, mock_account_class, mock_get, mock_put):
         """Test that exclude restrictions are applied to each user."""
@@ -3007,8 +3202,8 @@ class TestApplyUserLabelRestrictions:
         # Should be called twice (once for each non-admin user)
         assert mock_put.call_count == 2
 
-    @patch("utils.plex_policy.requests.put")
-    @patch("utils.plex_policy.requests.get")
+    @patch("utils.plex.http_client.put")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex_policy.MyPlexAccount")
     def test_applied_exclusions_log_line_includes_the_account_id(self, mock_account_class, mock_get, mock_put, capsys):
         """#359: the account id must be in the "Applied exclusions"
@@ -3048,8 +3243,8 @@ class TestApplyUserLabelRestrictions:
         assert "Applied exclusions for Sarah" in out
         assert "456" in out, "account id missing from the applied-exclusions log line"
 
-    @patch("utils.plex_policy.requests.put")
-    @patch("utils.plex_policy.requests.get")
+    @patch("utils.plex.http_client.put")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex_policy.MyPlexAccount")
     def test_skips_admin_user(self, mock_account_class, mock_get, mock_put):
         """Test that admin user is skipped (can't have restrictions)."""
@@ -3083,8 +3278,8 @@ class TestApplyUserLabelRestrictions:
         # Should only be called once (for OtherUser, not AdminUser)
         mock_put.assert_called_once()
 
-    @patch("utils.plex_policy.requests.put")
-    @patch("utils.plex_policy.requests.get")
+    @patch("utils.plex.http_client.put")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex_policy.MyPlexAccount")
     def test_returns_false_for_unknown_user(self, mock_account_class, mock_get, mock_put):
         """Test that unknown users result in partial failure."""
@@ -3174,8 +3369,8 @@ class TestApplyUserLabelRestrictions:
         assert result is True
         mock_account_class.assert_not_called()
 
-    @patch("utils.plex_policy.requests.put")
-    @patch("utils.plex_policy.requests.get")
+    @patch("utils.plex.http_client.put")
+    @patch("utils.plex.http_client.get")
     @patch("utils.plex_policy.MyPlexAccount")
     def test_case_insensitive_username_match(self, mock_account_class, mock_get, mock_put):
         """Test that username matching is case insensitive."""
@@ -4395,3 +4590,395 @@ class TestPerUserTokenCache:
         with patch("utils.plex.plexapi.server.PlexServer"):
             result = get_user_connection(plex, cfg, "alice")
         assert result is plex.switchUser.return_value
+
+
+def _history_page(videos, chunk_size=40):
+    """A streamed history page response whose body arrives in small chunks."""
+    body = ("<MediaContainer>" + "".join(videos) + "</MediaContainer>").encode()
+    response = Mock()
+    response.headers = {}
+    response.iter_content = Mock(return_value=[body[i : i + chunk_size] for i in range(0, len(body), chunk_size)])
+    response.raise_for_status = Mock()
+    return response
+
+
+def _episode(show_id, rating_key, viewed_at):
+    return (
+        f'<Video type="episode" grandparentKey="/library/metadata/{show_id}" '
+        f'ratingKey="{rating_key}" viewedAt="{viewed_at}"/>'
+    )
+
+
+class TestIterPlexHistory:
+    """Tests for iter_plex_history() - paged, streamed history reads."""
+
+    CONFIG = {"plex": {"url": "http://localhost", "token": "test"}}
+
+    @patch("utils.plex.PLEX_HISTORY_PAGE_SIZE", 2)
+    @patch("utils.plex.http_client.get")
+    def test_reads_every_page(self, mock_get):
+        from utils.plex import iter_plex_history
+
+        mock_get.side_effect = [
+            _history_page([_episode(1, 10, 300), _episode(1, 11, 200)]),
+            _history_page([_episode(2, 20, 100)]),
+        ]
+
+        plays = list(iter_plex_history(self.CONFIG, "123", 5))
+
+        assert [play.rating_key for play in plays] == ["10", "11", "20"]
+        assert plays[0].grandparent_key == "/library/metadata/1"
+        assert plays[0].viewed_at == 300
+        starts = [c.kwargs["params"]["X-Plex-Container-Start"] for c in mock_get.call_args_list]
+        assert starts == [0, 2]
+        assert all(c.kwargs["params"]["X-Plex-Container-Size"] == 2 for c in mock_get.call_args_list)
+        assert all(c.kwargs["stream"] is True for c in mock_get.call_args_list)
+
+    @patch("utils.plex.PLEX_HISTORY_PAGE_SIZE", 2)
+    @patch("utils.plex.http_client.get")
+    def test_stops_when_the_server_ignores_paging(self, mock_get):
+        from utils.plex import iter_plex_history
+
+        mock_get.return_value = _history_page([_episode(1, k, 100) for k in (10, 11, 12)])
+
+        assert len(list(iter_plex_history(self.CONFIG, "123", 5))) == 3
+        assert mock_get.call_count == 1
+
+    @patch("utils.plex.http_client.get")
+    def test_viewed_after_is_sent_as_a_lower_bound(self, mock_get):
+        from utils.plex import iter_plex_history
+
+        mock_get.return_value = _history_page([])
+
+        list(iter_plex_history(self.CONFIG, "123", 5, viewed_after=1700000000))
+
+        params = mock_get.call_args.kwargs["params"]
+        assert params["viewedAt>"] == 1700000000
+        assert params["accountID"] == "123"
+        assert params["librarySectionID"] == 5
+
+    @patch("utils.plex.http_client.get")
+    def test_oversized_body_is_rejected(self, mock_get):
+        from utils.plex import iter_plex_history
+
+        response = _history_page([_episode(1, 10, 100)])
+        response.headers = {"Content-Length": str(100 * 1024 * 1024)}
+        mock_get.return_value = response
+
+        with pytest.raises(requests.RequestException, match="rejected"):
+            list(iter_plex_history(self.CONFIG, "123", 5))
+
+    @patch("utils.plex.record_api_call")
+    @patch("utils.plex.http_client.get")
+    def test_each_page_is_recorded(self, mock_get, mock_record):
+        from utils.plex import iter_plex_history
+
+        mock_get.return_value = _history_page([_episode(1, 10, 100)])
+
+        list(iter_plex_history(self.CONFIG, "123", 5))
+
+        mock_record.assert_called_once()
+        assert mock_record.call_args.args[:2] == ("plex", "success")
+
+
+class TestSharedPlexHistory:
+    """One fetch_plex_history() result feeding every history consumer."""
+
+    CONFIG = {"plex": {"url": "http://localhost", "token": "test"}}
+
+    @patch("utils.plex.http_client.get")
+    @patch("utils.plex.log_error")
+    def test_failed_account_is_logged_and_left_out(self, mock_log, mock_get):
+        from utils.plex import fetch_plex_history
+
+        mock_get.side_effect = [requests.RequestException("down"), _history_page([_episode(1, 10, 100)])]
+        section = Mock(key=5)
+
+        history = fetch_plex_history(self.CONFIG, ["1", "2"], section)
+
+        assert list(history) == ["2"]
+        mock_log.assert_called_once()
+
+    @patch("utils.plex.http_client.get")
+    def test_shows_and_completion_share_one_fetch(self, mock_get):
+        from utils.plex import fetch_plex_history, fetch_plex_watch_history_shows, fetch_show_completion_data
+
+        mock_get.return_value = _history_page([_episode(1, 10, 300), _episode(2, 20, 100)])
+        show = Mock(ratingKey=2, title="Old Show", leafCount=4)
+        section = Mock(key=5)
+        section.all.return_value = [show]
+
+        history = fetch_plex_history(self.CONFIG, ["123"], section)
+        recent, timestamps = fetch_plex_watch_history_shows(
+            self.CONFIG, ["123"], section, return_timestamps=True, viewed_after=200, history=history
+        )
+        completion = fetch_show_completion_data(self.CONFIG, ["123"], section, history=history)
+
+        assert mock_get.call_count == 1
+        # Cut down to what a viewedAt>200 request would have returned
+        assert recent == {1}
+        assert timestamps == {1: 300}
+        # ... while completion still sees the whole history
+        assert completion[2]["watched_episodes"] == 1
+
+
+class TestPlexMaxWorkers:
+    def test_defaults_to_the_constant(self):
+        from utils.config import PLEX_MAX_WORKERS
+        from utils.plex import plex_max_workers
+
+        assert plex_max_workers({"plex": {}}) == PLEX_MAX_WORKERS
+
+    def test_config_overrides_and_is_at_least_one(self):
+        from utils.plex import plex_max_workers
+
+        assert plex_max_workers({"plex": {"max_concurrent_requests": 2}}) == 2
+        assert plex_max_workers({"plex": {"max_concurrent_requests": 0}}) == 1
+
+    @patch("utils.plex.log_warning")
+    def test_invalid_value_falls_back(self, mock_warn):
+        from utils.config import PLEX_MAX_WORKERS
+        from utils.plex import plex_max_workers
+
+        assert plex_max_workers({"plex": {"max_concurrent_requests": "many"}}) == PLEX_MAX_WORKERS
+        mock_warn.assert_called_once()
+
+
+class TestFetchPlexHistoryConcurrency:
+    @patch("utils.plex.iter_plex_history")
+    def test_accounts_are_fetched_concurrently(self, mock_iter):
+        import threading
+
+        from utils.plex import fetch_plex_history
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def history(config, account_id, section_key, viewed_after):
+            # Only passes once all three accounts are being fetched at once.
+            barrier.wait()
+            return iter([account_id])
+
+        mock_iter.side_effect = history
+        config = {"plex": {"url": "http://localhost", "token": "test", "max_concurrent_requests": 3}}
+
+        result = fetch_plex_history(config, ["1", "2", "3"], Mock(key=5))
+
+        assert result == {"1": ["1"], "2": ["2"], "3": ["3"]}
+        assert list(result) == ["1", "2", "3"]
+
+
+class TestFetchPlexItems:
+    def test_fetches_keys_in_chunks(self):
+        from utils.plex import fetch_plex_items
+
+        plex = Mock()
+        plex.fetchItems.side_effect = lambda keys: [Mock(ratingKey=k, _details_key=f"/d/{k}") for k in keys]
+
+        with patch("utils.plex.PLEX_METADATA_BATCH_SIZE", 2):
+            result = fetch_plex_items(plex, [1, "2", 3, 1, None, "x"])
+
+        assert [call.args[0] for call in plex.fetchItems.call_args_list] == [[1, 2], [3]]
+        assert sorted(result) == [1, 2, 3]
+
+    def test_items_marked_as_fully_loaded(self):
+        """An empty attribute (e.g. no labels) must not trigger plexapi's lazy reload."""
+        from utils.plex import fetch_plex_items
+
+        item = Mock(ratingKey="7", _details_key="/library/metadata/7?includeGuids=1", _initpath="/library/metadata/7,8")
+        plex = Mock()
+        plex.fetchItems.return_value = [item]
+
+        result = fetch_plex_items(plex, [7, 8])
+
+        assert result == {7: item}
+        assert item._initpath == "/library/metadata/7?includeGuids=1"
+
+    def test_failed_chunk_is_skipped(self):
+        from utils.plex import fetch_plex_items
+
+        good = Mock(ratingKey=3)
+        plex = Mock()
+        plex.fetchItems.side_effect = [plexapi.exceptions.NotFound("gone"), [good]]
+
+        with patch("utils.plex.PLEX_METADATA_BATCH_SIZE", 2):
+            result = fetch_plex_items(plex, [1, 2, 3])
+
+        assert result == {3: good}
+
+    def test_no_keys_makes_no_request(self):
+        from utils.plex import fetch_plex_items
+
+        plex = Mock()
+
+        assert fetch_plex_items(plex, []) == {}
+        plex.fetchItems.assert_not_called()
+
+
+class TestLoadFullPlexItems:
+    def test_keeps_order_and_reloads_only_misses(self):
+        from utils.plex import load_full_plex_items
+
+        partial_a, partial_b = Mock(ratingKey=1), Mock(ratingKey=2)
+        full_b = Mock(ratingKey=2)
+        plex = Mock()
+        plex.fetchItems.return_value = [full_b]
+
+        result = load_full_plex_items(plex, [partial_a, partial_b])
+
+        assert result == [partial_a, full_b]
+        partial_a.reload.assert_called_once()
+        partial_b.reload.assert_not_called()
+
+    def test_item_without_rating_key_is_reloaded(self):
+        from utils.plex import load_full_plex_items
+
+        partial = Mock(ratingKey=None)
+        plex = Mock()
+
+        assert load_full_plex_items(plex, [partial]) == [partial]
+        partial.reload.assert_called_once()
+        plex.fetchItems.assert_not_called()
+
+
+def _snapshot_server():
+    server = Mock()
+    server._baseurl = "http://localhost:32400"
+    server._token = "user-token"
+    server._session.verify = False
+    return server
+
+
+def _snapshot_movie(rating_key, title="Movie", view_count=0, extra=""):
+    return (
+        f'<Video ratingKey="{rating_key}" type="movie" title="{title}" year="2020" viewCount="{view_count}" {extra}>'
+        f'<Media id="9"><Part file="/x.mkv"/></Media>'
+        f'<Guid id="tmdb://{rating_key}"/><Guid id="imdb://tt{rating_key}"/><Label tag="Curatarr_alice"/>'
+        f"</Video>"
+    )
+
+
+class TestPlexMetadataDigest:
+    @staticmethod
+    def _item(xml):
+        return Mock(_data=ET.fromstring(xml))
+
+    def test_ignores_labels_collections_locks_and_viewing_state(self):
+        from utils.plex import plex_metadata_digest
+
+        before = self._item('<Video title="Heat" updatedAt="1" viewCount="0"><Genre tag="Crime"/></Video>')
+        after = self._item(
+            '<Video title="Heat" updatedAt="2" viewCount="3" lastViewedAt="5"><Genre tag="Crime"/>'
+            '<Label tag="Curatarr_alice"/><Collection tag="Alice - Recommended"/>'
+            '<Field locked="1" name="collection"/></Video>'
+        )
+
+        assert plex_metadata_digest(before) == plex_metadata_digest(after)
+
+    def test_changes_with_metadata(self):
+        from utils.plex import plex_metadata_digest
+
+        before = self._item('<Video title="Heat"><Genre tag="Crime"/></Video>')
+
+        assert plex_metadata_digest(before) != plex_metadata_digest(self._item('<Video title="Heat"/>'))
+        assert plex_metadata_digest(before) != plex_metadata_digest(
+            self._item('<Video title="Heat"><Genre tag="Drama"/></Video>')
+        )
+
+    def test_none_without_xml(self):
+        from utils.plex import plex_metadata_digest
+
+        assert plex_metadata_digest(Mock(spec=["title"])) is None
+
+
+class TestLibrarySnapshot:
+    """Tests for iter_library_snapshot()/read_library_snapshot() - projected section listings."""
+
+    @patch("utils.plex.http_client.get")
+    def test_parses_projected_fields(self, mock_get):
+        from utils.plex import LibraryGuid, LibraryTag, read_library_snapshot
+
+        mock_get.return_value = _history_page(
+            [_snapshot_movie(7, "Heat", 2, 'userRating="9.0" lastViewedAt="1700000000"')]
+        )
+        section = Mock(key=1, type="movie")
+
+        (item,) = read_library_snapshot(_snapshot_server(), section)
+
+        assert (item.ratingKey, item.title, item.year, item.viewCount, item.userRating) == (7, "Heat", 2020, 2, 9.0)
+        assert item.guids == (LibraryGuid("tmdb://7"), LibraryGuid("imdb://tt7"))
+        assert item.labels == (LibraryTag("Curatarr_alice"),)
+        assert item.lastViewedAt.year == 2023
+        assert item.addedAt is None
+        section.all.assert_not_called()
+
+    @patch("utils.plex.http_client.get")
+    def test_requests_through_the_servers_own_connection(self, mock_get):
+        from utils.plex import iter_library_snapshot
+
+        mock_get.return_value = _history_page([])
+
+        list(iter_library_snapshot(_snapshot_server(), Mock(key=3, type="show")))
+
+        assert mock_get.call_args.args[0] == "http://localhost:32400/library/sections/3/all"
+        assert mock_get.call_args.kwargs["headers"] == {"X-Plex-Token": "user-token"}
+        assert mock_get.call_args.kwargs["verify"] is False
+        params = mock_get.call_args.kwargs["params"]
+        assert params["type"] == 2
+        assert params["includeGuids"] == 1
+        assert "Media" in params["excludeElements"]
+
+    @patch("utils.plex.PLEX_SNAPSHOT_PAGE_SIZE", 2)
+    @patch("utils.plex.http_client.get")
+    def test_reads_every_page(self, mock_get):
+        from utils.plex import iter_library_snapshot
+
+        mock_get.side_effect = [
+            _history_page([_snapshot_movie(1), _snapshot_movie(2)]),
+            _history_page([_snapshot_movie(3)]),
+        ]
+
+        items = list(iter_library_snapshot(_snapshot_server(), Mock(key=1, type="movie")))
+
+        assert [item.ratingKey for item in items] == [1, 2, 3]
+        starts = [c.kwargs["params"]["X-Plex-Container-Start"] for c in mock_get.call_args_list]
+        assert starts == [0, 2]
+
+    @patch("utils.plex.http_client.get")
+    def test_request_failure_falls_back_to_full_listing(self, mock_get):
+        from utils.plex import read_library_snapshot
+
+        mock_get.side_effect = requests.ConnectionError("down")
+        section = Mock(key=1, type="movie")
+        section.all.return_value = ["full"]
+
+        assert read_library_snapshot(_snapshot_server(), section) == ["full"]
+
+    @patch("utils.plex.http_client.get")
+    def test_unsupported_section_type_falls_back_to_full_listing(self, mock_get):
+        from utils.plex import read_library_snapshot
+
+        section = Mock(key=1, type="artist")
+        section.all.return_value = ["full"]
+
+        assert read_library_snapshot(_snapshot_server(), section) == ["full"]
+        mock_get.assert_not_called()
+
+    @patch("utils.plex.http_client.get")
+    def test_filters_are_sent_with_the_listing(self, mock_get):
+        from utils.plex import iter_library_snapshot
+
+        mock_get.return_value = _history_page([])
+
+        list(iter_library_snapshot(_snapshot_server(), Mock(key=1, type="movie"), filters={"updatedAt>>": 1700000000}))
+
+        assert mock_get.call_args.kwargs["params"]["updatedAt>>"] == 1700000000
+
+    @patch("utils.plex.http_client.get")
+    def test_section_size_reads_total_from_an_empty_page(self, mock_get):
+        from utils.plex import library_section_size
+
+        body = b'<MediaContainer size="0" totalSize="18000"/>'
+        mock_get.return_value = Mock(headers={}, content=body, iter_content=Mock(return_value=[body]))
+
+        assert library_section_size(_snapshot_server(), Mock(key=1, type="movie")) == 18000
+        assert mock_get.call_args.kwargs["params"]["X-Plex-Container-Size"] == 0
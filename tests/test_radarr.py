@@ -58,7 +58,7 @@ class TestRadarrClientHeaders:
 class TestRadarrClientMakeRequest:
     """Tests for API request handling."""
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_successful_request(self, mock_request):
         """Test successful API request."""
         mock_response = Mock()
@@ -79,7 +79,7 @@ class TestRadarrClientMakeRequest:
         assert result == {"status": "ok"}
         mock_request.assert_called_once()
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_unauthorized_raises_error(self, mock_request):
         """Test 401 raises RadarrAPIError."""
         mock_response = Mock()
@@ -98,7 +98,7 @@ class TestRadarrClientMakeRequest:
         with pytest.raises(RadarrAPIError, match="Invalid API key"):
             client._make_request("GET", "system/status")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_404_returns_none(self, mock_request):
         """Test 404 returns None."""
         mock_response = Mock()
@@ -117,7 +117,7 @@ class TestRadarrClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_204_returns_none(self, mock_request):
         """Test 204 No Content returns None."""
         mock_response = Mock()
@@ -136,7 +136,7 @@ class TestRadarrClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_timeout_raises_error(self, mock_request):
         """Test timeout raises RadarrAPIError."""
         mock_request.side_effect = requests.exceptions.Timeout()
@@ -146,7 +146,7 @@ class TestRadarrClientMakeRequest:
         with pytest.raises(RadarrAPIError, match="timeout"):
             client._make_request("GET", "system/status")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_connection_error_raises_error(self, mock_request):
         """Test connection error raises RadarrAPIError."""
         mock_request.side_effect = requests.exceptions.ConnectionError()
@@ -156,7 +156,7 @@ class TestRadarrClientMakeRequest:
         with pytest.raises(RadarrAPIError, match="Could not connect"):
             client._make_request("GET", "system/status")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_generic_request_exception_raises_error(self, mock_request):
         """Test generic RequestException raises RadarrAPIError."""
         mock_request.side_effect = requests.exceptions.RequestException("Something broke")
@@ -166,7 +166,7 @@ class TestRadarrClientMakeRequest:
         with pytest.raises(RadarrAPIError, match="Request failed"):
             client._make_request("GET", "system/status")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_error_response_parsing_list(self, mock_request):
         """Test error parsing with list response (Radarr/Sonarr style)."""
         mock_response = Mock()
@@ -187,7 +187,7 @@ class TestRadarrClientMakeRequest:
         with pytest.raises(RadarrAPIError, match="Movie already exists"):
             client._make_request("POST", "movie")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_error_response_parsing_dict(self, mock_request):
         """Test error parsing with dict response."""
         mock_response = Mock()
@@ -208,7 +208,7 @@ class TestRadarrClientMakeRequest:
         with pytest.raises(RadarrAPIError, match="Invalid input"):
             client._make_request("POST", "movie")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_error_response_parsing_invalid_json(self, mock_request):
         """Test error parsing falls back to raw text on invalid JSON."""
         mock_response = Mock()
@@ -0,0 +1,252 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/rate_limit.py - the shared, adaptive rate limiters.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from utils.config import (
+    RATE_LIMIT_BACKOFF_FACTOR,
+    RATE_LIMIT_DEFAULT_BACKOFF_SECONDS,
+    RATE_LIMIT_MAX_PAUSE_SECONDS,
+    RATE_LIMIT_MIN_REQUESTS_PER_SECOND,
+    TMDB_RATE_LIMIT_BURST,
+    TMDB_REQUESTS_PER_SECOND,
+)
+from utils.http_session import PooledHTTPClient
+from utils.rate_limit import (
+    AdaptiveRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+    service_rate_limiter,
+    tmdb_rate_limiter,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+def _bucket(rate, capacity=None):
+    clock = _FakeClock()
+    return TokenBucket(rate, capacity, clock=clock, sleep=clock.sleep), clock
+
+
+class TestTokenBucket:
+    def test_burst_is_free(self):
+        bucket, clock = _bucket(10, capacity=3)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_empty_bucket_waits_for_the_refill(self):
+        bucket, clock = _bucket(10, capacity=1)
+        bucket.acquire()
+        assert bucket.acquire() == pytest.approx(0.1)
+        assert clock.sleeps == [pytest.approx(0.1)]
+
+    def test_waiting_callers_queue_behind_each_other(self):
+        bucket, _clock = _bucket(10, capacity=1)
+        bucket.acquire()
+        waits = [bucket.acquire() for _ in range(3)]
+        assert waits == [pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3)]
+
+    def test_refill_is_capped_at_capacity(self):
+        bucket, clock = _bucket(10, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now = 60.0
+        assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(0.1)
+
+    def test_capacity_defaults_to_one_second_of_rate(self):
+        assert TokenBucket(5).capacity == 5.0
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    def test_threads_share_the_limit(self):
+        bucket, clock = _bucket(10, capacity=1)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # One free token, then each of the other four waits a further
+        # tenth of a second behind the one before it.
+        assert sorted(clock.sleeps) == [pytest.approx(0.1 * n) for n in range(1, 5)]
+
+    def test_pause_holds_back_the_next_request(self):
+        bucket, clock = _bucket(10, capacity=5)
+        bucket.pause(2.0)
+        assert bucket.acquire() == pytest.approx(2.0)
+        # Then the normal pace, not a burst of everything that queued.
+        assert bucket.acquire() == pytest.approx(2.1)
+
+    def test_set_rate_keeps_earned_tokens(self):
+        bucket, clock = _bucket(10, capacity=1)
+        bucket.acquire()
+        bucket.set_rate(2)
+        assert bucket.acquire() == pytest.approx(0.5)
+
+
+def _limiter(rate=10.0, max_rate=20.0):
+    clock = _FakeClock()
+    return AdaptiveRateLimiter("test", rate, max_rate, capacity=1, clock=clock, sleep=clock.sleep), clock
+
+
+class TestAdaptiveRateLimiter:
+    def test_healthy_responses_raise_the_rate_additively(self):
+        limiter, _clock = _limiter(rate=10.0)
+        for _ in range(10):
+            limiter.observe(200, {})
+        # About a second of healthy traffic adds about one request/second.
+        assert limiter.rate == pytest.approx(11.0, abs=0.05)
+
+    def test_rate_never_exceeds_the_ceiling(self):
+        limiter, _clock = _limiter(rate=10.0, max_rate=10.5)
+        for _ in range(100):
+            limiter.observe(200, {})
+        assert limiter.rate == 10.5
+
+    def test_no_ceiling_keeps_the_starting_rate(self):
+        limiter = AdaptiveRateLimiter("test", 10.0)
+        limiter.observe(200, {})
+        assert limiter.rate == 10.0
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_throttling_backs_off_multiplicatively(self, status):
+        limiter, _clock = _limiter(rate=10.0)
+        limiter.observe(status, {"Retry-After": "0"})
+        assert limiter.rate == 10.0 * RATE_LIMIT_BACKOFF_FACTOR
+
+    def test_backoff_has_a_floor(self):
+        limiter, _clock = _limiter(rate=10.0)
+        for _ in range(50):
+            limiter.observe(503, {})
+        assert limiter.rate == RATE_LIMIT_MIN_REQUESTS_PER_SECOND
+
+    def test_other_errors_leave_the_rate_alone(self):
+        limiter, _clock = _limiter(rate=10.0)
+        limiter.observe(404, {})
+        limiter.observe(500, {})
+        assert limiter.rate == 10.0
+
+    def test_retry_after_pauses_the_service(self):
+        limiter, _clock = _limiter()
+        assert limiter.observe(429, {"Retry-After": "3"}) == 3.0
+        assert limiter.acquire() == pytest.approx(3.0)
+
+    def test_429_without_retry_after_pauses_by_default(self):
+        limiter, _clock = _limiter()
+        assert limiter.observe(429, {}) == RATE_LIMIT_DEFAULT_BACKOFF_SECONDS
+
+    def test_pause_is_clamped(self):
+        limiter, _clock = _limiter()
+        assert limiter.observe(429, {"Retry-After": "99999"}) == RATE_LIMIT_MAX_PAUSE_SECONDS
+        assert limiter.observe(429, {"Retry-After": "99999"}, max_pause=5) == 5
+
+    def test_exhausted_window_pauses_until_reset(self):
+        limiter, _clock = _limiter()
+        assert limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "7"}) == 7.0
+        assert limiter.observe(200, {"RateLimit-Remaining": "3", "RateLimit-Reset": "7"}) == 0.0
+
+    def test_exhausted_window_with_epoch_reset(self):
+        limiter, _clock = _limiter()
+        with patch("utils.rate_limit.time.time", return_value=1_800_000_000.0):
+            pause = limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1800000004"})
+        assert pause == pytest.approx(4.0)
+
+    def test_unreadable_headers_are_ignored(self):
+        limiter, _clock = _limiter(rate=10.0)
+        assert limiter.observe(200, Mock()) == 0.0
+        assert limiter.observe(Mock(), None) == 0.0
+
+    def test_backoff_is_published_immediately(self):
+        limiter, _clock = _limiter(rate=10.0)
+        with patch("utils.rate_limit.record_rate_limit") as record:
+            limiter.observe(429, {"Retry-After": "0"})
+        record.assert_called_once_with("test", 5.0)
+
+    def test_increases_are_published_at_most_once_per_interval(self):
+        limiter, clock = _limiter(rate=10.0)
+        with patch("utils.rate_limit.record_rate_limit") as record:
+            for _ in range(5):
+                limiter.observe(200, {})
+            assert record.call_count == 1
+            clock.now = 60.0
+            limiter.observe(200, {})
+            assert record.call_count == 2
+
+    def test_reset_restores_the_starting_state(self):
+        limiter, _clock = _limiter(rate=10.0)
+        limiter.observe(429, {"Retry-After": "30"})
+        limiter.reset()
+        assert limiter.rate == 10.0
+        assert limiter.acquire() == 0.0
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("12") == 12.0
+
+    def test_http_date(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0) == pytest.approx(10.0)
+
+    def test_missing_or_garbage(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestServiceRateLimiter:
+    def test_one_limiter_per_service(self):
+        first = service_rate_limiter("test-service", 5.0, 10.0)
+        assert service_rate_limiter("test-service", 1.0) is first
+        assert first.rate == 5.0
+
+    def test_tmdb_limiter_is_sized_from_config(self):
+        assert tmdb_rate_limiter.initial_rate == TMDB_REQUESTS_PER_SECOND
+        assert tmdb_rate_limiter.capacity == TMDB_RATE_LIMIT_BURST
+
+
+class TestHTTPClientFeedback:
+    def test_responses_adapt_the_host_limiter(self):
+        limiter, _clock = _limiter(rate=10.0)
+        session = Mock()
+        session.request.return_value = Mock(status_code=429, headers={"Retry-After": "2"})
+        registry = Mock()
+        registry.session_for.return_value = session
+        client = PooledHTTPClient(registry, limiters={"api.themoviedb.org": limiter})
+
+        client.get("https://api.themoviedb.org/3/movie/1")
+
+        assert limiter.rate == 10.0 * RATE_LIMIT_BACKOFF_FACTOR
+        # The Retry-After, plus one interval at the backed-off rate for
+        # the token the throttled request itself took.
+        assert limiter.acquire() == pytest.approx(2.0 + 1 / 5.0)
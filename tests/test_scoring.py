@@ -19,12 +19,15 @@ Tests for utils/scoring.py - Scoring and similarity functions.
 """
 
 import dataclasses
+import itertools
+import random
 from collections import Counter
 
 import pytest
 
 from utils.config import MAX_REDISTRIBUTION_MULTIPLIER
 from utils.scoring import (
+    CompiledProfile,
     ScoringOptions,
     _apply_active_weight_redistribution,
     _apply_popularity_dampening,
@@ -40,8 +43,11 @@ from utils.scoring import (
     calculate_recency_multiplier,
     calculate_rewatch_multiplier,
     calculate_similarity_score,
+    compile_profile,
     fuzzy_keyword_match,
+    iter_ranked_recommendations,
     normalize_genre,
+    recommendation_rank_key,
     select_tiered_recommendations,
 )
 
@@ -1340,3 +1346,106 @@ class TestRedistributionIsCapped:
             {"genre": True, "actor": True, "keyword": True, "language": False},
         )
         assert rich > sparse, "an item matching on three dimensions must beat one matching on genre alone"
+
+
+class TestCompiledProfile:
+    """compile_profile()/CompiledProfile - the once-per-run profile digest
+    calculate_similarity_score() accepts in place of a profile dict. It is
+    a pure performance change, so every test here is a parity check
+    against the plain-dict path (tests/test_harness.py covers the same
+    property over the full harness fixtures, bit for bit)."""
+
+    PROFILE = {
+        "genres": Counter({"Action": 8, "sci-fi": 5, "Science Fiction": 3, "drama": 1, "horror": -2}),
+        "directors": Counter({"Director X": 4, "Director Y": -1}),
+        "studios": Counter({"hbo": 3}),
+        "actors": Counter({"Actor A": 6, "Actor B": 1}),
+        "languages": Counter({"english": 9}),
+        "keywords": Counter({"space travel": 7, "robot": 4, "time loop": 1, "gore": -3}),
+    }
+    ITEMS = [
+        {
+            "genres": ["Action", "Science Fiction", "Drama"],
+            "directors": ["director x"],
+            "cast": ["Actor A", "Actor C"],
+            "language": "English",
+            "keywords": ["space", "robot uprising", "time loop", "gore"],
+            "vote_count": 900000,
+        },
+        {"genres": ["Horror"], "cast": ["Actor B"], "keywords": ["zombie"], "studio": "HBO"},
+        {"genres": ["Comedy"], "language": "N/A"},
+    ]
+
+    @pytest.mark.parametrize("media_type", ["movie", "tv"])
+    def test_matches_plain_dict_path_exactly(self, media_type):
+        compiled = compile_profile(self.PROFILE)
+        for item in self.ITEMS:
+            expected = calculate_similarity_score(item, self.PROFILE, media_type=media_type)
+            actual = calculate_similarity_score(item, compiled, media_type=media_type)
+            assert actual == expected
+
+    def test_matches_normalized_profile_path_exactly(self):
+        """external.py passes profiles through normalize_user_profile()
+        first, whose `_max_counts`/`_tfidf_thresholds` take precedence -
+        compiling must carry those over, not recompute them."""
+        from utils.scoring import normalize_user_profile
+
+        normalized = normalize_user_profile(dict(self.PROFILE), tfidf_penalty_threshold=0.4)
+        compiled = compile_profile(normalized)
+        assert compiled.tfidf_thresholds == normalized["_tfidf_thresholds"]
+        for item in self.ITEMS:
+            assert calculate_similarity_score(item, compiled) == calculate_similarity_score(item, normalized)
+
+    def test_empty_profile_compiles_falsy(self):
+        compiled = compile_profile({})
+        assert not compiled
+        assert calculate_similarity_score({"genres": ["action"]}, compiled)[0] == 0.0
+
+    def test_compiling_a_compiled_profile_is_a_no_op(self):
+        compiled = compile_profile(self.PROFILE)
+        assert compile_profile(compiled) is compiled
+
+    def test_effective_weights_are_memoized_per_weights_and_media_type(self):
+        compiled = compile_profile(self.PROFILE)
+        weights = {"genre": 0.25, "director": 0.05, "studio": 0.10, "actor": 0.20, "keyword": 0.50, "language": 0.0}
+        first = compiled.effective_weights(weights, "movie")
+        assert compiled.effective_weights(dict(weights), "movie") is first
+        assert compiled.effective_weights(weights, "tv") == _redistribute_weights(weights, self.PROFILE, "tv")
+
+    def test_fuzzy_cache_persists_across_items(self):
+        compiled = compile_profile(self.PROFILE)
+        calculate_similarity_score({"keywords": ["robot uprising"]}, compiled)
+        assert "robot uprising" in compiled.prefs["_fuzzy_cache"]
+
+    def test_source_profile_is_not_mutated(self):
+        profile = {"genres": {"action": 2}, "keywords": {"robot": 1}}
+        compile_profile(profile)
+        assert profile == {"genres": {"action": 2}, "keywords": {"robot": 1}}
+        assert isinstance(compile_profile(profile), CompiledProfile)
+
+
+class TestIterRankedRecommendations:
+    """iter_ranked_recommendations() must rank exactly as the stable sort does."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_stable_sort_including_ties(self, seed):
+        rng = random.Random(seed)
+        items = [
+            {
+                "id": i,
+                "similarity_score": rng.choice([0.0, 0.25, 0.5]),
+                "rating": rng.choice([None, 6.0, 7.5]),
+                "vote_count": rng.choice([None, 0, 100]),
+            }
+            for i in range(200)
+        ]
+        expected = [i["id"] for i in sorted(items, key=recommendation_rank_key, reverse=True)]
+        assert [i["id"] for i in iter_ranked_recommendations(items)] == expected
+
+    def test_prefix_without_ranking_the_rest(self):
+        items = [{"similarity_score": s / 10} for s in range(10)]
+        top = list(itertools.islice(iter_ranked_recommendations(items), 3))
+        assert [i["similarity_score"] for i in top] == [0.9, 0.8, 0.7]
+
+    def test_empty(self):
+        assert list(iter_ranked_recommendations([])) == []
@@ -41,7 +41,7 @@ class TestSimklClientInit:
         client = SimklClient(client_id="test_client_id")
         assert client.client_id == "test_client_id"
         assert client.access_token is None
-        assert client._last_request_time == 0
+        assert client.rate_limiter.rate == pytest.approx(1 / SIMKL_RATE_LIMIT_DELAY)
 
     def test_init_with_access_token(self):
         """Test initialization with access token."""
@@ -89,38 +89,47 @@ class TestSimklClientRateLimit:
     """Tests for rate limiting."""
 
     @patch("utils.simkl.time.sleep")
-    @patch("utils.simkl.time.time")
-    def test_rate_limit_sleeps_when_needed(self, mock_time, mock_sleep):
+    def test_rate_limit_sleeps_when_needed(self, mock_sleep):
         """Test rate limiting enforces delay between requests."""
         client = SimklClient("id")
-        client._last_request_time = 100.0
-
-        mock_time.side_effect = [100.1, 100.2]  # 0.1s since last request
 
+        client._rate_limit()
         client._rate_limit()
 
         mock_sleep.assert_called_once()
         sleep_time = mock_sleep.call_args[0][0]
-        assert sleep_time == pytest.approx(SIMKL_RATE_LIMIT_DELAY - 0.1, abs=0.01)
+        assert sleep_time == pytest.approx(SIMKL_RATE_LIMIT_DELAY, abs=0.01)
 
     @patch("utils.simkl.time.sleep")
-    @patch("utils.simkl.time.time")
-    def test_rate_limit_no_sleep_when_enough_time_passed(self, mock_time, mock_sleep):
-        """Test no sleep when enough time has passed."""
-        client = SimklClient("id")
-        client._last_request_time = 100.0
+    def test_rate_limit_no_sleep_for_first_request(self, mock_sleep):
+        """Test no sleep when the limiter has a token."""
+        SimklClient("id")._rate_limit()
 
-        mock_time.return_value = 100.5  # 0.5s since last request
+        mock_sleep.assert_not_called()
 
-        client._rate_limit()
+    @patch("utils.simkl.time.sleep")
+    @patch("utils.simkl.http_client.request")
+    def test_rate_limit_backs_off_on_429(self, mock_request, mock_sleep):
+        """A 429 halves the shared Simkl rate for every later request."""
+        rate_limit_response = Mock()
+        rate_limit_response.status_code = 429
+        rate_limit_response.headers = {"Retry-After": "1"}
+        success_response = Mock()
+        success_response.status_code = 200
+        success_response.headers = {}
+        success_response.json.return_value = {"ok": True}
+        mock_request.side_effect = [rate_limit_response, success_response]
 
-        mock_sleep.assert_not_called()
+        client = SimklClient("id")
+        client._make_request("GET", "/test", authenticated=False)
+
+        assert SimklClient("other").rate_limiter.rate < 1 / SIMKL_RATE_LIMIT_DELAY
 
 
 class TestSimklClientMakeRequest:
     """Tests for API request handling."""
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_successful_request(self, mock_request):
         """Test successful API request."""
         mock_response = Mock()
@@ -134,7 +143,7 @@ class TestSimklClientMakeRequest:
         assert result == {"status": "ok"}
         mock_request.assert_called_once()
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_unauthorized_raises_auth_error(self, mock_request):
         """Test 401 raises SimklAuthError."""
         mock_response = Mock()
@@ -146,7 +155,7 @@ class TestSimklClientMakeRequest:
         with pytest.raises(SimklAuthError, match="Invalid or expired"):
             client._make_request("GET", "/users/settings")
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_404_returns_none(self, mock_request):
         """Test 404 returns None."""
         mock_response = Mock()
@@ -158,7 +167,7 @@ class TestSimklClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_204_returns_none(self, mock_request):
         """Test 204 No Content returns None."""
         mock_response = Mock()
@@ -170,7 +179,7 @@ class TestSimklClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_error_response_raises_api_error(self, mock_request):
         """Test error responses raise SimklAPIError."""
         mock_response = Mock()
@@ -183,7 +192,7 @@ class TestSimklClientMakeRequest:
         with pytest.raises(SimklAPIError, match="400"):
             client._make_request("POST", "/sync/history")
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_timeout_raises_api_error(self, mock_request):
         """Test timeout raises SimklAPIError."""
         mock_request.side_effect = requests.exceptions.Timeout()
@@ -193,7 +202,7 @@ class TestSimklClientMakeRequest:
         with pytest.raises(SimklAPIError, match="timeout"):
             client._make_request("GET", "/users/settings")
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_connection_error_raises_api_error(self, mock_request):
         """Test connection error raises SimklAPIError."""
         mock_request.side_effect = requests.exceptions.ConnectionError()
@@ -203,7 +212,7 @@ class TestSimklClientMakeRequest:
         with pytest.raises(SimklAPIError, match="Could not connect"):
             client._make_request("GET", "/users/settings")
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_401_is_logged(self, mock_request, caplog):
         """#284: a bad/expired Simkl token must be visible - logged HERE,
         at the one shared choke point every Simkl request goes through."""
@@ -221,7 +230,7 @@ class TestSimklClientMakeRequest:
         assert "Simkl" in caplog.text
         assert "authentication failed" in caplog.text.lower()
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_error_response_is_logged(self, mock_request, caplog):
         import logging
 
@@ -238,7 +247,7 @@ class TestSimklClientMakeRequest:
         assert "Simkl" in caplog.text
         assert "400" in caplog.text
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_connection_error_is_logged(self, mock_request, caplog):
         import logging
 
@@ -251,7 +260,7 @@ class TestSimklClientMakeRequest:
 
         assert "Simkl" in caplog.text
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_rate_limit_retries(self, mock_request):
         """Test 429 rate limit triggers retry."""
         rate_limit_response = Mock()
@@ -271,7 +280,7 @@ class TestSimklClientMakeRequest:
         assert mock_request.call_count == 2
 
     @patch("utils.simkl.time.sleep")
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_rate_limit_gives_up_after_max_retries(self, mock_request, mock_sleep):
         """FIX 9: this used to recurse unboundedly on a 429 - a server
         that never stops rate-limiting must not be able to hang/loop
@@ -291,7 +300,7 @@ class TestSimklClientMakeRequest:
         assert mock_request.call_count == 1 + SIMKL_MAX_429_RETRIES
 
     @patch("utils.simkl.time.sleep")
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_retry_after_is_clamped_to_a_ceiling(self, mock_request, mock_sleep):
         """Retry-After is server-controlled input - a malicious/
         misbehaving Simkl endpoint must not be able to stall this
@@ -314,10 +323,10 @@ class TestSimklClientMakeRequest:
         from utils.simkl import SIMKL_MAX_RETRY_AFTER_SECONDS
 
         sleep_durations = [call.args[0] for call in mock_sleep.call_args_list]
-        assert SIMKL_MAX_RETRY_AFTER_SECONDS in sleep_durations
-        assert 99999 not in sleep_durations
+        assert any(d == pytest.approx(SIMKL_MAX_RETRY_AFTER_SECONDS, abs=1) for d in sleep_durations)
+        assert max(sleep_durations) <= SIMKL_MAX_RETRY_AFTER_SECONDS + 1
 
-    @patch("utils.simkl.requests.request")
+    @patch("utils.simkl.http_client.request")
     def test_generic_request_exception(self, mock_request):
         """Test generic RequestException raises SimklAPIError."""
         mock_request.side_effect = requests.exceptions.RequestException("Something broke")
@@ -331,7 +340,7 @@ class TestSimklClientMakeRequest:
 class TestSimklClientPinAuth:
     """Tests for PIN authentication flow."""
 
-    @patch("utils.simkl.requests.get")
+    @patch("utils.simkl.http_client.get")
     def test_get_pin_code_success(self, mock_get):
         """Test successful PIN code retrieval."""
         mock_response = Mock()
@@ -351,7 +360,7 @@ class TestSimklClientPinAuth:
         assert result["verification_url"] == "https://simkl.com/pin"
         assert result["expires_in"] == 900
 
-    @patch("utils.simkl.requests.get")
+    @patch("utils.simkl.http_client.get")
     def test_get_pin_code_error(self, mock_get):
         """Test PIN code error handling."""
         mock_response = Mock()
@@ -364,7 +373,7 @@ class TestSimklClientPinAuth:
         with pytest.raises(SimklAuthError, match="Failed to get PIN"):
             client.get_pin_code()
 
-    @patch("utils.simkl.requests.get")
+    @patch("utils.simkl.http_client.get")
     def test_poll_for_token_success(self, mock_get):
         """Test successful token polling."""
         mock_response = Mock()
@@ -378,7 +387,7 @@ class TestSimklClientPinAuth:
         assert result is True
         assert client.access_token == "my_access_token"
 
-    @patch("utils.simkl.requests.get")
+    @patch("utils.simkl.http_client.get")
     @patch("utils.simkl.time.sleep")
     @patch("utils.simkl.time.time")
     def test_poll_for_token_waits(self, mock_time, mock_sleep, mock_get):
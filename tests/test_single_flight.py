@@ -0,0 +1,139 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/single_flight.py - in-flight request coalescing.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from utils.single_flight import SingleFlight, service_single_flight, tmdb_single_flight
+
+
+def _run_while_blocked(flight, key, followers, result=None, error=None):
+    """Start a leader whose fn blocks, then `followers` callers of the same
+    key; release the leader once they are all waiting. Returns (calls,
+    outcomes) - how often fn ran and what every caller got."""
+    release = threading.Event()
+    calls = []
+    outcomes = []
+    outcomes_lock = threading.Lock()
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        if error is not None:
+            raise error
+        return result
+
+    def caller():
+        try:
+            value = flight.do(key, fn)
+        except Exception as e:  # noqa: BLE001 - recorded for the assertion
+            value = e
+        with outcomes_lock:
+            outcomes.append(value)
+
+    threads = [threading.Thread(target=caller)]
+    threads[0].start()
+    while not calls:
+        time.sleep(0.001)
+    for _ in range(followers):
+        thread = threading.Thread(target=caller)
+        thread.start()
+        threads.append(thread)
+    while flight._counts["shared"] < followers:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return calls, outcomes
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight("test")
+        result = object()
+        calls, outcomes = _run_while_blocked(flight, "k", followers=4, result=result)
+
+        assert len(calls) == 1
+        assert outcomes == [result] * 5
+
+    def test_leaders_error_reaches_every_caller(self):
+        flight = SingleFlight("test")
+        error = ValueError("boom")
+        calls, outcomes = _run_while_blocked(flight, "k", followers=2, error=error)
+
+        assert len(calls) == 1
+        assert outcomes == [error] * 3
+
+    def test_finished_calls_are_not_reused(self):
+        flight = SingleFlight("test")
+        results = iter([1, 2])
+
+        assert flight.do("k", lambda: next(results)) == 1
+        assert flight.do("k", lambda: next(results)) == 2
+        assert flight._calls == {}
+
+    def test_failed_call_is_forgotten(self):
+        flight = SingleFlight("test")
+        with pytest.raises(RuntimeError):
+            flight.do("k", lambda: (_ for _ in ()).throw(RuntimeError("x")))
+        assert flight.do("k", lambda: "ok") == "ok"
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight("test")
+        assert flight.do("a", lambda: "a") == "a"
+        assert flight.do("b", lambda: "b") == "b"
+
+    def test_counts_are_published_in_batches(self):
+        flight = SingleFlight("test")
+        with (
+            patch("utils.single_flight.SINGLE_FLIGHT_METRIC_BATCH", 5),
+            patch("utils.single_flight.record_single_flight_requests") as record,
+        ):
+            _run_while_blocked(flight, "k", followers=3)
+            assert record.call_count == 0
+            flight.do("other", lambda: None)
+
+        record.assert_any_call("test", "leader", 2)
+        record.assert_any_call("test", "shared", 3)
+
+    def test_flush_publishes_pending_counts(self):
+        flight = SingleFlight("test")
+        flight.do("k", lambda: None)
+        with patch("utils.single_flight.record_single_flight_requests") as record:
+            flight.flush_metrics()
+            flight.flush_metrics()
+        record.assert_called_once_with("test", "leader", 1)
+
+    def test_fork_forgets_the_parents_calls(self):
+        flight = SingleFlight("test")
+        # A call the parent had in flight when it forked - never finishes here
+        flight._calls["k"] = object()
+        with patch("utils.single_flight.os.getpid", return_value=flight._pid + 1):
+            assert flight.do("k", lambda: "child") == "child"
+
+
+class TestServiceSingleFlight:
+    def test_one_instance_per_service(self):
+        assert service_single_flight("tmdb") is tmdb_single_flight
+        assert service_single_flight("trakt") is service_single_flight("trakt")
+        assert service_single_flight("trakt") is not tmdb_single_flight
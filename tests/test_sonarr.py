@@ -58,7 +58,7 @@ class TestSonarrClientHeaders:
 class TestSonarrClientMakeRequest:
     """Tests for API request handling."""
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_successful_request(self, mock_request):
         """Test successful API request."""
         mock_response = Mock()
@@ -79,7 +79,7 @@ class TestSonarrClientMakeRequest:
         assert result == {"status": "ok"}
         mock_request.assert_called_once()
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_unauthorized_raises_error(self, mock_request):
         """Test 401 raises SonarrAPIError."""
         mock_response = Mock()
@@ -98,7 +98,7 @@ class TestSonarrClientMakeRequest:
         with pytest.raises(SonarrAPIError, match="Invalid API key"):
             client._make_request("GET", "system/status")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_404_returns_none(self, mock_request):
         """Test 404 returns None."""
         mock_response = Mock()
@@ -117,7 +117,7 @@ class TestSonarrClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_204_returns_none(self, mock_request):
         """Test 204 No Content returns None."""
         mock_response = Mock()
@@ -136,7 +136,7 @@ class TestSonarrClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_timeout_raises_error(self, mock_request):
         """Test timeout raises SonarrAPIError."""
         mock_request.side_effect = requests.exceptions.Timeout()
@@ -146,7 +146,7 @@ class TestSonarrClientMakeRequest:
         with pytest.raises(SonarrAPIError, match="timeout"):
             client._make_request("GET", "system/status")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_connection_error_raises_error(self, mock_request):
         """Test connection error raises SonarrAPIError."""
         mock_request.side_effect = requests.exceptions.ConnectionError()
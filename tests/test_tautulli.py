@@ -50,14 +50,14 @@ class TestTautulliClientInit:
 
     def test_init_sets_rate_limit_state(self):
         client = TautulliClient(url="http://localhost:8181", api_key="key123")
-        assert client._last_request_time == 0
         assert client.rate_limit_delay == TAUTULLI_RATE_LIMIT_DELAY
+        assert client.rate_limiter.rate == pytest.approx(1 / TAUTULLI_RATE_LIMIT_DELAY)
 
 
 class TestTautulliClientCall:
     """Tests for the low-level _call() request/response handling."""
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_call_success_unwraps_data(self, mock_request):
         mock_response = Mock()
         # BaseAPIClient now streams+caps the response body (see
@@ -81,7 +81,7 @@ class TestTautulliClientCall:
         assert called_params["apikey"] == "key123"
         assert called_params["cmd"] == "get_users"
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_call_error_result_raises(self, mock_request):
         mock_response = Mock()
         # BaseAPIClient now streams+caps the response body (see
@@ -99,7 +99,7 @@ class TestTautulliClientCall:
         with pytest.raises(TautulliAPIError, match="Invalid apikey"):
             client._call("get_users")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_call_unexpected_shape_raises(self, mock_request):
         mock_response = Mock()
         # BaseAPIClient now streams+caps the response body (see
@@ -117,7 +117,7 @@ class TestTautulliClientCall:
         with pytest.raises(TautulliAPIError, match="Unexpected response shape"):
             client._call("get_users")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_call_http_error_raises(self, mock_request):
         mock_response = Mock()
         # BaseAPIClient now streams+caps the response body (see
@@ -134,7 +134,7 @@ class TestTautulliClientCall:
         with pytest.raises(TautulliAPIError):
             client._call("get_users")
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_call_timeout_raises_tautulli_error(self, mock_request):
         import requests
 
@@ -144,7 +144,7 @@ class TestTautulliClientCall:
         with pytest.raises(TautulliAPIError, match="timeout"):
             client._call("get_history", params={"user_id": 1})
 
-    @patch("utils.api_client.requests.request")
+    @patch("utils.api_client.http_client.request")
     def test_call_connection_error_raises_tautulli_error(self, mock_request):
         import requests
 
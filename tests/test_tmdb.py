@@ -22,10 +22,14 @@ import pytest
 
 from utils.tmdb import (
     LANGUAGE_CODES,
+    TITLE_APPEND_TO_RESPONSE,
+    fetch_title_record,
     fetch_tmdb_with_retry,
+    fetch_watch_providers,
     get_full_language_name,
     get_tmdb_id_for_item,
     get_tmdb_keywords,
+    title_record,
 )
 
 
@@ -136,7 +140,7 @@ class TestFetchTmdbWithRetry:
         yield
         _reset_tmdb_auth_failure_logged_for_tests()
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_successful_request(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -147,7 +151,7 @@ class TestFetchTmdbWithRetry:
 
         assert result == {"id": 123, "title": "Test Movie"}
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_on_non_200(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 404
@@ -157,10 +161,11 @@ class TestFetchTmdbWithRetry:
 
         assert result is None
 
-    @patch("utils.tmdb.time.sleep")
-    @patch("utils.tmdb.requests.get")
-    def test_retries_on_rate_limit(self, mock_get, mock_sleep):
-        # First call returns 429, second returns 200
+    @patch("utils.tmdb.http_client.get")
+    def test_retries_on_rate_limit(self, mock_get):
+        # First call returns 429, second returns 200 - the wait between
+        # them is the TMDB limiter's (see test_rate_limit.py), not a
+        # fixed sleep here.
         mock_rate_limit = Mock()
         mock_rate_limit.status_code = 429
 
@@ -173,10 +178,10 @@ class TestFetchTmdbWithRetry:
         result = fetch_tmdb_with_retry("http://test.api", {"api_key": "key"})
 
         assert result == {"id": 123}
-        assert mock_sleep.called
+        assert mock_get.call_count == 2
 
     @patch("utils.tmdb.time.sleep")
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_retries_on_connection_error(self, mock_get, mock_sleep):
         import requests
 
@@ -192,7 +197,7 @@ class TestFetchTmdbWithRetry:
         assert result == {"id": 456}
 
     @patch("utils.tmdb.time.sleep")
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_after_max_retries(self, mock_get, mock_sleep):
         import requests
 
@@ -203,7 +208,7 @@ class TestFetchTmdbWithRetry:
         assert result is None
         assert mock_get.call_count == 3
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_401_logs_authentication_failure(self, mock_get, caplog):
         """#284: a bad/expired TMDB API key must be visible rather than
         degrading every TMDB-dependent lookup into a silent None with
@@ -221,7 +226,7 @@ class TestFetchTmdbWithRetry:
         assert "TMDB" in caplog.text
         assert "authentication failed" in caplog.text.lower()
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_403_logs_authentication_failure(self, mock_get, caplog):
         import logging
 
@@ -234,7 +239,7 @@ class TestFetchTmdbWithRetry:
 
         assert "authentication failed" in caplog.text.lower()
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_repeated_401s_are_logged_only_once_per_process(self, mock_get, caplog):
         """Avoids turning a per-item lookup (called up to hundreds of
         times per run) into exactly the log firehose the quiet default
@@ -253,7 +258,7 @@ class TestFetchTmdbWithRetry:
 
         assert caplog.text.count("authentication failed") == 1
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_other_status_codes_stay_at_debug_not_error(self, mock_get, caplog):
         """A non-auth, non-2xx/429 status (e.g. a transient 500) is
         unchanged by #284 - still DEBUG-tier (verbose only), not
@@ -271,7 +276,7 @@ class TestFetchTmdbWithRetry:
         assert result is None
         assert caplog.text == ""
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_on_generic_exception(self, mock_get):
         mock_get.side_effect = ValueError("Unexpected error")
 
@@ -280,7 +285,7 @@ class TestFetchTmdbWithRetry:
         assert result is None
 
     @patch("utils.tmdb.time.sleep")
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_retries_on_timeout(self, mock_get, mock_sleep):
         import requests
 
@@ -445,6 +450,116 @@ class TestGetTmdbIdForItem:
         assert cache["12345"] == 22222
 
 
+class TestTitleRecord:
+    """Tests for title_record / fetch_title_record."""
+
+    MOVIE = {
+        "id": 550,
+        "title": "Fight Club",
+        "release_date": "1999-10-15",
+        "status": "Released",
+        "vote_average": 8.4,
+        "vote_count": 30000,
+        "genres": [{"id": 18, "name": "Drama"}],
+        "belongs_to_collection": None,
+        "production_companies": [{"id": 508, "name": "Regency"}],
+        "keywords": {"keywords": [{"id": 1, "name": "Dual Identity"}]},
+        "credits": {
+            "cast": [{"name": "Edward Norton"}, {"name": "Brad Pitt"}],
+            "crew": [{"name": "David Fincher", "job": "Director"}, {"name": "Jim Uhls", "job": "Screenplay"}],
+        },
+        "external_ids": {"imdb_id": "tt0137523"},
+    }
+
+    def test_normalizes_a_movie(self):
+        record = title_record(self.MOVIE, "movie")
+
+        assert record["tmdb_id"] == 550
+        assert (record["title"], record["year"], record["status"]) == ("Fight Club", 1999, "Released")
+        assert (record["rating"], record["vote_count"]) == (8.4, 30000)
+        assert record["genres"] == ["Drama"]
+        assert record["keywords"] == ["Dual Identity"]
+        assert record["cast"] == ["Edward Norton", "Brad Pitt"]
+        assert record["directors"] == ["David Fincher"]
+        assert record["production_company_ids"] == [508]
+        assert record["collection_id"] is None
+        assert record["imdb_id"] == "tt0137523"
+
+    def test_normalizes_a_show(self):
+        data = {
+            "id": 1399,
+            "name": "Game of Thrones",
+            "first_air_date": "2011-04-17",
+            "networks": [{"name": "HBO"}],
+            "keywords": {"results": [{"name": "dragon"}]},
+        }
+
+        record = title_record(data, "tv")
+
+        assert (record["title"], record["year"]) == ("Game of Thrones", 2011)
+        assert record["keywords"] == ["dragon"]
+        assert record["networks"] == ["HBO"]
+        assert record["imdb_id"] is None
+
+    @patch("utils.tmdb.fetch_tmdb_with_retry")
+    def test_fetch_is_one_request_with_every_sub_resource(self, mock_fetch):
+        mock_fetch.return_value = self.MOVIE
+
+        record = fetch_title_record("key", 550, "movie")
+
+        mock_fetch.assert_called_once()
+        url, params = mock_fetch.call_args[0]
+        assert url == "https://api.themoviedb.org/3/movie/550"
+        assert params == {"api_key": "key", "append_to_response": TITLE_APPEND_TO_RESPONSE}
+        assert record["imdb_id"] == "tt0137523"
+
+    @patch("utils.tmdb.fetch_tmdb_with_retry")
+    def test_fetch_failure_is_none(self, mock_fetch):
+        mock_fetch.return_value = None
+
+        assert fetch_title_record("key", 550, "movie") is None
+
+    @patch("utils.tmdb.fetch_tmdb_with_retry")
+    def test_fetch_needs_an_id_and_key(self, mock_fetch):
+        assert fetch_title_record("key", None) is None
+        assert fetch_title_record("", 550) is None
+        mock_fetch.assert_not_called()
+
+
+class TestFetchWatchProviders:
+    """Tests for fetch_watch_providers."""
+
+    @patch("utils.tmdb.fetch_tmdb_with_retry")
+    def test_is_its_own_request(self, mock_fetch):
+        mock_fetch.return_value = {
+            "id": 550,
+            "results": {"US": {"flatrate": [{"provider_id": 8}], "buy": [{"provider_id": 2}]}, "XX": "junk"},
+        }
+
+        providers = fetch_watch_providers("key", 550, "movie")
+
+        url, params = mock_fetch.call_args[0]
+        assert url == "https://api.themoviedb.org/3/movie/550/watch/providers"
+        assert params == {"api_key": "key"}
+        assert providers == {"US": {"flatrate": [8], "rent": [], "buy": [2]}}
+
+    @patch("utils.tmdb.fetch_tmdb_with_retry")
+    def test_show_without_providers(self, mock_fetch):
+        mock_fetch.return_value = {"id": 1399, "results": {}}
+
+        assert fetch_watch_providers("key", 1399, "tv") == {}
+        assert mock_fetch.call_args[0][0] == "https://api.themoviedb.org/3/tv/1399/watch/providers"
+
+    @patch("utils.tmdb.fetch_tmdb_with_retry")
+    def test_failure_is_none(self, mock_fetch):
+        mock_fetch.return_value = None
+
+        assert fetch_watch_providers("key", 550) is None
+
+    def test_providers_are_not_appended_to_details(self):
+        assert "watch/providers" not in TITLE_APPEND_TO_RESPONSE.split(",")
+
+
 class TestLoadImdbTmdbCache:
     """Tests for load_imdb_tmdb_cache function."""
 
@@ -535,7 +650,7 @@ class TestGetTmdbIdFromImdb:
         result = get_tmdb_id_from_imdb("api_key", "tt1234567", "movie", cache)
         assert result == 99999
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_fetches_from_api_movie(self, mock_get):
         """Test fetches movie from TMDB API."""
         from utils.tmdb import get_tmdb_id_from_imdb
@@ -548,7 +663,7 @@ class TestGetTmdbIdFromImdb:
         result = get_tmdb_id_from_imdb("api_key", "tt1234567", "movie")
         assert result == 12345
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_fetches_from_api_tv(self, mock_get):
         """Test fetches TV show from TMDB API."""
         from utils.tmdb import get_tmdb_id_from_imdb
@@ -561,7 +676,7 @@ class TestGetTmdbIdFromImdb:
         result = get_tmdb_id_from_imdb("api_key", "tt1234567", "tv")
         assert result == 54321
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_updates_cache_on_fetch(self, mock_get):
         """Test updates cache when fetching from API."""
         from utils.tmdb import get_tmdb_id_from_imdb
@@ -576,7 +691,7 @@ class TestGetTmdbIdFromImdb:
         assert result == 12345
         assert cache["tt1234567"] == 12345
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_on_not_found(self, mock_get):
         """Test returns None when no results."""
         from utils.tmdb import get_tmdb_id_from_imdb
@@ -589,7 +704,7 @@ class TestGetTmdbIdFromImdb:
         result = get_tmdb_id_from_imdb("api_key", "tt1234567", "movie")
         assert result is None
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_on_api_error(self, mock_get):
         """Test returns None on API error."""
         from utils.tmdb import get_tmdb_id_from_imdb
@@ -599,7 +714,7 @@ class TestGetTmdbIdFromImdb:
         result = get_tmdb_id_from_imdb("api_key", "tt1234567", "movie")
         assert result is None
 
-    @patch("utils.tmdb.requests.get")
+    @patch("utils.tmdb.http_client.get")
     def test_returns_none_on_non_200(self, mock_get):
         """Test returns None on non-200 status."""
         from utils.tmdb import get_tmdb_id_from_imdb
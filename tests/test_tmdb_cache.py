@@ -0,0 +1,229 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/tmdb_cache.py - the persistent TMDB response cache.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import requests
+
+from utils.tmdb_cache import TMDBResponseCache, cache_key, ttl_class
+
+BASE = "https://api.themoviedb.org/3"
+
+
+def _response(data, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(data).encode()
+    return response
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _cache(tmp_path, **kwargs):
+    return TMDBResponseCache(str(tmp_path / "tmdb_responses.db"), **kwargs)
+
+
+class TestCacheKey:
+    def test_api_key_is_dropped(self):
+        assert cache_key(f"{BASE}/movie/1", {"api_key": "a"}) == cache_key(f"{BASE}/movie/1", {"api_key": "b"})
+        assert "api_key" not in cache_key(f"{BASE}/movie/1", {"api_key": "a"})
+
+    def test_params_are_order_insensitive(self):
+        first = cache_key(f"{BASE}/discover/movie", {"page": 1, "with_genres": "18"})
+        second = cache_key(f"{BASE}/discover/movie", [("with_genres", "18"), ("page", 1)])
+        assert first == second == "/discover/movie?page=1&with_genres=18"
+
+    def test_url_query_and_params_are_merged(self):
+        assert cache_key(f"{BASE}/movie/1?language=en", {"append_to_response": "credits"}) == (
+            "/movie/1?append_to_response=credits&language=en"
+        )
+
+    def test_none_params_are_left_out(self):
+        assert cache_key(f"{BASE}/search/movie", {"query": "x", "year": None}) == "/search/movie?query=x"
+
+    def test_different_params_are_different_keys(self):
+        assert cache_key(f"{BASE}/discover/tv", {"page": 1}) != cache_key(f"{BASE}/discover/tv", {"page": 2})
+
+
+class TestTTLClass:
+    def test_id_mappings_are_immutable(self):
+        assert ttl_class(f"{BASE}/find/tt0111161") == "immutable"
+        assert ttl_class(f"{BASE}/tv/1399/external_ids") == "immutable"
+        assert ttl_class(f"{BASE}/search/keyword") == "immutable"
+
+    def test_details_are_slow_changing(self):
+        assert ttl_class(f"{BASE}/movie/550") == "details"
+        assert ttl_class(f"{BASE}/tv/1399/keywords") == "details"
+        assert ttl_class(f"{BASE}/collection/10") == "details"
+
+    def test_listings_and_providers_are_volatile(self):
+        assert ttl_class(f"{BASE}/movie/550/watch/providers") == "volatile"
+        assert ttl_class(f"{BASE}/discover/movie") == "volatile"
+        assert ttl_class(f"{BASE}/search/movie") == "volatile"
+        assert ttl_class(f"{BASE}/tv/1399/similar") == "volatile"
+
+    def test_appended_sub_resources_take_the_shortest_class(self):
+        url = f"{BASE}/movie/550"
+        assert ttl_class(url, {"append_to_response": "keywords,credits,external_ids"}) == "details"
+        assert ttl_class(url, {"append_to_response": "credits,watch/providers"}) == "volatile"
+        assert ttl_class(f"{url}?append_to_response=watch/providers") == "volatile"
+
+    def test_configuration_is_never_cached(self):
+        assert ttl_class(f"{BASE}/configuration") is None
+
+
+class TestTMDBResponseCache:
+    def test_miss_then_hit(self, tmp_path):
+        cache = _cache(tmp_path)
+        url = f"{BASE}/movie/550"
+        assert cache.lookup(url, {"api_key": "k"}) is None
+
+        cache.store(url, {"api_key": "k"}, _response({"id": 550, "title": "Fight Club"}))
+        hit = cache.lookup(url, {"api_key": "other"})
+
+        assert hit.status_code == 200
+        assert hit.json() == {"id": 550, "title": "Fight Club"}
+        hit.raise_for_status()
+
+    def test_persists_across_instances(self, tmp_path):
+        _cache(tmp_path).store(f"{BASE}/movie/1", None, _response({"id": 1}))
+        assert _cache(tmp_path).lookup(f"{BASE}/movie/1").json() == {"id": 1}
+
+    def test_only_200s_are_stored(self, tmp_path):
+        cache = _cache(tmp_path)
+        cache.store(f"{BASE}/movie/1", None, _response({"status_code": 34}, status=404))
+        assert cache.lookup(f"{BASE}/movie/1") is None
+
+    def test_configuration_is_not_stored(self, tmp_path):
+        cache = _cache(tmp_path)
+        cache.store(f"{BASE}/configuration", {"api_key": "k"}, _response({"images": {}}))
+        assert cache.lookup(f"{BASE}/configuration", {"api_key": "k"}) is None
+
+    def test_entries_expire_by_class(self, tmp_path):
+        clock = Clock()
+        cache = _cache(tmp_path, clock=clock)
+        cache.store(f"{BASE}/movie/1/watch/providers", None, _response({"results": {}}))
+        cache.store(f"{BASE}/movie/1", None, _response({"id": 1}))
+        cache.store(f"{BASE}/find/tt1", None, _response({"movie_results": [{"id": 1}]}))
+
+        clock.now += 24 * 3600
+        assert cache.lookup(f"{BASE}/movie/1/watch/providers") is None
+        assert cache.lookup(f"{BASE}/movie/1") is not None
+
+        clock.now += 7 * 24 * 3600
+        assert cache.lookup(f"{BASE}/movie/1") is None
+        assert cache.lookup(f"{BASE}/find/tt1") is not None
+
+    def test_details_with_appended_providers_expire_on_the_volatile_ttl(self, tmp_path):
+        clock = Clock()
+        cache = _cache(tmp_path, clock=clock)
+        with_providers = {"append_to_response": "credits,watch/providers"}
+        details_only = {"append_to_response": "credits"}
+        cache.store(f"{BASE}/movie/1", with_providers, _response({"id": 1, "watch/providers": {"results": {}}}))
+        cache.store(f"{BASE}/movie/1", details_only, _response({"id": 1}))
+
+        clock.now += 11 * 3600
+        assert cache.lookup(f"{BASE}/movie/1", with_providers) is not None
+
+        clock.now += 2 * 3600
+        assert cache.lookup(f"{BASE}/movie/1", with_providers) is None
+        assert cache.lookup(f"{BASE}/movie/1", details_only) is not None
+
+    def test_empty_id_lookup_is_kept_briefly(self, tmp_path):
+        clock = Clock()
+        cache = _cache(tmp_path, clock=clock)
+        cache.store(f"{BASE}/find/tt9", None, _response({"movie_results": [], "tv_results": []}))
+        assert cache.lookup(f"{BASE}/find/tt9") is not None
+
+        clock.now += 24 * 3600
+        assert cache.lookup(f"{BASE}/find/tt9") is None
+
+    def test_least_recently_used_are_evicted_past_the_cap(self, tmp_path):
+        clock = Clock()
+        cache = _cache(tmp_path, max_bytes=3000, clock=clock)
+        for i in range(6):
+            clock.now += 7200
+            cache.store(f"{BASE}/movie/{i}", None, _response({"id": i, "overview": os.urandom(800).hex()}))
+        clock.now += 7200
+        # Touched, so it is no longer among the oldest
+        assert cache.lookup(f"{BASE}/movie/0") is not None
+
+        cache.prune()
+
+        assert cache.lookup(f"{BASE}/movie/0") is not None
+        assert cache.lookup(f"{BASE}/movie/1") is None
+        assert cache.lookup(f"{BASE}/movie/5") is not None
+
+    def test_expired_entries_are_pruned(self, tmp_path):
+        clock = Clock()
+        cache = _cache(tmp_path, clock=clock)
+        cache.store(f"{BASE}/discover/movie", {"page": 1}, _response({"results": []}))
+        clock.now += 24 * 3600
+        cache.prune()
+        count = cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        assert count == 0
+
+    def test_lookups_are_published_in_batches(self, tmp_path):
+        cache = _cache(tmp_path)
+        cache.store(f"{BASE}/movie/1", None, _response({"id": 1}))
+        with (
+            patch("utils.tmdb_cache.TMDB_CACHE_METRIC_BATCH", 3),
+            patch("utils.tmdb_cache.record_tmdb_cache_lookups") as record,
+        ):
+            cache.lookup(f"{BASE}/movie/1")
+            cache.lookup(f"{BASE}/movie/2")
+            assert record.call_count == 0
+            cache.lookup(f"{BASE}/movie/1")
+
+        record.assert_any_call("details", "hit", 2)
+        record.assert_any_call("details", "miss", 1)
+
+    def test_close_publishes_pending_counts(self, tmp_path):
+        cache = _cache(tmp_path)
+        cache.lookup(f"{BASE}/find/tt1")
+        with patch("utils.tmdb_cache.record_tmdb_cache_lookups") as record:
+            cache.close()
+        record.assert_called_once_with("immutable", "miss", 1)
+
+    def test_unopenable_database_fails_open(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        cache = TMDBResponseCache(str(blocker / "tmdb_responses.db"))
+        with patch("utils.tmdb_cache.log_warning") as warn:
+            assert cache.lookup(f"{BASE}/movie/1") is None
+            cache.store(f"{BASE}/movie/1", None, _response({"id": 1}))
+            assert cache.lookup(f"{BASE}/movie/1") is None
+        warn.assert_called_once()
+
+    def test_fork_reopens_the_database(self, tmp_path):
+        cache = _cache(tmp_path)
+        cache.store(f"{BASE}/movie/1", None, _response({"id": 1}))
+        parent = cache._conn
+        with patch("utils.tmdb_cache.os.getpid", return_value=cache._pid + 1):
+            assert cache.lookup(f"{BASE}/movie/1") is not None
+        assert cache._conn is not parent
@@ -0,0 +1,101 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/tmdb_pool.py - concurrent batches of TMDB lookups.
+"""
+
+import threading
+
+import pytest
+
+from utils.tmdb_pool import fetch_concurrently
+
+
+class TestFetchConcurrently:
+    def test_every_key_is_fetched_once(self):
+        results = dict(fetch_concurrently(lambda key: key * 2, range(20), max_workers=4))
+        assert results == {key: key * 2 for key in range(20)}
+
+    def test_ordered_yields_in_key_order(self):
+        release = threading.Event()
+
+        def fetch(key):
+            # The first key finishes last.
+            if key == 0:
+                release.wait(5)
+            else:
+                release.set()
+            return key
+
+        assert [key for key, _ in fetch_concurrently(fetch, [0, 1, 2], max_workers=3, ordered=True)] == [0, 1, 2]
+
+    def test_unordered_yields_as_completed(self):
+        release = threading.Event()
+
+        def fetch(key):
+            if key == 0:
+                release.wait(5)
+            return key
+
+        results = fetch_concurrently(fetch, [0, 1], max_workers=2)
+        assert next(results)[0] == 1
+        release.set()
+        assert next(results)[0] == 0
+
+    def test_lookups_overlap(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(key):
+            # Only passes once three lookups are in flight at once.
+            barrier.wait()
+            return key
+
+        assert len(list(fetch_concurrently(fetch, range(3), max_workers=3))) == 3
+
+    def test_single_worker_fetches_inline(self):
+        threads = set()
+
+        def fetch(key):
+            threads.add(threading.get_ident())
+            return key
+
+        list(fetch_concurrently(fetch, range(5), max_workers=1))
+        assert threads == {threading.get_ident()}
+
+    def test_exception_is_raised_when_reached(self):
+        def fetch(key):
+            if key == 1:
+                raise KeyError(key)
+            return key
+
+        results = fetch_concurrently(fetch, [0, 1], max_workers=2, ordered=True)
+        assert next(results) == (0, 0)
+        with pytest.raises(KeyError):
+            next(results)
+
+    def test_keys_need_not_be_hashable(self):
+        keys = [{"id": 1}, {"id": 2}]
+        assert sorted(r for _, r in fetch_concurrently(lambda info: info["id"], keys, max_workers=2)) == [1, 2]
+
+    def test_workers_are_named_for_the_service(self):
+        results = fetch_concurrently(
+            lambda key: threading.current_thread().name, range(2), max_workers=2, thread_name_prefix="plex-history"
+        )
+        assert all(name.startswith("plex-history") for _, name in results)
+
+    def test_empty_batch(self):
+        assert list(fetch_concurrently(lambda key: key, [])) == []
@@ -112,11 +112,18 @@ class TestTraktClientRateLimiting:
         second_duration = time.time() - start
         assert second_duration >= TRAKT_RATE_LIMIT_DELAY * 0.9  # Allow some tolerance
 
+    def test_clients_share_the_trakt_single_flight(self):
+        """Concurrent identical GETs from any Trakt client are coalesced."""
+        from utils.single_flight import service_single_flight
+
+        assert TraktClient("id", "secret").single_flight is service_single_flight("trakt")
+        assert TraktClient("other", "secret").single_flight is service_single_flight("trakt")
+
 
 class TestTraktClientMakeRequest:
     """Tests for API request handling."""
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_successful_request(self, mock_request):
         """Test successful API request."""
         mock_response = Mock()
@@ -130,7 +137,7 @@ class TestTraktClientMakeRequest:
         assert result == {"data": "test"}
         mock_request.assert_called_once()
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_204_no_content(self, mock_request):
         """Test 204 No Content response."""
         mock_response = Mock()
@@ -142,7 +149,7 @@ class TestTraktClientMakeRequest:
 
         assert result is None
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_rate_limit_429_retry(self, mock_request):
         """Test 429 rate limit triggers retry."""
         rate_limited = Mock()
@@ -162,7 +169,7 @@ class TestTraktClientMakeRequest:
         assert mock_request.call_count == 2
 
     @patch("utils.trakt.time.sleep")
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_rate_limit_gives_up_after_max_retries(self, mock_request, mock_sleep):
         """FIX 9: this used to recurse unboundedly on a 429 - a server
         that never stops rate-limiting must not be able to hang/loop
@@ -183,7 +190,7 @@ class TestTraktClientMakeRequest:
         assert mock_request.call_count == 1 + TRAKT_MAX_429_RETRIES
 
     @patch("utils.trakt.time.sleep")
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_retry_after_is_clamped_to_a_ceiling(self, mock_request, mock_sleep):
         """Retry-After is server-controlled input - a malicious/
         misbehaving Trakt endpoint must not be able to stall this
@@ -209,10 +216,10 @@ class TestTraktClientMakeRequest:
         from utils.trakt import TRAKT_MAX_RETRY_AFTER_SECONDS
 
         sleep_durations = [call.args[0] for call in mock_sleep.call_args_list]
-        assert TRAKT_MAX_RETRY_AFTER_SECONDS in sleep_durations
-        assert 99999 not in sleep_durations
+        assert any(d == pytest.approx(TRAKT_MAX_RETRY_AFTER_SECONDS, abs=1) for d in sleep_durations)
+        assert max(sleep_durations) <= TRAKT_MAX_RETRY_AFTER_SECONDS + 1
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_api_error_raises_exception(self, mock_request):
         """Test API error raises TraktAPIError."""
         mock_response = Mock()
@@ -227,7 +234,7 @@ class TestTraktClientMakeRequest:
 
         assert "500" in str(exc_info.value)
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_401_triggers_token_refresh(self, mock_request):
         """Test 401 triggers token refresh attempt."""
         unauthorized = Mock()
@@ -242,7 +249,7 @@ class TestTraktClientMakeRequest:
             with pytest.raises(TraktAuthError):
                 client._make_request("GET", "/test")
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_api_error_is_logged_at_the_choke_point(self, mock_request, caplog):
         """#284: a Trakt API failure must be logged HERE, at the one
         shared choke point every Trakt request goes through - never
@@ -264,7 +271,7 @@ class TestTraktClientMakeRequest:
         assert "Trakt" in caplog.text
         assert "500" in caplog.text
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_token_refresh_failure_is_logged(self, mock_request, caplog):
         """#284: a bad/expired Trakt token, unrecoverable via refresh,
         must be visible - not just an exception a caller might swallow."""
@@ -286,7 +293,7 @@ class TestTraktClientMakeRequest:
 
         assert "authentication failed" in caplog.text.lower()
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_connection_failure_is_logged(self, mock_request, caplog):
         import logging
 
@@ -302,7 +309,7 @@ class TestTraktClientMakeRequest:
 class TestTraktClientDeviceAuth:
     """Tests for device authentication flow."""
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_get_device_code_success(self, mock_post):
         """Test successful device code request."""
         mock_response = Mock()
@@ -322,8 +329,8 @@ class TestTraktClientDeviceAuth:
         assert result["device_code"] == "device123"
         assert result["user_code"] == "USER123"
 
-    @patch("utils.trakt.requests.post")
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.post")
+    @patch("utils.trakt.http_client.get")
     def test_get_device_code_failure(self, mock_get, mock_post):
         """Test device code request failure."""
         mock_response = Mock()
@@ -340,7 +347,7 @@ class TestTraktClientDeviceAuth:
         with pytest.raises(TraktAuthError):
             client.get_device_code()
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_poll_for_token_success(self, mock_post):
         """Test successful token poll."""
         mock_response = Mock()
@@ -357,7 +364,7 @@ class TestTraktClientDeviceAuth:
         assert client.refresh_token == "refresh456"
         callback.assert_called_once_with("access123", "refresh456", None, None)
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_poll_for_token_captures_created_at_and_expires_in(self, mock_post):
         """The token grant's own created_at/expires_in fields (device-
         code polling's own `expires_in` parameter is a DIFFERENT thing -
@@ -382,7 +389,7 @@ class TestTraktClientDeviceAuth:
         assert client.expires_in == 7776000
         callback.assert_called_once_with("access123", "refresh456", 1700000000, 7776000)
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_poll_for_token_pending(self, mock_post):
         """Test poll returns pending then success."""
         pending = Mock()
@@ -400,7 +407,7 @@ class TestTraktClientDeviceAuth:
         assert result is True
         assert mock_post.call_count == 2
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_poll_for_token_denied(self, mock_post):
         """Test poll when user denies."""
         mock_response = Mock()
@@ -412,7 +419,7 @@ class TestTraktClientDeviceAuth:
 
         assert result is False
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_poll_for_token_calls_on_wait_once_per_pending_iteration(self, mock_post):
         """on_wait (see utils/trakt_auth.py's periodic progress printer)
         must fire once per still-waiting (400) iteration, and never on
@@ -433,7 +440,7 @@ class TestTraktClientDeviceAuth:
         assert result is True
         assert on_wait.call_count == 2
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_poll_for_token_without_on_wait_still_works(self, mock_post):
         """on_wait defaults to None - existing callers (and every
         existing test above) that never pass it must be unaffected."""
@@ -451,7 +458,7 @@ class TestTraktClientDeviceAuth:
 
         assert result is True
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_poll_for_token_on_wait_not_called_on_denied(self, mock_post):
         """on_wait is specifically for the still-waiting (400) branch -
         never for a terminal outcome like 418 (denied)."""
@@ -470,7 +477,7 @@ class TestTraktClientDeviceAuth:
 class TestTraktClientTokenRefresh:
     """Tests for token refresh."""
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_refresh_access_token_success(self, mock_post):
         """Test successful token refresh."""
         mock_response = Mock()
@@ -487,7 +494,7 @@ class TestTraktClientTokenRefresh:
         assert client.refresh_token == "new_refresh"
         callback.assert_called_once_with("new_access", "new_refresh", None, None)
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_refresh_access_token_sends_redirect_uri(self, mock_post):
         """Trakt's documented /oauth/token refresh body includes
         redirect_uri (PyTrakt sends this too) - suspected-required per
@@ -506,7 +513,7 @@ class TestTraktClientTokenRefresh:
         assert body["redirect_uri"] == TRAKT_OOB_REDIRECT_URI
         assert body["grant_type"] == "refresh_token"
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_refresh_access_token_captures_created_at_and_expires_in(self, mock_post):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -525,8 +532,8 @@ class TestTraktClientTokenRefresh:
         assert client.expires_in == 7776000
 
     @patch("utils.trakt.log_error")
-    @patch("utils.trakt.requests.post")
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.post")
+    @patch("utils.trakt.http_client.get")
     def test_refresh_access_token_failure(self, mock_get, mock_post, mock_log_error):
         """Test failed token refresh - status + body are logged (#trakt-
         token-refresh-persistence: this used to fail completely silently)."""
@@ -548,7 +555,7 @@ class TestTraktClientTokenRefresh:
         assert "--reauth" in mock_log_error.call_args_list[1][0][0]
 
     @patch("utils.trakt.log_error")
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_refresh_access_token_request_exception_is_logged(self, mock_post, mock_log_error):
         """A network-level failure (not just a bad HTTP status) must
         also be logged, not silently swallowed."""
@@ -596,7 +603,7 @@ class TestTraktClientProactiveExpiry:
         client = TraktClient("id", "secret", access_token="tok", created_at=created_at, expires_in=7776000)
         assert client._access_token_expired() is True
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_make_request_refreshes_proactively_before_sending(self, mock_post):
         """An expired-per-our-tracking token triggers a refresh BEFORE
         the real request is sent, not just reactively after a 401."""
@@ -828,7 +835,7 @@ class TestRevokeToken:
         result = client.revoke_token()
         assert result is True
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_revoke_success(self, mock_post):
         """Test successful token revocation."""
         mock_post.return_value = Mock(status_code=200)
@@ -841,7 +848,7 @@ class TestRevokeToken:
         assert client.refresh_token is None
         mock_post.assert_called_once()
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_revoke_failure(self, mock_post):
         """Test token revocation failure."""
         mock_post.return_value = Mock(status_code=500)
@@ -851,7 +858,7 @@ class TestRevokeToken:
 
         assert result is False
 
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.post")
     def test_revoke_request_exception(self, mock_post):
         """Test revoke handles request exception."""
         import requests
@@ -867,7 +874,7 @@ class TestRevokeToken:
 class TestTraktClientUserInfo:
     """Tests for user info methods."""
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_user_settings(self, mock_request):
         """Test get_user_settings."""
         mock_response = Mock()
@@ -880,7 +887,7 @@ class TestTraktClientUserInfo:
 
         assert result["user"]["username"] == "testuser"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_username(self, mock_request):
         """Test get_username."""
         mock_response = Mock()
@@ -893,7 +900,7 @@ class TestTraktClientUserInfo:
 
         assert result == "testuser"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_username_error(self, mock_request):
         """Test get_username returns None on error."""
         mock_response = Mock()
@@ -937,7 +944,7 @@ class TestTraktClientUserInfo:
 class TestTraktClientListManagement:
     """Tests for list management methods."""
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_lists(self, mock_request):
         """Test getting user lists."""
         # First call returns user settings, second returns lists
@@ -960,7 +967,7 @@ class TestTraktClientListManagement:
         assert len(result) == 2
         assert result[0]["name"] == "List 1"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_list_not_found(self, mock_request):
         """Test getting a list that doesn't exist."""
         settings_response = Mock()
@@ -978,7 +985,7 @@ class TestTraktClientListManagement:
 
         assert result is None
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_create_list(self, mock_request):
         """Test creating a new list."""
         settings_response = Mock()
@@ -997,7 +1004,7 @@ class TestTraktClientListManagement:
         assert result["name"] == "New List"
         assert result["ids"]["slug"] == "new-list"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_add_to_list(self, mock_request):
         """Test adding items to a list."""
         settings_response = Mock()
@@ -1024,7 +1031,7 @@ class TestTraktClientListManagement:
         assert result["added"]["movies"] == 2
         assert result["added"]["shows"] == 1
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_remove_from_list(self, mock_request):
         """Test removing items from a list."""
         settings_response = Mock()
@@ -1052,7 +1059,7 @@ class TestTraktClientListManagement:
 
         assert result == {"added": {"movies": 0, "shows": 0}}
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_add_to_list_no_username(self, mock_request):
         """Test add_to_list raises error when no username."""
         settings = Mock(status_code=200)
@@ -1063,7 +1070,7 @@ class TestTraktClientListManagement:
         with pytest.raises(TraktAuthError):
             client.add_to_list("my-list", movies=[{"ids": {"imdb": "tt123"}}])
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_remove_from_list_no_username(self, mock_request):
         """Test remove_from_list raises error when no username."""
         settings = Mock(status_code=200)
@@ -1081,7 +1088,7 @@ class TestTraktClientListManagement:
 
         assert result == {"deleted": {"movies": 0, "shows": 0}}
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_delete_list_success(self, mock_request):
         """Test successful list deletion."""
         settings = Mock(status_code=200)
@@ -1097,7 +1104,7 @@ class TestTraktClientListManagement:
 
         assert result is True
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_delete_list_no_username(self, mock_request):
         """Test delete list fails when no username."""
         settings = Mock(status_code=200)
@@ -1110,7 +1117,7 @@ class TestTraktClientListManagement:
 
         assert result is False
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_delete_list_api_error(self, mock_request):
         """Test delete list handles API error."""
         settings = Mock(status_code=200)
@@ -1125,7 +1132,7 @@ class TestTraktClientListManagement:
 
         assert result is False
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_or_create_finds_by_name(self, mock_request):
         """Test get_or_create_list finds list by name when slug lookup fails."""
         settings = Mock(status_code=200)
@@ -1146,7 +1153,7 @@ class TestTraktClientListManagement:
         assert result is not None
         assert result["name"] == "My List"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_or_create_direct_lookup_slug_hits_for_hyphen_separated_name(self, mock_request):
         """Regression test: get_or_create_list's speculative direct-
         lookup slug used to be a naive `name.lower().replace(" ",
@@ -1214,7 +1221,7 @@ class TestDeriveTraktListSlug:
 class TestTraktClientSyncList:
     """Tests for list sync functionality."""
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_sync_list_creates_new(self, mock_request):
         """Test syncing to a new list."""
         # Mock responses in order: get_username, get_list (404), get_lists, create_list,
@@ -1255,7 +1262,7 @@ class TestTraktClientSyncList:
         assert result["added"]["movies"] == 2
         assert result["list_slug"] == "test"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_sync_list_clears_and_adds(self, mock_request):
         """Test syncing clears existing items before adding new ones."""
         settings = Mock(status_code=200)
@@ -1290,7 +1297,7 @@ class TestTraktClientSyncList:
         assert result["added"]["movies"] == 1
         assert result["list_slug"] == "test"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_sync_list_returns_real_slug_not_a_naive_derivation(self, mock_request):
         """Regression test for the real bug: a list literally named
         'Curatarr - Jason - Movies' has a REAL Trakt slug of
@@ -1338,7 +1345,7 @@ class TestTraktClientSyncList:
 class TestTraktClientImport:
     """Tests for watch history and watchlist import methods."""
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watched_movies(self, mock_request):
         """Test getting watched movies."""
         settings = Mock(status_code=200)
@@ -1358,7 +1365,7 @@ class TestTraktClientImport:
         assert len(result) == 2
         assert result[0]["movie"]["title"] == "Movie 1"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watched_shows(self, mock_request):
         """Test getting watched shows."""
         settings = Mock(status_code=200)
@@ -1375,7 +1382,7 @@ class TestTraktClientImport:
         assert len(result) == 1
         assert result[0]["show"]["title"] == "Show 1"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_ratings(self, mock_request):
         """Test getting user ratings."""
         settings = Mock(status_code=200)
@@ -1395,7 +1402,7 @@ class TestTraktClientImport:
         assert len(result) == 2
         assert result[0]["rating"] == 10
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watchlist(self, mock_request):
         """Test getting watchlist."""
         settings = Mock(status_code=200)
@@ -1415,7 +1422,7 @@ class TestTraktClientImport:
         assert len(result) == 2
         assert result[0]["type"] == "movie"
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watch_history_imdb_ids(self, mock_request):
         """Test getting IMDB IDs from watch history."""
         settings = Mock(status_code=200)
@@ -1434,7 +1441,7 @@ class TestTraktClientImport:
 
         assert result == {"tt123", "tt456"}
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watchlist_imdb_ids(self, mock_request):
         """Test getting IMDB IDs from watchlist."""
         settings = Mock(status_code=200)
@@ -1453,7 +1460,7 @@ class TestTraktClientImport:
 
         assert result == {"tt111", "tt222"}
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watched_movies_no_auth(self, mock_request):
         """Test get_watched_movies returns empty when not authenticated.
 
@@ -1469,7 +1476,7 @@ class TestTraktClientImport:
         result = client.get_watched_movies()
         assert result == []
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watched_movies_api_error(self, mock_request):
         """Test get_watched_movies returns empty on API error."""
         settings = Mock(status_code=200)
@@ -1483,7 +1490,7 @@ class TestTraktClientImport:
         result = client.get_watched_movies()
         assert result == []
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watched_shows_api_error(self, mock_request):
         """Test get_watched_shows returns empty on API error."""
         settings = Mock(status_code=200)
@@ -1497,7 +1504,7 @@ class TestTraktClientImport:
         result = client.get_watched_shows()
         assert result == []
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watchlist_no_auth(self, mock_request):
         """Test get_watchlist returns empty when not authenticated.
 
@@ -1509,7 +1516,7 @@ class TestTraktClientImport:
         result = client.get_watchlist()
         assert result == []
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watchlist_api_error(self, mock_request):
         """Test get_watchlist returns empty on API error."""
         settings = Mock(status_code=200)
@@ -1521,7 +1528,7 @@ class TestTraktClientImport:
         result = client.get_watchlist()
         assert result == []
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_ratings_api_error(self, mock_request):
         """Test get_ratings returns empty on API error."""
         settings = Mock(status_code=200)
@@ -1533,7 +1540,7 @@ class TestTraktClientImport:
         result = client.get_ratings()
         assert result == []
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_ratings_no_auth(self, mock_request):
         """Test get_ratings returns empty when not authenticated.
 
@@ -1551,7 +1558,7 @@ class TestTraktClientImport:
         result = client.add_to_history()
         assert result == {"added": {"movies": 0, "episodes": 0}}
 
-    @patch("utils.trakt.requests.request")
+    @patch("utils.trakt.http_client.request")
     def test_get_watch_history_imdb_ids_shows(self, mock_request):
         """Test get_watch_history_imdb_ids for shows."""
         settings = Mock(status_code=200)
@@ -1672,34 +1679,34 @@ class TestTraktApplicationDiagnostics:
     def _client():
         return TraktClient(client_id="dead-id", client_secret="secret")
 
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.get")
     def test_registered_application_reports_true(self, mock_get):
         mock_get.return_value = Mock(status_code=200)
         assert self._client().application_is_registered() is True
 
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.get")
     def test_rejected_key_reports_false(self, mock_get):
         """403 is what Trakt actually returned for the deleted app."""
         mock_get.return_value = Mock(status_code=403, text="Forbidden")
         assert self._client().application_is_registered() is False
 
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.get")
     def test_unauthorized_also_reports_false(self, mock_get):
         mock_get.return_value = Mock(status_code=401, text="Unauthorized")
         assert self._client().application_is_registered() is False
 
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.get")
     def test_network_failure_is_unknown_not_a_verdict(self, mock_get):
         """Never claim the app is dead because we could not ask."""
         mock_get.side_effect = requests.RequestException("no route to host")
         assert self._client().application_is_registered() is None
 
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.get")
     def test_unexpected_status_is_unknown(self, mock_get):
         mock_get.return_value = Mock(status_code=500, text="boom")
         assert self._client().application_is_registered() is None
 
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.get")
     def test_message_for_a_dead_application_names_the_remedy(self, mock_get):
         mock_get.return_value = Mock(status_code=403, text="Forbidden")
         msg = self._client().describe_auth_failure()
@@ -1708,7 +1715,7 @@ class TestTraktApplicationDiagnostics:
         assert "urn:ietf:wg:oauth:2.0:oob" in msg
         assert "Re-authorizing cannot fix this" in msg
 
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.get")
     def test_message_for_a_live_application_says_reauthorize_instead(self, mock_get):
         """The opposite remedy - must not tell the user to recreate a
         perfectly good application."""
@@ -1717,7 +1724,7 @@ class TestTraktApplicationDiagnostics:
         assert "--reauth" in msg
         assert "no longer exists" not in msg
 
-    @patch("utils.trakt.requests.get")
+    @patch("utils.trakt.http_client.get")
     def test_message_when_unreachable_claims_neither(self, mock_get):
         mock_get.side_effect = requests.RequestException("down")
         msg = self._client().describe_auth_failure()
@@ -1725,8 +1732,8 @@ class TestTraktApplicationDiagnostics:
         assert "no longer exists" not in msg
         assert "--reauth" not in msg
 
-    @patch("utils.trakt.requests.get")
-    @patch("utils.trakt.requests.post")
+    @patch("utils.trakt.http_client.get")
+    @patch("utils.trakt.http_client.post")
     def test_device_code_failure_carries_the_diagnosis(self, mock_post, mock_get):
         """The path the user actually hit: python -m utils.trakt_auth --reauth."""
         mock_post.return_value = Mock(
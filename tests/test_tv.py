@@ -19,6 +19,7 @@ Tests for recommenders/tv.py - TV show recommendation system.
 """
 
 import copy
+import time
 from collections import Counter
 from unittest.mock import MagicMock, Mock, patch
 
@@ -31,6 +32,9 @@ from recommenders.tv import (
     main,
     process_recommendations,
 )
+from utils.config import WATCH_LEDGER_OVERLAP_SECONDS
+from utils.plex import PlexPlay
+from utils.watch_ledger import WatchLedger
 
 
 @pytest.fixture(autouse=True)
@@ -62,6 +66,10 @@ def _no_real_plex_watched_lookups(monkeypatch):
     """
     monkeypatch.setattr("recommenders.tv.get_watched_show_count", lambda *a, **kw: 0)
     monkeypatch.setattr("recommenders.tv.get_plex_account_ids", lambda *a, **kw: [])
+    # The shared history fetch feeding the history consumers tests patch
+    # below (fetch_plex_watch_history_shows, and fetch_show_completion_data
+    # through the watch ledger).
+    monkeypatch.setattr("recommenders.tv.fetch_plex_history", lambda *a, **kw: {})
 
 
 class TestShowCache:
@@ -1433,7 +1441,7 @@ class TestGetPlexWatchedShowsData:
         assert result is cached
 
     @patch("os.path.exists", return_value=False)
-    @patch("recommenders.tv.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.tv.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.tv.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.tv.fetch_plex_watch_history_shows")
@@ -1465,7 +1473,7 @@ class TestGetPlexWatchedShowsData:
         mock_log_error.assert_called()
 
     @patch("os.path.exists", return_value=False)
-    @patch("recommenders.tv.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.tv.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.tv.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.tv.identify_dropped_shows")
@@ -1499,6 +1507,86 @@ class TestGetPlexWatchedShowsData:
         call_kwargs = mock_process_counters.call_args
         assert call_kwargs[1]["weight"] < 0
 
+    @patch("os.path.exists", return_value=False)
+    @patch("recommenders.tv.identify_dropped_shows", return_value=set())
+    @patch("recommenders.tv.fetch_show_completion_data", return_value={})
+    @patch("recommenders.tv.fetch_plex_watch_history_shows", return_value=({50}, {50: 20}))
+    @patch("recommenders.tv.fetch_plex_history")
+    @patch("recommenders.tv.get_plex_account_ids", return_value=["acct1"])
+    @patch("recommenders.tv.get_watched_show_count", return_value=1)
+    def test_history_is_fetched_once_for_shows_and_completion(
+        self, mock_count, mock_account_ids, mock_fetch, mock_history, mock_completion, mock_identify, mock_exists
+    ):
+        mock_fetch.return_value = {
+            "acct1": [
+                PlexPlay("501", "episode", "/library/metadata/50", 10, None),
+                PlexPlay("502", "episode", "/library/metadata/50", 20, None),
+            ]
+        }
+        recommender = _make_tv_recommender()
+
+        mock_fetch.assert_called_once()
+        assert mock_fetch.call_args.args[1] == ["acct1"]
+        assert mock_history.call_args.kwargs["history"] is mock_fetch.return_value
+        # Completion reads the episodes the ledger recorded from that fetch
+        assert mock_completion.call_args.kwargs["watched_episodes"] == ({50: {"501", "502"}}, {50: 20})
+        # Episode totals come from the run's shared library listing
+        assert mock_completion.call_args.kwargs["shows"] is recommender._get_all_library_items()
+
+    @patch("os.path.exists", return_value=False)
+    @patch("recommenders.base.save_watch_ledger")
+    @patch("recommenders.base.load_watch_ledger")
+    @patch("recommenders.tv.identify_dropped_shows", return_value=set())
+    @patch("recommenders.tv.fetch_show_completion_data", return_value={})
+    @patch("recommenders.tv.fetch_plex_watch_history_shows", return_value=({50}, {50: 1_700_000_500}))
+    @patch("recommenders.tv.fetch_plex_history")
+    @patch("recommenders.tv.get_plex_account_ids", return_value=["acct1"])
+    @patch("recommenders.tv.get_watched_show_count", return_value=1)
+    def test_dropped_detection_reads_only_new_plays(
+        self,
+        mock_count,
+        mock_account_ids,
+        mock_fetch,
+        mock_history,
+        mock_completion,
+        mock_identify,
+        mock_load_ledger,
+        mock_save_ledger,
+        mock_exists,
+    ):
+        stored = WatchLedger("tv")
+        stored.record_history({50: 1_700_000_000}, ["acct1"], full=True, now=time.time())
+        stored.record_episodes({50: {"501"}}, {50: 1_700_000_000}, full=True)
+        mock_load_ledger.return_value = stored.to_dict()
+        mock_fetch.return_value = {"acct1": [PlexPlay("502", "episode", "/library/metadata/50", 1_700_000_500, None)]}
+
+        _make_tv_recommender()
+
+        mock_fetch.assert_called_once()
+        assert mock_fetch.call_args.args[3] == 1_700_000_000 - WATCH_LEDGER_OVERLAP_SECONDS
+        # The stored episodes plus the new play
+        watched_episodes = mock_completion.call_args.kwargs["watched_episodes"]
+        assert watched_episodes == ({50: {"501", "502"}}, {50: 1_700_000_500})
+        saved = mock_save_ledger.call_args.args[1]
+        assert sorted(saved["show_episodes"]["50"]) == ["501", "502"]
+
+    @patch("os.path.exists", return_value=False)
+    @patch("recommenders.tv.fetch_show_completion_data")
+    @patch("recommenders.tv.fetch_plex_watch_history_shows", return_value=(set(), {}))
+    @patch("recommenders.tv.fetch_plex_history", return_value={})
+    @patch("recommenders.tv.get_plex_account_ids", return_value=["acct1"])
+    @patch("recommenders.tv.get_watched_show_count", return_value=1)
+    def test_without_dropped_detection_completion_is_skipped(
+        self, mock_count, mock_account_ids, mock_fetch, mock_history, mock_completion, mock_exists
+    ):
+        config = copy.deepcopy(TV_TEST_CONFIG)
+        config["negative_signals"] = {"dropped_shows": {"enabled": False}}
+        _make_tv_recommender(config=config)
+
+        mock_fetch.assert_called_once()
+        assert mock_history.call_args.kwargs["history"] is mock_fetch.return_value
+        mock_completion.assert_not_called()
+
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.tv.merge_show_watched_data")
     @patch("recommenders.tv.fetch_tautulli_show_watched_data")
@@ -1538,7 +1626,7 @@ class TestGetPlexWatchedShowsDataAccurateMode:
 
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.base.BaseRecommender._get_all_library_items_for_user")
-    @patch("recommenders.tv.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.tv.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.tv.fetch_plex_watch_history_shows")
     @patch("recommenders.tv.get_plex_account_ids")
@@ -1577,7 +1665,7 @@ class TestGetPlexWatchedShowsDataAccurateMode:
 
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.base.BaseRecommender._get_all_library_items_for_user")
-    @patch("recommenders.tv.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.tv.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.tv.fetch_plex_watch_history_shows")
     @patch("recommenders.tv.get_plex_account_ids")
@@ -1621,7 +1709,7 @@ class TestGetPlexWatchedShowsDataAccurateMode:
 
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.base.BaseRecommender._get_all_library_items_for_user")
-    @patch("recommenders.tv.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.tv.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.tv.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.tv.fetch_plex_watch_history_shows")
@@ -1660,7 +1748,7 @@ class TestGetPlexWatchedShowsDataAccurateMode:
 
     @patch("os.path.exists", return_value=False)
     @patch("recommenders.base.BaseRecommender._get_all_library_items_for_user")
-    @patch("recommenders.tv.process_counters_from_cache")
+    @patch("recommenders.base.process_counters_from_cache")
     @patch("recommenders.tv.calculate_rewatch_multiplier", return_value=1.0)
     @patch("recommenders.tv.calculate_recency_multiplier", return_value=1.0)
     @patch("recommenders.tv.fetch_plex_watch_history_shows")
@@ -0,0 +1,234 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for utils/watch_ledger.py - event-sourced watch profiles.
+"""
+
+import json
+
+import pytest
+
+from utils.config import WATCH_LEDGER_OVERLAP_SECONDS, WATCH_LEDGER_REBASE_DAYS, WATCH_LEDGER_RESYNC_DAYS
+from utils.counters import create_empty_counters, process_counters_from_cache
+from utils.watch_ledger import DAY_SECONDS, WatchLedger
+
+NOW = 1_800_000_000.0
+
+ITEMS = {
+    "1": {
+        "genres": ["Action", "Drama"],
+        "cast": ["Ann"],
+        "tmdb_keywords": ["heist"],
+        "tmdb_id": 101,
+        "collection_id": 7,
+    },
+    "2": {"genres": ["Drama"], "directors": ["Bo"], "tmdb_keywords": ["space"], "tmdb_id": 102},
+    "3": {"genres": ["Comedy"], "cast": ["Ann", "Cy"], "tmdb_id": 103},
+}
+
+
+def _apply(ledger, contributions, version="v1", now=NOW):
+    """What BaseRecommender._apply_watch_ledger does, minus the disk."""
+    counters, updates = ledger.plan(contributions, version, now=now)
+    for key, weight, cap in updates:
+        process_counters_from_cache(ITEMS[key], counters, media_type="movie", weight=weight, cap_penalty=cap)
+        counters["tmdb_ids"].add(ITEMS[key]["tmdb_id"])
+    ledger.commit(counters, contributions, version)
+    return counters, updates
+
+
+def _from_scratch(contributions):
+    return _apply(WatchLedger("movie"), contributions)[0]
+
+
+def _assert_same_counters(actual, expected):
+    assert set(actual) == set(expected)
+    for name, counter in expected.items():
+        if isinstance(counter, set):
+            assert actual[name] == counter
+        else:
+            assert set(actual[name]) == set(counter), name
+            for key, value in counter.items():
+                assert actual[name][key] == pytest.approx(value), (name, key)
+
+
+class TestHistorySince:
+    def test_first_run_reads_everything(self):
+        assert WatchLedger("movie").history_since(["acct1"], now=NOW) is None
+
+    def test_reads_from_the_watermark_minus_overlap(self):
+        ledger = WatchLedger("movie")
+        ledger.record_history({1: 1_700_000_000}, ["acct1"], full=True, now=NOW)
+        assert ledger.history_since(["acct1"], now=NOW) == 1_700_000_000 - WATCH_LEDGER_OVERLAP_SECONDS
+
+    def test_changed_accounts_read_everything(self):
+        ledger = WatchLedger("movie")
+        ledger.record_history({1: 1_700_000_000}, ["acct1"], full=True, now=NOW)
+        assert ledger.history_since(["acct1", "acct2"], now=NOW) is None
+
+    def test_account_order_does_not_matter(self):
+        ledger = WatchLedger("movie")
+        ledger.record_history({1: 1_700_000_000}, [2, 1], full=True, now=NOW)
+        assert ledger.history_since(["1", "2"], now=NOW) is not None
+
+    def test_resync_is_due_after_the_interval(self):
+        ledger = WatchLedger("movie")
+        ledger.record_history({1: 1_700_000_000}, ["acct1"], full=True, now=NOW)
+        later = NOW + WATCH_LEDGER_RESYNC_DAYS * DAY_SECONDS + 1
+        assert ledger.history_since(["acct1"], now=later) is None
+
+
+class TestRecordHistory:
+    def test_incremental_read_adds_and_keeps_latest(self):
+        ledger = WatchLedger("movie")
+        ledger.record_history({1: 100, 2: 200}, ["a"], full=True, now=NOW)
+        ledger.record_history({2: 150, 3: 300}, ["a"], full=False, now=NOW)
+        assert ledger.viewed_timestamps() == {1: 100, 2: 200, 3: 300}
+        assert ledger.watermark == 300
+
+    def test_full_read_drops_plays_plex_no_longer_has(self):
+        ledger = WatchLedger("movie")
+        ledger.record_history({1: 100, 2: 200}, ["a"], full=True, now=NOW)
+        ledger.record_history({2: 200}, ["a"], full=True, now=NOW)
+        assert ledger.watched_ids() == {2}
+
+    def test_missing_viewed_at_is_watched_without_a_timestamp(self):
+        ledger = WatchLedger("movie")
+        ledger.record_history({1: None}, ["a"], full=True, now=NOW)
+        assert ledger.watched_ids() == {1}
+        assert ledger.viewed_timestamps() == {}
+
+
+class TestRecordEpisodes:
+    def test_incremental_read_adds_to_each_show(self):
+        ledger = WatchLedger("tv")
+        ledger.record_episodes({10: {"101", "102"}}, {10: 100}, full=True)
+        # The overlap re-reads 102; a new show starts too.
+        ledger.record_episodes({10: {"102", "103"}, 20: {"201"}}, {10: 300, 20: 250}, full=False)
+
+        assert ledger.watched_episodes() == ({10: {"101", "102", "103"}, 20: {"201"}}, {10: 300, 20: 250})
+
+    def test_full_read_replaces_them(self):
+        ledger = WatchLedger("tv")
+        ledger.record_episodes({10: {"101"}, 20: {"201"}}, {10: 100, 20: 200}, full=True)
+        ledger.record_episodes({20: {"201"}}, {20: 200}, full=True)
+
+        assert ledger.watched_episodes() == ({20: {"201"}}, {20: 200})
+
+    def test_round_trip_through_json(self):
+        ledger = WatchLedger("tv", ["acct1"])
+        ledger.record_episodes({10: {"101", "102"}}, {10: 100}, full=True)
+
+        restored = WatchLedger.from_dict(json.loads(json.dumps(ledger.to_dict())), "tv")
+
+        assert restored.watched_episodes() == ledger.watched_episodes()
+
+
+class TestPlan:
+    def test_unchanged_weights_apply_nothing(self):
+        ledger = WatchLedger("movie")
+        _apply(ledger, {1: (1.0, 0.5), 2: (0.8, 0.5)})
+        counters, updates = _apply(ledger, {1: (1.0, 0.5), 2: (0.8, 0.5)}, now=NOW + 60)
+        assert updates == []
+        _assert_same_counters(counters, _from_scratch({1: (1.0, 0.5), 2: (0.8, 0.5)}))
+
+    def test_delta_matches_a_rebuild(self):
+        ledger = WatchLedger("movie")
+        _apply(ledger, {1: (1.0, 0.5), 2: (0.8, 0.5)})
+        wanted = {1: (0.6, 0.5), 2: (0.8, 0.5), 3: (1.2, 0.5)}
+        counters, updates = _apply(ledger, wanted, now=NOW + 60)
+        assert sorted(key for key, _w, _cap in updates) == ["1", "3"]
+        _assert_same_counters(counters, _from_scratch(wanted))
+
+    def test_delta_leaves_no_float_residue(self):
+        ledger = WatchLedger("movie")
+        _apply(ledger, {1: (0.1, 0.5), 2: (0.3, 0.5)})
+        counters, _ = _apply(ledger, {1: (0.0, 0.5), 2: (0.3, 0.5)}, now=NOW + 60)
+        assert "heist" not in counters["tmdb_keywords"]
+        assert "action" not in counters["genres"]
+
+    @pytest.mark.parametrize(
+        "wanted",
+        [
+            {1: (1.0, 0.5)},  # item 2 left the profile
+            {1: (1.0, 0.5), 2: (-0.4, 0.5)},  # a negative weight
+        ],
+    )
+    def test_non_additive_changes_rebuild(self, wanted):
+        ledger = WatchLedger("movie")
+        _apply(ledger, {1: (1.0, 0.5), 2: (0.8, 0.5)})
+        counters, updates = _apply(ledger, wanted, now=NOW + 60)
+        assert len(updates) == len(wanted)
+        _assert_same_counters(counters, _from_scratch(wanted))
+
+    def test_rebuild_keeps_the_builder_order(self):
+        # The negative cap is order-dependent; replaying in the given
+        # order is what keeps a rebuild identical to a from-scratch build.
+        _counters, updates = WatchLedger("movie").plan({2: (0.8, 0.5), 1: (-0.4, 0.5), 3: (1.0, 0.5)}, "v1", now=NOW)
+        assert [key for key, _w, _cap in updates] == ["2", "1", "3"]
+
+    def test_library_change_rebuilds(self):
+        ledger = WatchLedger("movie")
+        _apply(ledger, {1: (1.0, 0.5)})
+        _counters, updates = ledger.plan({1: (1.0, 0.5)}, "v2", now=NOW + 60)
+        assert updates == [("1", 1.0, 0.5)]
+
+    def test_rebase_interval_rebuilds(self):
+        ledger = WatchLedger("movie")
+        _apply(ledger, {1: (1.0, 0.5)})
+        later = NOW + WATCH_LEDGER_REBASE_DAYS * DAY_SECONDS + 1
+        _counters, updates = ledger.plan({1: (1.0, 0.5)}, "v1", now=later)
+        assert updates == [("1", 1.0, 0.5)]
+
+    def test_planned_counters_are_a_copy(self):
+        ledger = WatchLedger("movie")
+        _apply(ledger, {1: (1.0, 0.5)})
+        counters, _ = ledger.plan({1: (1.0, 0.5)}, "v1", now=NOW + 60)
+        counters["genres"]["Trakt-only"] += 5
+        assert "Trakt-only" not in ledger.counters["genres"]
+
+
+class TestSerialization:
+    def test_round_trip_through_json(self):
+        ledger = WatchLedger("movie", ["acct1"])
+        ledger.record_history({1: 100, 2: 200}, ["acct1"], full=True, now=NOW)
+        _apply(ledger, {1: (1.0, 0.5), 2: (-0.4, 0.5)})
+
+        restored = WatchLedger.from_dict(json.loads(json.dumps(ledger.to_dict())), "movie")
+
+        assert restored.viewed_timestamps() == ledger.viewed_timestamps()
+        assert restored.contributions == ledger.contributions
+        assert restored.history_since(["acct1"], now=NOW) == ledger.history_since(["acct1"], now=NOW)
+        # Collection IDs stay ints.
+        assert 7 in restored.counters["collections"]
+        _assert_same_counters(restored.counters, ledger.counters)
+
+    def test_other_media_type_is_rejected(self):
+        assert WatchLedger.from_dict(WatchLedger("movie").to_dict(), "tv") is None
+
+    def test_ledger_without_episodes_is_rejected(self):
+        data = WatchLedger("tv").to_dict()
+        del data["show_episodes"]
+        assert WatchLedger.from_dict(data, "tv") is None
+
+    def test_malformed_data_is_rejected(self):
+        data = WatchLedger("movie").to_dict()
+        data["viewed_at"] = ["not", "a", "dict"]
+        assert WatchLedger.from_dict(data, "movie") is None
+
+    def test_empty_ledger_has_empty_counters(self):
+        _assert_same_counters(WatchLedger("tv").counters, create_empty_counters("tv"))
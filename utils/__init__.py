@@ -21,13 +21,28 @@ This package contains modular utility functions organized by responsibility.
 All public functions are re-exported here for backwards compatibility.
 """
 
+# Vectorized batch scoring (optional NumPy - see module docstring)
+from .batch_scoring import (
+    BatchCorpus,
+    batch_scoring_available,
+    batch_similarity_scores,
+)
+
 # Config utilities
 # Cache utilities
 from .cache import (
     load_json_cache,
+    load_library_index,
     load_media_cache,
+    load_owned_index,
+    load_score_store_record,
+    load_watch_ledger,
     save_json_cache,
+    save_library_index,
     save_media_cache,
+    save_owned_index,
+    save_score_store,
+    save_watch_ledger,
     save_watched_cache,
 )
 
@@ -58,6 +73,9 @@ from .cli import (
     update_config_for_user,
 )
 from .config import (
+    BATCH_SCORE_TOLERANCE,
+    BATCH_SCORING_MIN_CANDIDATES,
+    CACHE_BACKENDS,
     CACHE_VERSION,
     CALIBRATION_CERTIFICATE_WEIGHT,
     CALIBRATION_DIVERGENCE_SCALE,
@@ -99,6 +117,7 @@ from .config import (
     RATING_TIER_4_STAR,
     RATING_TIER_5_STAR,
     RECOMMEND_FOR_NO_HISTORY_DEFAULT,
+    SCORER_VERSION,
     SONARR_REQUEST_TIMEOUT,
     SUPPLY_GAP_MIN_PROFILE_SHARE,
     SUPPLY_GAP_MIN_SHORTFALL,
@@ -115,6 +134,8 @@ from .config import (
     WEIGHT_SUM_TOLERANCE,
     __version__,
     check_cache_version,
+    check_loaded_cache_version,
+    get_cache_backend,
     get_config_section,
     get_effective_arr_config,
     get_libraries,
@@ -133,6 +154,7 @@ from .config import (
 from .corpus_idf import (
     build_corpus_idf,
     build_document_frequency,
+    corpus_idf_from_frequency,
     describe_least_informative,
     idf_weight,
 )
@@ -144,6 +166,15 @@ from .counters import (
     process_counters_from_cache,
 )
 
+# Delta rescoring (see utils/delta_scoring.py)
+from .delta_scoring import (
+    TermIndex,
+    changed_terms,
+    content_terms,
+    profile_signature,
+    profile_snapshot,
+)
+
 # Display utilities
 from .display import (
     ANSI_PATTERN,
@@ -204,6 +235,9 @@ from .helpers import (
     normalize_title,
 )
 
+# Pooled keep-alive HTTP sessions (see utils/http_session.py)
+from .http_session import PooledHTTPClient, SessionRegistry, http_client
+
 # Negative feedback from declined recommendations
 from .ignored_recs import (
     apply_ignored_penalties,
@@ -217,12 +251,17 @@ from .integration_status import (
     record_integration_status,
 )
 
+# Indexed fuzzy keyword matching (see utils/keyword_index.py)
+from .keyword_index import FuzzyKeywordIndex
+
 # Label utilities
 from .labels import (
     DEFAULT_MOVIE_NAME_TEMPLATE,
     DEFAULT_TV_NAME_TEMPLATE,
+    LabelEdit,
     add_labels_to_items,
     build_label_name,
+    bulk_edit_labels,
     categorize_labeled_items,
     remove_labels_from_items,
     render_collection_name,
@@ -234,11 +273,15 @@ from .library_health import (
     SupplyGap,
     assess_pool_health,
     find_supply_gaps,
+    find_supply_gaps_in,
     format_health_report,
     gaps_to_dict,
     prioritize_discovery_genres,
 )
 
+# Persistent library-wide derived indexes (see utils/library_index.py)
+from .library_index import LibraryIndex, library_content_version
+
 # MDBList utilities
 from .mdblist import (
     MDBListAPIError,
@@ -246,26 +289,40 @@ from .mdblist import (
     create_mdblist_client,
 )
 
+# SQLite media cache backend (see utils/media_store.py)
+from .media_store import MediaCacheStore, import_json_media_cache
+
 # Metrics utilities (local-first Prometheus text format - see module
 # docstring for why this isn't the prometheus_client package)
 from .metrics import (
     DURATION_BUCKETS,
     record_api_call,
     record_cache_lookup,
+    record_rate_limit,
     record_recommender_run,
     record_self_update_attempt,
+    record_single_flight_requests,
+    record_tmdb_cache_lookups,
     record_unhandled_error,
     render_prometheus_text,
     track_api_call,
 )
 
+# Persisted owned-title index (see utils/owned_index.py)
+from .owned_index import OwnedIndex, owned_library_index
+
 # Plex utilities
 from .plex import (
+    LibraryGuid,
+    LibraryItem,
+    LibraryTag,
     cleanup_legacy_unnamed_collection,
     cleanup_old_collections,
     extract_genres,
     extract_ids_from_guids,
     extract_rating,
+    fetch_plex_history,
+    fetch_plex_items,
     fetch_plex_libraries,
     fetch_plex_users,
     fetch_plex_watch_history_movies,
@@ -289,9 +346,18 @@ from .plex import (
     get_watched_show_count,
     identify_dropped_shows,
     init_plex,
+    iter_library_snapshot,
+    library_section_size,
+    load_full_plex_items,
+    plan_collection_moves,
+    plex_max_workers,
+    plex_metadata_digest,
+    read_library_snapshot,
     remove_owned_collection,
     resolve_plex_user,
     update_plex_collection,
+    updated_at_epoch,
+    watched_episodes_by_show,
 )
 
 # Plex rating/label POLICY (split from .plex - see utils/plex_policy.py's
@@ -314,6 +380,9 @@ from .radarr import (
     create_radarr_client_from,
 )
 
+# Shared request rate limits (see utils/rate_limit.py)
+from .rate_limit import AdaptiveRateLimiter, TokenBucket, service_rate_limiter, tmdb_rate_limiter
+
 # Explicit, structured per-(engine, user) recommender run status (#292 -
 # see module docstring for why this replaces log-tail marker matching)
 from .run_status import (
@@ -334,12 +403,17 @@ from .scheduler import (
 # Scoring utilities
 from .scoring import (
     GENRE_NORMALIZATION,
+    CompiledProfile,
+    ScoringOptions,
     calculate_recency_multiplier,
     calculate_rewatch_multiplier,
     calculate_similarity_score,
+    compile_profile,
     fuzzy_keyword_match,
+    iter_ranked_recommendations,
     normalize_genre,
     normalize_user_profile,
+    recommendation_rank_key,
     select_tiered_recommendations,
 )
 
@@ -379,6 +453,9 @@ from .simkl import (
     get_authenticated_simkl_client,
 )
 
+# In-flight request coalescing (see utils/single_flight.py)
+from .single_flight import SingleFlight, service_single_flight, tmdb_single_flight
+
 # Sonarr utilities
 from .sonarr import (
     SonarrAPIError,
@@ -405,15 +482,25 @@ from .tautulli import (
 from .tmdb import (
     IMDB_TMDB_CACHE_VERSION,
     LANGUAGE_CODES,
+    TITLE_APPEND_TO_RESPONSE,
+    fetch_title_record,
     fetch_tmdb_with_retry,
+    fetch_watch_providers,
     get_full_language_name,
     get_tmdb_id_for_item,
     get_tmdb_id_from_imdb,
     get_tmdb_keywords,
     load_imdb_tmdb_cache,
     save_imdb_tmdb_cache,
+    title_record,
 )
 
+# Persistent TMDB response cache (see utils/tmdb_cache.py)
+from .tmdb_cache import TMDBResponseCache, tmdb_response_cache
+
+# Concurrent TMDB batches (see utils/tmdb_pool.py)
+from .tmdb_pool import fetch_concurrently
+
 # Trakt utilities
 from .trakt import (
     TRAKT_ENHANCE_CACHE_VERSION,
@@ -475,11 +562,15 @@ from .user_migration import (
     save_user_id_map,
 )
 
+# Event-sourced watch profiles (see utils/watch_ledger.py)
+from .watch_ledger import WatchLedger
+
 # Define __all__ for explicit public API
 __all__ = [
     # Config
     "__version__",
     "CACHE_VERSION",
+    "SCORER_VERSION",
     "TOP_CAST_COUNT",
     "TMDB_RATE_LIMIT_DELAY",
     "DEFAULT_RATING",
@@ -501,6 +592,8 @@ __all__ = [
     "DEFAULT_LIMIT_RESULTS",
     "DEFAULT_MIN_SIMILARITY",
     "CANDIDATE_BUFFER_MULTIPLIER",
+    "BATCH_SCORING_MIN_CANDIDATES",
+    "BATCH_SCORE_TOLERANCE",
     "TOP_POOL_PERCENTAGE",
     "MEDIA_TYPE_MOVIE",
     "MEDIA_TYPE_TV",
@@ -511,7 +604,9 @@ __all__ = [
     "TIER_WILDCARD_PERCENT",
     "DEFAULT_RATING_MULTIPLIERS",
     "UPDATE_MODES",
+    "CACHE_BACKENDS",
     "check_cache_version",
+    "check_loaded_cache_version",
     "get_config_section",
     "get_tmdb_config",
     "load_config",
@@ -522,6 +617,7 @@ __all__ = [
     "get_libraries_for_media_type",
     "get_effective_arr_config",
     "get_update_mode",
+    "get_cache_backend",
     "get_negative_multiplier",
     "get_negative_signals_config",
     "PLEX_REQUEST_TIMEOUT",
@@ -618,31 +714,88 @@ __all__ = [
     "get_tmdb_keywords",
     "load_imdb_tmdb_cache",
     "save_imdb_tmdb_cache",
+    "TITLE_APPEND_TO_RESPONSE",
+    "fetch_title_record",
+    "fetch_watch_providers",
+    "title_record",
     # Cache
     "save_json_cache",
     "load_json_cache",
     "load_media_cache",
     "save_media_cache",
     "save_watched_cache",
+    "load_score_store_record",
+    "save_score_store",
+    "load_library_index",
+    "save_library_index",
+    "load_watch_ledger",
+    "save_watch_ledger",
+    "load_owned_index",
+    "save_owned_index",
     # Labels
     "build_label_name",
     "categorize_labeled_items",
     "remove_labels_from_items",
     "add_labels_to_items",
+    "bulk_edit_labels",
+    "LabelEdit",
     # Scoring
     "GENRE_NORMALIZATION",
     "normalize_genre",
     "normalize_user_profile",
     "fuzzy_keyword_match",
+    "FuzzyKeywordIndex",
     "calculate_recency_multiplier",
     "calculate_rewatch_multiplier",
     "calculate_similarity_score",
+    "CompiledProfile",
+    "compile_profile",
+    "ScoringOptions",
     "select_tiered_recommendations",
+    "recommendation_rank_key",
+    "iter_ranked_recommendations",
+    # Batch scoring
+    "BatchCorpus",
+    "batch_scoring_available",
+    "batch_similarity_scores",
+    # Delta rescoring
+    "TermIndex",
+    "changed_terms",
+    "content_terms",
+    "profile_signature",
+    "profile_snapshot",
     # Corpus IDF
     "build_corpus_idf",
     "build_document_frequency",
+    "corpus_idf_from_frequency",
     "describe_least_informative",
     "idf_weight",
+    # Library index
+    "LibraryIndex",
+    "library_content_version",
+    # Watch ledger
+    "WatchLedger",
+    # Owned-title index
+    "OwnedIndex",
+    "owned_library_index",
+    # Pooled HTTP sessions
+    "PooledHTTPClient",
+    "SessionRegistry",
+    "http_client",
+    # Rate limits and concurrent TMDB batches
+    "AdaptiveRateLimiter",
+    "TokenBucket",
+    "fetch_concurrently",
+    "service_rate_limiter",
+    "tmdb_rate_limiter",
+    "TMDBResponseCache",
+    "tmdb_response_cache",
+    "SingleFlight",
+    "service_single_flight",
+    "tmdb_single_flight",
+    # Media cache store
+    "MediaCacheStore",
+    "import_json_media_cache",
     # Ignored-recommendation negative feedback
     "apply_ignored_penalties",
     "find_ignored_recommendations",
@@ -666,6 +819,7 @@ __all__ = [
     "SupplyGap",
     "assess_pool_health",
     "find_supply_gaps",
+    "find_supply_gaps_in",
     "format_health_report",
     "gaps_to_dict",
     "prioritize_discovery_genres",
@@ -715,10 +869,23 @@ __all__ = [
     "get_plex_account_ids",
     "get_watched_movie_count",
     "get_watched_show_count",
+    "fetch_plex_history",
+    "plex_max_workers",
+    "fetch_plex_items",
+    "load_full_plex_items",
+    "LibraryItem",
+    "LibraryGuid",
+    "LibraryTag",
+    "iter_library_snapshot",
+    "read_library_snapshot",
+    "library_section_size",
+    "plex_metadata_digest",
+    "updated_at_epoch",
     "fetch_plex_watch_history_movies",
     "fetch_plex_watch_history_shows",
     "fetch_watch_history_with_tmdb",
     "update_plex_collection",
+    "plan_collection_moves",
     "remove_owned_collection",
     "cleanup_old_collections",
     "cleanup_legacy_unnamed_collection",
@@ -756,6 +923,7 @@ __all__ = [
     "get_library_imdb_ids_from_items",
     "get_plex_user_ids",
     "fetch_show_completion_data",
+    "watched_episodes_by_show",
     "identify_dropped_shows",
     # User migration (stable Plex id -> username)
     "USER_ID_MAP_FILENAME",
@@ -828,6 +996,9 @@ __all__ = [
     "record_api_call",
     "track_api_call",
     "record_cache_lookup",
+    "record_rate_limit",
+    "record_tmdb_cache_lookups",
+    "record_single_flight_requests",
     "record_self_update_attempt",
     "record_unhandled_error",
     "render_prometheus_text",
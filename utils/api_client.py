@@ -17,6 +17,17 @@
 """
 Base API client for Curatarr external service integrations.
 Provides common functionality for rate limiting, request handling, and error parsing.
+
+Rate limiting is adaptive and per service (utils/rate_limit.py): every
+client of one api_name shares a single limiter that starts at
+1 / rate_limit_delay requests per second, climbs towards
+max_requests_per_second while responses are healthy, and backs off on a
+429/503 - pausing for the server's Retry-After when it gives one.
+
+A client with coalesce_requests set also shares the service's
+SingleFlight (utils/single_flight.py): a GET identical - URL, params and
+headers, so never across two users' tokens - to one already in flight
+waits for that response instead of being sent again.
 """
 
 import logging
@@ -28,7 +39,10 @@ import requests
 
 from .display import log_error
 from .helpers import read_response_capped
+from .http_session import http_client
 from .metrics import record_api_call
+from .rate_limit import service_rate_limiter
+from .single_flight import service_single_flight
 
 logger = logging.getLogger("curatarr")
 
@@ -57,6 +71,13 @@ class BaseAPIClient:
     rate_limit_delay: float = 0.1
     request_timeout: int = 30
 
+    # Ceiling (requests/second) the service's adaptive limiter may climb
+    # to while responses stay healthy. None keeps it at the starting
+    # 1 / rate_limit_delay - it still backs off on a 429/503. Only set
+    # for the rate-limited cloud APIs (Trakt/Simkl/MDBList), not the
+    # user's own Radarr/Sonarr/Tautulli.
+    max_requests_per_second: Optional[float] = None
+
     # Bounds a 429 (rate-limited) retry loop in _send_with_retries.
     # 0 (default) preserves every existing subclass's behavior exactly
     # (Radarr/Sonarr/Tautulli/MDBList never retried a 429, and don't
@@ -66,23 +87,28 @@ class BaseAPIClient:
     # local network services) set this explicitly.
     max_429_retries: int = 0
 
-    # Ceiling on how long a single 429 retry will ever sleep for,
+    # Ceiling on how long a single 429 will ever pause this service for,
     # regardless of what the server's Retry-After header asks for -
     # that header is server-controlled input, and a compromised/
     # misbehaving endpoint could otherwise stall this process for an
     # arbitrary/huge amount of time.
     max_retry_after_seconds: int = 60
 
+    # Coalesce concurrent identical GETs in _send_with_retries onto one
+    # request (see utils/single_flight.py). Off by default; set by the
+    # read-heavy cloud clients whose lookups repeat across users (Trakt).
+    coalesce_requests: bool = False
+
     def __init__(self):
         """Initialize base client state."""
-        self._last_request_time = 0
+        self.rate_limiter = service_rate_limiter(
+            self.api_name.lower(), 1.0 / self.rate_limit_delay, self.max_requests_per_second
+        )
+        self.single_flight = service_single_flight(self.api_name.lower()) if self.coalesce_requests else None
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        """Wait for this service's shared limiter before a request."""
+        self.rate_limiter.acquire()
 
     def _send_with_retries(
         self,
@@ -93,8 +119,9 @@ class BaseAPIClient:
         headers: Optional[Dict] = None,
     ) -> requests.Response:
         """Issue a rate-limited request with a bounded 429 (rate
-        limited) retry loop, honoring the server's Retry-After header
-        (capped at max_retry_after_seconds).
+        limited) retry loop. The limiter pauses for the server's
+        Retry-After header (capped at max_retry_after_seconds) before the
+        retry is sent.
 
         Returns the raw response whatever its status code - unlike
         _make_request_to_url this never raises on a 4xx/5xx and never
@@ -105,11 +132,31 @@ class BaseAPIClient:
         prevent) can do so itself. Callers that just want the shared
         error-handling pipeline should use _make_request_to_url
         instead - this only owns the rate-limit/429-retry loop.
+
+        With coalesce_requests set, a GET identical to one already in
+        flight gets that one's response object (callers only read it).
         """
+        if self.single_flight is not None and method.upper() == "GET":
+            key = (
+                url,
+                tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+                tuple(sorted((headers or {}).items())),
+            )
+            return self.single_flight.do(key, lambda: self._send_with_429_retries(method, url, data, params, headers))
+        return self._send_with_429_retries(method, url, data, params, headers)
+
+    def _send_with_429_retries(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict],
+        params: Optional[Dict],
+        headers: Optional[Dict],
+    ) -> requests.Response:
         response = None
         for attempt in range(self.max_429_retries + 1):
             self._rate_limit()
-            response = requests.request(
+            response = http_client.request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -118,18 +165,16 @@ class BaseAPIClient:
                 timeout=self.request_timeout,
                 allow_redirects=False,
             )
+            retry_after = self.rate_limiter.observe(
+                response.status_code, response.headers, max_pause=self.max_retry_after_seconds
+            )
 
             if response.status_code != 429 or attempt == self.max_429_retries:
                 break
 
-            retry_after = min(
-                int(response.headers.get("Retry-After", 1)),
-                self.max_retry_after_seconds,
-            )
             logger.warning(
-                f"{self.api_name} rate limited, waiting {retry_after}s (retry {attempt + 1}/{self.max_429_retries})"
+                f"{self.api_name} rate limited, waiting {retry_after:g}s (retry {attempt + 1}/{self.max_429_retries})"
             )
-            time.sleep(retry_after)
         # range(self.max_429_retries + 1) always executes at least once
         # (max_429_retries is never negative), so response is always
         # assigned by the time we get here.
@@ -254,7 +299,7 @@ class BaseAPIClient:
                     f"with credentials."
                 )
                 break
-            response = requests.request(
+            response = http_client.request(
                 method=method,
                 url=next_url,
                 headers=headers,
@@ -314,7 +359,7 @@ class BaseAPIClient:
         request_start = time.time()
         outcome = "error"
         try:
-            response = requests.request(
+            response = http_client.request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -336,6 +381,7 @@ class BaseAPIClient:
                 stream=True,
             )
             response = self._follow_same_host_redirect(method, response, headers, data, params)
+            self.rate_limiter.observe(response.status_code, response.headers, max_pause=self.max_retry_after_seconds)
             try:
                 read_response_capped(response)
             except ValueError as e:
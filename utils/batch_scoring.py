@@ -0,0 +1,474 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Vectorized batch scoring for large candidate sets.
+
+calculate_similarity_score() (utils/scoring.py) scores one item at a time,
+and every per-term lookup it does - "how much does this user like the
+genre Thriller?" - is repeated for every item carrying that term. On an
+18k-title library the distinct terms number in the low thousands while
+term *occurrences* run to the hundreds of thousands.
+
+This module inverts that. Every distinct genre/director/studio/actor/
+language/keyword string in the candidate set is interned into an integer
+term ID, each item becomes a sparse CSR row of those IDs, and the profile
+is evaluated once per distinct term. The per-item component sums, TF-IDF
+penalties, corpus IDF, active-weight redistribution and popularity
+dampening are then a handful of NumPy array operations over the whole
+set.
+
+It is a second implementation of the same formula, not a new one. The
+per-term arithmetic is shared with the _score_*_component() helpers op for
+op, each row's terms are summed in the order calculate_similarity_score()
+sums them (np.bincount accumulates in input order; genres are read back
+through set() exactly as the scalar path does), and the few steps where
+NumPy and the math module can disagree - 3-decimal rounding before
+redistribution, log10 in popularity dampening - are resolved the Python
+way. The contract callers rely on is agreement to within
+BATCH_SCORE_TOLERANCE (utils/config.py) per item; tests/test_batch_scoring.py
+pins it against the tests/harness.py fixtures. Scores only: breakdowns
+stay with calculate_similarity_score(), which callers run for the handful
+of items they actually display.
+
+NumPy is pinned in requirements.txt, so the lock, the Docker image and
+the release binaries all carry it, but it is still imported behind a
+guard: without it batch_scoring_available() is False and callers keep
+scoring one item at a time.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .config import (
+    MAX_REDISTRIBUTION_MULTIPLIER,
+    POPULARITY_DAMPENING_CAP,
+    POPULARITY_DAMPENING_FACTOR,
+    TFIDF_GENRE_PENALTY,
+    TFIDF_KEYWORD_PENALTY,
+    UNSEEN_GENRE_PENALTY,
+    UNSEEN_KEYWORD_PENALTY,
+)
+from .corpus_idf import idf_weight
+from .scoring import (
+    DEFAULT_SCORING_WEIGHTS,
+    CompiledProfile,
+    ScoringOptions,
+    compile_profile,
+    fuzzy_keyword_match,
+    normalize_genre,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via batch_scoring_available()
+    np = None  # type: ignore[assignment]
+
+# Component order matters: calculate_similarity_score() adds the
+# components (and later their redistribution extras) in exactly this
+# order, and float addition is not associative.
+COMPONENTS = ("genre", "director", "studio", "actor", "language", "keyword")
+
+
+def batch_scoring_available() -> bool:
+    """True when NumPy is importable and the batch path can run."""
+    return np is not None
+
+
+@dataclass
+class TermRows:
+    """
+    One dimension of a BatchCorpus, as CSR rows of interned term IDs.
+
+    Row i's term IDs are indices[indptr[i]:indptr[i + 1]]; `terms[id]` is
+    the original string. Duplicates within a row are kept for the
+    list-valued dimensions (a director listed twice counts twice in
+    calculate_similarity_score() too) and dropped for genres, which it
+    reads through set() - in set() iteration order, for the same reason.
+    """
+
+    terms: List[Any]
+    indptr: Any
+    indices: Any
+
+    @property
+    def row_ids(self):
+        """The row index of every entry in `indices` (CSR -> COO)."""
+        return np.repeat(np.arange(len(self.indptr) - 1), np.diff(self.indptr))
+
+    @property
+    def row_lengths(self):
+        return np.diff(self.indptr)
+
+
+def intern_rows(rows: Iterable[Sequence[Hashable]]) -> TermRows:
+    """Intern every row's terms into integer IDs and pack them as CSR."""
+    term_ids: Dict[Hashable, int] = {}
+    terms: List[Any] = []
+    indptr = [0]
+    indices: List[int] = []
+    for row in rows:
+        for term in row:
+            term_id = term_ids.get(term)
+            if term_id is None:
+                term_id = len(terms)
+                term_ids[term] = term_id
+                terms.append(term)
+            indices.append(term_id)
+        indptr.append(len(indices))
+    return TermRows(terms=terms, indptr=np.asarray(indptr, dtype=np.int64), indices=np.asarray(indices, dtype=np.int64))
+
+
+def _studios_to_check(content_studio) -> List:
+    """_score_studio_component()'s reading of a studio field."""
+    if isinstance(content_studio, str):
+        return [content_studio] if content_studio and content_studio != "N/A" else []
+    return list(content_studio or [])
+
+
+@dataclass
+class BatchCorpus:
+    """
+    A candidate set interned for batch scoring.
+
+    Built from the same `content_info` dicts calculate_similarity_score()
+    takes (see BaseRecommender._scoring_content_info), so both paths read
+    identical inputs. The corpus is profile-independent: build it once and
+    score any number of profiles against it.
+    """
+
+    media_type: str
+    size: int
+    genres: TermRows
+    directors: TermRows
+    studios: TermRows
+    actors: TermRows
+    languages: TermRows
+    keywords: TermRows
+    # Per-component "item carries any data" masks - see
+    # _apply_active_weight_redistribution()'s docstring for why absent
+    # and zero-scoring are different things.
+    has_data: Dict[str, Any]
+    vote_counts: Any
+
+    @classmethod
+    def from_content_infos(cls, contents: Sequence[Mapping], media_type: str = "movie") -> "BatchCorpus":
+        genres_rows = []
+        director_rows = []
+        studio_rows = []
+        actor_rows = []
+        language_rows = []
+        keyword_rows = []
+        has_data: Dict[str, List[bool]] = {comp: [] for comp in COMPONENTS}
+        vote_counts = []
+
+        for content in contents:
+            # set(), not a first-occurrence dedupe: its iteration order is
+            # the order calculate_similarity_score() sums genre scores in.
+            genres = list(set(content.get("genres", [])))
+            directors = list(content.get("directors", [])) if media_type == "movie" else []
+            raw_studio: Any = content.get("studio", content.get("studios", [])) if media_type == "tv" else []
+            cast = list(content.get("cast", []))
+            language = content.get("language", "N/A")
+            keywords = list(content.get("keywords", []))
+
+            genres_rows.append(genres)
+            director_rows.append(directors)
+            studio_rows.append(_studios_to_check(raw_studio))
+            actor_rows.append(cast)
+            language_rows.append([language.lower()] if language and language != "N/A" else [])
+            keyword_rows.append(keywords)
+
+            has_data["genre"].append(bool(genres))
+            has_data["director"].append(bool(directors))
+            # bool() of the raw field, not of the studios actually
+            # checked - calculate_similarity_score() treats a literal
+            # "N/A" as present data, and parity means matching that.
+            has_data["studio"].append(bool(raw_studio))
+            has_data["actor"].append(bool(cast))
+            has_data["language"].append(bool(language) and language != "N/A")
+            has_data["keyword"].append(bool(keywords))
+            vote_counts.append(content.get("vote_count", 0) or 0)
+
+        return cls(
+            media_type=media_type,
+            size=len(contents),
+            genres=intern_rows(genres_rows),
+            directors=intern_rows(director_rows),
+            studios=intern_rows(studio_rows),
+            actors=intern_rows(actor_rows),
+            languages=intern_rows(language_rows),
+            keywords=intern_rows(keyword_rows),
+            has_data={comp: np.asarray(mask, dtype=bool) for comp, mask in has_data.items()},
+            vote_counts=np.asarray(vote_counts, dtype=np.float64),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Per-term evaluation. Each of these mirrors the loop body of the matching
+# _score_*_component() in utils/scoring.py for a single term, returning
+# (positive_contribution, penalty, counts_as_positive).
+# ---------------------------------------------------------------------------
+TermValue = Tuple[float, float, bool]
+
+
+def _normalized(count: float, max_count: float, options: ScoringOptions) -> float:
+    if options.normalize_counters:
+        return math.sqrt(count / max_count)
+    return min(count / max_count, 1.0)
+
+
+def _genre_term(genre, profile: CompiledProfile, threshold: float, options: ScoringOptions) -> TermValue:
+    norm_genre = normalize_genre(genre)
+    max_genre_count = profile.max_genre_count
+    count = profile.normalized_user_genres.get(norm_genre, 0)
+    if count == 0:
+        count = profile.prefs["genres"].get(genre, 0)
+    if count > 0:
+        if options.use_tfidf and count < threshold:
+            return 0.0, (1 - (count / threshold)) * TFIDF_GENRE_PENALTY, False
+        score = _normalized(count, max_genre_count, options) * idf_weight(norm_genre, options.genre_idf)
+        return score, 0.0, True
+    if count < 0:
+        return 0.0, abs(count) / max_genre_count * 0.5, False
+    if options.use_tfidf:
+        return 0.0, UNSEEN_GENRE_PENALTY, False
+    return 0.0, 0.0, False
+
+
+def _person_term(key: str, name, profile: CompiledProfile, options: ScoringOptions) -> TermValue:
+    """Directors and actors: exact lookup first, then case-insensitive."""
+    max_count = profile.max_counts[key]
+    count = profile.prefs[key].get(name, 0)
+    if count == 0:
+        count = profile.prefs[f"{key}_lower"].get(name.lower() if isinstance(name, str) else name, 0)
+    if count > 0:
+        return _normalized(count, max_count, options), 0.0, True
+    if count < 0:
+        return 0.0, abs(count) / max_count * 0.5, False
+    return 0.0, 0.0, False
+
+
+def _studio_term(studio, profile: CompiledProfile, options: ScoringOptions) -> TermValue:
+    """Studios: case-insensitive lookup first, then exact - the reverse of _person_term."""
+    studios = profile.prefs["studios"]
+    max_count = profile.max_counts["studios"]
+    count = studios.get(studio.lower() if isinstance(studio, str) else studio, 0)
+    if count == 0:
+        count = studios.get(studio, 0)
+    if count > 0:
+        return _normalized(count, max_count, options), 0.0, True
+    if count < 0:
+        return 0.0, abs(count) / max_count * 0.5, False
+    return 0.0, 0.0, False
+
+
+def _language_term(language_lower, profile: CompiledProfile, options: ScoringOptions) -> TermValue:
+    count = profile.prefs["languages"].get(language_lower, 0)
+    if count <= 0:
+        return 0.0, 0.0, False
+    return _normalized(count, profile.max_counts["languages"], options), 0.0, True
+
+
+def _keyword_term(keyword, profile: CompiledProfile, threshold: float, options: ScoringOptions) -> TermValue:
+    keyword_lower = keyword.lower() if isinstance(keyword, str) else keyword
+    keywords_lower = profile.prefs["keywords_lower"]
+    max_count = profile.max_counts["keywords"]
+    count = profile.prefs["keywords"].get(keyword, 0)
+    if count == 0:
+        count = keywords_lower.get(keyword_lower, 0)
+    if count == 0 and options.use_fuzzy_keywords:
+        count, _matched = fuzzy_keyword_match(
+            keyword, keywords_lower, profile.prefs.get("_fuzzy_cache"), profile.prefs.get("_fuzzy_index")
+        )
+    if count > 0:
+        if options.use_tfidf and count < threshold:
+            return 0.0, (1 - (count / threshold)) * TFIDF_KEYWORD_PENALTY, False
+        score = _normalized(count, max_count, options) * idf_weight(keyword_lower, options.keyword_idf)
+        return score, 0.0, True
+    if count < 0:
+        return 0.0, abs(count) / max_count * 0.5, False
+    if options.use_tfidf:
+        return 0.0, UNSEEN_KEYWORD_PENALTY, False
+    return 0.0, 0.0, False
+
+
+def _row_totals(rows: TermRows, evaluate: Callable[[Any], TermValue], size: int):
+    """
+    Evaluate every distinct term once, then gather-and-sum per row.
+
+    Returns (positive_sum, penalty_sum, positive_count) arrays of length
+    `size`.
+    """
+    if not rows.terms:
+        zeros = np.zeros(size, dtype=np.float64)
+        return zeros, zeros.copy(), zeros.copy()
+    values = np.array([evaluate(term) for term in rows.terms], dtype=np.float64).reshape(-1, 3)
+    row_ids = rows.row_ids
+    gathered = values[rows.indices]
+    positive = np.bincount(row_ids, weights=gathered[:, 0], minlength=size)
+    penalty = np.bincount(row_ids, weights=gathered[:, 1], minlength=size)
+    positive_count = np.bincount(row_ids, weights=gathered[:, 2], minlength=size)
+    return positive, penalty, positive_count
+
+
+def _ratio_final(positive, penalty, weight: float):
+    """Sum-based dimensions (genre, actor, keyword): 1 - 1/(1 + sum)."""
+    ratio = 1 - (1 / (1 + positive))
+    return np.maximum(0, ratio - penalty) * weight
+
+
+def _average_final(positive, penalty, positive_count, weight: float):
+    """Average-based dimensions (director, studio)."""
+    average = np.divide(positive, positive_count, out=np.zeros_like(positive), where=positive_count > 0)
+    return np.maximum(0, average - penalty) * weight
+
+
+def batch_similarity_scores(
+    corpus: BatchCorpus,
+    user_profile: Any,
+    weights: Optional[Dict] = None,
+    options: Optional[ScoringOptions] = None,
+):
+    """
+    Score every item in `corpus` against `user_profile` at once.
+
+    The batch counterpart of calculate_similarity_score(): same inputs
+    (profile dict or CompiledProfile, weights, ScoringOptions), same
+    result per item to within BATCH_SCORE_TOLERANCE, no breakdowns.
+
+    Returns:
+        float64 array of scores, one per corpus row, in corpus order.
+    """
+    if np is None:
+        raise RuntimeError("batch scoring requires NumPy")
+
+    options = options or ScoringOptions()
+    size = corpus.size
+    if not user_profile or size == 0:
+        return np.zeros(size, dtype=np.float64)
+
+    profile = compile_profile(user_profile)
+    media_type = corpus.media_type
+    effective_weights = profile.effective_weights(weights or DEFAULT_SCORING_WEIGHTS, media_type)
+    genre_threshold = profile.tfidf_threshold("genres", profile.max_genre_count, options)
+    keyword_threshold = profile.tfidf_threshold("keywords", profile.max_counts["keywords"], options)
+
+    finals: Dict[str, Any] = {}
+
+    positive, penalty, _count = _row_totals(
+        corpus.genres, lambda t: _genre_term(t, profile, genre_threshold, options), size
+    )
+    finals["genre"] = _ratio_final(positive, penalty, effective_weights.get("genre", 0.20))
+
+    finals["director"] = np.zeros(size, dtype=np.float64)
+    if media_type == "movie":
+        positive, penalty, count = _row_totals(
+            corpus.directors, lambda t: _person_term("directors", t, profile, options), size
+        )
+        finals["director"] = _average_final(positive, penalty, count, effective_weights.get("director", 0.15))
+
+    finals["studio"] = np.zeros(size, dtype=np.float64)
+    if media_type == "tv":
+        positive, penalty, count = _row_totals(corpus.studios, lambda t: _studio_term(t, profile, options), size)
+        finals["studio"] = _average_final(positive, penalty, count, effective_weights.get("studio", 0.15))
+
+    positive, penalty, _count = _row_totals(corpus.actors, lambda t: _person_term("actors", t, profile, options), size)
+    finals["actor"] = _ratio_final(positive, penalty, effective_weights.get("actor", 0.15))
+
+    positive, _penalty, _count = _row_totals(corpus.languages, lambda t: _language_term(t, profile, options), size)
+    finals["language"] = positive * effective_weights.get("language", 0.05)
+
+    positive, penalty, _count = _row_totals(
+        corpus.keywords, lambda t: _keyword_term(t, profile, keyword_threshold, options), size
+    )
+    finals["keyword"] = _ratio_final(positive, penalty, effective_weights.get("keyword", 0.45))
+
+    score = np.zeros(size, dtype=np.float64)
+    for comp in COMPONENTS:
+        score = score + finals[comp]
+
+    score = _redistribute(score, finals, corpus.has_data, effective_weights)
+    score = np.minimum(score, 1.0)
+    return _dampen(score, corpus.vote_counts, options)
+
+
+def _round3(values):
+    """
+    round(x, 3) for an array, with Python's rounding.
+
+    np.round() scales, rounds half-to-even and scales back, so a value
+    sitting within a few ULPs of a .0005 boundary can land on the other
+    side of it from round(). Those few are re-rounded in Python; a
+    component that flips there moves the item's redistribution share by
+    a whole 0.001 of weight, far outside BATCH_SCORE_TOLERANCE.
+    """
+    rounded = np.round(values, 3)
+    scaled = values * 1000.0
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_half):
+        rounded[i] = round(float(values[i]), 3)
+    return rounded
+
+
+def _redistribute(score, finals: Dict[str, Any], has_data: Dict[str, Any], effective_weights: Mapping):
+    """Array form of utils.scoring._apply_active_weight_redistribution()."""
+    size = len(score)
+    rounded = {comp: _round3(finals[comp]) for comp in COMPONENTS}
+    lost = np.zeros(size, dtype=np.float64)
+    active_weight = np.zeros(size, dtype=np.float64)
+    active: Dict[str, Any] = {}
+    for comp in COMPONENTS:
+        weight = effective_weights.get(comp, 0)
+        if weight <= 0:
+            continue
+        active[comp] = rounded[comp] > 0
+        active_weight = active_weight + np.where(active[comp], weight, 0.0)
+        lost = lost + np.where(~active[comp] & ~has_data[comp], weight, 0.0)
+
+    applies = (lost > 0) & (active_weight > 0)
+    if not applies.any():
+        return score
+
+    safe_active = np.where(applies, active_weight, 1.0)
+    multiplier = (safe_active + lost) / safe_active
+    lost = np.where(
+        multiplier > MAX_REDISTRIBUTION_MULTIPLIER, (MAX_REDISTRIBUTION_MULTIPLIER - 1.0) * safe_active, lost
+    )
+    for comp, is_active in active.items():
+        weight = effective_weights.get(comp, 0)
+        extra = (lost * (weight / safe_active)) * (rounded[comp] / weight)
+        score = score + np.where(applies & is_active, extra, 0.0)
+    return score
+
+
+def _dampen(score, vote_counts, options: ScoringOptions):
+    """Array form of utils.scoring._apply_popularity_dampening()."""
+    if not options.use_popularity_dampening:
+        return score
+    threshold = options.popularity_threshold
+    over = vote_counts > threshold
+    if not over.any():
+        return score
+    # Per item in Python: only the blockbuster tail is over threshold,
+    # and math.log10 is what the scalar path calls.
+    dampened = score.copy()
+    for i in np.flatnonzero(over):
+        excess_ratio = float(vote_counts[i]) / threshold
+        dampening = max(POPULARITY_DAMPENING_CAP, 1 - (math.log10(excess_ratio) * POPULARITY_DAMPENING_FACTOR))
+        dampened[i] = score[i] * dampening
+    return dampened
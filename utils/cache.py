@@ -27,7 +27,7 @@ import tempfile
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from .config import CACHE_VERSION, check_cache_version
+from .config import CACHE_VERSION, SCORER_VERSION, check_loaded_cache_version
 from .display import log_warning
 from .metrics import record_cache_lookup
 
@@ -99,6 +99,15 @@ def load_json_cache(cache_path: str) -> Optional[Dict]:
         return None
 
 
+def _empty_media_cache(media_key: str) -> Dict[str, Any]:
+    return {
+        media_key: {},
+        "last_updated": None,
+        "library_count": 0,
+        "cache_version": CACHE_VERSION,
+    }
+
+
 def load_media_cache(cache_path: str, media_key: str = "movies") -> Dict:
     """
     Load media cache from file with version checking.
@@ -110,29 +119,26 @@ def load_media_cache(cache_path: str, media_key: str = "movies") -> Dict:
     Returns:
         Cache dictionary with media items, or empty structure if invalid/missing
     """
-    empty_cache: Dict[str, Any] = {
-        media_key: {},
-        "last_updated": None,
-        "library_count": 0,
-        "cache_version": CACHE_VERSION,
-    }
+    empty_cache = _empty_media_cache(media_key)
 
-    if not check_cache_version(cache_path, f"{media_key.title()} cache"):
+    if not os.path.exists(cache_path):
         record_cache_lookup("miss")
         return empty_cache
 
-    if os.path.exists(cache_path):
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            record_cache_lookup("hit")
-            return data
-        except Exception as e:
-            log_warning(f"Error loading {media_key} cache: {e}")
+    # Parsed once and version-checked in memory: this file is the whole
+    # library, and check_cache_version() would parse it a second time.
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not check_loaded_cache_version(data, cache_path, f"{media_key.title()} cache"):
             record_cache_lookup("miss")
             return empty_cache
-    record_cache_lookup("miss")
-    return empty_cache
+        record_cache_lookup("hit")
+        return data
+    except Exception as e:
+        log_warning(f"Error loading {media_key} cache: {e}")
+        record_cache_lookup("miss")
+        return empty_cache
 
 
 def save_media_cache(cache_path: str, cache_data: Dict, media_key: str = "movies") -> bool:
@@ -210,3 +216,170 @@ def save_watched_cache(
     except Exception as e:
         logging.error(f"Error saving watched cache: {e}")
         return False
+
+
+def load_score_store_record(cache_path: str, scorer_version: int = SCORER_VERSION) -> Dict[str, Any]:
+    """
+    Load a per-user score store whole - scores (ratingKey -> similarity
+    score) plus the profile_hash, profile snapshot and signature they
+    were saved under - whatever profile it was written for.
+
+    Which of its scores still hold is the caller's to decide (see
+    BaseRecommender._reusable_scores and utils/delta_scoring.py). A store
+    written by a different scorer is discarded whole.
+
+    Returns:
+        The store's dict, empty if missing, invalid or from another scorer
+    """
+    data = load_json_cache(cache_path)
+    if not isinstance(data, dict) or data.get("scorer_version") != scorer_version:
+        return {}
+    if not isinstance(data.get("scores"), dict):
+        return {}
+    return data
+
+
+def save_score_store(
+    cache_path: str,
+    profile_hash: str,
+    scores: Dict[str, float],
+    scorer_version: int = SCORER_VERSION,
+    profile: Optional[Dict] = None,
+    signature: Optional[str] = None,
+    entry_versions: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Save a per-user score store (see load_score_store_record).
+
+    Written compact rather than indented: it holds one number per library
+    item and nobody reads it by hand. `profile` and `signature` are the
+    delta rescoring snapshot (utils/delta_scoring.py's profile_snapshot
+    and profile_signature) the next run diffs its own profile against;
+    `entry_versions` (ratingKey -> version) identifies the media cache
+    entry each score was computed from.
+
+    Returns:
+        True on success, False on failure
+    """
+    try:
+        data = {
+            "scorer_version": scorer_version,
+            "profile_hash": profile_hash,
+            "last_updated": datetime.now().isoformat(),
+            "scores": scores,
+        }
+        if profile is not None:
+            data["profile"] = profile
+        if signature is not None:
+            data["signature"] = signature
+        if entry_versions is not None:
+            data["entry_versions"] = entry_versions
+        _atomic_write_json(cache_path, data, separators=(",", ":"))
+        return True
+    except Exception as e:
+        logging.error(f"Error saving score store to {cache_path}: {e}")
+        return False
+
+
+def load_library_index(cache_path: str, content_version: str) -> Dict[str, Any]:
+    """
+    Load a library index (utils/library_index.py) saved for the media
+    cache contents stamped `content_version`.
+
+    An index saved for any other contents is discarded whole - the
+    caller rebuilds it from the media cache in one pass.
+
+    Returns:
+        The stored index dict, empty if missing, invalid or stale
+    """
+    data = load_json_cache(cache_path)
+    if not isinstance(data, dict) or data.get("content_version") != content_version:
+        return {}
+    index = data.get("index")
+    return index if isinstance(index, dict) else {}
+
+
+def save_library_index(cache_path: str, content_version: str, index: Dict[str, Any]) -> bool:
+    """
+    Save a library index (see load_library_index), stamped with the
+    media cache contents it was built from.
+
+    Written compact, like the score store: it is derived data nobody
+    reads by hand.
+
+    Returns:
+        True on success, False on failure
+    """
+    try:
+        data = {
+            "content_version": content_version,
+            "last_updated": datetime.now().isoformat(),
+            "index": index,
+        }
+        _atomic_write_json(cache_path, data, separators=(",", ":"))
+        return True
+    except Exception as e:
+        logging.error(f"Error saving library index to {cache_path}: {e}")
+        return False
+
+
+def load_owned_index(cache_path: str) -> Dict[str, Any]:
+    """
+    Load a section's owned-title index (utils/owned_index.py).
+
+    Returns:
+        The stored index dict, empty if missing or invalid
+    """
+    data = load_json_cache(cache_path)
+    return data if isinstance(data, dict) else {}
+
+
+def save_owned_index(cache_path: str, index: Dict[str, Any]) -> bool:
+    """
+    Save a section's owned-title index (see load_owned_index).
+
+    Written compact, like the watch ledger: one entry per library item,
+    read back only by OwnedIndex.from_dict.
+
+    Returns:
+        True on success, False on failure
+    """
+    try:
+        data = dict(index)
+        data["last_updated"] = datetime.now().isoformat()
+        _atomic_write_json(cache_path, data, separators=(",", ":"))
+        return True
+    except Exception as e:
+        logging.error(f"Error saving owned index to {cache_path}: {e}")
+        return False
+
+
+def load_watch_ledger(cache_path: str) -> Dict[str, Any]:
+    """
+    Load a per-user watch ledger (utils/watch_ledger.py).
+
+    Returns:
+        The stored ledger dict, empty if missing or invalid
+    """
+    data = load_json_cache(cache_path)
+    return data if isinstance(data, dict) else {}
+
+
+def save_watch_ledger(cache_path: str, ledger: Dict[str, Any]) -> bool:
+    """
+    Save a per-user watch ledger (see load_watch_ledger).
+
+    Written compact: one entry per watched item, read back only by
+    WatchLedger.from_dict.
+
+    Returns:
+        True on success, False on failure
+    """
+    try:
+        data = dict(ledger)
+        data["last_updated"] = datetime.now().isoformat()
+        _atomic_write_json(cache_path, data, separators=(",", ":"))
+        return True
+    except Exception as e:
+        logging.error(f"Error saving watch ledger to {cache_path}: {e}")
+        return False
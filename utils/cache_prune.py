@@ -29,7 +29,7 @@ external_recs_<removed-user>_*.json for a user no longer in users.list
 at all.
 
 Deliberately conservative:
-  - Only ever considers the four exact per-user filename patterns
+  - Only ever considers the exact per-user filename patterns
     utils.user_migration's rename-migration already uses
     (CACHE_FILENAME_PATTERNS) - a file this doesn't recognize is left
     alone entirely, not even logged. This never touches
@@ -86,7 +86,7 @@ def find_orphaned_cache_files(cache_dir: str, configured_usernames: Iterable[str
     patterns (see utils.user_migration.CACHE_FILENAME_PATTERNS) whose
     embedded username isn't in configured_usernames.
 
-    A file that doesn't match one of those four exact patterns is left
+    A file that doesn't match one of those exact patterns is left
     alone entirely - not even logged - so this never flags/removes
     anything this codebase doesn't have positive evidence is a
     per-user cache file. A file whose embedded "username" is actually
@@ -51,10 +51,12 @@ watches some family content still gets family content - just at the rate
 they actually watch it, and the highest-scoring examples of it.
 """
 
+import heapq
 import math
 from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
 
 from utils.config import (
+    CALIBRATION_BOUND_WINDOW_DIVISOR,
     CALIBRATION_DIVERGENCE_SCALE,
     CALIBRATION_MIN_PROFILE_SAMPLE,
     CALIBRATION_MIN_TARGET_CATEGORIES,
@@ -224,6 +226,11 @@ def calibrate_recommendations(
     utils/config.py for why the raw Steck objective needs it to make
     `calibration_strength` behave as a plain 0.0-1.0 dial.
 
+    The KL term is not recomputed from scratch per candidate: a
+    candidate only moves the genres it carries, and candidates that
+    cannot beat the current best are never re-evaluated at all - see
+    _greedy_calibrated_selection.
+
     Note this calibrates genre MASS, not title count. An item's genre
     mass is split across the genres it carries (see
     item_genre_distribution), so a 6-genre action/adventure/comedy/
@@ -265,33 +272,8 @@ def calibrate_recommendations(
     if not target_distribution or calibration_strength <= 0 or len(ordered) <= limit:
         return ordered[:limit]
 
-    selected: List[T] = []
-    selected_genres: List[Sequence[str]] = []
-    remaining = ordered[:]
-
-    while len(selected) < limit and remaining:
-        best_index = 0
-        best_value = -math.inf
-
-        for i, candidate in enumerate(remaining):
-            trial_genres = selected_genres + [get_genres(candidate)]
-            trial_distribution = projected_distribution(
-                list_distribution(trial_genres), target_distribution, len(trial_genres), limit
-            )
-            divergence = kl_divergence(target_distribution, trial_distribution)
-            value = (1 - calibration_strength) * get_score(candidate) - (
-                calibration_strength * CALIBRATION_DIVERGENCE_SCALE * divergence
-            )
-
-            if value > best_value:
-                best_value = value
-                best_index = i
-
-        chosen = remaining.pop(best_index)
-        selected.append(chosen)
-        selected_genres.append(get_genres(chosen))
-
-    return selected
+    dimension = CalibrationDimension("genres", target_distribution, get_genres)
+    return _greedy_calibrated_selection(ordered, limit, get_score, [dimension], calibration_strength)
 
 
 def calibrate_multi(
@@ -348,31 +330,123 @@ def calibrate_multi(
         # a failure that looks exactly like success.
         return sorted(ordered, key=get_score, reverse=True)[:limit]
 
+    return _greedy_calibrated_selection(ordered, limit, get_score, active, calibration_strength)
+
+
+def _greedy_calibrated_selection(
+    candidates: Sequence[T],
+    limit: int,
+    get_score: Callable[[T], float],
+    dimensions: Sequence["CalibrationDimension"],
+    calibration_strength: float,
+) -> List[T]:
+    """
+    The greedy loop shared by calibrate_recommendations() and
+    calibrate_multi(), evaluated incrementally and lazily.
+
+    Incrementally: with k items picked and their summed item
+    distributions M (per dimension), the trial list's projected
+    distribution is (M + d) / limit + (1 - (k+1) / limit) * target, where
+    d is the candidate's own item distribution. Every candidate at a step
+    shares the same baseline (d = 0), so they differ only by how much
+    each lowers the KL divergence on the target categories it carries:
+
+        gain = sum over g in d: p(g) * log(1 + (1 - alpha) * d(g) / limit / q(g))
+
+    with q(g) the smoothed baseline. That costs O(categories of the
+    candidate), not O(categories of the list), and ranks candidates
+    exactly as the full objective does.
+
+    Lazily: picks only ever add mass, which raises q(g), and the
+    target's projected share only ever shrinks. A gain computed from
+    today's mass and the projected share a few picks ahead
+    (CALIBRATION_BOUND_WINDOW_DIVISOR) therefore bounds the candidate's
+    value at every step until then. Candidates sit in a max-heap on that
+    bound, recomputed when it expires; each step evaluates them
+    best-bound first and stops as soon as the best exact value found
+    beats every remaining bound. Ties go to the
+    earlier candidate, as in a plain scan.
+    """
+    alpha = CALIBRATION_SMOOTHING_ALPHA
+    divergence_weight = calibration_strength * CALIBRATION_DIVERGENCE_SCALE
+    masses: List[Dict[str, float]] = [{} for _ in dimensions]
+
+    # Per candidate: (dimension, category, target share, mass it adds).
+    terms: List[List[Tuple[int, str, float, float]]] = []
+    relevance: List[float] = []
+    for candidate in candidates:
+        own: List[Tuple[int, str, float, float]] = []
+        for d_i, dim in enumerate(dimensions):
+            for key, share in item_genre_distribution(dim.get_values(candidate)).items():
+                p = dim.target.get(key, 0.0)
+                if p > 0:
+                    own.append((d_i, key, p, (1 - alpha) * share / limit))
+        terms.append(own)
+        relevance.append((1 - calibration_strength) * get_score(candidate))
+
+    def value(index: int, rest: float) -> float:
+        gain = 0.0
+        for d_i, key, p, added in terms[index]:
+            baseline = (1 - alpha) * (masses[d_i].get(key, 0.0) / limit + rest * p) + alpha * p
+            gain += dimensions[d_i].weight * p * math.log1p(added / baseline)
+        return relevance[index] + divergence_weight * gain
+
+    window = max(1, limit // CALIBRATION_BOUND_WINDOW_DIVISOR)
+
+    def bound(index: int, step: int) -> Tuple[float, int]:
+        # Valid from `step` through `expiry`: the projected target share
+        # only shrinks and the picked mass only grows until then.
+        expiry = min(limit - 1, step + window - 1)
+        return value(index, 1 - (expiry + 1) / limit), expiry
+
+    # Live heap entry per unpicked candidate; anything else in the heap
+    # is superseded. `expiring` indexes them by the last step they hold for.
+    current: Dict[int, Tuple[float, int]] = {}
+    expiring: Dict[int, List[int]] = {}
+    heap: List[Tuple[float, int, int]] = []
+
+    def push(index: int, step: int) -> None:
+        upper, expiry = bound(index, step)
+        current[index] = (upper, expiry)
+        expiring.setdefault(expiry, []).append(index)
+        heapq.heappush(heap, (-upper, index, expiry))
+
+    for i in range(len(candidates)):
+        push(i, 0)
+
     selected: List[T] = []
-    selected_values: List[List[Sequence[str]]] = [[] for _ in active]
-    remaining = ordered[:]
+    while len(selected) < limit and current:
+        step = len(selected)
+        rest = 1 - (step + 1) / limit
+        for index in expiring.pop(step - 1, []):
+            if current.get(index, (None, None))[1] == step - 1:
+                push(index, step)
 
-    while len(selected) < limit and remaining:
-        best_index = 0
         best_value = -math.inf
-
-        for i, candidate in enumerate(remaining):
-            divergence = 0.0
-            for d_i, dim in enumerate(active):
-                trial = selected_values[d_i] + [dim.get_values(candidate)]
-                trial_distribution = projected_distribution(list_distribution(trial), dim.target, len(trial), limit)
-                divergence += dim.weight * kl_divergence(dim.target, trial_distribution)
-            value = (1 - calibration_strength) * get_score(candidate) - (
-                calibration_strength * CALIBRATION_DIVERGENCE_SCALE * divergence
-            )
-            if value > best_value:
-                best_value = value
-                best_index = i
-
-        chosen = remaining.pop(best_index)
-        selected.append(chosen)
-        for d_i, dim in enumerate(active):
-            selected_values[d_i].append(dim.get_values(chosen))
+        best_index = -1
+        evaluated: List[int] = []
+        while heap:
+            negated, index, expiry = heap[0]
+            if current.get(index) != (-negated, expiry):
+                heapq.heappop(heap)  # superseded or already picked
+                continue
+            if best_index >= 0 and (best_value > -negated or (best_value == -negated and best_index < index)):
+                break
+            heapq.heappop(heap)
+            del current[index]
+            evaluated.append(index)
+            exact = value(index, rest)
+            if exact > best_value or (exact == best_value and index < best_index):
+                best_value, best_index = exact, index
+
+        selected.append(candidates[best_index])
+        for d_i, dim in enumerate(dimensions):
+            mass = masses[d_i]
+            for key, share in item_genre_distribution(dim.get_values(candidates[best_index])).items():
+                mass[key] = mass.get(key, 0.0) + share
+        for index in evaluated:
+            if index != best_index:
+                push(index, step + 1)
 
     return selected
 
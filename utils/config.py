@@ -72,6 +72,15 @@ CACHE_VERSION = 9  # v9: new cache FIELD - `content_rating` per item
 # left with a half-populated/missing rating that would be misread as 0 and
 # wrongly filtered out.
 
+# Scorer version - part of every per-user score store key (utils/cache.py's
+# load_score_store_record), next to the profile_hash. Bump this, NOT
+# CACHE_VERSION, for a change to how scores are CALCULATED: v6-v8 above
+# show why the score key must cover the scoring code as well as the
+# profile, and bumping CACHE_VERSION for that also threw away every
+# item's TMDB metadata, which costs a full library re-fetch to rebuild.
+# This only invalidates scores.
+SCORER_VERSION = 1
+
 # Common constants used across recommenders
 TOP_CAST_COUNT = 3  # Number of top actors to consider
 TMDB_RATE_LIMIT_DELAY = 0.5  # Seconds between TMDB API calls
@@ -136,6 +145,26 @@ TIER_WILDCARD_PERCENT = 0.1  # 10% wildcard picks for discovery
 # they opt in.
 DEFAULT_MIN_SIMILARITY = 0.0
 
+# Event-sourced watch profiles (utils/watch_ledger.py). Each run fetches
+# only the Plex history newer than the last one folded in, minus this
+# overlap - plays synced late from an offline device can land with a
+# viewedAt slightly behind the newest one already seen. Re-reading a play
+# is harmless: the ledger keeps each item's latest viewedAt only.
+WATCH_LEDGER_OVERLAP_SECONDS = 24 * 60 * 60
+# Counters kept up to date by per-item weight deltas are rebuilt from the
+# ledger this often, so float drift from repeated add/subtract never
+# accumulates into a profile a full rebuild wouldn't produce.
+WATCH_LEDGER_REBASE_DAYS = 7
+# Incremental history can't see a play being deleted from Plex, so the
+# whole history is re-read this often regardless.
+WATCH_LEDGER_RESYNC_DAYS = 30
+
+# How long a SQLite media cache (utils/media_store.py) waits on another
+# process's write before giving up. Writes are a few rows per run, so the
+# other docker-compose service holding the lock this long means it is
+# stuck, not busy.
+MEDIA_STORE_BUSY_TIMEOUT_SECONDS = 30
+
 # Calibrated recommendations - see utils/calibration.py for the method
 # (Steck, RecSys 2018). `lambda` trades relevance against how closely the
 # collection's genre mix matches the user's actual watch history.
@@ -161,6 +190,12 @@ CALIBRATION_SMOOTHING_ALPHA = 0.01
 # 0.25/0.5/0.75 are all meaningfully different. Derived from the
 # unscaled behavior: strength 0.5 here reproduces roughly lambda=0.99.
 CALIBRATION_DIVERGENCE_SCALE = 100.0
+# Lazy greedy calibration (utils/calibration.py) ranks candidates by an
+# upper bound on their value that holds for limit / this many picks
+# before it is recomputed. Longer windows mean fewer refreshes but looser
+# bounds, since the bound must assume the target's projected share of
+# the list has already shrunk to where it is at the end of the window.
+CALIBRATION_BOUND_WINDOW_DIVISOR = 8
 # Relative weight of each calibration dimension (utils/calibration.py's
 # calibrate_multi). Genre says what a title is ABOUT; the certificate says
 # who it is FOR, and on real libraries only the certificate is reliable
@@ -243,6 +278,19 @@ MAX_REDISTRIBUTION_MULTIPLIER = 1.25
 POPULARITY_DAMPENING_FACTOR = 0.03  # ~3% penalty per order of magnitude above threshold
 POPULARITY_DAMPENING_CAP = 0.90  # Cap at 10% max penalty (minimum multiplier)
 
+# Batch scoring (utils/batch_scoring.py). Below this many cache-miss
+# candidates get_recommendations() scores item by item as before: the
+# batch path's fixed cost (interning every term, building the arrays) only
+# pays for itself once the same genres/actors/keywords recur across
+# enough items.
+BATCH_SCORING_MIN_CANDIDATES = 500
+# Largest per-item difference allowed between a batch score and
+# calculate_similarity_score()'s for the same item. The batch path
+# reproduces the scalar arithmetic op for op, so in practice the two are
+# identical; this is the contract, with room for a libm that rounds a
+# sqrt/division differently from NumPy's.
+BATCH_SCORE_TOLERANCE = 1e-9
+
 # Default rating multipliers for similarity scoring (Plex uses 0-10 scale)
 # Higher ratings = stronger signal. 5-star (10) boosted to emphasize favorites.
 DEFAULT_RATING_MULTIPLIERS = {
@@ -375,11 +423,113 @@ TMDB_REQUEST_TIMEOUT = 10
 SONARR_REQUEST_TIMEOUT = 30
 RADARR_REQUEST_TIMEOUT = 30
 
-# A handful of Plex calls (e.g. a watch-history page fetch of up to
-# 10000 items) legitimately take longer than the default request timeout
-# above - this is a deliberate, separate ceiling for just those call
-# sites, not a general Plex timeout.
-PLEX_LONG_REQUEST_TIMEOUT = 60
+# Plays per /status/sessions/history/all request (X-Plex-Container-Size).
+# History is read page by page (X-Plex-Container-Start) and parsed as it
+# streams in, so a user with a long history costs more requests, never a
+# bigger response or a truncated one; a page this size stays well within
+# PLEX_REQUEST_TIMEOUT and MAX_RESPONSE_BYTES.
+PLEX_HISTORY_PAGE_SIZE = 1000
+
+# Items per /library/sections/{id}/all request when reading a projected
+# library snapshot (utils/plex.py's read_library_snapshot). Parsed as it
+# streams in and kept only as compact records, so the page size bounds
+# request count, not memory: an 18k-item section is 9 requests.
+PLEX_SNAPSHOT_PAGE_SIZE = 2000
+
+# Owned-title index (utils/owned_index.py). Each refresh asks Plex only
+# for the items updated since the newest updatedAt already indexed, minus
+# this overlap - an item edited in the same second as the last one seen
+# would otherwise be missed. Re-reading an item is harmless.
+OWNED_INDEX_OVERLAP_SECONDS = 60
+# A refreshed index is reused for this long within one process, so a run
+# that checks the same section for every user asks Plex once.
+OWNED_INDEX_REUSE_SECONDS = 300
+# The index is rebuilt from a full listing this often regardless - a
+# re-match that changes an item's guids without bumping its updatedAt
+# would otherwise never be picked up.
+OWNED_INDEX_RESYNC_DAYS = 7
+
+# Independent per-account Plex reads (each account's watch history, each
+# user's own library snapshot) issued at once. Kept low: they all land on
+# the user's own Plex server, not a CDN-backed API. Overridden by
+# plex.max_concurrent_requests in config.yml; 1 reads one at a time.
+PLEX_MAX_WORKERS = 4
+
+# Items per /library/metadata/{k1,k2,...} request when loading many Plex
+# items in full at once (utils/plex.py's fetch_plex_items) - one request
+# per this many items instead of a fetchItem()/reload() round trip each.
+# Bounded by URL length more than by response size.
+PLEX_METADATA_BATCH_SIZE = 100
+
+# Items per multi-id label edit (PUT /library/sections/{id}/all?id=k1,k2,...)
+# in utils/labels.py's bulk_edit_labels - one request per this many items
+# labeled or unlabeled, instead of one addLabel()/removeLabel() PUT each.
+PLEX_LABEL_EDIT_BATCH_SIZE = 100
+
+# Collection.collectionSort value for "custom" (plexapi's sortUpdate map) -
+# the only sort under which utils/plex.py reorders a collection's items.
+COLLECTION_SORT_CUSTOM = 2
+
+# Connections each pooled HTTP session (utils/http_session.py) keeps open
+# to its service's host. Sized for the most requests a single run issues
+# to one service at once - calls beyond it still go out, their
+# connections just aren't kept for reuse.
+HTTP_POOL_MAXSIZE = 16
+
+# TMDB's published ceiling is about 50 requests per second per IP (it
+# answers 429 beyond that). Every request to api.themoviedb.org draws from
+# one process-wide token bucket (utils/rate_limit.py) that starts at this
+# rate - kept under the ceiling so a run rarely trips it - and adapts from
+# there up to TMDB_MAX_REQUESTS_PER_SECOND, holding at most
+# TMDB_RATE_LIMIT_BURST tokens when idle.
+TMDB_REQUESTS_PER_SECOND = 40
+TMDB_MAX_REQUESTS_PER_SECOND = 50
+TMDB_RATE_LIMIT_BURST = 20
+# Worker threads fetch_concurrently() (utils/tmdb_pool.py) runs a batch of
+# TMDB lookups on. The bucket above sets the pace; this only needs to be
+# enough to keep it busy while responses are in flight, and stays within
+# HTTP_POOL_MAXSIZE so every worker gets a kept-alive connection.
+TMDB_MAX_WORKERS = 8
+
+# Persistent TMDB response cache (utils/tmdb_cache.py). A GET to TMDB is
+# served from disk while its entry is younger than its endpoint class's
+# TTL: id mappings (/find, /external_ids, keyword/genre ids) effectively
+# never change; title details, keywords and collections change slowly;
+# watch providers, discover/search/similar listings turn over daily.
+TMDB_CACHE_TTL_IMMUTABLE_SECONDS = 90 * 24 * 3600
+TMDB_CACHE_TTL_DETAILS_SECONDS = 3 * 24 * 3600
+TMDB_CACHE_TTL_VOLATILE_SECONDS = 12 * 3600
+# Size cap on the cache database's stored bodies (compressed). Past it the
+# least recently used entries are evicted - checked every
+# TMDB_CACHE_PRUNE_EVERY stores rather than on each one.
+TMDB_CACHE_MAX_BYTES = 256 * 1024 * 1024
+TMDB_CACHE_PRUNE_EVERY = 500
+# Hit/miss counts are batched in memory and written to the metrics state
+# file every this many lookups (and at exit) - not once per request.
+TMDB_CACHE_METRIC_BATCH = 100
+
+# Leader/shared counts of coalesced in-flight requests (utils/
+# single_flight.py) are likewise written to the metrics state file every
+# this many requests per service (and at exit).
+SINGLE_FLIGHT_METRIC_BATCH = 100
+
+# Adaptive (AIMD) request rates - see utils/rate_limit.py. While a
+# service answers normally its rate climbs by RATE_LIMIT_ADDITIVE_INCREASE
+# requests/second for every second's worth of healthy responses, up to
+# that service's ceiling; a 429/503 multiplies it by
+# RATE_LIMIT_BACKOFF_FACTOR, never below RATE_LIMIT_MIN_REQUESTS_PER_SECOND.
+RATE_LIMIT_ADDITIVE_INCREASE = 1.0
+RATE_LIMIT_BACKOFF_FACTOR = 0.5
+RATE_LIMIT_MIN_REQUESTS_PER_SECOND = 0.2
+# How long a 429 without a Retry-After header pauses the service, and the
+# most any Retry-After/rate-limit-reset header can pause it for - those
+# headers are server-controlled input.
+RATE_LIMIT_DEFAULT_BACKOFF_SECONDS = 1.0
+RATE_LIMIT_MAX_PAUSE_SECONDS = 60
+# Minimum seconds between curatarr_api_rate_limit_per_second gauge
+# updates while a rate is only climbing (every backoff is recorded
+# immediately) - each update is a write to the metrics state file.
+RATE_LIMIT_METRIC_INTERVAL_SECONDS = 10
 
 # Cap on any single log file under logs/ before cleanup_old_logs() force-
 # truncates it, regardless of its mtime. Needed because an append-only log
@@ -419,19 +569,36 @@ def check_cache_version(cache_path: str, cache_type: str = "cache") -> bool:
         with open(cache_path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        cached_version = data.get("cache_version", 1)  # Default to v1 if not present
-
-        if cached_version < CACHE_VERSION:
-            print(f"\033[93m{cache_type} is outdated (v{cached_version} < v{CACHE_VERSION}), rebuilding...\033[0m")
-            os.remove(cache_path)
-            return False
-
-        return True
+        return check_loaded_cache_version(data, cache_path, cache_type)
     except Exception as e:
         print(f"\033[93mError reading {cache_type}, rebuilding: {e}\033[0m")
         return False
 
 
+def check_loaded_cache_version(data: Dict, cache_path: str, cache_type: str = "cache") -> bool:
+    """
+    check_cache_version() for a cache file the caller has already parsed,
+    so a loader doesn't read and parse the whole file twice. Deletes the
+    file when it is outdated, exactly as check_cache_version() does.
+
+    Args:
+        data: The parsed cache file contents
+        cache_path: Path the data was read from
+        cache_type: Description for logging (e.g., "movie cache", "watched cache")
+
+    Returns:
+        True if cache is valid and compatible, False if it should be rebuilt
+    """
+    cached_version = data.get("cache_version", 1)  # Default to v1 if not present
+
+    if cached_version < CACHE_VERSION:
+        print(f"\033[93m{cache_type} is outdated (v{cached_version} < v{CACHE_VERSION}), rebuilding...\033[0m")
+        os.remove(cache_path)
+        return False
+
+    return True
+
+
 def get_config_section(config: Dict, key: str, default: Optional[Dict] = None) -> Dict:
     """
     Get a config section case-insensitively.
@@ -913,6 +1080,29 @@ def get_update_mode(config: dict) -> str:
     return "notify"
 
 
+# Valid values for general.cache_backend (see get_cache_backend() below).
+CACHE_BACKENDS = ("json", "sqlite")
+
+
+def get_cache_backend(config: Optional[dict]) -> str:
+    """
+    Resolve general.cache_backend - where the library media caches
+    (all_movies_cache / all_shows_cache) live:
+      - 'json' (default): one JSON file per library, rewritten whole
+      - 'sqlite': one SQLite database per library, written row by row
+        (see utils/media_store.py); imports the JSON cache on first use
+    Anything unrecognized falls back to 'json'.
+
+    Args:
+        config: Root configuration dictionary (or a media-adapted one)
+
+    Returns:
+        One of CACHE_BACKENDS
+    """
+    backend = ((config or {}).get("general") or {}).get("cache_backend")
+    return backend if backend in CACHE_BACKENDS else "json"
+
+
 def get_rating_multipliers(config: Optional[dict] = None) -> dict:
     """
     Get rating multipliers from config or use defaults.
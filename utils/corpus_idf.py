@@ -105,12 +105,18 @@ def build_corpus_idf(items: Iterable[Mapping], field: str) -> Dict[str, float]:
     weighting" rather than as all-terms-equally-rare.
     """
     corpus = list(items)
-    total = len(corpus)
-    if total < IDF_MIN_CORPUS_SIZE:
+    if len(corpus) < IDF_MIN_CORPUS_SIZE:
         return {}
+    return corpus_idf_from_frequency(build_document_frequency(corpus, field), len(corpus))
 
-    frequency = build_document_frequency(corpus, field)
-    if not frequency:
+
+def corpus_idf_from_frequency(frequency: Mapping[str, int], total: int) -> Dict[str, float]:
+    """
+    build_corpus_idf() from document frequencies already counted over a
+    corpus of `total` items - for callers that keep the counts up to
+    date rather than recounting the corpus (utils/library_index.py).
+    """
+    if total < IDF_MIN_CORPUS_SIZE or not frequency:
         return {}
 
     scale = math.log(total)
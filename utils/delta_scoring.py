@@ -0,0 +1,194 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Delta rescoring: which stored scores does a profile change invalidate?
+
+A new watch changes the profile hash, and the per-user score store
+(utils/cache.py's load_score_store_record) used to be thrown away whole
+on any hash change - one new title meant rescoring every unwatched item
+in the library. Most of those scores can't have moved. An item's score reads
+the profile in exactly two ways:
+
+  - per term: the count of each genre/director/studio/actor/language/
+    keyword the item carries (plus, for the recommenders' bonuses, the
+    collection or production-company counts);
+  - globally: the per-dimension max counts, the TF-IDF thresholds derived
+    from them and the effective weights, which depend on which
+    dimensions are empty.
+
+profile_signature() fingerprints the global part. While it holds, only
+items carrying a term whose count changed can score differently, and
+TermIndex maps changed terms to exactly those items. Terms are keyed the
+way calculate_similarity_score() looks them up (normalize_genre() for
+genres, lower case elsewhere), and a changed keyword also reaches every
+item keyword it could fuzzy-match - one string containing the other, as
+fuzzy_keyword_match() tests. Whenever the signature moves, every score
+is stale and the caller rescores in full.
+"""
+
+import hashlib
+import json
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from .keyword_index import FuzzyKeywordIndex
+from .scoring import CompiledProfile, ScoringOptions, normalize_genre
+
+# The scoring-profile dimensions (build_profile_from_counters() keys)
+# calculate_similarity_score() reads per term.
+SCORING_DIMENSIONS = ("genres", "directors", "studios", "actors", "languages", "keywords")
+
+
+def term_key(dimension: str, term: Any) -> str:
+    """`term` as calculate_similarity_score() matches it in `dimension`."""
+    if not isinstance(term, str):
+        return str(term)
+    if dimension == "genres":
+        return normalize_genre(term)
+    return term.lower()
+
+
+def content_terms(content_info: Mapping, media_type: str) -> Dict[str, List[Any]]:
+    """
+    The raw terms per dimension calculate_similarity_score() would look up
+    for `content_info` - the same field reads and media-type gating.
+    """
+    terms: Dict[str, List[Any]] = {
+        "genres": list(content_info.get("genres", []) or []),
+        "actors": list(content_info.get("cast", []) or []),
+        "keywords": list(content_info.get("keywords", []) or []),
+    }
+    if media_type == "movie":
+        terms["directors"] = list(content_info.get("directors", []) or [])
+    if media_type == "tv":
+        studio = content_info.get("studio", content_info.get("studios", []))
+        if isinstance(studio, str):
+            terms["studios"] = [studio] if studio and studio != "N/A" else []
+        else:
+            terms["studios"] = list(studio or [])
+    language = content_info.get("language", "N/A")
+    terms["languages"] = [language] if language and language != "N/A" else []
+    return terms
+
+
+def profile_snapshot(profile: Mapping, extra: Optional[Mapping[str, Mapping]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    The per-term counts of a scoring profile, JSON-ready, for
+    changed_terms() to diff against on the next run.
+
+    `extra` adds the non-scoring counters a recommender's bonus reads
+    (e.g. {"collections": ...}), under their own dimension names.
+    """
+    snapshot = {dimension: dict(profile.get(dimension, {}) or {}) for dimension in SCORING_DIMENSIONS}
+    for dimension, counter in (extra or {}).items():
+        snapshot[dimension] = dict(counter or {})
+    return {dimension: {str(k): v for k, v in counts.items()} for dimension, counts in snapshot.items()}
+
+
+def changed_terms(old: Mapping[str, Mapping], new: Mapping[str, Mapping]) -> Dict[str, Set[str]]:
+    """
+    Per dimension, the term_key()s whose count differs between two
+    profile_snapshot()s - added, removed or changed.
+    """
+    changed: Dict[str, Set[str]] = {}
+    for dimension in set(old) | set(new):
+        old_counts = old.get(dimension, {})
+        new_counts = new.get(dimension, {})
+        keys = {
+            term_key(dimension, term)
+            for term in set(old_counts) | set(new_counts)
+            if old_counts.get(term) != new_counts.get(term)
+        }
+        if keys:
+            changed[dimension] = keys
+    return changed
+
+
+def profile_signature(compiled: CompiledProfile, weights: Dict, media_type: str, options: ScoringOptions) -> str:
+    """
+    Fingerprint of everything a score reads from the profile and
+    configuration other than per-term counts. Stored scores survive a
+    profile change only while this stays the same.
+
+    Corpus IDF is library-wide rather than per-profile and stays out,
+    exactly as it stays out of the score store's own key.
+    """
+    payload = {
+        "has_data": compiled.has_data,
+        "max_counts": compiled.max_counts,
+        "max_genre_count": compiled.max_genre_count,
+        "genre_threshold": compiled.tfidf_threshold("genres", compiled.max_genre_count, options),
+        "keyword_threshold": compiled.tfidf_threshold("keywords", compiled.max_counts["keywords"], options),
+        "weights": compiled.effective_weights(weights, media_type),
+        "media_type": media_type,
+        "options": [
+            options.normalize_counters,
+            options.use_fuzzy_keywords,
+            options.use_tfidf,
+            options.tfidf_penalty_threshold,
+            options.use_popularity_dampening,
+            options.popularity_threshold,
+        ],
+    }
+    serialized = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+
+
+class TermIndex:
+    """
+    Inverted index from (dimension, term_key()) to the rating keys of the
+    items carrying that term.
+
+    Built from the library cache each run rather than stored next to it:
+    the cache already persists every item's terms, and a second on-disk
+    copy would cost as much to load as this does to build.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._keyword_index: Optional[FuzzyKeywordIndex] = None
+
+    def add(self, rating_key: str, terms: Mapping[str, Iterable[Any]]) -> None:
+        """Index one item's raw terms (content_terms() plus any bonus dimensions)."""
+        for dimension, values in terms.items():
+            postings = self._postings[dimension]
+            for term in values:
+                postings[term_key(dimension, term)].add(rating_key)
+        self._keyword_index = None
+
+    def _keyword_vocabulary(self) -> FuzzyKeywordIndex:
+        """The indexed keywords, searchable by substring in either direction."""
+        if self._keyword_index is None:
+            self._keyword_index = FuzzyKeywordIndex(dict.fromkeys(self._postings.get("keywords", {}), 1))
+        return self._keyword_index
+
+    def affected_items(self, changed: Mapping[str, Set[str]], fuzzy_keywords: bool = True) -> Set[str]:
+        """
+        Rating keys of every item carrying a changed term. With
+        `fuzzy_keywords`, a changed keyword also reaches the items whose
+        keywords contain it or are contained in it.
+        """
+        affected: Set[str] = set()
+        for dimension, keys in changed.items():
+            postings = self._postings.get(dimension)
+            if not postings:
+                continue
+            if dimension == "keywords" and fuzzy_keywords:
+                keys = {match for key in keys for match in self._keyword_vocabulary().partial_matches(key)}
+            for key in keys:
+                affected.update(postings.get(key, ()))
+        return affected
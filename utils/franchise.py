@@ -334,12 +334,13 @@ def _promote(entry: FranchiseEntry, original: Mapping) -> Dict:
     Build the recommendation dict for a promoted entry.
 
     A COPY, never the cached dict itself: the media cache's own item
-    dicts are the same objects `get_recommendations()` writes
-    `cached_score`/`profile_hash` into and then persists, so writing a
-    borrowed score onto one would poison the score cache for every later
-    run. `cached_score`/`profile_hash` are dropped from the copy for the
-    same reason in reverse - they describe a score this dict no longer
-    carries, and leaving them would invite a future reader to trust them.
+    dicts are the same objects `get_recommendations()` writes each item's
+    own `similarity_score`/`score_breakdown` into, so writing a borrowed
+    score onto one would misreport that item for the rest of the run.
+    `cached_score`/`profile_hash` (per-item score fields from before the
+    per-user score store) are dropped from the copy for the same reason
+    in reverse - they describe a score this dict no longer carries, and
+    leaving them would invite a future reader to trust them.
     """
     promoted = dict(entry.info)
     promoted.pop("cached_score", None)
@@ -26,7 +26,7 @@ import subprocess
 import sys
 from datetime import datetime, timedelta
 from functools import lru_cache
-from typing import Dict
+from typing import Dict, Iterator
 
 from .config import MAX_LOG_FILE_BYTES
 from .display import RESET, YELLOW, log_info, log_warning
@@ -222,19 +222,12 @@ def migrate_legacy_cache_dir(legacy_dir: str, new_dir: str) -> None:
 MAX_RESPONSE_BYTES = 10 * 1024 * 1024
 
 
-def read_response_capped(response, max_bytes: int = MAX_RESPONSE_BYTES):
-    """Read *response* (a `requests.Response` obtained with
-    `stream=True`) into memory, capped at *max_bytes* - see
-    MAX_RESPONSE_BYTES above for why. Raises ValueError if the body is
-    (or claims, via a Content-Length header, to be) larger than the cap;
-    callers translate that into whatever error type is appropriate for
-    their own call site.
-
-    Pre-fills response._content (requests' own internal cache for this)
-    so every normal accessor downstream - .content, .text, .json() -
-    just returns the already-capped bytes instead of re-reading (and
-    potentially buffering an unbounded body) themselves. Returns
-    *response* itself for convenient chaining.
+def iter_response_capped(response, max_bytes: int = MAX_RESPONSE_BYTES) -> Iterator[bytes]:
+    """The body of *response* (a `requests.Response` obtained with
+    `stream=True`) as it arrives, capped at *max_bytes* - the streaming
+    form of read_response_capped below, for a caller that parses the
+    body incrementally instead of holding all of it. Raises ValueError
+    the same way, as soon as the cap is crossed.
     """
     content_length = response.headers.get("Content-Length")
     if content_length is not None:
@@ -247,7 +240,6 @@ def read_response_capped(response, max_bytes: int = MAX_RESPONSE_BYTES):
                 f"Response declared {declared} bytes via Content-Length, exceeding the {max_bytes}-byte limit"
             )
 
-    chunks = []
     total = 0
     for chunk in response.iter_content(chunk_size=65536):
         if not chunk:
@@ -255,8 +247,24 @@ def read_response_capped(response, max_bytes: int = MAX_RESPONSE_BYTES):
         total += len(chunk)
         if total > max_bytes:
             raise ValueError(f"Response exceeded the {max_bytes}-byte limit while streaming")
-        chunks.append(chunk)
-    response._content = b"".join(chunks)
+        yield chunk
+
+
+def read_response_capped(response, max_bytes: int = MAX_RESPONSE_BYTES):
+    """Read *response* (a `requests.Response` obtained with
+    `stream=True`) into memory, capped at *max_bytes* - see
+    MAX_RESPONSE_BYTES above for why. Raises ValueError if the body is
+    (or claims, via a Content-Length header, to be) larger than the cap;
+    callers translate that into whatever error type is appropriate for
+    their own call site.
+
+    Pre-fills response._content (requests' own internal cache for this)
+    so every normal accessor downstream - .content, .text, .json() -
+    just returns the already-capped bytes instead of re-reading (and
+    potentially buffering an unbounded body) themselves. Returns
+    *response* itself for convenient chaining.
+    """
+    response._content = b"".join(iter_response_capped(response, max_bytes))
     response._content_consumed = True
     return response
 
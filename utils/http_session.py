@@ -0,0 +1,179 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Pooled, keep-alive HTTP sessions for every outbound integration.
+
+Module-level requests.get()/requests.request() build a throwaway Session
+per call, so every TMDB/Trakt/Simkl/Radarr/Sonarr/Plex request paid a
+fresh TCP connect and TLS handshake - on an external run that is
+thousands of handshakes to the same TMDB host.
+
+http_client is a drop-in for those module-level functions (same
+signatures, same return values, same exceptions) that sends each request
+through one long-lived requests.Session per service host instead, so
+connections are kept alive and reused. Per-call arguments behave exactly
+as they do with requests.get(): allow_redirects=False still refuses
+redirects, stream=True still defers the body for read_response_capped(),
+and an explicit verify= still wins over anything else.
+
+Two things a Session would otherwise carry over between calls are
+deliberately not: cookies (a Set-Cookie from one response is never sent
+with the next - calls stay as stateless as requests.get()'s), and
+connections inherited across a fork (a child process starts with an
+empty registry rather than sharing its parent's sockets).
+
+Requests to a rate-limited host (TMDB - see utils/rate_limit.py) first
+take a token from that host's process-wide limiter, so concurrent callers
+share one limit however many threads they fetch on, and every response
+is fed back to it to adapt that limit. A GET to a cached host (TMDB -
+see utils/tmdb_cache.py) is answered from its response cache when it
+can be, without a token or a connection; one that misses while an
+identical GET is already in flight waits for that one's response
+instead of sending its own (utils/single_flight.py).
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+
+from .config import HTTP_POOL_MAXSIZE
+from .rate_limit import TMDB_API_HOST, AdaptiveRateLimiter, tmdb_rate_limiter
+from .single_flight import SingleFlight, tmdb_single_flight
+from .tmdb_cache import TMDBResponseCache, cache_key, tmdb_response_cache
+
+
+class _DiscardingCookieJar(RequestsCookieJar):
+    """A session cookie jar that never keeps a cookie."""
+
+    def set_cookie(self, cookie, *args, **kwargs):
+        return None
+
+
+class SessionRegistry:
+    """One pooled requests.Session per service host, created on first use."""
+
+    def __init__(self, pool_maxsize: int = HTTP_POOL_MAXSIZE) -> None:
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[Tuple[str, str], requests.Session] = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        """The session for `url`'s scheme and host."""
+        parts = urlsplit(url)
+        key = (parts.scheme.lower(), parts.netloc.lower())
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the parent's pooled sockets are not ours to use.
+                self._sessions = {}
+                self._pid = os.getpid()
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._new_session()
+                self._sessions[key] = session
+            return session
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.cookies = _DiscardingCookieJar()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close every pooled connection (the next request reconnects)."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+
+class PooledHTTPClient:
+    """requests' module-level request functions, over pooled sessions."""
+
+    def __init__(
+        self,
+        registry: Optional[SessionRegistry] = None,
+        limiters: Optional[Dict[str, AdaptiveRateLimiter]] = None,
+        caches: Optional[Dict[str, TMDBResponseCache]] = None,
+        flights: Optional[Dict[str, SingleFlight]] = None,
+    ) -> None:
+        self.registry = registry or SessionRegistry()
+        # hostname -> the limiter every request to that host goes through
+        self.limiters = limiters or {}
+        # hostname -> the response cache GETs to that host are served from
+        self.caches = caches or {}
+        # hostname -> the SingleFlight concurrent identical GETs to that
+        # host (cache_key() equal - the API key is not part of it) share
+        self.flights = flights or {}
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Same as requests.request()."""
+        host = (urlsplit(url).hostname or "").lower()
+        plain_get = method.upper() == "GET" and not kwargs.get("stream")
+        cache = self.caches.get(host) if plain_get else None
+        if cache is not None:
+            cached = cache.lookup(url, kwargs.get("params"))
+            if cached is not None:
+                return cached
+        flight = self.flights.get(host) if plain_get else None
+        if flight is not None:
+            return flight.do(cache_key(url, kwargs.get("params")), lambda: self._send(host, method, url, cache, kwargs))
+        return self._send(host, method, url, cache, kwargs)
+
+    def _send(
+        self, host: str, method: str, url: str, cache: Optional[TMDBResponseCache], kwargs: Dict
+    ) -> requests.Response:
+        limiter = self.limiters.get(host)
+        if limiter is not None:
+            limiter.acquire()
+        response = self.registry.session_for(url).request(method=method, url=url, **kwargs)
+        if limiter is not None:
+            limiter.observe(response.status_code, response.headers)
+        if cache is not None:
+            cache.store(url, kwargs.get("params"), response)
+        return response
+
+    def get(self, url: str, params=None, **kwargs) -> requests.Response:
+        """Same as requests.get()."""
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs) -> requests.Response:
+        """Same as requests.post()."""
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def put(self, url: str, data=None, **kwargs) -> requests.Response:
+        """Same as requests.put()."""
+        return self.request("PUT", url, data=data, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        """Same as requests.delete()."""
+        return self.request("DELETE", url, **kwargs)
+
+
+# The process-wide client every integration sends through.
+http_client = PooledHTTPClient(
+    limiters={TMDB_API_HOST: tmdb_rate_limiter},
+    caches={TMDB_API_HOST: tmdb_response_cache},
+    flights={TMDB_API_HOST: tmdb_single_flight},
+)
@@ -0,0 +1,165 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Indexed partial-match lookup for fuzzy keyword scoring.
+
+utils.scoring.fuzzy_keyword_match()'s partial-match step compares the
+content keyword against every keyword in the user's profile - two
+substring tests, then two split()s and three set constructions for each
+candidate - so each unmatched content keyword costs O(profile keywords).
+Heavy users carry thousands of TMDB keywords, and that fallback came to
+cost more than the rest of keyword scoring put together.
+
+FuzzyKeywordIndex answers the same question without the scan. A user
+keyword is a partial match when one string contains the other, so two
+lookups cover it:
+
+  - user keyword inside the content keyword: every substring of the
+    content keyword is looked up in a dict of the profile's keywords -
+    O(len(keyword)^2) probes, independent of profile size;
+  - content keyword inside the user keyword: character n-gram postings
+    narrow the profile down to keywords sharing all of the content
+    keyword's n-grams, and only those get the real `in` test.
+
+Token sets are computed once per profile keyword, not once per pair.
+Candidates are then scored exactly as fuzzy_keyword_match() scores them,
+in profile order, so the best (score, matched_kw) - ties included - is
+identical to the linear scan's.
+"""
+
+from typing import Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+# Character n-gram length for the "content keyword inside user keyword"
+# postings. Content keywords shorter than this can't be looked up by
+# n-gram and fall back to the linear scan - rare for TMDB keywords.
+FUZZY_NGRAM_LENGTH = 3
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i : i + FUZZY_NGRAM_LENGTH] for i in range(len(text) - FUZZY_NGRAM_LENGTH + 1)}
+
+
+class FuzzyKeywordIndex:
+    """
+    Partial-match index over one profile's keyword -> count mapping.
+
+    Built once per profile (compile_profile() attaches one to every
+    CompiledProfile) and passed to fuzzy_keyword_match() as `index`. The
+    postings are built lazily on the first partial lookup, so a profile
+    whose content keywords all match exactly never pays for them.
+
+    The index reads a snapshot of `user_keywords` at build time; build a
+    new one if the profile changes.
+    """
+
+    def __init__(self, user_keywords: Mapping[str, float]):
+        self._user_keywords = user_keywords
+        self._built = False
+        # Per profile keyword, in profile order. Only positive counts are
+        # kept: fuzzy_keyword_match() only accepts a match that beats a
+        # starting best of 0, which a zero or negative count never does.
+        self._keywords: List[str] = []
+        self._counts: List[float] = []
+        self._lowered: List[str] = []
+        self._tokens: List[FrozenSet[str]] = []
+        self._by_text: Dict[str, List[int]] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._longest = 0
+
+    def _build(self) -> None:
+        for user_kw, count in self._user_keywords.items():
+            user_kw_lower = user_kw.lower()
+            if not count > 0:
+                continue
+            position = len(self._keywords)
+            self._keywords.append(user_kw)
+            self._counts.append(count)
+            self._lowered.append(user_kw_lower)
+            self._tokens.append(frozenset(user_kw_lower.split()))
+            self._by_text.setdefault(user_kw_lower, []).append(position)
+            self._longest = max(self._longest, len(user_kw_lower))
+            for gram in _ngrams(user_kw_lower):
+                self._postings.setdefault(gram, []).append(position)
+        self._built = True
+
+    def _contained_in_keyword(self, keyword_lower: str) -> Set[int]:
+        """Profile keywords that are substrings of `keyword_lower`."""
+        found: Set[int] = set(self._by_text.get("", ()))
+        length = len(keyword_lower)
+        for start in range(length):
+            for end in range(start + 1, min(length, start + self._longest) + 1):
+                positions = self._by_text.get(keyword_lower[start:end])
+                if positions:
+                    found.update(positions)
+        return found
+
+    def _containing_keyword(self, keyword_lower: str) -> Set[int]:
+        """Profile keywords that contain `keyword_lower`."""
+        if len(keyword_lower) < FUZZY_NGRAM_LENGTH:
+            return {i for i, user_kw_lower in enumerate(self._lowered) if keyword_lower in user_kw_lower}
+
+        postings = []
+        for gram in _ngrams(keyword_lower):
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return candidates
+        return {i for i in candidates if keyword_lower in self._lowered[i]}
+
+    def partial_matches(self, keyword_lower: str) -> List[str]:
+        """
+        Every indexed keyword that contains, or is contained in, an already
+        lower-cased keyword - all the candidates best_partial_match()
+        chooses between, in profile order.
+        """
+        if not self._built:
+            self._build()
+        candidates = self._contained_in_keyword(keyword_lower) | self._containing_keyword(keyword_lower)
+        return [self._keywords[position] for position in sorted(candidates)]
+
+    def best_partial_match(self, keyword_lower: str) -> Tuple[float, Optional[str]]:
+        """
+        fuzzy_keyword_match()'s partial-match result for an already
+        lower-cased keyword: (best_score, matched_user_keyword), or
+        (0, None) when nothing overlaps.
+        """
+        if not self._built:
+            self._build()
+
+        candidates = self._contained_in_keyword(keyword_lower) | self._containing_keyword(keyword_lower)
+        best_score: float = 0
+        best_match: Optional[str] = None
+        if not candidates:
+            return best_score, best_match
+
+        keyword_tokens = set(keyword_lower.split())
+        for position in sorted(candidates):
+            user_tokens = self._tokens[position]
+            overlap = len(keyword_tokens & user_tokens)
+            total = len(keyword_tokens | user_tokens)
+            similarity = overlap / total if total > 0 else 0
+            match_score = self._counts[position] * (0.5 + 0.5 * similarity)
+            if match_score > best_score:
+                best_score = match_score
+                best_match = self._keywords[position]
+        return best_score, best_match
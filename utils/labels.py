@@ -17,13 +17,20 @@
 """
 Label management utilities for Curatarr.
 Handles adding, removing, and categorizing Plex labels.
+
+Given the library section, labels are added and removed with multi-id
+section edits (bulk_edit_labels) - one PUT per PLEX_LABEL_EDIT_BATCH_SIZE
+items rather than one addLabel()/removeLabel() PUT per item.
 """
 
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import plexapi.exceptions
 
+from .config import PLEX_LABEL_EDIT_BATCH_SIZE
 from .display import GREEN, RESET, log_info, log_warning
 
 logger = logging.getLogger("curatarr")
@@ -157,6 +164,7 @@ def categorize_labeled_items(
     label_name: str,
     label_dates: Dict,
     stale_days: int = 7,
+    reload_items: bool = True,
 ) -> Dict[str, List]:
     """
     Categorize labeled items into watched, excluded, and fresh.
@@ -171,6 +179,8 @@ def categorize_labeled_items(
         label_name: Name of the label
         label_dates: Dictionary tracking when labels were added
         stale_days: Deprecated, kept for API compatibility
+        reload_items: Reload each item first; False when the caller has
+            already loaded them in full (utils/plex.py's load_full_plex_items)
 
     Returns:
         Dictionary with keys: 'fresh', 'watched', 'stale', 'excluded'
@@ -186,7 +196,8 @@ def categorize_labeled_items(
     }
 
     for item in labeled_items:
-        item.reload()
+        if reload_items:
+            item.reload()
         item_id = int(item.ratingKey)
         label_key = f"{item_id}_{label_name}"
 
@@ -218,7 +229,101 @@ def categorize_labeled_items(
     return result
 
 
-def remove_labels_from_items(items: List, label_name: str, label_dates: Dict, reason: str = "") -> None:
+class LabelEdit(NamedTuple):
+    """One multi-id label edit: a single request to Plex."""
+
+    action: str  # "add" or "remove"
+    label: str
+    rating_keys: Tuple[int, ...]
+    reason: str = ""
+
+
+def _edit_batches(items: List) -> List[List]:
+    """`items` grouped by type (a multi-edit can't mix them), in batches."""
+    by_type: Dict[str, List] = {}
+    for item in items:
+        by_type.setdefault(getattr(item, "type", ""), []).append(item)
+    return [
+        group[start : start + PLEX_LABEL_EDIT_BATCH_SIZE]
+        for group in by_type.values()
+        for start in range(0, len(group), PLEX_LABEL_EDIT_BATCH_SIZE)
+    ]
+
+
+def _apply_label_edit(section, batch: List, action: str, label_name: str) -> None:
+    try:
+        section.batchMultiEdits(batch)
+        if action == "add":
+            section.addLabel(label_name, locked=False)
+        else:
+            section.removeLabel(label_name, locked=False)
+        section.saveMultiEdits()
+    except plexapi.exceptions.PlexApiException as e:
+        # BadRequest when an item isn't from this section - edit them one by one
+        logger.debug(f"Multi-edit {action} of label {label_name} failed ({e}), editing items individually")
+        for item in batch:
+            if action == "add":
+                item.addLabel(label_name, locked=False)
+            else:
+                item.removeLabel(label_name, locked=False)
+
+
+def bulk_edit_labels(
+    section,
+    label_name: str,
+    label_dates: Dict,
+    add: Iterable = (),
+    remove: Iterable = (),
+    reason: str = "",
+    dry_run: bool = False,
+) -> List[LabelEdit]:
+    """
+    Add and remove a label on many Plex items with multi-id section edits.
+
+    Items already carrying the label aren't added again (read off the items
+    as loaded - no request). label_dates is kept exactly as the per-item
+    functions below keep it.
+
+    Args:
+        section: PlexAPI library section the items belong to
+        label_name: Name of the label to add/remove
+        label_dates: Dictionary tracking label dates (will be updated)
+        add: Plex items to label
+        remove: Plex items to unlabel
+        reason: Reason for removal (for logging)
+        dry_run: Only log the planned edits - send nothing, update nothing
+
+    Returns:
+        The edits sent (or, in dry_run, that would have been) - one per request
+    """
+    add = [item for item in add if label_name not in [label.tag for label in item.labels]]
+    remove = list(remove)
+    plan = []
+
+    for action, items in (("remove", remove), ("add", add)):
+        for batch in _edit_batches(items):
+            edit = LabelEdit(action, label_name, tuple(int(item.ratingKey) for item in batch), reason)
+            plan.append(edit)
+            if dry_run:
+                titles = ", ".join(item.title for item in batch)
+                log_info(f"[dry-run] Would {action} label {label_name} ({len(batch)} items): {titles}")
+                continue
+
+            _apply_label_edit(section, batch, action, label_name)
+            for item in batch:
+                label_key = f"{int(item.ratingKey)}_{label_name}"
+                if action == "add":
+                    label_dates[label_key] = datetime.now().isoformat()
+                    print(f"{GREEN}Added: {item.title}{RESET}")
+                else:
+                    label_dates.pop(label_key, None)
+                    if reason:
+                        log_info(f"Removed ({reason}): {item.title}")
+
+    return plan
+
+
+def remove_labels_from_items(items: List, label_name: str, label_dates: Dict, reason: str = "", section=None) -> None:
     """
     Remove labels from a list of Plex items.
 
@@ -227,7 +332,13 @@ def remove_labels_from_items(items: List, label_name: str, label_dates: Dict, re
         label_name: Name of the label to remove
         label_dates: Dictionary tracking label dates (will be updated)
         reason: Reason for removal (for logging)
+        section: The items' library section - if given, removed in bulk
+            (bulk_edit_labels) instead of one request per item
     """
+    if section is not None:
+        bulk_edit_labels(section, label_name, label_dates, remove=items, reason=reason)
+        return
+
     for item in items:
         item.removeLabel(label_name, locked=False)
         label_key = f"{int(item.ratingKey)}_{label_name}"
@@ -237,7 +348,7 @@ def remove_labels_from_items(items: List, label_name: str, label_dates: Dict, re
             log_info(f"Removed ({reason}): {item.title}")
 
 
-def add_labels_to_items(items: List, label_name: str, label_dates: Dict) -> int:
+def add_labels_to_items(items: List, label_name: str, label_dates: Dict, section=None) -> int:
     """
     Add labels to a list of Plex items.
 
@@ -245,10 +356,16 @@ def add_labels_to_items(items: List, label_name: str, label_dates: Dict) -> int:
         items: List of Plex items
         label_name: Name of the label to add
         label_dates: Dictionary tracking label dates (will be updated)
+        section: The items' library section - if given, added in bulk
+            (bulk_edit_labels) instead of one request per item
 
     Returns:
         Number of items that had labels added
     """
+    if section is not None:
+        plan = bulk_edit_labels(section, label_name, label_dates, add=items)
+        return sum(len(edit.rating_keys) for edit in plan)
+
     added_count = 0
     for item in items:
         current_labels = [label.tag for label in item.labels]
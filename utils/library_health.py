@@ -120,7 +120,19 @@ def find_supply_gaps(
     from utils.calibration import list_distribution
 
     available = list_distribution(candidate_genre_lists)
+    return find_supply_gaps_in(target_distribution, available, min_profile_share, min_shortfall)
 
+
+def find_supply_gaps_in(
+    target_distribution: Mapping[str, float],
+    available: Mapping[str, float],
+    min_profile_share: float = SUPPLY_GAP_MIN_PROFILE_SHARE,
+    min_shortfall: float = SUPPLY_GAP_MIN_SHORTFALL,
+) -> List[SupplyGap]:
+    """
+    find_supply_gaps() against an already-measured supply distribution
+    (e.g. LibraryIndex.genre_supply in utils/library_index.py).
+    """
     gaps = []
     for genre, wanted in target_distribution.items():
         if wanted < min_profile_share:
@@ -0,0 +1,239 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Library-wide derived indexes, kept next to the media cache.
+
+Every recommendation run used to rebuild the same library-wide tables
+from the whole media cache, once per user: the corpus document
+frequencies behind the IDF weights (utils/corpus_idf.py), the franchise
+index (utils/franchise.py's build_franchise_index) - twice, for the fresh
+pool and again for the label side - and the set of owned TMDB IDs the
+franchise gap report checks against. None of them depend on the user,
+and all of them only change when the library does.
+
+The unwatched pool's genre supply (utils/library_health.py) is per
+user, but it is the library's genre mass minus the items a user can't be
+offered, so the library-wide half is kept here too.
+
+LibraryIndex holds the raw material for all of these and is kept in step
+with the media cache by BaseCache.update_cache(): an added or removed
+item adjusts the counts it touches instead of triggering a rebuild. It
+is stamped with library_content_version() and thrown away (then rebuilt
+in one pass) whenever the stamp no longer matches the media cache it was
+built from.
+
+What is stored is deliberately the inputs, not the outputs: document
+frequencies rather than IDF weights, because every weight moves with
+the corpus size; franchise membership rather than FranchiseEntry lists,
+because an entry carries the item's cached info, which the media cache
+already holds.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from .calibration import item_genre_distribution
+from .corpus_idf import corpus_idf_from_frequency
+from .franchise import FranchiseEntry, build_franchise_index, normalize_collection_id
+
+# Bump when the stored layout changes; an index of another format is
+# rebuilt rather than read.
+LIBRARY_INDEX_FORMAT = 1
+
+# The per-item list fields the corpus IDF tables are built over.
+IDF_FIELDS = ("genres", "tmdb_keywords")
+
+# Genre mass left behind by float subtraction once every item carrying
+# the genre is gone; anything below this is treated as zero.
+GENRE_MASS_EPSILON = 1e-9
+
+
+def library_content_version(cache: Mapping, media_key: str) -> str:
+    """
+    Stamp identifying the contents of a media cache.
+
+    Combines the cache's `content_version` counter (bumped by every
+    BaseCache write that adds, removes or rewrites items), its item count
+    and its last_updated time, so a cache replaced or edited behind the
+    counter's back still reads as different.
+    """
+    items = cache.get(media_key, {}) or {}
+    return f"{cache.get('content_version', 0)}:{len(items)}:{cache.get('last_updated')}"
+
+
+def _item_terms(item_info: Mapping, field: str) -> Set[str]:
+    """The de-duplicated, lower-cased terms build_document_frequency() counts."""
+    return {t.lower() for t in item_info.get(field) or [] if isinstance(t, str)}
+
+
+def _item_genre_distribution(item_info: Mapping) -> Dict[str, float]:
+    """The per-item share _report_library_health() feeds find_supply_gaps()."""
+    return item_genre_distribution([g.lower() for g in (item_info.get("genres") or [])])
+
+
+def _item_tmdb_id(item_info: Mapping) -> Optional[int]:
+    """The TMDB ID collect_library_tmdb_ids() would collect, if any."""
+    tmdb_id = item_info.get("tmdb_id")
+    return tmdb_id if isinstance(tmdb_id, int) else None
+
+
+class LibraryIndex:
+    """
+    Document frequencies, franchise membership, genre mass and owned
+    TMDB IDs for one library's media cache, maintainable item by item.
+    """
+
+    def __init__(self, version: str = "") -> None:
+        self.version = version
+        self.total = 0
+        self.document_frequency: Dict[str, Dict[str, int]] = {field: {} for field in IDF_FIELDS}
+        # Rating keys of every item with a collection_id, in media cache
+        # order - build_franchise_index() keeps its input order for ties.
+        self.collection_members: Dict[str, None] = {}
+        # Genre -> summed item_genre_distribution() share over all items.
+        self.genre_mass: Dict[str, float] = {}
+        # TMDB ID -> number of cached items carrying it.
+        self.tmdb_ids: Dict[int, int] = {}
+
+    @classmethod
+    def build(cls, items: Mapping[str, Mapping], version: str = "") -> "LibraryIndex":
+        """Index a whole media cache's items in one pass."""
+        index = cls(version)
+        for rating_key, item_info in items.items():
+            index.add_item(rating_key, item_info)
+        return index
+
+    def add_item(self, rating_key: str, item_info: Mapping) -> None:
+        """Count one item newly added to the media cache."""
+        self.total += 1
+        for field in IDF_FIELDS:
+            frequency = self.document_frequency[field]
+            for term in _item_terms(item_info, field):
+                frequency[term] = frequency.get(term, 0) + 1
+        if normalize_collection_id(item_info.get("collection_id")) is not None:
+            self.collection_members[str(rating_key)] = None
+        for genre, share in _item_genre_distribution(item_info).items():
+            self.genre_mass[genre] = self.genre_mass.get(genre, 0.0) + share
+        tmdb_id = _item_tmdb_id(item_info)
+        if tmdb_id is not None:
+            self.tmdb_ids[tmdb_id] = self.tmdb_ids.get(tmdb_id, 0) + 1
+
+    def remove_item(self, rating_key: str, item_info: Mapping) -> None:
+        """Uncount one item leaving the media cache, as it was cached."""
+        self.total = max(0, self.total - 1)
+        for field in IDF_FIELDS:
+            frequency = self.document_frequency[field]
+            for term in _item_terms(item_info, field):
+                remaining = frequency.get(term, 0) - 1
+                if remaining > 0:
+                    frequency[term] = remaining
+                else:
+                    frequency.pop(term, None)
+        self.collection_members.pop(str(rating_key), None)
+        for genre, share in _item_genre_distribution(item_info).items():
+            remaining_mass = self.genre_mass.get(genre, 0.0) - share
+            if remaining_mass > GENRE_MASS_EPSILON:
+                self.genre_mass[genre] = remaining_mass
+            else:
+                self.genre_mass.pop(genre, None)
+        tmdb_id = _item_tmdb_id(item_info)
+        if tmdb_id is not None:
+            remaining = self.tmdb_ids.get(tmdb_id, 0) - 1
+            if remaining > 0:
+                self.tmdb_ids[tmdb_id] = remaining
+            else:
+                self.tmdb_ids.pop(tmdb_id, None)
+
+    def replace_item(self, rating_key: str, old_info: Mapping, new_info: Mapping, order: Iterable[str]) -> None:
+        """
+        Recount one item whose media cache entry was rewritten in place,
+        keeping its place among collection_members. `order` (the media
+        cache's keys) is only read when the item newly joined a collection.
+        """
+        key = str(rating_key)
+        members = list(self.collection_members)
+        self.remove_item(key, old_info)
+        self.add_item(key, new_info)
+        if key not in self.collection_members:
+            return
+        if key in members:
+            self.collection_members = dict.fromkeys(members)
+        else:
+            self.collection_members = dict.fromkeys(k for k in map(str, order) if k in self.collection_members)
+
+    def corpus_idf(self, field: str) -> Dict[str, float]:
+        """build_corpus_idf() for `field`, from the stored frequencies."""
+        return corpus_idf_from_frequency(self.document_frequency.get(field, {}), self.total)
+
+    def franchise_index(self, items: Mapping[str, Mapping]) -> Dict[Any, List[FranchiseEntry]]:
+        """
+        build_franchise_index() over `items` (the media cache the index
+        was built from), reading only the items known to belong to a
+        collection.
+        """
+        members = {key: items[key] for key in self.collection_members if key in items}
+        return build_franchise_index(members)
+
+    def genre_supply(self, withheld: Iterable[Mapping]) -> Dict[str, float]:
+        """
+        list_distribution() over the library minus `withheld` (items of
+        it a user can't be offered: watched, excluded, below quality),
+        touching only the withheld items.
+        """
+        mass = dict(self.genre_mass)
+        count = self.total
+        for item_info in withheld:
+            count -= 1
+            for genre, share in _item_genre_distribution(item_info).items():
+                mass[genre] = mass.get(genre, 0.0) - share
+        if count <= 0:
+            return {}
+        return {genre: value / count for genre, value in mass.items() if value > GENRE_MASS_EPSILON}
+
+    def library_tmdb_ids(self) -> Set[int]:
+        """collect_library_tmdb_ids(), without walking the library."""
+        return set(self.tmdb_ids)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form for save_library_index()."""
+        return {
+            "format": LIBRARY_INDEX_FORMAT,
+            "total": self.total,
+            "document_frequency": self.document_frequency,
+            "collection_members": list(self.collection_members),
+            "genre_mass": self.genre_mass,
+            # JSON object keys are strings; pairs keep the IDs as ints.
+            "tmdb_ids": [[tmdb_id, count] for tmdb_id, count in self.tmdb_ids.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping, version: str = "") -> Optional["LibraryIndex"]:
+        """Inverse of to_dict(); None for anything of another format or malformed."""
+        if data.get("format") != LIBRARY_INDEX_FORMAT:
+            return None
+        try:
+            index = cls(version)
+            index.total = int(data["total"])
+            for field in IDF_FIELDS:
+                index.document_frequency[field] = {
+                    str(term): int(df) for term, df in data["document_frequency"][field].items()
+                }
+            index.collection_members = dict.fromkeys(str(key) for key in data["collection_members"])
+            index.genre_mass = {str(genre): float(mass) for genre, mass in data["genre_mass"].items()}
+            index.tmdb_ids = {int(tmdb_id): int(count) for tmdb_id, count in data["tmdb_ids"]}
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return index
@@ -30,6 +30,10 @@ logger = logging.getLogger("curatarr")
 MDBLIST_RATE_LIMIT_DELAY = 0.1
 MDBLIST_REQUEST_TIMEOUT = 30
 
+# Ceiling the adaptive limiter (utils/rate_limit.py) may climb to while
+# MDBList keeps answering normally.
+MDBLIST_MAX_REQUESTS_PER_SECOND = 20
+
 # API base URL
 MDBLIST_API_BASE = "https://api.mdblist.com"
 
@@ -50,6 +54,7 @@ class MDBListClient(BaseAPIClient):
     api_name = "MDBList"
     exception_class = MDBListAPIError
     rate_limit_delay = 0.1
+    max_requests_per_second = MDBLIST_MAX_REQUESTS_PER_SECOND
     request_timeout = 30
 
     def __init__(self, api_key: str):
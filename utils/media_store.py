@@ -0,0 +1,322 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+SQLite backend for the library media caches (general.cache_backend:
+sqlite - see utils/config.py's get_cache_backend()).
+
+The JSON media cache is one file holding the whole library: every save
+rewrites all of it (indent=4, several MB for a large library) to change a
+handful of items, and two processes saving it - docker-compose runs a
+`curatarr` and a `curatarr-recommend` service on the same ./cache volume -
+each replace the whole file, so the later one silently drops whatever the
+earlier one added (the lost-update tradeoff utils/cache.py's JSON caches
+accept).
+
+MediaCacheStore keeps the same cache dict in a SQLite database in WAL
+mode instead:
+
+  - `meta`: the header fields (cache_version, library_count,
+    last_updated, content_version, ...), one keyed row each - the
+    version check reads these alone, never the items;
+  - `items`: one row per rating key, the item dict as compact JSON.
+
+The items dict load() hands out records which rating keys were set,
+removed or had a field changed since the load, and save() writes only
+those rows, in one transaction - so a run that added three movies
+encodes and writes three rows, and rows another process added in the
+meantime are never touched. The header rows are replaced in the same
+transaction, dropping any key the header no longer has. WAL lets the
+other service keep reading while a write is in progress.
+
+Items are still decoded up front rather than row by row on demand:
+every update_cache() reads each entry's Plex updatedAt stamp, and
+BaseCache._load_cache() strips legacy fields from each, so a lazily
+decoded cache would be decoded whole on first use anyway.
+
+The in-memory shape is exactly load_media_cache()'s, so BaseCache and
+everything reading BaseCache.cache are unaware which backend is in use.
+The first load of a library with no database yet imports its JSON cache
+(import_json_media_cache()); the JSON file is left in place, unchanged,
+so switching back to the json backend still works.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from typing import Any, Dict, Optional, Set
+
+from .cache import _empty_media_cache, load_media_cache
+from .config import CACHE_VERSION, MEDIA_STORE_BUSY_TIMEOUT_SECONDS
+from .display import log_warning
+from .metrics import record_cache_lookup
+
+# PRAGMA user_version of the database layout below. A database of any
+# other layout is dropped and rebuilt (from the JSON cache if present).
+MEDIA_STORE_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS items (rating_key TEXT PRIMARY KEY, data TEXT NOT NULL) WITHOUT ROWID;
+"""
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class _TrackedEntry(dict):
+    """One loaded cache entry, adding its rating key to `dirty` when a field of it changes."""
+
+    def __init__(self, data: Dict, key: str, dirty: Set[str]) -> None:
+        super().__init__(data)
+        self._key = key
+        self._dirty = dirty
+
+    def __reduce__(self):
+        # Copies and pickles are plain dicts.
+        return dict, (dict(self),)
+
+    def _touch(self) -> None:
+        self._dirty.add(self._key)
+
+    def __setitem__(self, name, value) -> None:
+        if name not in self or self[name] != value:
+            self._touch()
+        super().__setitem__(name, value)
+
+    def __delitem__(self, name) -> None:
+        super().__delitem__(name)
+        self._touch()
+
+    def __ior__(self, other):  # type: ignore[misc]  # dict's C __ior__ would skip the tracking __setitem__
+        self.update(other)
+        return self
+
+    def pop(self, name, *default):
+        if name in self:
+            self._touch()
+        return super().pop(name, *default)
+
+    def popitem(self):
+        item = super().popitem()
+        self._touch()
+        return item
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self._touch()
+        return super().setdefault(name, default)
+
+    def update(self, *args, **kwargs) -> None:
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def clear(self) -> None:
+        if self:
+            self._touch()
+        super().clear()
+
+
+class _TrackedItems(dict):
+    """
+    rating key -> entry, as MediaCacheStore.load() hands it out. `dirty`
+    holds every key set, removed or changed in place since the last
+    load or save. An entry set as a plain dict can't report its own
+    changes, so its key stays dirty.
+    """
+
+    def __init__(self, rows: Optional[Dict[str, str]] = None) -> None:
+        super().__init__()
+        self.dirty: Set[str] = set()
+        for key, data in (rows or {}).items():
+            value = json.loads(data)
+            super().__setitem__(key, _TrackedEntry(value, key, self.dirty) if isinstance(value, dict) else value)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.dirty.add(key)
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.dirty.add(key)
+
+    def __ior__(self, other):  # type: ignore[misc]  # dict's C __ior__ would skip the tracking __setitem__
+        self.update(other)
+        return self
+
+    def pop(self, key, *default):
+        if key in self:
+            self.dirty.add(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        item = super().popitem()
+        self.dirty.add(item[0])
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.dirty.add(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        self.dirty.update(self)
+        super().clear()
+
+
+class MediaCacheStore:
+    """One library's media cache in a SQLite database, saved row by row."""
+
+    def __init__(self, db_path: str, media_key: str = "movies") -> None:
+        self.db_path = db_path
+        self.media_key = media_key
+        # The items dict the last load() handed out; save() writes only
+        # its dirty keys.
+        self._items: Optional[_TrackedItems] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=MEDIA_STORE_BUSY_TIMEOUT_SECONDS)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Safe with WAL: a crash can lose the last commit, never
+            # corrupt the database.
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != MEDIA_STORE_FORMAT:
+                with conn:
+                    conn.execute("DROP TABLE IF EXISTS meta")
+                    conn.execute("DROP TABLE IF EXISTS items")
+                    conn.execute(f"PRAGMA user_version = {MEDIA_STORE_FORMAT}")
+            conn.executescript(_SCHEMA)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def load(self, json_path: Optional[str] = None) -> Dict:
+        """
+        Load the cache, in load_media_cache()'s shape.
+
+        Args:
+            json_path: The library's JSON media cache, imported when there
+                is no database yet
+
+        Returns:
+            Cache dictionary with media items, or empty structure if
+            outdated/missing
+        """
+        if not os.path.exists(self.db_path) and json_path and os.path.exists(json_path):
+            import_json_media_cache(json_path, self)
+
+        self._items = _TrackedItems()
+        empty_cache = _empty_media_cache(self.media_key)
+        empty_cache[self.media_key] = self._items
+        if not os.path.exists(self.db_path):
+            record_cache_lookup("miss")
+            return empty_cache
+        try:
+            with closing(self._connect()) as conn:
+                header = {key: json.loads(value) for key, value in conn.execute("SELECT key, value FROM meta")}
+                if not header:
+                    record_cache_lookup("miss")
+                    return empty_cache
+                cached_version = header.get("cache_version", 1)
+                if cached_version < CACHE_VERSION:
+                    print(
+                        f"\033[93m{self.media_key.title()} cache is outdated "
+                        f"(v{cached_version} < v{CACHE_VERSION}), rebuilding...\033[0m"
+                    )
+                    with conn:
+                        conn.execute("DELETE FROM meta")
+                        conn.execute("DELETE FROM items")
+                    record_cache_lookup("miss")
+                    return empty_cache
+                rows = dict(conn.execute("SELECT rating_key, data FROM items"))
+        except (sqlite3.Error, OSError, ValueError) as e:
+            log_warning(f"Error loading {self.media_key} cache database: {e}")
+            record_cache_lookup("miss")
+            return empty_cache
+
+        cache = dict(header)
+        cache[self.media_key] = self._items = _TrackedItems(rows)
+        record_cache_lookup("hit")
+        return cache
+
+    def save(self, cache_data: Dict) -> bool:
+        """
+        Write the header and every item set, removed or changed since
+        load() or the last save(). A cache dict load() didn't hand out
+        has every item written.
+
+        Args:
+            cache_data: Cache dictionary, as load() returned it
+
+        Returns:
+            True on success, False on failure
+        """
+        items = cache_data.get(self.media_key, {})
+        tracked = items is self._items and self._items is not None
+        keys = set(items.dirty) if tracked else set(items)
+        changed = [(key, _encode(items[key])) for key in keys if key in items]
+        removed = [(key,) for key in keys if key not in items]
+        header = [(key, _encode(value)) for key, value in cache_data.items() if key != self.media_key]
+        try:
+            with closing(self._connect()) as conn:
+                with conn:
+                    conn.execute(
+                        f"DELETE FROM meta WHERE key NOT IN ({', '.join('?' * len(header))})",
+                        [key for key, _value in header],
+                    )
+                    conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", header)
+                    conn.executemany("INSERT OR REPLACE INTO items (rating_key, data) VALUES (?, ?)", changed)
+                    conn.executemany("DELETE FROM items WHERE rating_key = ?", removed)
+        except (sqlite3.Error, OSError) as e:
+            log_warning(f"Error saving {self.media_key} cache database: {e}")
+            return False
+        if tracked:
+            items.dirty.difference_update(
+                key for key in keys if key not in items or isinstance(items[key], _TrackedEntry)
+            )
+        return True
+
+
+def import_json_media_cache(json_path: str, store: MediaCacheStore) -> bool:
+    """
+    One-time import of a library's JSON media cache into its database.
+    The JSON file itself is left as it is.
+
+    Returns:
+        True if anything was imported, False otherwise
+    """
+    data = load_media_cache(json_path, store.media_key)
+    if data.get("last_updated") is None and not data.get(store.media_key):
+        return False
+    if not store.save(data):
+        return False
+    print(
+        f"Imported {len(data[store.media_key])} {store.media_key} from "
+        f"{os.path.basename(json_path)} into {os.path.basename(store.db_path)}"
+    )
+    return True
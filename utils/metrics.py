@@ -106,6 +106,14 @@ _COUNTERS = {
         "Total local cache lookups, by result.",
         ("result",),
     ),
+    "curatarr_tmdb_cache_lookups_total": (
+        "Total TMDB response cache lookups, by endpoint TTL class and result.",
+        ("ttl_class", "result"),
+    ),
+    "curatarr_single_flight_requests_total": (
+        "Total coalescable outbound requests, by service and result (leader sent it, shared joined one in flight).",
+        ("service", "result"),
+    ),
     "curatarr_self_update_attempts_total": (
         "Total self-update attempts, by outcome.",
         ("outcome",),
@@ -116,6 +124,14 @@ _COUNTERS = {
     ),
 }
 
+# name -> (HELP text, label names) - gauges
+_GAUGES = {
+    "curatarr_api_rate_limit_per_second": (
+        "Current adaptive request rate limit in requests per second, by service.",
+        ("service",),
+    ),
+}
+
 # name -> (HELP text, label names) - histograms
 _HISTOGRAMS = {
     "curatarr_recommender_run_duration_seconds": (
@@ -141,18 +157,19 @@ def _state_path() -> str:
 def _load_state() -> dict:
     path = _state_path()
     if not os.path.isfile(path):
-        return {"counters": {}, "histograms": {}}
+        return {"counters": {}, "gauges": {}, "histograms": {}}
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
         if not isinstance(data, dict):
-            return {"counters": {}, "histograms": {}}
+            return {"counters": {}, "gauges": {}, "histograms": {}}
         data.setdefault("counters", {})
+        data.setdefault("gauges", {})
         data.setdefault("histograms", {})
         return data
     except Exception as e:
         logger.debug(f"Could not read metrics state ({path}): {e}")
-        return {"counters": {}, "histograms": {}}
+        return {"counters": {}, "gauges": {}, "histograms": {}}
 
 
 def _atomic_write(path: str, data: dict) -> None:
@@ -200,6 +217,17 @@ def _increment_counter(name: str, labels: Dict[str, str], amount: float = 1.0) -
             logger.debug(f"Could not persist metric {name}: {e}")
 
 
+def _set_gauge(name: str, labels: Dict[str, str], value: float) -> None:
+    key = _label_key(labels)
+    with _lock:
+        try:
+            state = _load_state()
+            state["gauges"].setdefault(name, {})[key] = value
+            _atomic_write(_state_path(), state)
+        except Exception as e:
+            logger.debug(f"Could not persist metric {name}: {e}")
+
+
 def _observe_histogram(name: str, labels: Dict[str, str], value: float) -> None:
     key = _label_key(labels)
     with _lock:
@@ -269,11 +297,31 @@ def track_api_call(service: str) -> Iterator[None]:
         record_api_call(service, outcome, time.monotonic() - start)
 
 
+def record_rate_limit(service: str, requests_per_second: float) -> None:
+    """The current adaptive request rate for `service` (see
+    utils/rate_limit.py's AdaptiveRateLimiter) - the most recent value
+    wins, whichever process recorded it."""
+    _set_gauge("curatarr_api_rate_limit_per_second", {"service": service}, requests_per_second)
+
+
 def record_cache_lookup(result: str) -> None:
     """One local on-disk cache read. `result` is 'hit' or 'miss'."""
     _increment_counter("curatarr_cache_lookups_total", {"result": result})
 
 
+def record_tmdb_cache_lookups(ttl_class: str, result: str, count: int = 1) -> None:
+    """`count` TMDB response cache lookups (utils/tmdb_cache.py) of one
+    endpoint class. `result` is 'hit' or 'miss'."""
+    _increment_counter("curatarr_tmdb_cache_lookups_total", {"ttl_class": ttl_class, "result": result}, count)
+
+
+def record_single_flight_requests(service: str, result: str, count: int = 1) -> None:
+    """`count` requests to `service` through its SingleFlight (utils/
+    single_flight.py). `result` is 'leader' (sent to the network) or
+    'shared' (joined an identical request already in flight)."""
+    _increment_counter("curatarr_single_flight_requests_total", {"service": service, "result": result}, count)
+
+
 def record_self_update_attempt(outcome: str) -> None:
     """One self-update attempt (CLI `--self-update` or the web UI's
     "Update now" for a frozen binary - see utils/self_update.py's
@@ -315,6 +363,15 @@ def render_prometheus_text() -> str:
             labels = f"{{{label_str}}}" if label_str else ""
             lines.append(f"{name}{labels} {value}")
 
+    gauges = state.get("gauges", {})
+    for name, (help_text, _label_names) in _GAUGES.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for key, value in sorted(gauges.get(name, {}).items()):
+            label_str = _format_labels(key)
+            labels = f"{{{label_str}}}" if label_str else ""
+            lines.append(f"{name}{labels} {value}")
+
     histograms = state.get("histograms", {})
     for name, (help_text, _label_names) in _HISTOGRAMS.items():
         lines.append(f"# HELP {name} {help_text}")
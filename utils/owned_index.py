@@ -0,0 +1,227 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persisted owned-title index.
+
+The external run asks "is this already in the library?" from three
+places - every user's get_library_items() (movies and shows), Sequel
+Huntarr and Horizon Huntarr - and each used to list the whole Plex
+section to answer it, although between two runs a library usually gains
+or changes a handful of items.
+
+OwnedIndex is one section's TMDB/TVDB/IMDb ids and (title, year) pairs,
+saved next to the other caches and kept in step with Plex between runs:
+
+  - each refresh lists only the items updated since the newest updatedAt
+    already indexed (the watermark, less OWNED_INDEX_OVERLAP_SECONDS) -
+    an added item counts as updated too;
+  - removals never show up as updates, so the refresh also reads the
+    section's item count; an index holding more items than the section
+    does is rebuilt from a full listing, as it is every
+    OWNED_INDEX_RESYNC_DAYS and whenever the section it was built from
+    is not the one asked about.
+
+Within one process a refreshed index is reused for
+OWNED_INDEX_REUSE_SECONDS, so a run checking the same section for every
+user asks Plex once.
+"""
+
+import logging
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+import requests
+
+from .cache import load_owned_index, save_owned_index
+from .config import OWNED_INDEX_OVERLAP_SECONDS, OWNED_INDEX_RESYNC_DAYS, OWNED_INDEX_REUSE_SECONDS
+from .plex import iter_library_snapshot, library_section_size, read_library_snapshot, updated_at_epoch
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout changes; an index of another format is
+# discarded and rebuilt from a full listing.
+OWNED_INDEX_FORMAT = 1
+
+DAY_SECONDS = 24 * 60 * 60
+
+# Guid prefix -> (entry field, id type) of the ids an entry keeps.
+_GUID_FIELDS = {"tmdb://": ("tmdb", int), "tvdb://": ("tvdb", int), "imdb://": ("imdb", str)}
+
+
+def _owned_entry(item: Any) -> Dict[str, Any]:
+    """The compact record an index keeps of one library item."""
+    entry: Dict[str, Any] = {
+        "title": item.title.lower().strip(),
+        "year": getattr(item, "year", None),
+        "tmdb": [],
+        "tvdb": [],
+        "imdb": [],
+    }
+    for guid in getattr(item, "guids", None) or []:
+        for prefix, (field, cast) in _GUID_FIELDS.items():
+            if prefix in guid.id:
+                try:
+                    entry[field].append(cast(guid.id.split(prefix)[1]))
+                except (ValueError, IndexError) as e:
+                    logger.debug(f"Error parsing {field} ID from guid {guid.id}: {e}")
+                break
+    return entry
+
+
+class OwnedIndex:
+    """The ids and titles of one library section's items, kept in step with Plex between runs."""
+
+    def __init__(self, section_uuid: str = "") -> None:
+        self.section_uuid = section_uuid
+        # Newest updatedAt indexed, and when the index was last built
+        # from a full listing.
+        self.watermark = 0
+        self.synced_at = 0.0
+        # rating key -> _owned_entry(), in library order.
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add_item(self, item: Any) -> None:
+        """Index one listed item, replacing what was indexed for it."""
+        self.entries[str(item.ratingKey)] = _owned_entry(item)
+        self.watermark = max(self.watermark, updated_at_epoch(item))
+
+    def updated_since(self, now: Optional[float] = None) -> Optional[int]:
+        """
+        The updatedAt to list changes from, or None when the section has
+        to be listed in full: nothing indexed yet, or a resync due.
+        """
+        now = time.time() if now is None else now
+        if not self.entries or not self.watermark or now - self.synced_at > OWNED_INDEX_RESYNC_DAYS * DAY_SECONDS:
+            return None
+        return max(0, self.watermark - OWNED_INDEX_OVERLAP_SECONDS)
+
+    def tmdb_ids(self) -> Set[int]:
+        return {tmdb_id for entry in self.entries.values() for tmdb_id in entry["tmdb"]}
+
+    def tvdb_ids(self) -> Set[int]:
+        return {tvdb_id for entry in self.entries.values() for tvdb_id in entry["tvdb"]}
+
+    def imdb_ids(self) -> Set[str]:
+        return {imdb_id for entry in self.entries.values() for imdb_id in entry["imdb"]}
+
+    def titles(self) -> Set[Tuple[str, Optional[int]]]:
+        """(lower-cased title, year) of every item, for matching without ids."""
+        return {(entry["title"], entry["year"]) for entry in self.entries.values()}
+
+    def item_tmdb_ids(self) -> List[int]:
+        """Each item's first TMDB ID, in library order - items without one are left out."""
+        return [entry["tmdb"][0] for entry in self.entries.values() if entry["tmdb"]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form for save_owned_index()."""
+        return {
+            "format": OWNED_INDEX_FORMAT,
+            "section_uuid": self.section_uuid,
+            "watermark": self.watermark,
+            "synced_at": self.synced_at,
+            "entries": self.entries,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping, section_uuid: str = "") -> Optional["OwnedIndex"]:
+        """
+        Inverse of to_dict(); None for anything of another format, built
+        from another section, or malformed.
+        """
+        if data.get("format") != OWNED_INDEX_FORMAT or data.get("section_uuid") != section_uuid:
+            return None
+        try:
+            index = cls(section_uuid)
+            index.watermark = int(data["watermark"])
+            index.synced_at = float(data["synced_at"])
+            for key, entry in data["entries"].items():
+                index.entries[str(key)] = {
+                    "title": str(entry["title"]),
+                    "year": entry["year"],
+                    "tmdb": [int(value) for value in entry["tmdb"]],
+                    "tvdb": [int(value) for value in entry["tvdb"]],
+                    "imdb": [str(value) for value in entry["imdb"]],
+                }
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return index
+
+
+# Index path -> (refreshed at, index), for OWNED_INDEX_REUSE_SECONDS.
+_refreshed: Dict[str, Tuple[float, OwnedIndex]] = {}
+_refreshed_lock = threading.Lock()
+
+
+def _apply_changes(index: OwnedIndex, server: Any, section: Any, now: float) -> bool:
+    """
+    Fold the items updated since the index's watermark in.
+
+    Returns:
+        False when the index has to be rebuilt from a full listing instead
+    """
+    since = index.updated_since(now)
+    if since is None:
+        return False
+    try:
+        changed = list(iter_library_snapshot(server, section, filters={"updatedAt>>": since}))
+        total = library_section_size(server, section)
+    except (ValueError, requests.RequestException, ET.ParseError) as e:
+        logger.debug(f"Owned index changes unavailable ({e}) - listing section in full")
+        return False
+    for item in changed:
+        index.add_item(item)
+    # Anything else means items left the section (or arrived between the
+    # two requests) - only a full listing says which.
+    return len(index) == total
+
+
+def owned_library_index(server: Any, section: Any, cache_dir: str) -> OwnedIndex:
+    """
+    `section`'s owned-title index, refreshed from Plex (see the module
+    docstring) and saved to `cache_dir`.
+
+    Args:
+        server: PlexServer the section belongs to
+        section: Library section to index
+        cache_dir: Directory the index is kept in
+
+    Raises:
+        Whatever listing the section in full raises, when it has to be
+    """
+    path = os.path.join(cache_dir, f"owned_index_{section.key}.json")
+    section_uuid = str(getattr(section, "uuid", "") or "")
+    with _refreshed_lock:
+        now = time.time()
+        reused = _refreshed.get(path)
+        if reused is not None and now - reused[0] < OWNED_INDEX_REUSE_SECONDS:
+            return reused[1]
+
+        index = OwnedIndex.from_dict(load_owned_index(path), section_uuid)
+        if index is None or not _apply_changes(index, server, section, now):
+            index = OwnedIndex(section_uuid)
+            for item in read_library_snapshot(server, section):
+                index.add_item(item)
+            index.synced_at = now
+        save_owned_index(path, index.to_dict())
+        _refreshed[path] = (now, index)
+        return index
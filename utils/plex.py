@@ -28,13 +28,28 @@ import of plex_policy (and must never gain one - plex_policy imports
 FROM here, not the other way around, to avoid a cycle).
 """
 
+import bisect
+import hashlib
 import json
 import logging
 import os
 import time
 import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TypedDict, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 import plexapi.exceptions
 import plexapi.server
@@ -42,11 +57,26 @@ import requests
 import urllib3
 from plexapi.myplex import MyPlexAccount
 
-from .config import PLEX_LONG_REQUEST_TIMEOUT, PLEX_REQUEST_TIMEOUT
+from .config import (
+    COLLECTION_SORT_CUSTOM,
+    PLEX_HISTORY_PAGE_SIZE,
+    PLEX_MAX_WORKERS,
+    PLEX_METADATA_BATCH_SIZE,
+    PLEX_REQUEST_TIMEOUT,
+    PLEX_SNAPSHOT_PAGE_SIZE,
+)
 from .display import GREEN, RESET, YELLOW, log_error, log_warning
-from .helpers import get_project_root, harden_file_permissions, normalize_title, read_response_capped
+from .helpers import (
+    get_project_root,
+    harden_file_permissions,
+    iter_response_capped,
+    normalize_title,
+    read_response_capped,
+)
+from .http_session import http_client
 from .labels import remove_labels_from_items
 from .metrics import record_api_call
+from .tmdb_pool import fetch_concurrently
 
 # Module-level logger
 logger = logging.getLogger("curatarr")
@@ -68,7 +98,8 @@ def _resolve_verify_ssl(config: dict) -> bool:
 
 
 def _capped_get(url, **kwargs):
-    """requests.get() wrapper that streams the response and caps its
+    """requests.get() wrapper (over the pooled http_client - see
+    utils/http_session.py) that streams the response and caps its
     body size (see utils.helpers.read_response_capped) - config['plex']
     ['url'] is user-configured and could point anywhere, so a response
     body is never assumed to be a bounded size just because a
@@ -90,7 +121,7 @@ def _capped_get(url, **kwargs):
     outcome = "error"
     try:
         kwargs.setdefault("stream", True)
-        response = requests.get(url, **kwargs)
+        response = http_client.get(url, **kwargs)
         try:
             read_response_capped(response)
         except ValueError as e:
@@ -101,13 +132,22 @@ def _capped_get(url, **kwargs):
         record_api_call("plex", outcome, time.time() - start)
 
 
+def _streamed_get(url, **kwargs):
+    """_capped_get without the read: the streaming response, for a caller
+    that parses the body as it arrives - through
+    utils.helpers.iter_response_capped, which applies the same size cap -
+    and records its own metrics once it has (see iter_plex_history)."""
+    kwargs["stream"] = True
+    return http_client.get(url, **kwargs)
+
+
 def _capped_put(url, **kwargs):
     """See _capped_get's docstring - identical reasoning, for PUT."""
     start = time.time()
     outcome = "error"
     try:
         kwargs.setdefault("stream", True)
-        response = requests.put(url, **kwargs)
+        response = http_client.put(url, **kwargs)
         try:
             read_response_capped(response)
         except ValueError as e:
@@ -302,8 +342,438 @@ def get_watched_show_count(config: Dict, users_to_check: List[str]) -> int:
         return 0
 
 
+class PlexPlay(NamedTuple):
+    """One play from /status/sessions/history/all - the Video attributes
+    the history consumers below read, and nothing else of the element."""
+
+    rating_key: Optional[str]
+    media_type: Optional[str]
+    grandparent_key: Optional[str]
+    viewed_at: int
+    user_rating: Optional[float]
+
+
+class HistoryItem:
+    """The shape of a movie history entry fetch_plex_watch_history_movies()
+    returns (utils/tautulli.py builds the same one)."""
+
+    def __init__(self, rating_key, viewed_at, user_rating=None):
+        self.ratingKey = rating_key
+        self.viewedAt = viewed_at
+        self.userRating = user_rating
+
+
+def _play_from_video(attrib: Dict[str, str]) -> PlexPlay:
+    user_rating = attrib.get("userRating")
+    return PlexPlay(
+        rating_key=attrib.get("ratingKey"),
+        media_type=attrib.get("type"),
+        grandparent_key=attrib.get("grandparentKey"),
+        viewed_at=int(attrib.get("viewedAt") or 0),
+        user_rating=float(user_rating) if user_rating else None,
+    )
+
+
+def _iter_streamed_children(response) -> Iterator[ET.Element]:
+    """The children of a streamed XML body's root element, each parsed as
+    the body arrives and dropped from the tree once the caller is done
+    with it, so a page is never held whole, as bytes or as a tree.
+
+    Raises:
+        ValueError: body over the response cap (see iter_response_capped)
+        ET.ParseError: malformed body
+    """
+    parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+    root: Optional[ET.Element] = None
+    depth = 0
+    for chunk in iter_response_capped(response):
+        parser.feed(chunk)
+        for event in parser.read_events():
+            # Only ("start" | "end", element) pairs were asked for.
+            elem = event[-1]
+            if not isinstance(elem, ET.Element):
+                continue
+            if event[0] == "start":
+                depth += 1
+                if root is None:
+                    root = elem
+                continue
+            depth -= 1
+            if depth == 1 and root is not None:
+                yield elem
+                del root[:]
+    parser.close()
+
+
+def _iter_history_page(response) -> Iterator[PlexPlay]:
+    """The plays of one streamed history page - see _iter_streamed_children."""
+    try:
+        for elem in _iter_streamed_children(response):
+            if elem.tag == "Video":
+                yield _play_from_video(elem.attrib)
+    except ValueError as e:
+        raise requests.RequestException(f"Plex response rejected: {e}") from e
+
+
+def iter_plex_history(
+    config: Dict, account_id: str, section_key: Any, viewed_after: Optional[int] = None
+) -> Iterator[PlexPlay]:
+    """
+    Stream one account's watch history for one library section, newest
+    first, a PLEX_HISTORY_PAGE_SIZE page (X-Plex-Container-Start) at a time.
+
+    Args:
+        config: Configuration dict with plex URL and token
+        account_id: Plex account ID
+        section_key: Library section key
+        viewed_after: Only plays viewed after this Unix time (see
+            utils/watch_ledger.py); the whole history when None
+
+    Raises:
+        requests.RequestException, ET.ParseError: while iterating
+    """
+    url = f"{config['plex']['url']}/status/sessions/history/all"
+    params: Dict[str, Any] = {
+        "accountID": account_id,
+        "librarySectionID": section_key,
+        "sort": "viewedAt:desc",
+        "X-Plex-Container-Size": PLEX_HISTORY_PAGE_SIZE,
+    }
+    if viewed_after is not None:
+        params["viewedAt>"] = viewed_after
+
+    start = 0
+    while True:
+        # Same metrics as _capped_get, covering the streamed read too
+        request_start = time.time()
+        outcome = "error"
+        try:
+            response = _streamed_get(
+                url,
+                params={**params, "X-Plex-Container-Start": start},
+                headers={"X-Plex-Token": config["plex"]["token"]},
+                verify=_resolve_verify_ssl(config),
+                timeout=PLEX_REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            count = 0
+            for play in _iter_history_page(response):
+                count += 1
+                yield play
+            outcome = "success"
+        finally:
+            record_api_call("plex", outcome, time.time() - request_start)
+        # A short page is the last one. A long one means the server
+        # ignored the paging parameters and already sent everything.
+        if count != PLEX_HISTORY_PAGE_SIZE:
+            return
+        start += count
+
+
+class LibraryGuid(NamedTuple):
+    """A Guid child of a snapshot item - `id` as on plexapi's Guid."""
+
+    id: str
+
+
+class LibraryTag(NamedTuple):
+    """A Label child of a snapshot item - `tag` as on plexapi's Label."""
+
+    tag: str
+
+
+class LibraryItem(NamedTuple):
+    """
+    One movie/show of a projected library snapshot (read_library_snapshot).
+
+    Fields are named after the plexapi Movie/Show attributes they carry,
+    so code written against a section.all() listing reads these unchanged.
+    Anything else needs the full item - see fetch_plex_items().
+    """
+
+    ratingKey: int
+    type: str
+    title: str
+    year: Optional[int]
+    guids: Tuple[LibraryGuid, ...]
+    labels: Tuple[LibraryTag, ...]
+    viewCount: int
+    userRating: Optional[float]
+    leafCount: Optional[int]
+    lastViewedAt: Optional[datetime]
+    addedAt: Optional[datetime]
+    updatedAt: Optional[datetime]
+
+
+def updated_at_epoch(item: Any) -> int:
+    """`item`'s updatedAt (a LibraryItem's or a plexapi object's) as epoch seconds, 0 if it has none."""
+    updated_at = getattr(item, "updatedAt", None)
+    return int(updated_at.timestamp()) if isinstance(updated_at, datetime) else 0
+
+
+# What a full item's XML carries that changes without its metadata
+# changing - labels, collections and field locks (curatarr's own edits
+# write these), and per-viewer playback state. Left out of
+# plex_metadata_digest().
+_DIGEST_IGNORED_ELEMENTS = frozenset({"Label", "Collection", "Field"})
+_DIGEST_IGNORED_ATTRIBUTES = frozenset(
+    {
+        "updatedAt",
+        "viewCount",
+        "viewOffset",
+        "viewedLeafCount",
+        "lastViewedAt",
+        "lastRatedAt",
+        "skipCount",
+        "userRating",
+    }
+)
+
+
+def _digest_element(elem: ET.Element, digest: Any) -> None:
+    attrib = sorted((k, v) for k, v in elem.attrib.items() if k not in _DIGEST_IGNORED_ATTRIBUTES)
+    digest.update(json.dumps([elem.tag, attrib]).encode())
+    for child in elem:
+        if child.tag not in _DIGEST_IGNORED_ELEMENTS:
+            _digest_element(child, digest)
+    digest.update(b"/")
+
+
+def plex_metadata_digest(item: Any) -> Optional[str]:
+    """
+    Digest of a fully loaded plexapi item's metadata: its XML less labels,
+    collections, field locks and viewing state, so a label edit - which
+    moves updatedAt all the same - leaves it unchanged. None for an object
+    not built from XML.
+    """
+    data = getattr(item, "_data", None)
+    if not isinstance(data, ET.Element):
+        return None
+    digest = hashlib.sha1()
+    _digest_element(data, digest)
+    return digest.hexdigest()
+
+
+# Section types a snapshot can be read for, as Plex's `type` filter
+_SNAPSHOT_LIBTYPES = {"movie": 1, "show": 2}
+
+# Child elements and fields a snapshot never reads - asked to be left out
+# of the listing (a server that ignores this only costs bandwidth: the
+# parser drops them either way)
+_SNAPSHOT_EXCLUDED_ELEMENTS = (
+    "Media,Genre,Country,Director,Writer,Role,Producer,Collection,Similar,Image,UltraBlurColors"
+)
+_SNAPSHOT_EXCLUDED_FIELDS = "summary,tagline"
+
+
+def _optional(cast: Any, value: Optional[str]) -> Any:
+    return cast(value) if value else None
+
+
+def _library_item(elem: ET.Element) -> LibraryItem:
+    attrib = elem.attrib
+    last_viewed_at = _optional(int, attrib.get("lastViewedAt"))
+    added_at = _optional(int, attrib.get("addedAt"))
+    updated_at = _optional(int, attrib.get("updatedAt"))
+    return LibraryItem(
+        ratingKey=int(attrib["ratingKey"]),
+        type=attrib.get("type", ""),
+        title=attrib.get("title", ""),
+        year=_optional(int, attrib.get("year")),
+        guids=tuple(LibraryGuid(child.attrib["id"]) for child in elem if child.tag == "Guid"),
+        labels=tuple(LibraryTag(child.attrib["tag"]) for child in elem if child.tag == "Label"),
+        viewCount=int(attrib.get("viewCount") or 0),
+        userRating=_optional(float, attrib.get("userRating")),
+        leafCount=_optional(int, attrib.get("leafCount")),
+        lastViewedAt=datetime.fromtimestamp(last_viewed_at) if last_viewed_at else None,
+        addedAt=datetime.fromtimestamp(added_at) if added_at else None,
+        updatedAt=datetime.fromtimestamp(updated_at) if updated_at else None,
+    )
+
+
+def _iter_snapshot_page(response) -> Iterator[LibraryItem]:
+    """The items of one streamed section listing page - see _iter_streamed_children."""
+    try:
+        for elem in _iter_streamed_children(response):
+            if elem.tag in ("Video", "Directory"):
+                yield _library_item(elem)
+    except ValueError as e:
+        raise requests.RequestException(f"Plex response rejected: {e}") from e
+
+
+def _snapshot_libtype(section: Any) -> int:
+    section_type = str(getattr(section, "type", ""))
+    libtype = _SNAPSHOT_LIBTYPES.get(section_type)
+    if libtype is None:
+        raise ValueError(f"No library snapshot for section type {section_type!r}")
+    return libtype
+
+
+def _section_listing_request(server: Any, section: Any) -> Tuple[str, Dict[str, Any]]:
+    """URL and request kwargs of `section`'s listing through `server`'s own connection."""
+    return f"{server._baseurl}/library/sections/{section.key}/all", {
+        "headers": {"X-Plex-Token": server._token},
+        "verify": getattr(getattr(server, "_session", None), "verify", True),
+        "timeout": PLEX_REQUEST_TIMEOUT,
+    }
+
+
+def library_section_size(server: Any, section: Any) -> int:
+    """
+    How many movies/shows `section` holds - the listing's totalSize, read
+    from an empty page rather than by listing anything.
+
+    Raises:
+        ValueError: for a section type snapshots aren't read for
+        requests.RequestException, ET.ParseError: if it can't be read
+    """
+    libtype = _snapshot_libtype(section)
+    url, request = _section_listing_request(server, section)
+    response = _capped_get(
+        url, params={"type": libtype, "X-Plex-Container-Start": 0, "X-Plex-Container-Size": 0}, **request
+    )
+    response.raise_for_status()
+    root = ET.fromstring(response.content)
+    total = root.get("totalSize", root.get("size"))
+    if total is None:
+        raise requests.RequestException("Plex listing carried no totalSize")
+    return int(total)
+
+
+def iter_library_snapshot(
+    server: Any, section: Any, filters: Optional[Mapping[str, Any]] = None
+) -> Iterator[LibraryItem]:
+    """
+    Stream `section`'s items as LibraryItem records, through `server`'s
+    own connection (so a switched user's server reads that user's
+    viewCount/userRating), a PLEX_SNAPSHOT_PAGE_SIZE page at a time.
+
+    Args:
+        filters: Extra Plex listing filters, e.g. {"updatedAt>>": epoch}
+            for only the items changed since then
+
+    Raises:
+        ValueError: for a section type snapshots aren't read for
+        requests.RequestException, ET.ParseError: while iterating
+    """
+    libtype = _snapshot_libtype(section)
+    url, request = _section_listing_request(server, section)
+    params: Dict[str, Any] = {
+        **(filters or {}),
+        "type": libtype,
+        "includeGuids": 1,
+        "excludeElements": _SNAPSHOT_EXCLUDED_ELEMENTS,
+        "excludeFields": _SNAPSHOT_EXCLUDED_FIELDS,
+        "X-Plex-Container-Size": PLEX_SNAPSHOT_PAGE_SIZE,
+    }
+
+    start = 0
+    while True:
+        request_start = time.time()
+        outcome = "error"
+        try:
+            response = _streamed_get(url, params={**params, "X-Plex-Container-Start": start}, **request)
+            response.raise_for_status()
+            count = 0
+            for item in _iter_snapshot_page(response):
+                count += 1
+                yield item
+            outcome = "success"
+        finally:
+            record_api_call("plex", outcome, time.time() - request_start)
+        if count != PLEX_SNAPSHOT_PAGE_SIZE:
+            return
+        start += count
+
+
+def read_library_snapshot(server: Any, section: Any) -> List[Any]:
+    """
+    `section`'s items as a projected snapshot: LibraryItem records holding
+    only what library scans read (ids, guids, title/year, view state,
+    rating, labels, episode count), streamed and parsed page by page,
+    instead of a full plexapi object per item from section.all().
+
+    Falls back to section.all() when the snapshot can't be read - a section
+    type it isn't read for, or a request/parse failure - so callers get a
+    listing either way; both shapes carry the attributes LibraryItem names.
+
+    Args:
+        server: PlexServer (or a user's switched connection) to read through
+        section: Library section of that server
+    """
+    try:
+        return list(iter_library_snapshot(server, section))
+    except (ValueError, requests.RequestException, ET.ParseError) as e:
+        logger.debug(f"Library snapshot unavailable ({e}) - listing section in full")
+        return section.all()
+
+
+def plex_max_workers(config: Dict) -> int:
+    """How many independent per-account Plex reads to run at once:
+    plex.max_concurrent_requests, else PLEX_MAX_WORKERS."""
+    try:
+        return max(1, int(config["plex"].get("max_concurrent_requests", PLEX_MAX_WORKERS)))
+    except (TypeError, ValueError):
+        log_warning(f"Invalid plex.max_concurrent_requests, using {PLEX_MAX_WORKERS}")
+        return PLEX_MAX_WORKERS
+
+
+def fetch_plex_history(
+    config: Dict, account_ids: List[str], section: Any, viewed_after: Optional[int] = None
+) -> Dict[str, List[PlexPlay]]:
+    """
+    Fetch each account's watch history for a library section once, for
+    every consumer below to share (the TV run feeds one fetch to both
+    fetch_plex_watch_history_shows and watched_episodes_by_show).
+    Accounts are fetched concurrently, up to plex_max_workers() at once.
+
+    Args:
+        config: Configuration dict with plex URL and token
+        account_ids: List of account ID strings
+        section: PlexAPI library section
+        viewed_after: Only plays viewed after this Unix time; the whole
+            history when None
+
+    Returns:
+        Dict of account ID -> its plays, newest first. An account whose
+        history couldn't be fetched is logged and left out.
+    """
+
+    def fetch(account_id: str) -> Union[List[PlexPlay], Exception]:
+        try:
+            return list(iter_plex_history(config, account_id, section.key, viewed_after))
+        except (requests.RequestException, ET.ParseError) as e:
+            return e
+
+    history: Dict[str, List[PlexPlay]] = {}
+    results = fetch_concurrently(
+        fetch, account_ids, max_workers=plex_max_workers(config), ordered=True, thread_name_prefix="plex-history"
+    )
+    for account_id, plays in results:
+        if isinstance(plays, Exception):
+            # A failure to fetch one user's watch history is exactly the
+            # kind of thing an operator must see (#306) - the same class
+            # of silent failure that hid a real six-month Trakt outage -
+            # so this stays visible at the default 'quiet' level.
+            log_error(f"Error fetching watch history for account {account_id}: {plays}")
+        else:
+            history[account_id] = plays
+    return history
+
+
+def _plays_after(plays: List[PlexPlay], viewed_after: Optional[int]) -> List[PlexPlay]:
+    """`plays` cut down to what a viewedAt> request would have returned."""
+    if viewed_after is None:
+        return plays
+    return [play for play in plays if play.viewed_at > viewed_after]
+
+
 def fetch_plex_watch_history_movies(
-    config: Dict, account_ids: List[str], movies_section: Any
+    config: Dict,
+    account_ids: List[str],
+    movies_section: Any,
+    viewed_after: Optional[int] = None,
+    history: Optional[Dict[str, List[PlexPlay]]] = None,
 ) -> Tuple[List[Any], Dict]:
     """
     Fetch movie watch history for specified account IDs using direct Plex API.
@@ -312,6 +782,10 @@ def fetch_plex_watch_history_movies(
         config: Configuration dict with plex URL and token
         account_ids: List of account ID strings
         movies_section: PlexAPI movies library section
+        viewed_after: Only fetch plays viewed after this Unix time (see
+            utils/watch_ledger.py); the whole history when None
+        history: Already-fetched fetch_plex_history() output to use
+            instead of fetching
 
     Returns:
         Tuple of (all_history_items, watched_movie_dates dict)
@@ -332,70 +806,33 @@ def fetch_plex_watch_history_movies(
         all_history_items = []
         watched_movie_dates: Dict[str, Any] = {}
 
+        known_ids = [
+            account_id for account_id in account_ids if account_id in managed_users_map or account_id == owner_id
+        ]
+        if history is None:
+            # Logs its own error (#306) for an account it couldn't fetch
+            history = fetch_plex_history(config, known_ids, movies_section, viewed_after)
+        else:
+            history = {account_id: _plays_after(plays, viewed_after) for account_id, plays in history.items()}
+
         for i, account_id in enumerate(account_ids, 1):
             print(f"  [{i}/{len(account_ids)}] Fetching history for account ID {account_id}...", end="")
 
-            try:
-                if account_id in managed_users_map or account_id == owner_id:
-                    base_url = config["plex"]["url"]
-                    token = config["plex"]["token"]
-                    library_key = movies_section.key
-
-                    history_url = f"{base_url}/status/sessions/history/all"
-                    params = {
-                        "accountID": account_id,
-                        "librarySectionID": library_key,
-                        "sort": "viewedAt:desc",
-                        "X-Plex-Container-Size": 10000,
-                    }
-
-                    response = _capped_get(
-                        history_url,
-                        params=params,
-                        headers={"X-Plex-Token": token},
-                        verify=_resolve_verify_ssl(config),
-                        timeout=PLEX_REQUEST_TIMEOUT,
-                    )
-                    response.raise_for_status()
-
-                    root = ET.fromstring(response.content)
-
-                    for video in root.findall(".//Video"):
-
-                        class HistoryItem:
-                            def __init__(self, rating_key, viewed_at, user_rating=None):
-                                self.ratingKey = rating_key
-                                self.viewedAt = viewed_at
-                                self.userRating = user_rating
-
-                        rating_key = video.get("ratingKey")
-                        viewed_at_ts = int(video.get("viewedAt", 0))
-                        user_rating = float(video.get("userRating", 0)) if video.get("userRating") else None
-
-                        if rating_key and viewed_at_ts:
-                            item = HistoryItem(rating_key, datetime.fromtimestamp(viewed_at_ts), user_rating)
-                            all_history_items.append(item)
-
-                    print(f" {GREEN}OK{RESET}")
-                else:
-                    print(f" {YELLOW}SKIP (account not found in managed users){RESET}")
-
-            except (requests.RequestException, ET.ParseError) as e:
-                # Routed through the level-gated logging module (#306) -
-                # this is the one choke point that was still a bare
-                # print(), so logging.verbosity's off/quiet/verbose
-                # setting didn't govern it like every other integration
-                # (Plex connection init, TMDB, Trakt, Simkl, the shared
-                # Sonarr/Radarr/Tautulli/MDBList client, and this same
-                # module's fetch_plex_watch_history_shows/
-                # fetch_show_completion_data siblings just below, which
-                # already did this correctly). A failure to fetch one
-                # user's watch history is exactly the kind of thing an
-                # operator must see - the same class of silent failure
-                # that hid a real six-month Trakt outage - so this stays
-                # visible at the default 'quiet' level (log_error maps
-                # to logging.ERROR, at or above every non-off tier).
-                log_error(f"Error fetching watch history for account {account_id}: {e}")
+            if account_id not in known_ids:
+                print(f" {YELLOW}SKIP (account not found in managed users){RESET}")
+                continue
+
+            plays = history.get(account_id)
+            if plays is None:
+                print(f" {YELLOW}FAILED{RESET}")
+                continue
+
+            for play in plays:
+                if play.rating_key and play.viewed_at:
+                    item = HistoryItem(play.rating_key, datetime.fromtimestamp(play.viewed_at), play.user_rating)
+                    all_history_items.append(item)
+
+            print(f" {GREEN}OK{RESET}")
 
         return all_history_items, watched_movie_dates
 
@@ -405,7 +842,12 @@ def fetch_plex_watch_history_movies(
 
 
 def fetch_plex_watch_history_shows(
-    config: Dict, account_ids: List[str], tv_section: Any = None, return_timestamps: bool = False
+    config: Dict,
+    account_ids: List[str],
+    tv_section: Any = None,
+    return_timestamps: bool = False,
+    viewed_after: Optional[int] = None,
+    history: Optional[Dict[str, List[PlexPlay]]] = None,
 ) -> Union[Set[int], Tuple[Set[int], Dict[int, Any]]]:
     """
     Fetch TV show watch history for specified account IDs using direct Plex API.
@@ -415,6 +857,10 @@ def fetch_plex_watch_history_shows(
         account_ids: List of account ID strings
         tv_section: PlexAPI TV library section
         return_timestamps: If True, returns (set, dict) where dict maps show_id -> latest viewedAt
+        viewed_after: Only fetch plays viewed after this Unix time (see
+            utils/watch_ledger.py); the whole history when None
+        history: Already-fetched fetch_plex_history() output to use
+            instead of fetching (cut down to viewed_after here)
 
     Returns:
         Set of watched show IDs (rating keys), or tuple (set, dict) if return_timestamps=True
@@ -422,72 +868,95 @@ def fetch_plex_watch_history_shows(
     print("")
     print(f"{GREEN}Fetching Plex watch history for {len(account_ids)} user(s)...{RESET}")
 
+    if history is None:
+        history = fetch_plex_history(config, account_ids, tv_section, viewed_after)
+    else:
+        history = {account_id: _plays_after(plays, viewed_after) for account_id, plays in history.items()}
+
     watched_show_ids: Set[int] = set()
     show_timestamps: Dict[int, Any] = {}  # show_id -> latest viewedAt timestamp
 
     for account_id in account_ids:
+        plays = history.get(account_id)
+        if plays is None:
+            continue
         print("")
         print(f"{GREEN}Fetching Plex history for account ID: {account_id}{RESET}")
 
-        url = f"{config['plex']['url']}/status/sessions/history/all"
-        params = {
-            "accountID": account_id,
-            "librarySectionID": tv_section.key,
-            "sort": "viewedAt:desc",
-            "X-Plex-Container-Size": 5000,
-        }
-
-        try:
-            response = _capped_get(
-                url,
-                params=params,
-                headers={"X-Plex-Token": config["plex"]["token"]},
-                verify=_resolve_verify_ssl(config),
-                timeout=PLEX_REQUEST_TIMEOUT,
-            )
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-            episode_count = 0
+        episode_count = 0
+        for play in plays:
+            if play.media_type == "episode" and play.grandparent_key:
+                show_id = int(play.grandparent_key.split("/")[-1])
+                watched_show_ids.add(show_id)
+                episode_count += 1
 
-            for video in root.findall(".//Video"):
-                if video.get("type") == "episode":
-                    grandparent_key_path = video.get("grandparentKey")
-                    if grandparent_key_path:
-                        grandparent_key = grandparent_key_path.split("/")[-1]
-                        show_id = int(grandparent_key)
-                        watched_show_ids.add(show_id)
-                        episode_count += 1
-
-                        # Track latest viewedAt per show for recency decay
-                        if return_timestamps:
-                            viewed_at_str = video.get("viewedAt")
-                            if viewed_at_str:
-                                viewed_at = int(viewed_at_str)
-                                if show_id not in show_timestamps or viewed_at > show_timestamps[show_id]:
-                                    show_timestamps[show_id] = viewed_at
-
-            print(f"Fetched {episode_count} watched episodes from {len(watched_show_ids)} shows")
+                # Track latest viewedAt per show for recency decay
+                if return_timestamps and play.viewed_at:
+                    if show_id not in show_timestamps or play.viewed_at > show_timestamps[show_id]:
+                        show_timestamps[show_id] = play.viewed_at
 
-        except (requests.RequestException, ET.ParseError) as e:
-            log_error(f"Error fetching Plex history: {e}")
-            continue
+        print(f"Fetched {episode_count} watched episodes from {len(watched_show_ids)} shows")
 
     if return_timestamps:
         return watched_show_ids, show_timestamps
     return watched_show_ids
 
 
-def fetch_show_completion_data(config: Dict, account_ids: List[str], tv_section: Any) -> Dict[int, Dict]:
+def watched_episodes_by_show(
+    history: Mapping[str, List[PlexPlay]], account_ids: List[str]
+) -> Tuple[Dict[int, Set[str]], Dict[int, int]]:
+    """
+    The accounts' episode plays grouped by show (grandparentKey).
+
+    Args:
+        history: fetch_plex_history() output
+        account_ids: The accounts to read it for
+
+    Returns:
+        Tuple of (show_id -> distinct watched episode rating keys,
+        show_id -> most recent viewedAt)
+    """
+    show_episodes: Dict[int, Set[str]] = {}
+    show_last_watched: Dict[int, int] = {}
+    for account_id in account_ids:
+        for play in history.get(account_id, ()):
+            if play.media_type == "episode" and play.grandparent_key and play.rating_key:
+                show_id = int(play.grandparent_key.split("/")[-1])
+                show_episodes.setdefault(show_id, set()).add(play.rating_key)
+                show_last_watched[show_id] = max(show_last_watched.get(show_id, 0), play.viewed_at)
+    return show_episodes, show_last_watched
+
+
+def fetch_show_completion_data(
+    config: Dict,
+    account_ids: List[str],
+    tv_section: Any,
+    history: Optional[Dict[str, List[PlexPlay]]] = None,
+    shows: Optional[Iterable[Any]] = None,
+    watched_episodes: Optional[Tuple[Mapping[int, Set[str]], Mapping[int, int]]] = None,
+) -> Dict[int, Dict]:
     """
     Fetch detailed watch completion data for TV shows.
 
     Used to detect dropped shows - shows that were started but abandoned.
 
+    Watched episodes are the distinct episodes in the accounts' history,
+    grouped by show (grandparentKey); total episodes is each show's
+    leafCount from the section listing - no per-show episode listing.
+    Not viewedLeafCount: through the admin connection that is the admin's
+    own watched state, not these accounts'.
+
     Args:
         config: Configuration dict with plex URL and token
         account_ids: List of account ID strings
         tv_section: PlexAPI TV library section
+        history: Already-fetched fetch_plex_history() output - the whole
+            history, not a viewed_after slice - to use instead of fetching
+        shows: Already-fetched listing of tv_section's shows to use
+            instead of listing it again
+        watched_episodes: watched_episodes_by_show()'s result to use
+            instead of any history - e.g. the watch ledger's, kept
+            across runs (utils/watch_ledger.py)
 
     Returns:
         Dict mapping show_id to completion data:
@@ -499,73 +968,108 @@ def fetch_show_completion_data(config: Dict, account_ids: List[str], tv_section:
         }
     """
     show_data: Dict[int, Any] = {}
-    show_episodes: Dict[int, Set[Any]] = {}  # show_id -> set of episode rating keys
-    show_last_watched: Dict[int, Any] = {}  # show_id -> most recent viewedAt
 
-    # Fetch watched episode data from history
-    for account_id in account_ids:
-        url = f"{config['plex']['url']}/status/sessions/history/all"
-        params = {
-            "accountID": account_id,
-            "librarySectionID": tv_section.key,
-            "sort": "viewedAt:desc",
-            "X-Plex-Container-Size": 10000,
-        }
+    # Watched episode data from history
+    if watched_episodes is None:
+        if history is None:
+            history = fetch_plex_history(config, account_ids, tv_section)
+        watched_episodes = watched_episodes_by_show(history, account_ids)
+    show_episodes, show_last_watched = watched_episodes
 
-        try:
-            # This history/all page can return up to 10000 items
-            # (X-Plex-Container-Size above) - larger than a typical Plex
-            # call, so it gets the longer of the two timeouts.
-            response = _capped_get(
-                url,
-                params=params,
-                headers={"X-Plex-Token": config["plex"]["token"]},
-                verify=_resolve_verify_ssl(config),
-                timeout=PLEX_LONG_REQUEST_TIMEOUT,
-            )
-            response.raise_for_status()
-            root = ET.fromstring(response.content)
+    if not show_episodes:
+        return show_data
 
-            for video in root.findall(".//Video"):
-                if video.get("type") == "episode":
-                    grandparent_key_path = video.get("grandparentKey")
-                    if grandparent_key_path:
-                        show_id = int(grandparent_key_path.split("/")[-1])
-                        episode_key = video.get("ratingKey")
-                        viewed_at = int(video.get("viewedAt", 0))
+    # Total episode counts from the library listing
+    try:
+        if shows is None:
+            shows = tv_section.all()
+        for show in shows:
+            show_id = int(show.ratingKey)
+            if show_id not in show_episodes:
+                continue
+            total_episodes = int(getattr(show, "leafCount", None) or 0)
+            watched_count = len(show_episodes[show_id])
+            completion = (watched_count / total_episodes * 100) if total_episodes > 0 else 0
+
+            show_data[show_id] = {
+                "total_episodes": total_episodes,
+                "watched_episodes": watched_count,
+                "completion_percent": completion,
+                "last_watched": show_last_watched.get(show_id, 0),
+                "title": show.title,
+            }
+    except (plexapi.exceptions.PlexApiException, requests.RequestException) as e:
+        logger.debug(f"Error listing shows for completion data: {e}")
 
-                        if show_id not in show_episodes:
-                            show_episodes[show_id] = set()
-                            show_last_watched[show_id] = 0
+    return show_data
 
-                        show_episodes[show_id].add(episode_key)
-                        show_last_watched[show_id] = max(show_last_watched[show_id], viewed_at)
 
-        except (requests.RequestException, ET.ParseError) as e:
-            log_warning(f"Error fetching show completion data for account {account_id}: {e}")
-            continue
+def _as_rating_key(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
 
-    # Get total episode counts from library
-    for show in tv_section.all():
-        show_id = int(show.ratingKey)
-        if show_id in show_episodes:
-            try:
-                total_episodes = len(show.episodes())
-                watched_count = len(show_episodes[show_id])
-                completion = (watched_count / total_episodes * 100) if total_episodes > 0 else 0
-
-                show_data[show_id] = {
-                    "total_episodes": total_episodes,
-                    "watched_episodes": watched_count,
-                    "completion_percent": completion,
-                    "last_watched": show_last_watched[show_id],
-                    "title": show.title,
-                }
-            except plexapi.exceptions.PlexApiException as e:
-                logger.debug(f"Error processing show completion for {show.title}: {e}")
-                continue
 
-    return show_data
+def fetch_plex_items(plex: Any, rating_keys: Iterable[Any]) -> Dict[int, Any]:
+    """
+    Load many Plex items in full, PLEX_METADATA_BATCH_SIZE per
+    /library/metadata/{k1,k2,...} request - instead of a fetchItem() and
+    a reload() round trip per item.
+
+    Each item's response carries everything curatarr reads off an item
+    (labels, genres, guids, ratings, collections), so it is marked as
+    loaded: plexapi would otherwise lazily reload it the first time an
+    attribute turned out empty - an unlabeled item's labels, say.
+
+    Args:
+        plex: PlexServer (or a user's switched connection)
+        rating_keys: Rating keys to load; invalid and repeated ones are ignored
+
+    Returns:
+        Dict of rating key -> item. A key Plex no longer has (the item was
+        deleted or re-added under a new key) is absent, as are the keys of
+        a request that failed - callers fall back per item for those.
+    """
+    keys = list(dict.fromkeys(k for k in map(_as_rating_key, rating_keys) if k is not None))
+    items: Dict[int, Any] = {}
+    for start in range(0, len(keys), PLEX_METADATA_BATCH_SIZE):
+        chunk = keys[start : start + PLEX_METADATA_BATCH_SIZE]
+        try:
+            fetched = plex.fetchItems(chunk)
+        except (plexapi.exceptions.PlexApiException, requests.RequestException) as e:
+            # NotFound when none of the chunk's keys exist any more
+            logger.debug(f"Error loading {len(chunk)} Plex items by rating key: {e}")
+            continue
+        for item in fetched:
+            rating_key = _as_rating_key(getattr(item, "ratingKey", None))
+            if rating_key is None:
+                continue
+            details_key = getattr(item, "_details_key", None)
+            if details_key:
+                item._initpath = details_key
+            items[rating_key] = item
+    return items
+
+
+def load_full_plex_items(plex: Any, items: Iterable[Any]) -> List[Any]:
+    """
+    `items` (partial objects, e.g. search results) loaded in full, in the
+    same order - through fetch_plex_items(), reloading only the ones it
+    didn't return one at a time.
+    """
+    items = list(items)
+    loaded = fetch_plex_items(plex, (item.ratingKey for item in items))
+    result = []
+    for item in items:
+        rating_key = _as_rating_key(item.ratingKey)
+        # An item without a usable rating key can only be reloaded on its own.
+        full = loaded.get(rating_key) if rating_key is not None else None
+        if full is None:
+            item.reload()
+            full = item
+        result.append(full)
+    return result
 
 
 def identify_dropped_shows(show_data: Dict[int, Dict], config: Dict) -> Set[int]:
@@ -887,6 +1391,76 @@ def _clear_collection_lock(section: Any, items: List[Any], context: str, logger:
             print(f"WARNING: {msg}")
 
 
+def plan_collection_moves(current: List[Any], desired: List[Any]) -> List[Tuple[Any, Optional[Any]]]:
+    """
+    The fewest Collection.moveItem() calls that turn `current` order into `desired`.
+
+    The longest run of items already in the right relative order (a longest
+    increasing subsequence of their desired positions) stays put; every
+    other item - including any not in `current` at all, e.g. just added -
+    is moved right after its desired predecessor, front to back.
+
+    Args:
+        current: Items in their current collection order (may be partial)
+        desired: Items in the wanted order; matched to `current` by ratingKey
+
+    Returns:
+        (item, after) pairs to pass to moveItem in order - after=None moves
+        the item to the start
+    """
+    position = {item.ratingKey: i for i, item in enumerate(desired)}
+    placed = [position[item.ratingKey] for item in current if item.ratingKey in position]
+
+    # Patience sorting: tails[k] is the index in `placed` ending the best
+    # increasing run of length k + 1 found so far, tail_values[k] its value
+    tails: List[int] = []
+    tail_values: List[int] = []
+    previous: List[Optional[int]] = [None] * len(placed)
+    for i, pos in enumerate(placed):
+        k = bisect.bisect_left(tail_values, pos)
+        previous[i] = tails[k - 1] if k else None
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(pos)
+        else:
+            tails[k] = i
+            tail_values[k] = pos
+    stable: Set[int] = set()
+    run_index: Optional[int] = tails[-1] if tails else None
+    while run_index is not None:
+        stable.add(placed[run_index])
+        run_index = previous[run_index]
+
+    return [(item, desired[pos - 1] if pos else None) for pos, item in enumerate(desired) if pos not in stable]
+
+
+def _add_private_collection_label(
+    collection: Any, label_name: Optional[str], private_label: Optional[str], logger: Any = None
+) -> None:
+    """
+    Add private label to collection itself for per-user label restrictions
+    (utils.plex_policy.apply_user_label_restrictions).
+
+    Uses a DIFFERENT namespace than item labels so exclusions only ever
+    affect collections, never the items shared in everyone's normal
+    library view - items keep Recommended_* labels (visible to all),
+    collections get PrivateCollection_* (see update_plex_collection's
+    private_label docstring for why this is passed in fully-built, not
+    derived here). NOT an access-control boundary - see
+    apply_user_label_restrictions's own docstring for the enumeration
+    caveat (Plex enforces this exclusion on the collection object, not on
+    the items inside it).
+    """
+    if collection and label_name and private_label:
+        try:
+            current_labels = [label.tag for label in collection.labels]
+            if private_label not in current_labels:
+                collection.addLabel(private_label, locked=False)
+        except plexapi.exceptions.PlexApiException as e:
+            if logger:
+                logger.warning(f"Could not add label to collection: {e}")
+
+
 def update_plex_collection(
     section: Any,
     collection_name: str,
@@ -900,6 +1474,11 @@ def update_plex_collection(
     """
     Create or update a Plex collection with items in the specified order.
 
+    An existing collection is reconciled rather than rebuilt: only items
+    that left or joined it are removed/added, and only the items out of
+    place are moved (plan_collection_moves). One whose membership and
+    custom order already match is left untouched.
+
     Args:
         section: PlexAPI library section (movies or shows)
         collection_name: Name of the collection to create/update
@@ -1028,17 +1607,47 @@ def update_plex_collection(
         # back to the exact-title match found above.
         target_collection = target_collection or existing_collection
 
+        # Custom order as it stands in Plex, None when it can't be known
+        # (a new collection, or one that wasn't on custom sort)
+        current_order: Optional[List[Any]] = None
+
         if target_collection:
-            current_items = target_collection.items()
-            if current_items:
-                target_collection.removeItems(current_items)
-                _clear_collection_lock(section, current_items, f"removed from {collection_name}", logger)
-            target_collection.addItems(items)
-            _clear_collection_lock(section, items, f"added to {collection_name}", logger)
+            current_items = list(target_collection.items())
+            desired_keys = {item.ratingKey for item in items}
+            current_keys = {item.ratingKey for item in current_items}
+            removed = [item for item in current_items if item.ratingKey not in desired_keys]
+            added = [item for item in items if item.ratingKey not in current_keys]
+            is_custom_sort = getattr(target_collection, "collectionSort", None) == COLLECTION_SORT_CUSTOM
+
+            if (
+                not removed
+                and not added
+                and is_custom_sort
+                and [item.ratingKey for item in current_items] == [item.ratingKey for item in items]
+            ):
+                msg = f"Collection unchanged: {collection_name} ({len(items)} items)"
+                if logger:
+                    logger.info(msg)
+                else:
+                    print(msg)
+                _add_private_collection_label(target_collection, label_name, private_label, logger)
+                return True
+
+            if removed:
+                target_collection.removeItems(removed)
+                _clear_collection_lock(section, removed, f"removed from {collection_name}", logger)
+            if added:
+                target_collection.addItems(added)
+                _clear_collection_lock(section, added, f"added to {collection_name}", logger)
+            if is_custom_sort:
+                # Where Plex puts added items isn't relied on - the move
+                # plan places every one of them explicitly.
+                current_order = [item for item in current_items if item.ratingKey in desired_keys]
+            msg = f"Updated collection: {collection_name} ({len(items)} items, +{len(added)} -{len(removed)})"
             if logger:
-                logger.info(f"Updated collection: {collection_name} ({len(items)} items)")
+                logger.info(msg)
             else:
-                print(f"Updated collection: {collection_name} ({len(items)} items)")
+                print(msg)
         else:
             target_collection = section.createCollection(title=collection_name, items=items)
             _clear_collection_lock(section, items, f"created in {collection_name}", logger)
@@ -1047,37 +1656,19 @@ def update_plex_collection(
             else:
                 print(f"Created collection: {collection_name} ({len(items)} items)")
 
-        # Set custom sort order and reorder items to match our ranking
+        # Set custom sort order and move only the items out of place
         if target_collection and len(items) > 1:
             try:
-                target_collection.sortUpdate(sort="custom")
-                # Move items in REVERSE order, each to the beginning
-                # This results in first item ending up at position 1
-                for item in reversed(items):
-                    target_collection.moveItem(item, after=None)
+                if current_order is None:
+                    target_collection.sortUpdate(sort="custom")
+                for item, after in plan_collection_moves(current_order or [], items):
+                    target_collection.moveItem(item, after=after)
             except plexapi.exceptions.PlexApiException as e:
                 # Log but don't fail if reordering doesn't work
                 if logger:
                     logger.warning(f"Could not set custom order: {e}")
 
-        # Add private label to collection itself for per-user label
-        # restrictions (utils.plex_policy.apply_user_label_restrictions).
-        # Uses a DIFFERENT namespace than item labels so exclusions only ever
-        # affect collections, never the items shared in everyone's normal
-        # library view - items keep Recommended_* labels (visible to all),
-        # collections get PrivateCollection_* (see private_label's docstring
-        # above for why this is passed in fully-built, not derived here).
-        # NOT an access-control boundary - see apply_user_label_restrictions's
-        # own docstring for the enumeration caveat (Plex enforces this
-        # exclusion on the collection object, not on the items inside it).
-        if target_collection and label_name and private_label:
-            try:
-                current_labels = [label.tag for label in target_collection.labels]
-                if private_label not in current_labels:
-                    target_collection.addLabel(private_label, locked=False)
-            except plexapi.exceptions.PlexApiException as e:
-                if logger:
-                    logger.warning(f"Could not add label to collection: {e}")
+        _add_private_collection_label(target_collection, label_name, private_label, logger)
 
         return True
 
@@ -1198,6 +1789,7 @@ def cleanup_legacy_unnamed_collection(
                     _LEGACY_SHARED_COLLECTION_LABEL,
                     {},
                     "legacy collections.append_usernames=false cleanup (#261)",
+                    section=section,
                 )
 
             collection.delete()
@@ -0,0 +1,292 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Process-wide, adaptive request rate limits for outbound services.
+
+TMDB calls used to be paced by a fixed time.sleep(TMDB_RATE_LIMIT_DELAY)
+between them at each call site, and every BaseAPIClient by a fixed
+rate_limit_delay per client instance - conservative constants that were
+either slower than the service allows or, once two callers ran at once,
+no limit at all. A 429 was handled by whatever sleep each retry loop
+hard-coded.
+
+A TokenBucket paces every caller that shares it instead: it refills at
+`rate` tokens per second up to `capacity`, and acquire() takes one,
+waiting only as long as the bucket is actually empty (or paused).
+Concurrent callers each reserve their own token under the lock and sleep
+outside it, so N threads sharing one bucket still send at most `rate`
+requests a second between them, in arrival order.
+
+An AdaptiveRateLimiter is a TokenBucket whose rate follows the service's
+own responses (AIMD, as TCP congestion control does):
+
+  - additive increase: every healthy response adds
+    RATE_LIMIT_ADDITIVE_INCREASE / rate, i.e. the rate climbs by that
+    much per second of healthy traffic, up to the service's ceiling;
+  - multiplicative decrease: a 429/503 multiplies the rate by
+    RATE_LIMIT_BACKOFF_FACTOR;
+  - a Retry-After header (on a 429/503), or an exhausted
+    X-RateLimit-Remaining / RateLimit-Remaining with its reset time,
+    pauses the whole service until then - clamped, since those are
+    server-controlled.
+
+There is one limiter per service (service_rate_limiter()), shared by
+every client and thread in the process; its current rate is published as
+the curatarr_api_rate_limit_per_second gauge (utils/metrics.py).
+http_client (utils/http_session.py) applies TMDB's to every request to
+api.themoviedb.org; BaseAPIClient applies its service's around every
+request it sends.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+from .config import (
+    RATE_LIMIT_ADDITIVE_INCREASE,
+    RATE_LIMIT_BACKOFF_FACTOR,
+    RATE_LIMIT_DEFAULT_BACKOFF_SECONDS,
+    RATE_LIMIT_MAX_PAUSE_SECONDS,
+    RATE_LIMIT_METRIC_INTERVAL_SECONDS,
+    RATE_LIMIT_MIN_REQUESTS_PER_SECOND,
+    TMDB_MAX_REQUESTS_PER_SECOND,
+    TMDB_RATE_LIMIT_BURST,
+    TMDB_REQUESTS_PER_SECOND,
+)
+from .metrics import record_rate_limit
+
+TMDB_API_HOST = "api.themoviedb.org"
+
+# Statuses that mean "slow down", as opposed to a failed request.
+THROTTLE_STATUSES = (429, 503)
+
+# A reset header above this is an epoch timestamp, not a delta in seconds.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class TokenBucket:
+    """A thread-safe token bucket: `rate` tokens/second, at most `capacity` held."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._clock = clock
+        # Looked up at call time when not given, so a patched time.sleep
+        # reaches a bucket created at import.
+        self._sleep = sleep
+        self._tokens = self.capacity
+        # The time _tokens was counted at - in the future while paused.
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take `tokens` from the bucket, waiting until they are available.
+
+        Returns:
+            Seconds spent waiting (0.0 when the bucket had them)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            # Reserved even when short: the balance goes negative and the
+            # next caller's wait is measured from behind this one's.
+            self._tokens -= tokens
+            wait = max(0.0, self._updated - now) + max(0.0, -self._tokens) / self.rate
+        if wait > 0:
+            (self._sleep or time.sleep)(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every acquire() back for `seconds` from now."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._updated = max(self._updated, now + seconds)
+            # The first caller after the pause goes at its end, not a
+            # whole burst at once.
+            self._tokens = min(self._tokens, 1.0)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate; tokens already earned are kept."""
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = float(rate)
+
+
+def _header(headers, name: str) -> Optional[str]:
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    return str(value) if isinstance(value, (str, int, float)) else None
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds a Retry-After header value asks for - either delta-seconds or
+    an HTTP date. None if absent or unparseable.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+    return max(0.0, when - (time.time() if now is None else now))
+
+
+def _reset_seconds(headers) -> Optional[float]:
+    """Seconds until an exhausted rate-limit window resets, if the
+    response says its remaining allowance is zero."""
+    for prefix in ("X-RateLimit-", "RateLimit-"):
+        remaining = _header(headers, f"{prefix}Remaining")
+        if remaining is None:
+            continue
+        try:
+            if float(remaining) > 0:
+                return None
+            reset = float(_header(headers, f"{prefix}Reset") or "")
+        except ValueError:
+            return None
+        return max(0.0, reset - time.time()) if reset > _EPOCH_THRESHOLD else max(0.0, reset)
+    return None
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """A TokenBucket whose rate adapts to one service's responses (AIMD)."""
+
+    def __init__(
+        self,
+        service: str,
+        rate: float,
+        max_rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        super().__init__(rate, capacity, clock=clock, sleep=sleep)
+        self.service = service
+        self.initial_rate = self.rate
+        self.max_rate = float(max(max_rate or rate, rate))
+        self.min_rate = min(RATE_LIMIT_MIN_REQUESTS_PER_SECOND, self.rate)
+        self._published_rate: Optional[float] = None
+        self._published_at = float("-inf")
+
+    def observe(self, status_code, headers=None, max_pause: Optional[float] = None) -> float:
+        """
+        Adjust the rate from one response of this service.
+
+        Args:
+            status_code: The response's HTTP status
+            headers: The response's headers (Retry-After, rate-limit)
+            max_pause: Ceiling on any header-requested pause (default
+                RATE_LIMIT_MAX_PAUSE_SECONDS)
+
+        Returns:
+            Seconds the service is now paused for (0.0 if not paused)
+        """
+        throttled = status_code in THROTTLE_STATUSES
+        pause = None
+        with self._lock:
+            self._refill(self._clock())
+            if throttled:
+                self.rate = max(self.min_rate, self.rate * RATE_LIMIT_BACKOFF_FACTOR)
+                pause = parse_retry_after(_header(headers, "Retry-After"))
+                if pause is None and status_code == 429:
+                    pause = RATE_LIMIT_DEFAULT_BACKOFF_SECONDS
+            elif isinstance(status_code, int) and status_code < 400:
+                self.rate = min(self.max_rate, self.rate + RATE_LIMIT_ADDITIVE_INCREASE / self.rate)
+            rate = self.rate
+        if pause is None:
+            pause = _reset_seconds(headers)
+        if pause:
+            pause = min(pause, RATE_LIMIT_MAX_PAUSE_SECONDS if max_pause is None else max_pause)
+            self.pause(pause)
+        self._publish(rate, force=throttled)
+        return pause or 0.0
+
+    def _publish(self, rate: float, force: bool) -> None:
+        now = self._clock()
+        if rate == self._published_rate:
+            return
+        if not force and now - self._published_at < RATE_LIMIT_METRIC_INTERVAL_SECONDS:
+            return
+        self._published_rate, self._published_at = rate, now
+        record_rate_limit(self.service, rate)
+
+    def reset(self) -> None:
+        """Back to the starting rate, full and unpaused."""
+        with self._lock:
+            self.rate = self.initial_rate
+            self._tokens = self.capacity
+            self._updated = self._clock()
+            self._published_rate = None
+            self._published_at = float("-inf")
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def service_rate_limiter(
+    service: str, rate: float, max_rate: Optional[float] = None, capacity: float = 1.0
+) -> AdaptiveRateLimiter:
+    """
+    The process-wide limiter for `service`, created on first use with
+    the given starting rate, ceiling and burst capacity (later callers
+    share it as it is).
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(service)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(service, rate, max_rate, capacity)
+            _limiters[service] = limiter
+        return limiter
+
+
+def _reset_rate_limiters_for_tests() -> None:
+    """Test-only: every service limiter back to its starting state, so a
+    throttled response in one test never paces the next."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    for limiter in limiters:
+        limiter.reset()
+
+
+# The limiter every TMDB request in this process draws from.
+tmdb_rate_limiter = service_rate_limiter(
+    "tmdb", TMDB_REQUESTS_PER_SECOND, TMDB_MAX_REQUESTS_PER_SECOND, TMDB_RATE_LIMIT_BURST
+)
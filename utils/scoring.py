@@ -19,13 +19,14 @@ Similarity scoring utilities for Curatarr.
 Handles content-to-profile similarity calculations.
 """
 
+import heapq
 import logging
 import math
 import random
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Mapping, Optional, Protocol, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Protocol, Sequence, Tuple, Union
 
 from .config import (
     MAX_REDISTRIBUTION_MULTIPLIER,
@@ -37,6 +38,7 @@ from .config import (
     UNSEEN_KEYWORD_PENALTY,
 )
 from .corpus_idf import idf_weight
+from .keyword_index import FuzzyKeywordIndex
 
 
 def normalize_user_profile(user_prefs: Dict, tfidf_penalty_threshold: float = 0.15) -> Dict:
@@ -139,7 +141,10 @@ def normalize_genre(genre_name: str) -> str:
 
 
 def fuzzy_keyword_match(
-    keyword: str, user_keywords: Dict[str, int], cache: Optional[Dict[str, Tuple[float, Optional[str]]]] = None
+    keyword: str,
+    user_keywords: Dict[str, int],
+    cache: Optional[Dict[str, Tuple[float, Optional[str]]]] = None,
+    index: Optional[FuzzyKeywordIndex] = None,
 ) -> Tuple[float, Optional[str]]:
     """
     Check if keyword fuzzy-matches any user keyword.
@@ -148,6 +153,9 @@ def fuzzy_keyword_match(
         keyword: Keyword to match
         user_keywords: Dict of user's keyword preferences with counts
         cache: Optional dict to cache results (pass user_prefs['_fuzzy_cache'])
+        index: Optional FuzzyKeywordIndex built over `user_keywords` (pass
+            user_prefs['_fuzzy_index']). Replaces the linear partial-match
+            scan with indexed lookups; the result is the same.
 
     Returns:
         Tuple of (match_score, matched_keyword) based on best partial match
@@ -168,6 +176,12 @@ def fuzzy_keyword_match(
             cache[keyword_lower] = result
         return result
 
+    if index is not None:
+        result = index.best_partial_match(keyword_lower)
+        if cache is not None:
+            cache[keyword_lower] = result
+        return result
+
     # Check for partial matches (keyword contains or is contained by user keyword)
     best_score: float = 0
     best_match: Optional[str] = None
@@ -337,6 +351,18 @@ def _redistribute_weights(weights: Dict, user_profile: Dict, media_type: str = "
     return effective
 
 
+# calculate_similarity_score()'s weights when the caller passes none
+# (specificity-first approach).
+DEFAULT_SCORING_WEIGHTS = {
+    "genre": 0.25,
+    "director": 0.05,
+    "studio": 0.10,
+    "actor": 0.20,
+    "keyword": 0.50,
+    "language": 0.0,
+}
+
+
 @dataclass(frozen=True)
 class ScoringOptions:
     """
@@ -406,6 +432,121 @@ def _normalize_user_genre_counts(user_genre_counter: Counter) -> Tuple[Dict[str,
     return normalized_user_genres, max_genre_count
 
 
+def _max_positive(counter: Mapping) -> float:
+    """Largest positive value in `counter`, or 1 when there is none."""
+    positive_vals = [v for v in counter.values() if v > 0]
+    return max(positive_vals) if positive_vals else 1
+
+
+@dataclass
+class CompiledProfile:
+    """
+    A user profile pre-digested for scoring many items against it.
+
+    calculate_similarity_score() used to rebuild all of this from the raw
+    profile dict for every single item it scored: fresh Counter() wrappers
+    for every dimension, the lowercase lookup maps, max counts, the
+    normalized genre table and the profile-level weight redistribution.
+    None of it depends on the item, so on an 18k-title library that
+    per-item rebuild was most of the "Calculating similarity scores"
+    phase. compile_profile() does it once per user/library run and
+    calculate_similarity_score() accepts the result anywhere it accepts a
+    profile dict.
+
+    A plain dict passed to calculate_similarity_score() is compiled
+    internally on every call, so there is exactly one scoring code path
+    and a compiled profile cannot drift from the dict it came from -
+    tests/harness.py's float.hex() output is identical either way (see
+    tests/test_scoring.py's TestCompiledProfile).
+
+    `prefs` is the scoring-side view the _score_*_component() helpers
+    read: Counter-valued dimensions plus the `<key>_lower` maps and the
+    `_fuzzy_cache` normalize_user_profile() describes. Unlike that
+    function's in-place additions, these live here rather than on the
+    caller's dict - calculate_similarity_score() never looked at them
+    there anyway, since it always re-wrapped the profile first.
+    """
+
+    prefs: Dict[str, Any]
+    max_counts: Dict[str, float]
+    normalized_user_genres: Dict[str, float]
+    max_genre_count: float
+    # normalize_user_profile()'s pre-computed `_tfidf_thresholds`, carried
+    # over only when the source profile had them - see _tfidf_threshold()
+    # for why "absent" has to stay distinguishable from "present".
+    tfidf_thresholds: Optional[Dict[str, float]] = None
+    # False for an empty source profile (calculate_similarity_score()'s
+    # `not user_profile` early return has to keep working).
+    has_data: bool = True
+    _weights_cache: Dict[Tuple, Dict] = field(default_factory=dict, repr=False)
+
+    def __bool__(self) -> bool:
+        return self.has_data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style read of a profile dimension (Counter-valued)."""
+        return self.prefs.get(key, default)
+
+    def effective_weights(self, weights: Dict, media_type: str) -> Dict:
+        """_redistribute_weights() for this profile, memoized per weights/media_type."""
+        cache_key = (media_type, tuple(sorted(weights.items())))
+        cached = self._weights_cache.get(cache_key)
+        if cached is None:
+            cached = _redistribute_weights(weights, self.prefs, media_type)
+            self._weights_cache[cache_key] = cached
+        return cached
+
+    def tfidf_threshold(self, key: str, max_count: float, options: ScoringOptions) -> float:
+        """Same resolution as _tfidf_threshold(), against the compiled thresholds."""
+        if not options.use_tfidf:
+            return 0
+        return (self.tfidf_thresholds or {}).get(key, max_count * options.tfidf_penalty_threshold)
+
+
+def compile_profile(user_profile: Union[Dict, CompiledProfile, None]) -> CompiledProfile:
+    """
+    Build a CompiledProfile from a scoring-profile dict (the shape
+    build_profile_from_counters() returns, optionally already passed
+    through normalize_user_profile()). Returns `user_profile` unchanged
+    if it is already compiled.
+
+    Build once per user/library run, then pass the result to
+    calculate_similarity_score() for every candidate.
+    """
+    if isinstance(user_profile, CompiledProfile):
+        return user_profile
+
+    source = user_profile or {}
+    prefs: Dict[str, Any] = {
+        key: Counter(source.get(key, {}))
+        for key in ("genres", "directors", "studios", "actors", "languages", "keywords")
+    }
+    for key in ("directors", "actors", "keywords"):
+        prefs[f"{key}_lower"] = {k.lower() if isinstance(k, str) else k: v for k, v in prefs[key].items()}
+    prefs["_fuzzy_cache"] = {}
+    prefs["_fuzzy_index"] = FuzzyKeywordIndex(prefs["keywords_lower"])
+
+    # Pre-computed max counts (normalize_user_profile()) win when present,
+    # exactly as calculate_similarity_score() has always preferred them.
+    if "_max_counts" in source:
+        max_counts = source["_max_counts"]
+    else:
+        max_counts = {
+            key: _max_positive(prefs[key])
+            for key in ("genres", "directors", "studios", "actors", "languages", "keywords")
+        }
+
+    normalized_user_genres, max_genre_count = _normalize_user_genre_counts(prefs["genres"])
+    return CompiledProfile(
+        prefs=prefs,
+        max_counts=max_counts,
+        normalized_user_genres=normalized_user_genres,
+        max_genre_count=max_genre_count,
+        tfidf_thresholds=source.get("_tfidf_thresholds"),
+        has_data=bool(user_profile),
+    )
+
+
 def _score_genre_component(
     content_genres: set,
     user_genre_counter: Counter,
@@ -679,7 +820,8 @@ def _score_keyword_component(
             count = user_keywords_lower.get(kw_lower, 0)
         if count == 0 and options.use_fuzzy_keywords:
             fuzzy_cache = user_prefs.get("_fuzzy_cache")
-            fuzzy_count, _matched_kw = fuzzy_keyword_match(kw, user_keywords_lower, fuzzy_cache)
+            fuzzy_index = user_prefs.get("_fuzzy_index")
+            fuzzy_count, _matched_kw = fuzzy_keyword_match(kw, user_keywords_lower, fuzzy_cache, fuzzy_index)
             count = fuzzy_count
         if count > 0:
             # TF-IDF: if keyword is rare in user's profile, apply penalty
@@ -861,7 +1003,7 @@ def _apply_popularity_dampening(
 
 def calculate_similarity_score(
     content_info: Dict,
-    user_profile: Dict,
+    user_profile: Union[Dict, CompiledProfile],
     media_type: str = "movie",
     weights: Optional[Dict] = None,
     normalize_counters: bool = True,
@@ -887,7 +1029,8 @@ def calculate_similarity_score(
 
     Args:
         content_info: Dict with content metadata (genres, directors/studio, cast, keywords, language)
-        user_profile: Dict with user's weighted preferences (Counter objects or dicts)
+        user_profile: Dict with user's weighted preferences (Counter objects or dicts),
+            or a CompiledProfile built from one by compile_profile()
         media_type: 'movie' or 'tv' - determines director vs studio scoring
         weights: Optional custom weights dict. Defaults to standard weights if None.
         normalize_counters: If True, use sqrt normalization for diminishing returns
@@ -917,11 +1060,7 @@ def calculate_similarity_score(
             keyword_idf=keyword_idf,
         )
 
-    # Default weights (specificity-first approach)
-    default_weights = {"genre": 0.25, "director": 0.05, "studio": 0.10, "actor": 0.20, "keyword": 0.50, "language": 0.0}
-    weights = weights or default_weights
-
-    effective_weights = _redistribute_weights(weights, user_profile, media_type)
+    weights = weights or DEFAULT_SCORING_WEIGHTS
 
     # Any, not a narrower per-key type - this is a heterogeneous
     # reporting structure (float component scores alongside a nested
@@ -942,38 +1081,19 @@ def calculate_similarity_score(
     try:
         score = 0.0
 
-        user_prefs = {
-            "genres": Counter(user_profile.get("genres", {})),
-            "directors": Counter(user_profile.get("directors", {})),
-            "studios": Counter(user_profile.get("studios", {})),
-            "actors": Counter(user_profile.get("actors", {})),
-            "languages": Counter(user_profile.get("languages", {})),
-            "keywords": Counter(user_profile.get("keywords", {})),
-        }
-
-        # Use pre-computed max counts if available (from normalize_user_profile)
-        # Otherwise calculate them (for backwards compatibility)
-        if "_max_counts" in user_profile:
-            max_counts = user_profile["_max_counts"]
-        else:
-
-            def max_positive(counter):
-                positive_vals = [v for v in counter.values() if v > 0]
-                return max(positive_vals) if positive_vals else 1
-
-            max_counts = {
-                "genres": max_positive(user_prefs["genres"]),
-                "directors": max_positive(user_prefs["directors"]),
-                "studios": max_positive(user_prefs["studios"]),
-                "actors": max_positive(user_prefs["actors"]),
-                "languages": max_positive(user_prefs["languages"]),
-                "keywords": max_positive(user_prefs["keywords"]),
-            }
+        # A plain dict is compiled here, per call - the pre-CompiledProfile
+        # behavior. Callers scoring many items compile once up front and
+        # pass the result instead (see CompiledProfile).
+        compiled = compile_profile(user_profile)
+        effective_weights = compiled.effective_weights(weights, media_type)
+        user_prefs = compiled.prefs
+        max_counts = compiled.max_counts
 
         # --- Genre Score (with embedded TF-IDF penalty) ---
         content_genres = set(content_info.get("genres", []))
-        normalized_user_genres, max_genre_count = _normalize_user_genre_counts(user_prefs["genres"])
-        genre_tfidf_threshold = _tfidf_threshold(user_profile, "genres", max_genre_count, options)
+        normalized_user_genres = compiled.normalized_user_genres
+        max_genre_count = compiled.max_genre_count
+        genre_tfidf_threshold = compiled.tfidf_threshold("genres", max_genre_count, options)
         genre_weight = effective_weights.get("genre", 0.20)
         genre_final, _genre_penalty_w, genre_details = _score_genre_component(
             content_genres,
@@ -1038,7 +1158,7 @@ def calculate_similarity_score(
         # --- Keyword Score (with embedded TF-IDF penalty) ---
         content_keywords = content_info.get("keywords", [])
         keyword_weight = effective_weights.get("keyword", 0.45)
-        keyword_tfidf_threshold = _tfidf_threshold(user_profile, "keywords", max_counts["keywords"], options)
+        keyword_tfidf_threshold = compiled.tfidf_threshold("keywords", max_counts["keywords"], options)
         keyword_final, _keyword_penalty_w, keyword_details = _score_keyword_component(
             content_keywords, user_prefs, max_counts, keyword_weight, keyword_tfidf_threshold, options
         )
@@ -1089,6 +1209,34 @@ def calculate_similarity_score(
         return 0.0, score_breakdown
 
 
+def recommendation_rank_key(item: Mapping) -> Tuple[float, float, int]:
+    """
+    Sort key for scored recommendations, highest first with reverse=True:
+    similarity score, then (#291) rating and vote count to break ties.
+    """
+    return (item["similarity_score"], item.get("rating") or 0.0, item.get("vote_count") or 0)
+
+
+def iter_ranked_recommendations(scored_items: Sequence[Dict]) -> Iterator[Dict]:
+    """
+    Yield `scored_items` in exactly
+    sorted(scored_items, key=recommendation_rank_key, reverse=True) order,
+    ties included, but lazily: a heap is built in O(n) and each item
+    costs O(log n) only when it is asked for.
+
+    get_recommendations() keeps a few dozen of an 18k-title library's
+    candidates; sorting all of them to read off the first few is wasted
+    work.
+    """
+    heap = [
+        (-score, -rating, -votes, position)
+        for position, (score, rating, votes) in enumerate(recommendation_rank_key(item) for item in scored_items)
+    ]
+    heapq.heapify(heap)
+    while heap:
+        yield scored_items[heapq.heappop(heap)[3]]
+
+
 class _RandomLike(Protocol):
     """Structural type for select_tiered_recommendations()'s `rng` param.
 
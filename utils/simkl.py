@@ -28,6 +28,7 @@ import requests
 
 from .api_client import BaseAPIClient
 from .display import log_error
+from .http_session import http_client
 from .metrics import record_api_call
 
 logger = logging.getLogger("curatarr")
@@ -39,6 +40,10 @@ SIMKL_AUTH_URL = "https://simkl.com"
 # Rate limiting: 0.2s delay between requests
 SIMKL_RATE_LIMIT_DELAY = 0.2
 
+# Ceiling the adaptive limiter (utils/rate_limit.py) may climb to from
+# there while Simkl keeps answering normally.
+SIMKL_MAX_REQUESTS_PER_SECOND = 10
+
 # HTTP request timeout in seconds
 SIMKL_REQUEST_TIMEOUT = 30
 
@@ -51,7 +56,7 @@ SIMKL_REQUEST_TIMEOUT = 30
 # trustworthy either).
 SIMKL_MAX_429_RETRIES = 3
 
-# Ceiling on how long a single 429 retry will ever sleep for, regardless
+# Ceiling on how long a single 429 will ever pause Simkl for, regardless
 # of what the server's Retry-After header asks for - server-controlled
 # input, and a compromised/misbehaving Simkl endpoint (or a malicious
 # response) could otherwise stall this process for an arbitrary/huge
@@ -81,6 +86,7 @@ class SimklClient(BaseAPIClient):
     api_name = "Simkl"
     exception_class = SimklAPIError
     rate_limit_delay = SIMKL_RATE_LIMIT_DELAY
+    max_requests_per_second = SIMKL_MAX_REQUESTS_PER_SECOND
     request_timeout = SIMKL_REQUEST_TIMEOUT
     max_429_retries = SIMKL_MAX_429_RETRIES
     max_retry_after_seconds = SIMKL_MAX_RETRY_AFTER_SECONDS
@@ -116,7 +122,7 @@ class SimklClient(BaseAPIClient):
             headers["Authorization"] = f"Bearer {self.access_token}"
         return headers
 
-    # _rate_limit() inherited from BaseAPIClient (rate_limit_delay set above)
+    # _rate_limit() inherited from BaseAPIClient (rate_limit_delay/max_requests_per_second set above)
 
     def _make_request(
         self,
@@ -222,7 +228,7 @@ class SimklClient(BaseAPIClient):
         params = {"client_id": self.client_id}
 
         try:
-            response = requests.get(
+            response = http_client.get(
                 url,
                 params=params,
                 timeout=SIMKL_REQUEST_TIMEOUT,
@@ -261,7 +267,7 @@ class SimklClient(BaseAPIClient):
 
         while time.time() - start_time < expires_in:
             try:
-                response = requests.get(
+                response = http_client.get(
                     url,
                     params=params,
                     timeout=SIMKL_REQUEST_TIMEOUT,
@@ -0,0 +1,162 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+In-flight request coalescing ("single-flight").
+
+A multi-user external run discovers the same TMDB ids for several users,
+and its fetch_concurrently() workers can ask for the same /movie/{id} or
+/search/keyword at the same moment. The persistent response cache (utils/
+tmdb_cache.py) only helps once the first of those requests has come back;
+until then every duplicate goes to the network too, and spends a rate
+limit token doing it.
+
+SingleFlight.do(key, fn) runs fn for the first caller of a key (the
+leader); anyone asking for the same key while it is running waits for it
+and gets the leader's result - or its exception - instead of running fn
+again. Once the leader finishes the key is forgotten, so the next call
+goes out (or, for TMDB, to the response cache) as usual: this only ever
+merges requests that overlap in time, never serves a stale one.
+
+There is one SingleFlight per service (service_single_flight()):
+http_client coalesces TMDB GETs on it, BaseAPIClient the GETs of clients
+that opt in (Trakt). How many calls led and how many were absorbed is
+published as curatarr_single_flight_requests_total, in batches.
+"""
+
+import atexit
+import os
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar, cast
+
+from .config import SINGLE_FLIGHT_METRIC_BATCH
+from .metrics import record_single_flight_requests
+
+R = TypeVar("R")
+
+
+class _Call:
+    """One in-flight call: its waiters block on `done`."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with equal keys into one."""
+
+    def __init__(self, service: str) -> None:
+        self.service = service
+        self._calls: Dict[Hashable, _Call] = {}
+        self._counts: Counter = Counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        """
+        fn() - or, if a call with this key is already running, its result.
+
+        Raises:
+            Whatever fn raises - to the leader and every caller it absorbed
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the parent's in-flight calls will never finish here.
+                self._calls, self._pid = {}, os.getpid()
+                self._counts.clear()
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            self._counts["leader" if leader else "shared"] += 1
+            counts = self._take_counts(SINGLE_FLIGHT_METRIC_BATCH)
+        self._publish(counts)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(R, call.result)
+
+        try:
+            result = call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return result
+
+    def _take_counts(self, batch: int) -> Counter:
+        if sum(self._counts.values()) < batch:
+            return Counter()
+        counts, self._counts = self._counts, Counter()
+        return counts
+
+    def _publish(self, counts: Counter) -> None:
+        for result, count in counts.items():
+            record_single_flight_requests(self.service, result, count)
+
+    def flush_metrics(self) -> None:
+        """Publish the counts not yet written."""
+        with self._lock:
+            counts = self._take_counts(1)
+        self._publish(counts)
+
+
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def service_single_flight(service: str) -> SingleFlight:
+    """The process-wide SingleFlight for `service`, created on first use."""
+    with _flights_lock:
+        flight = _flights.get(service)
+        if flight is None:
+            flight = SingleFlight(service)
+            _flights[service] = flight
+        return flight
+
+
+def _flush_single_flight_metrics() -> None:
+    with _flights_lock:
+        flights = list(_flights.values())
+    for flight in flights:
+        flight.flush_metrics()
+
+
+atexit.register(_flush_single_flight_metrics)
+
+
+def _reset_single_flights_for_tests() -> None:
+    """Test-only: drop every flight's unpublished counts, so the exit-time
+    flush never writes a test's calls to the real metrics state."""
+    with _flights_lock:
+        flights = list(_flights.values())
+    for flight in flights:
+        with flight._lock:
+            flight._counts.clear()
+
+
+# The SingleFlight every TMDB GET in this process goes through.
+tmdb_single_flight = service_single_flight("tmdb")
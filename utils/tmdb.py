@@ -29,7 +29,9 @@ import requests
 
 from .config import TMDB_REQUEST_TIMEOUT
 from .display import log_error
+from .http_session import http_client
 from .metrics import record_api_call
+from .rate_limit import tmdb_rate_limiter
 
 # Module-level logger
 logger = logging.getLogger("curatarr")
@@ -130,12 +132,13 @@ def _fetch_tmdb_with_retry_impl(url: str, params: Dict, max_retries: int = 3, ti
     global _tmdb_auth_failure_logged
     for attempt in range(max_retries):
         try:
-            resp = requests.get(url, params=params, timeout=timeout, allow_redirects=False)
+            resp = http_client.get(url, params=params, timeout=timeout, allow_redirects=False)
 
             if resp.status_code == 429:
-                sleep_time = 2 * (attempt + 1)
-                logging.warning(f"TMDB rate limit hit, waiting {sleep_time}s...")
-                time.sleep(sleep_time)
+                # http_client has already fed this to TMDB's limiter, which
+                # slowed down and paused for any Retry-After - the retry
+                # below waits on it, not on a fixed sleep here.
+                logging.warning(f"TMDB rate limit hit, slowing to {tmdb_rate_limiter.rate:.1f} requests/s...")
                 continue
 
             if resp.status_code == 200:
@@ -285,6 +288,132 @@ def get_tmdb_keywords(
     return []
 
 
+# Sub-resources fetched with every title's details. One request per
+# title - and so one persistent response-cache entry (utils/
+# tmdb_cache.py) - answers every consumer of a title's TMDB data: the
+# library media caches, collection backfill, external candidate scoring
+# and the IMDB id lookup. Watch providers are fetched on their own
+# (fetch_watch_providers()): they change by the day, and appended here
+# they would cut every title's cached details down to their lifetime.
+TITLE_APPEND_TO_RESPONSE = "keywords,credits,external_ids"
+
+
+def title_record(data: Dict, media_type: str = "movie") -> Dict:
+    """
+    Normalize a /movie|tv/{id} response fetched with
+    TITLE_APPEND_TO_RESPONSE into the canonical title record.
+
+    Args:
+        data: The TMDB details response
+        media_type: 'movie' or 'tv'
+
+    Returns:
+        Dict with tmdb_id, media_type, title, year, release_date, status,
+        overview, original_language, rating, vote_count, genres, keywords,
+        cast (billing order), directors, networks, production_company_ids,
+        collection_id, collection_name and imdb_id
+    """
+    if media_type == "movie":
+        title = data.get("title", "")
+        release_date = data.get("release_date") or ""
+    else:
+        title = data.get("name", "")
+        release_date = data.get("first_air_date") or ""
+
+    # Movies list keywords under 'keywords', TV under 'results'
+    keywords_data = data.get("keywords") or {}
+    keyword_list = keywords_data.get("keywords", keywords_data.get("results", []))
+    credits = data.get("credits") or {}
+    collection = data.get("belongs_to_collection") or {}
+    external_ids = data.get("external_ids") or {}
+
+    return {
+        "tmdb_id": data.get("id"),
+        "media_type": media_type,
+        "title": title,
+        "year": int(release_date[:4]) if len(release_date) >= 4 and release_date[:4].isdigit() else None,
+        "release_date": release_date,
+        "status": data.get("status"),
+        "overview": data.get("overview", ""),
+        "original_language": data.get("original_language", ""),
+        "rating": data.get("vote_average"),
+        "vote_count": data.get("vote_count"),
+        "genres": [g["name"] for g in data.get("genres", []) if g.get("name")],
+        "keywords": [k["name"] for k in keyword_list if k.get("name")],
+        "cast": [c["name"] for c in credits.get("cast", []) if c.get("name")],
+        "directors": [c["name"] for c in credits.get("crew", []) if c.get("job") == "Director" and c.get("name")],
+        "networks": [n["name"] for n in data.get("networks", []) if n.get("name")],
+        "production_company_ids": [pc["id"] for pc in data.get("production_companies", []) if "id" in pc],
+        "collection_id": collection.get("id"),
+        "collection_name": collection.get("name"),
+        "imdb_id": external_ids.get("imdb_id") or data.get("imdb_id"),
+    }
+
+
+def fetch_title_record(tmdb_api_key: str, tmdb_id: int, media_type: str = "movie") -> Optional[Dict]:
+    """
+    Fetch a title's details with every sub-resource in one request and
+    normalize them (see title_record()).
+
+    Args:
+        tmdb_api_key: TMDB API key
+        tmdb_id: TMDB ID
+        media_type: 'movie' or 'tv'
+
+    Returns:
+        The canonical title record, or None on failure
+    """
+    if not tmdb_id or not tmdb_api_key:
+        return None
+    media = "movie" if media_type == "movie" else "tv"
+    data = fetch_tmdb_with_retry(
+        f"https://api.themoviedb.org/3/{media}/{tmdb_id}",
+        {"api_key": tmdb_api_key, "append_to_response": TITLE_APPEND_TO_RESPONSE},
+        timeout=TMDB_REQUEST_TIMEOUT,
+    )
+    if not isinstance(data, dict):
+        return None
+    record = title_record(data, media)
+    if record["tmdb_id"] is None:
+        record["tmdb_id"] = tmdb_id
+    return record
+
+
+def fetch_watch_providers(tmdb_api_key: str, tmdb_id: int, media_type: str = "movie") -> Optional[Dict]:
+    """
+    Fetch a title's watch providers from /movie|tv/{id}/watch/providers -
+    a request of its own, cached on the volatile TTL (see utils/
+    tmdb_cache.py) rather than for as long as the title's details.
+
+    Args:
+        tmdb_api_key: TMDB API key
+        tmdb_id: TMDB ID
+        media_type: 'movie' or 'tv'
+
+    Returns:
+        region -> {'flatrate'/'rent'/'buy': [provider ids]}, or None on
+        failure
+    """
+    if not tmdb_id or not tmdb_api_key:
+        return None
+    media = "movie" if media_type == "movie" else "tv"
+    data = fetch_tmdb_with_retry(
+        f"https://api.themoviedb.org/3/{media}/{tmdb_id}/watch/providers",
+        {"api_key": tmdb_api_key},
+        timeout=TMDB_REQUEST_TIMEOUT,
+    )
+    if not isinstance(data, dict):
+        return None
+    return {
+        region: {
+            kind: [p["provider_id"] for p in offers.get(kind, []) if "provider_id" in p]
+            for kind in ("flatrate", "rent", "buy")
+        }
+        for region, offers in (data.get("results") or {}).items()
+        if isinstance(offers, dict)
+    }
+
+
 def load_imdb_tmdb_cache(cache_dir: str) -> Dict[str, int]:
     """
     Load IMDB→TMDB mapping cache.
@@ -347,7 +476,7 @@ def get_tmdb_id_from_imdb(
     try:
         url = f"https://api.themoviedb.org/3/find/{imdb_id}"
         params = {"api_key": tmdb_api_key, "external_source": "imdb_id"}
-        response = requests.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT, allow_redirects=False)
+        response = http_client.get(url, params=params, timeout=TMDB_REQUEST_TIMEOUT, allow_redirects=False)
 
         if response.status_code == 200:
             outcome = "success"
@@ -0,0 +1,372 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persistent, size-bounded cache of TMDB API responses.
+
+Every run re-asked TMDB the same questions: the same /movie/{id} details
+for every library item and candidate, the same /find/{imdb_id} and
+/external_ids mappings, the same keyword ids. A few call sites kept
+their own ad-hoc caches (tmdb_keywords_cache.json, horizon's 7-day
+file, the in-memory keyword id map), each with its own staleness rule,
+and everything else went to the network every time.
+
+TMDBResponseCache sits under all of them instead: http_client (utils/
+http_session.py) looks every GET to api.themoviedb.org up here first and
+stores each 200 it receives, so every TMDB caller - utils/tmdb.py,
+recommenders/external.py, huntarr.py, horizon.py, streaming.py - shares
+one cache without changing how it calls TMDB. A hit never takes a rate
+limit token.
+
+  - Keys are the endpoint path plus its query parameters, sorted, with
+    api_key dropped - the same question asked with a different key (or
+    parameters in a different order) is the same entry.
+  - Each endpoint falls into a TTL class (ttl_class()): id mappings are
+    kept for months, details for days, provider and listing endpoints
+    for hours. A request with sub-resources appended (append_to_response)
+    takes the shortest class among them, as they share its entry.
+    /configuration is never cached - it is how a new API key is checked.
+    An id lookup that found nothing is only kept as long as a listing, so
+    a title TMDB adds later is picked up.
+  - Bodies are stored zlib-compressed in a SQLite database (WAL, like
+    utils/media_store.py) under cache/, shared by every process.
+    Past TMDB_CACHE_MAX_BYTES the least recently used entries are
+    evicted; expired entries go with them.
+  - Hits and misses per TTL class are counted in memory and published
+    as curatarr_tmdb_cache_lookups_total in batches.
+
+The cache fails open: if the database cannot be opened or read, the
+request simply goes to TMDB.
+"""
+
+import atexit
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from .config import (
+    MEDIA_STORE_BUSY_TIMEOUT_SECONDS,
+    TMDB_CACHE_MAX_BYTES,
+    TMDB_CACHE_METRIC_BATCH,
+    TMDB_CACHE_PRUNE_EVERY,
+    TMDB_CACHE_TTL_DETAILS_SECONDS,
+    TMDB_CACHE_TTL_IMMUTABLE_SECONDS,
+    TMDB_CACHE_TTL_VOLATILE_SECONDS,
+)
+from .display import log_warning
+from .helpers import get_project_root
+from .metrics import record_tmdb_cache_lookups
+
+TMDB_CACHE_FILENAME = "tmdb_responses.db"
+
+# PRAGMA user_version of the layout below; any other layout is dropped.
+TMDB_CACHE_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at);
+"""
+
+# (path pattern, TTL class) - first match wins; paths are relative to /3.
+_TTL_RULES = (
+    (re.compile(r"^/configuration"), None),
+    (re.compile(r"^/(find/|genre/|search/keyword$|(movie|tv)/\d+/external_ids$)"), "immutable"),
+    (re.compile(r"/(watch/providers|similar|recommendations)$|^/(discover|trending|search)/"), "volatile"),
+)
+
+TTL_SECONDS = {
+    "immutable": TMDB_CACHE_TTL_IMMUTABLE_SECONDS,
+    "details": TMDB_CACHE_TTL_DETAILS_SECONDS,
+    "volatile": TMDB_CACHE_TTL_VOLATILE_SECONDS,
+}
+
+# A hit refreshes its entry's LRU position at most this often, so reads
+# don't each turn into a write.
+_TOUCH_INTERVAL_SECONDS = 3600
+# Eviction frees down to this share of the cap, so the next few stores
+# don't each evict again.
+_PRUNE_TARGET = 0.75
+
+
+def _api_path(url: str) -> str:
+    path = urlsplit(url).path
+    return path[2:] if path.startswith("/3/") else path
+
+
+def _path_ttl_class(path: str) -> Optional[str]:
+    for pattern, name in _TTL_RULES:
+        if pattern.search(path):
+            return name
+    return "details"
+
+
+def _query_pairs(url: str, params=None) -> list:
+    """Every (name, value) query parameter of a request, from the URL and from `params`, None values left out."""
+    pairs = parse_qsl(urlsplit(url).query, keep_blank_values=True)
+    if params:
+        items = params.items() if isinstance(params, dict) else params
+        for name, value in items:
+            values = value if isinstance(value, (list, tuple)) else [value]
+            pairs.extend((name, str(v)) for v in values if v is not None)
+    return pairs
+
+
+def ttl_class(url: str, params=None) -> Optional[str]:
+    """
+    The TTL class of a TMDB request - None if it is never cached. Each
+    sub-resource appended with append_to_response is classed as its own
+    endpoint would be, and the shortest-lived class wins: the appended
+    watch/providers of a /movie/{id} request must not be served for as
+    long as the details they came with.
+    """
+    path = _api_path(url)
+    name = _path_ttl_class(path)
+    if name is None:
+        return None
+    for key, value in _query_pairs(url, params):
+        if key != "append_to_response":
+            continue
+        for sub in filter(None, (part.strip() for part in value.split(","))):
+            sub_name = _path_ttl_class(f"{path}/{sub}")
+            if sub_name is not None and TTL_SECONDS[sub_name] < TTL_SECONDS[name]:
+                name = sub_name
+    return name
+
+
+def cache_key(url: str, params=None) -> str:
+    """
+    The cache key of a TMDB request: its path and every query parameter
+    (from the URL and from `params`) but api_key, in sorted order.
+    Parameters set to None are left out, as requests leaves them out.
+    """
+    pairs = sorted((str(name), str(value)) for name, value in _query_pairs(url, params) if name != "api_key")
+    key = _api_path(url)
+    return f"{key}?{urlencode(pairs)}" if pairs else key
+
+
+def _found_nothing(body: bytes) -> bool:
+    """True for a /find response whose every *_results list is empty."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return False
+    if not isinstance(data, dict):
+        return False
+    results = [value for name, value in data.items() if name.endswith("_results")]
+    return bool(results) and not any(results)
+
+
+def _cached_response(url: str, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json;charset=utf-8"
+    response._content = body
+    return response
+
+
+class TMDBResponseCache:
+    """TMDB GET responses on disk, keyed by cache_key(), per-class TTLs."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_bytes: int = TMDB_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        # None: cache/tmdb_responses.db under the project root, resolved
+        # when first opened.
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = os.getpid()
+        self._disabled = False
+        self._stores = 0
+        self._lookups: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._pid != os.getpid():
+            # Forked: the parent's connection is not ours to use.
+            self._conn, self._pid, self._stores = None, os.getpid(), 0
+            self._lookups.clear()
+        if self._conn is None and not self._disabled:
+            path = self.db_path or os.path.join(get_project_root(), "cache", TMDB_CACHE_FILENAME)
+            try:
+                self._conn = self._open(path)
+            except (sqlite3.Error, OSError) as e:
+                self._fail(e)
+        return self._conn
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = sqlite3.connect(path, timeout=MEDIA_STORE_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != TMDB_CACHE_FORMAT:
+                with conn:
+                    conn.execute("DROP TABLE IF EXISTS responses")
+                    conn.execute(f"PRAGMA user_version = {TMDB_CACHE_FORMAT}")
+            conn.executescript(_SCHEMA)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _fail(self, error: Exception) -> None:
+        # Never worth failing a request over: warn once and go uncached.
+        log_warning(f"TMDB response cache unavailable, continuing without it: {error}")
+        self._disabled = True
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def lookup(self, url: str, params=None) -> Optional[requests.Response]:
+        """
+        The cached response to a GET of `url` with `params`.
+
+        Returns:
+            A 200 requests.Response with the cached body, or None when the
+            endpoint is not cached, or its entry is missing or expired
+        """
+        ttl = ttl_class(url, params)
+        if ttl is None:
+            return None
+        key = cache_key(url, params)
+        now = self._clock()
+        body = None
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT body, expires_at, used_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[1] > now:
+                    body = zlib.decompress(row[0])
+                    if now - row[2] > _TOUCH_INTERVAL_SECONDS:
+                        with conn:
+                            conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+            except (sqlite3.Error, zlib.error) as e:
+                self._fail(e)
+                return None
+            self._count(ttl, "miss" if body is None else "hit")
+        return None if body is None else _cached_response(url, body)
+
+    def store(self, url: str, params, response: requests.Response) -> None:
+        """Keep a 200 response to a GET of `url` with `params`."""
+        ttl = ttl_class(url, params)
+        if ttl is None or response.status_code != 200:
+            return
+        body = response.content
+        if not isinstance(body, bytes):
+            return
+        lifetime = TTL_SECONDS[ttl]
+        if ttl == "immutable" and _found_nothing(body):
+            lifetime = TTL_SECONDS["volatile"]
+        data = zlib.compress(body)
+        now = self._clock()
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, body, size, expires_at, used_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (cache_key(url, params), data, len(data), now + lifetime, now),
+                    )
+                self._stores += 1
+                if self._stores % TMDB_CACHE_PRUNE_EVERY == 0:
+                    self._prune(conn, now)
+            except sqlite3.Error as e:
+                self._fail(e)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least recently used ones past max_bytes."""
+        with conn:
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        excess = (conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0] or 0) - self.max_bytes
+        if excess <= 0:
+            return
+        excess += int(self.max_bytes * (1 - _PRUNE_TARGET))
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY used_at"):
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= size
+        with conn:
+            conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def prune(self) -> None:
+        """Evict now rather than at the next TMDB_CACHE_PRUNE_EVERY-th store."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                self._prune(conn, self._clock())
+            except sqlite3.Error as e:
+                self._fail(e)
+
+    def _count(self, ttl: str, result: str) -> None:
+        self._lookups[(ttl, result)] += 1
+        if sum(self._lookups.values()) >= TMDB_CACHE_METRIC_BATCH:
+            self._flush_lookups()
+
+    def _flush_lookups(self) -> None:
+        lookups, self._lookups = self._lookups, Counter()
+        for (ttl, result), count in lookups.items():
+            record_tmdb_cache_lookups(ttl, result, count)
+
+    def flush_metrics(self) -> None:
+        """Publish the hit/miss counts not yet written."""
+        with self._lock:
+            self._flush_lookups()
+
+    def close(self) -> None:
+        """Publish pending counts and close the database (reopened on use)."""
+        with self._lock:
+            self._flush_lookups()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._disabled = False
+
+
+# The cache every TMDB request in this process goes through.
+tmdb_response_cache = TMDBResponseCache()
+atexit.register(tmdb_response_cache.flush_metrics)
@@ -0,0 +1,94 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Concurrent batches of TMDB lookups.
+
+External discovery scores up to MAX_CANDIDATES candidates per iteration
+and each needs its own TMDB detail request; BaseCache.update_cache()
+needs a Plex reload plus several TMDB requests per new library item.
+Issued one after another, each waits out a full round trip before the
+next starts - minutes per iteration, almost all of it idle.
+
+fetch_concurrently() runs one lookup function over a batch of keys on a
+bounded worker pool and yields each (key, result) back to the caller:
+as soon as it completes by default, or in submission order with
+ordered=True for callers whose output depends on the order they see
+results in. Workers only fetch; the caller consumes results on its own
+thread, so the cache, index, and counters it updates never see
+concurrent writes.
+
+The pool does not pace anything itself - every TMDB request still takes
+a token from the process-wide bucket in utils/rate_limit.py on its way
+out, so any number of workers (or concurrent batches) stay within TMDB's
+rate limit together.
+
+The same pool runs the per-account Plex reads (utils/plex.py's
+fetch_plex_history, BaseRecommender's per-user library snapshots); those
+have no bucket, so they are bounded by the worker count alone
+(plex_max_workers()).
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+from .config import TMDB_MAX_WORKERS
+
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+def fetch_concurrently(
+    fetch: Callable[[K], R],
+    keys: Iterable[K],
+    max_workers: int = TMDB_MAX_WORKERS,
+    ordered: bool = False,
+    thread_name_prefix: str = "tmdb-fetch",
+) -> Iterator[Tuple[K, R]]:
+    """
+    Run `fetch` over every key on a worker pool, yielding (key, result).
+
+    Args:
+        fetch: Lookup to run once per key. An exception it raises is
+            re-raised from this generator when its result is reached, so
+            lookups that may fail should catch and return a sentinel.
+        keys: The batch to fetch
+        max_workers: Worker threads; 1 or less fetches inline, one at a time
+        ordered: Yield in the order of `keys` instead of completion order
+        thread_name_prefix: Names the worker threads after the service
+
+    Yields:
+        (key, fetch(key)) for every key
+    """
+    keys = list(keys)
+    if max_workers <= 1 or len(keys) <= 1:
+        for key in keys:
+            yield key, fetch(key)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(keys)), thread_name_prefix=thread_name_prefix)
+    try:
+        futures = [(executor.submit(fetch, key), key) for key in keys]
+        if ordered:
+            for future, key in futures:
+                yield key, future.result()
+        else:
+            key_for = {future: key for future, key in futures}
+            for future in as_completed(key_for):
+                yield key_for[future], future.result()
+    finally:
+        # A consumer that stops early leaves queued lookups unsent.
+        executor.shutdown(wait=True, cancel_futures=True)
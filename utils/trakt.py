@@ -34,7 +34,9 @@ import yaml
 from .api_client import BaseAPIClient
 from .display import log_error, log_warning
 from .helpers import get_project_root, harden_file_permissions
+from .http_session import http_client
 from .metrics import record_api_call
+from .tmdb import fetch_title_record
 
 logger = logging.getLogger("curatarr")
 
@@ -66,6 +68,11 @@ TOKEN_EXPIRY_SAFETY_MARGIN_SECONDS = 300
 # Rate limiting: 0.2s delay (5 req/sec, well under 1000/5min limit)
 TRAKT_RATE_LIMIT_DELAY = 0.2
 
+# Ceiling the adaptive limiter (utils/rate_limit.py) may climb to from
+# there while Trakt keeps answering normally - its 429s and Retry-After
+# pull it back down.
+TRAKT_MAX_REQUESTS_PER_SECOND = 10
+
 # HTTP request timeout in seconds
 TRAKT_REQUEST_TIMEOUT = 30
 
@@ -77,7 +84,7 @@ TRAKT_REQUEST_TIMEOUT = 30
 # isn't trustworthy either).
 TRAKT_MAX_429_RETRIES = 3
 
-# Ceiling on how long a single 429 retry will ever sleep for, regardless
+# Ceiling on how long a single 429 will ever pause Trakt for, regardless
 # of what the server's Retry-After header asks for - that header is
 # server-controlled input, and a compromised/misbehaving Trakt endpoint
 # (or a malicious response) could otherwise stall this process for an
@@ -144,9 +151,11 @@ class TraktClient(BaseAPIClient):
     api_name = "Trakt"
     exception_class = TraktAPIError
     rate_limit_delay = TRAKT_RATE_LIMIT_DELAY
+    max_requests_per_second = TRAKT_MAX_REQUESTS_PER_SECOND
     request_timeout = TRAKT_REQUEST_TIMEOUT
     max_429_retries = TRAKT_MAX_429_RETRIES
     max_retry_after_seconds = TRAKT_MAX_RETRY_AFTER_SECONDS
+    coalesce_requests = True
 
     def __init__(
         self,
@@ -218,7 +227,7 @@ class TraktClient(BaseAPIClient):
             headers["Authorization"] = f"Bearer {self.access_token}"
         return headers
 
-    # _rate_limit() inherited from BaseAPIClient (rate_limit_delay set above)
+    # _rate_limit() inherited from BaseAPIClient (rate_limit_delay/max_requests_per_second set above)
 
     def _make_request(
         self,
@@ -343,7 +352,7 @@ class TraktClient(BaseAPIClient):
         (network failure) - which must not be reported as either verdict.
         """
         try:
-            response = requests.get(
+            response = http_client.get(
                 f"{TRAKT_API_URL}/movies/trending",
                 headers={
                     "Content-Type": "application/json",
@@ -402,7 +411,7 @@ class TraktClient(BaseAPIClient):
         Returns:
             Dict with device_code, user_code, verification_url, expires_in, interval
         """
-        response = requests.post(
+        response = http_client.post(
             f"{TRAKT_API_URL}/oauth/device/code",
             json={"client_id": self.client_id},
             headers={"Content-Type": "application/json"},
@@ -449,7 +458,7 @@ class TraktClient(BaseAPIClient):
         start_time = time.time()
 
         while time.time() - start_time < expires_in:
-            response = requests.post(
+            response = http_client.post(
                 f"{TRAKT_API_URL}/oauth/device/token",
                 json={"code": device_code, "client_id": self.client_id, "client_secret": self.client_secret},
                 headers={"Content-Type": "application/json"},
@@ -514,7 +523,7 @@ class TraktClient(BaseAPIClient):
             return False
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{TRAKT_API_URL}/oauth/token",
                 json={
                     "refresh_token": self.refresh_token,
@@ -578,7 +587,7 @@ class TraktClient(BaseAPIClient):
             return True
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{TRAKT_API_URL}/oauth/revoke",
                 json={"token": self.access_token, "client_id": self.client_id, "client_secret": self.client_secret},
                 headers={"Content-Type": "application/json"},
@@ -1350,6 +1359,10 @@ def fetch_tmdb_details_for_profile(tmdb_api_key: str, tmdb_id: int, media_type:
     """
     Fetch TMDB details for a movie or TV show.
 
+    Read from the title's canonical record (utils/tmdb.py's
+    fetch_title_record()), so scoring a candidate and then looking up its
+    IMDB id or watch providers is one TMDB request, not several.
+
     Args:
         tmdb_api_key: TMDB API key
         tmdb_id: TMDB ID of the item
@@ -1359,67 +1372,24 @@ def fetch_tmdb_details_for_profile(tmdb_api_key: str, tmdb_id: int, media_type:
         Dict with title, year, rating, vote_count, overview, genres, cast,
         keywords, directors/studios, or None on failure
     """
-    try:
-        endpoint = "movie" if media_type == "movie" else "tv"
-        url = f"https://api.themoviedb.org/3/{endpoint}/{tmdb_id}"
-        params = {"api_key": tmdb_api_key, "append_to_response": "keywords,credits"}
-        response = requests.get(url, params=params, timeout=10, allow_redirects=False)
-
-        if response.status_code != 200:
-            return None
-
-        data = response.json()
-
-        # Extract year from release date
-        if media_type == "movie":
-            title = data.get("title", "")
-            release_date = data.get("release_date", "")
-        else:
-            title = data.get("name", "")
-            release_date = data.get("first_air_date", "")
-        year = int(release_date[:4]) if release_date and len(release_date) >= 4 else None
-
-        details = {
-            "title": title,
-            "year": year,
-            "rating": data.get("vote_average", 0),
-            "vote_count": data.get("vote_count", 0),
-            "overview": data.get("overview", ""),
-            "genres": [g["name"] for g in data.get("genres", [])],
-            "original_language": data.get("original_language", ""),
-            "cast": [],
-            "keywords": [],
-            "directors": [],
-            "studios": [],
-        }
-
-        # Extract cast (top 5)
-        credits = data.get("credits", {})
-        for cast_member in credits.get("cast", [])[:5]:
-            if cast_member.get("name"):
-                details["cast"].append(cast_member["name"])
-
-        # Extract keywords (top 10)
-        keywords_data = data.get("keywords", {})
-        keyword_list = keywords_data.get("keywords", keywords_data.get("results", []))
-        for kw in keyword_list[:10]:
-            if kw.get("name"):
-                details["keywords"].append(kw["name"])
-
-        # Extract directors (movies) or studios (TV)
-        if media_type == "movie":
-            for crew in credits.get("crew", []):
-                if crew.get("job") == "Director" and crew.get("name"):
-                    details["directors"].append(crew["name"])
-        else:
-            for network in data.get("networks", [])[:2]:
-                if network.get("name"):
-                    details["studios"].append(network["name"])
-
-        return details
-
-    except Exception:
+    record = fetch_title_record(tmdb_api_key, tmdb_id, media_type)
+    if record is None:
         return None
+    return {
+        "title": record["title"],
+        "year": record["year"],
+        "rating": record["rating"] or 0,
+        "vote_count": record["vote_count"] or 0,
+        "overview": record["overview"],
+        "genres": record["genres"],
+        "original_language": record["original_language"],
+        # Top 5 cast, top 10 keywords
+        "cast": record["cast"][:5],
+        "keywords": record["keywords"][:10],
+        # Directors (movies) or studios (TV)
+        "directors": record["directors"] if media_type == "movie" else [],
+        "studios": record["networks"][:2] if media_type != "movie" else [],
+    }
 
 
 def enhance_profile_with_trakt(
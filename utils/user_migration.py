@@ -57,6 +57,10 @@ CACHE_FILENAME_PATTERNS = [
     "tv_watched_cache_plex_{username}.json",
     "external_recs_{username}_movies.json",
     "external_recs_{username}_shows.json",
+    "scores_movies_plex_{username}.json",
+    "scores_shows_plex_{username}.json",
+    "watch_ledger_movies_plex_{username}.json",
+    "watch_ledger_shows_plex_{username}.json",
 ]
 
 
@@ -0,0 +1,279 @@
+# curatarr
+# Copyright (C) 2026 OrchestratedChaos
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Event-sourced watch profiles.
+
+A watch profile (the weighted counters utils/counters.py builds) is a
+sum over watched items of weight x item metadata, where an item's weight
+is its recency x rating x rewatch multiplier. Every profile rebuild used
+to re-read the user's whole Plex history - up to 10,000 plays of XML -
+and re-add every item from zero, although between two runs usually only
+a handful of plays are new and a handful of items moved recency bucket.
+
+WatchLedger is the per-user record that makes the rebuild incremental:
+
+  - the latest viewedAt of every watched item, and the newest viewedAt
+    folded in at all (the watermark), so the next run only asks Plex for
+    history after it;
+  - the (weight, cap_penalty) each item last contributed, so only items
+    whose weight changed - new plays, a new rating, a recency bucket
+    crossed - are re-applied, as a weight delta;
+  - the counters those contributions add up to;
+  - for TV, each show's distinct watched episodes and latest viewedAt,
+    so dropped-show detection (utils/plex.py's
+    fetch_show_completion_data) works from them plus the new plays
+    instead of needing the whole history every run.
+
+A delta is only exact while the counters are a plain sum. Negative
+weights are applied capped (utils/counters.py's _apply_capped_weight),
+which is order-dependent and can't be undone by subtracting, so any
+negative contribution, any item leaving the profile, a change to the
+library's media cache or the periodic rebase (WATCH_LEDGER_REBASE_DAYS)
+rebuilds the counters from the ledger instead - in memory, with no Plex
+request. A full history re-read still happens every
+WATCH_LEDGER_RESYNC_DAYS, since only that notices a deleted play.
+"""
+
+import copy
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .config import WATCH_LEDGER_OVERLAP_SECONDS, WATCH_LEDGER_REBASE_DAYS, WATCH_LEDGER_RESYNC_DAYS
+from .counters import create_empty_counters
+
+# Bump when the stored layout changes; a ledger of another format is
+# discarded and rebuilt from a full history read.
+WATCH_LEDGER_FORMAT = 2
+
+DAY_SECONDS = 24 * 60 * 60
+
+# Counter values left this close to zero by an add/subtract pair are
+# float residue, not a preference; a rebuild would never have created them.
+COUNTER_EPSILON = 1e-9
+
+# The (weight, cap_penalty) one watched item contributes to the counters,
+# as passed to process_counters_from_cache().
+Contribution = Tuple[float, float]
+
+
+def _normalize_accounts(accounts: Iterable[Any]) -> List[str]:
+    return sorted(str(account) for account in accounts)
+
+
+class WatchLedger:
+    """
+    One user's watch history, the weight each item contributes and the
+    counters they add up to - kept in step between runs rather than
+    rebuilt from a full history read.
+    """
+
+    def __init__(self, media_type: str, accounts: Iterable[Any] = ()) -> None:
+        self.media_type = media_type
+        self.accounts = _normalize_accounts(accounts)
+        self.watermark = 0
+        self.synced_at = 0.0
+        self.rebased_at = 0.0
+        self.library_version = ""
+        # rating key -> latest viewedAt (0 when Plex gave none).
+        self.viewed_at: Dict[str, int] = {}
+        # show rating key -> distinct watched episode rating keys, and the
+        # latest viewedAt among them (TV only).
+        self.show_episodes: Dict[str, Set[str]] = {}
+        self.show_last_watched: Dict[str, int] = {}
+        self.contributions: Dict[str, Contribution] = {}
+        self.counters: Dict[str, Any] = create_empty_counters(media_type)
+
+    def history_since(self, accounts: Iterable[Any], now: Optional[float] = None) -> Optional[int]:
+        """
+        The viewedAt to fetch history from, or None when the whole
+        history has to be read: no history yet, a different set of
+        accounts, or a resync due.
+        """
+        now = time.time() if now is None else now
+        if (
+            not self.watermark
+            or _normalize_accounts(accounts) != self.accounts
+            or now - self.synced_at > WATCH_LEDGER_RESYNC_DAYS * DAY_SECONDS
+        ):
+            return None
+        return max(0, self.watermark - WATCH_LEDGER_OVERLAP_SECONDS)
+
+    def record_history(
+        self,
+        viewed_at: Mapping[Any, Optional[int]],
+        accounts: Iterable[Any],
+        full: bool,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Fold fetched plays in: rating key -> latest viewedAt.
+
+        A `full` read replaces the recorded history (dropping plays Plex
+        no longer has); an incremental one only ever adds to it.
+        """
+        if full:
+            self.viewed_at = {}
+            self.accounts = _normalize_accounts(accounts)
+            self.synced_at = time.time() if now is None else now
+        for key, value in viewed_at.items():
+            timestamp = int(value or 0)
+            key = str(key)
+            if key not in self.viewed_at or timestamp > self.viewed_at[key]:
+                self.viewed_at[key] = timestamp
+            self.watermark = max(self.watermark, timestamp)
+
+    def record_episodes(
+        self, show_episodes: Mapping[Any, Iterable[Any]], last_watched: Mapping[Any, int], full: bool
+    ) -> None:
+        """
+        Fold fetched episode plays in (utils/plex.py's
+        watched_episodes_by_show()), with the same `full` as the
+        record_history() call for the same fetch.
+        """
+        if full:
+            self.show_episodes = {}
+            self.show_last_watched = {}
+        for show, episodes in show_episodes.items():
+            self.show_episodes.setdefault(str(show), set()).update(str(episode) for episode in episodes)
+        for show, timestamp in last_watched.items():
+            show = str(show)
+            self.show_last_watched[show] = max(self.show_last_watched.get(show, 0), int(timestamp or 0))
+
+    def watched_episodes(self) -> Tuple[Dict[int, Set[str]], Dict[int, int]]:
+        """Every recorded show's watched episodes and latest viewedAt, as watched_episodes_by_show() gives them."""
+        return (
+            {int(show): set(episodes) for show, episodes in self.show_episodes.items()},
+            {int(show): timestamp for show, timestamp in self.show_last_watched.items()},
+        )
+
+    def watched_ids(self) -> Set[int]:
+        """Every rating key in the recorded history."""
+        return {int(key) for key in self.viewed_at}
+
+    def viewed_timestamps(self) -> Dict[int, int]:
+        """Rating key -> latest viewedAt, for the items Plex gave one for."""
+        return {int(key): ts for key, ts in self.viewed_at.items() if ts}
+
+    def plan(
+        self,
+        contributions: Mapping[Any, Contribution],
+        library_version: str,
+        now: Optional[float] = None,
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, float, float]]]:
+        """
+        What it takes to bring the counters in line with `contributions`
+        - the weight every watched item should carry now.
+
+        Returns the counters to start from and the (rating key, weight,
+        cap_penalty) updates to apply to them with
+        process_counters_from_cache(): either the stored counters and the
+        weight delta of each changed item, or empty counters and every
+        contribution, in the order given - the negative cap reads the
+        mass already there, so a rebuild replays the builder's own order
+        and comes out exactly as a from-scratch build. Hand the result to
+        commit().
+        """
+        now = time.time() if now is None else now
+        wanted = {str(key): (float(weight), float(cap)) for key, (weight, cap) in contributions.items()}
+        if self._needs_rebuild(wanted, library_version, now):
+            self.rebased_at = now
+            return create_empty_counters(self.media_type), [(key, w, cap) for key, (w, cap) in wanted.items()]
+
+        updates = []
+        for key, (weight, cap) in wanted.items():
+            previous = self.contributions.get(key)
+            if previous != (weight, cap):
+                # All weights here are non-negative, so the counters are a
+                # plain sum and the delta is exact; cap_penalty 0.0 only
+                # stops float residue going below zero.
+                updates.append((key, weight - (previous[0] if previous else 0.0), 0.0))
+        return copy.deepcopy(self.counters), updates
+
+    def _needs_rebuild(self, wanted: Mapping[str, Contribution], library_version: str, now: float) -> bool:
+        if library_version != self.library_version:
+            return True
+        if now - self.rebased_at > WATCH_LEDGER_REBASE_DAYS * DAY_SECONDS:
+            return True
+        if any(key not in wanted for key in self.contributions):
+            return True
+        return any(weight < 0 for weight, _cap in list(wanted.values()) + list(self.contributions.values()))
+
+    def commit(self, counters: Dict[str, Any], contributions: Mapping[Any, Contribution], library_version: str) -> None:
+        """
+        Record the counters plan()'s updates produced (pruned of float
+        residue in place) and the contributions they now reflect.
+        """
+        for counter in counters.values():
+            if isinstance(counter, Counter):
+                for key in [key for key, value in counter.items() if abs(value) < COUNTER_EPSILON]:
+                    del counter[key]
+        self.counters = copy.deepcopy(counters)
+        self.contributions = {str(key): (float(weight), float(cap)) for key, (weight, cap) in contributions.items()}
+        self.library_version = library_version
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form for save_watch_ledger()."""
+        return {
+            "format": WATCH_LEDGER_FORMAT,
+            "media_type": self.media_type,
+            "accounts": self.accounts,
+            "watermark": self.watermark,
+            "synced_at": self.synced_at,
+            "rebased_at": self.rebased_at,
+            "library_version": self.library_version,
+            "viewed_at": self.viewed_at,
+            "show_episodes": {show: sorted(episodes) for show, episodes in self.show_episodes.items()},
+            "show_last_watched": self.show_last_watched,
+            "contributions": {key: list(value) for key, value in self.contributions.items()},
+            # Pairs rather than objects: collection IDs are int keys,
+            # which a JSON object would turn into strings.
+            "counters": {
+                name: list(counter) if isinstance(counter, set) else [[key, value] for key, value in counter.items()]
+                for name, counter in self.counters.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping, media_type: str) -> Optional["WatchLedger"]:
+        """Inverse of to_dict(); None for another format, media type, or anything malformed."""
+        if data.get("format") != WATCH_LEDGER_FORMAT or data.get("media_type") != media_type:
+            return None
+        try:
+            ledger = cls(media_type, data["accounts"])
+            ledger.watermark = int(data["watermark"])
+            ledger.synced_at = float(data["synced_at"])
+            ledger.rebased_at = float(data["rebased_at"])
+            ledger.library_version = str(data["library_version"])
+            ledger.viewed_at = {str(key): int(ts) for key, ts in data["viewed_at"].items()}
+            ledger.show_episodes = {
+                str(show): {str(episode) for episode in episodes} for show, episodes in data["show_episodes"].items()
+            }
+            ledger.show_last_watched = {str(show): int(ts) for show, ts in data["show_last_watched"].items()}
+            ledger.contributions = {
+                str(key): (float(weight), float(cap)) for key, (weight, cap) in data["contributions"].items()
+            }
+            counters: Dict[str, Any] = {}
+            for name, stored in data["counters"].items():
+                if name == "tmdb_ids":
+                    counters[name] = set(stored)
+                else:
+                    counters[name] = Counter({key: float(value) for key, value in stored})
+            ledger.counters = counters
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return ledger